@@ -1,7 +1,9 @@
+from src.application.services.autosaver import Autosaver
 from src.application.services.contact_service import ContactService
 from src.application.services.note_service import NoteService
 
 __all__ = [
+    "Autosaver",
     "ContactService",
     "NoteService",
 ]
@@ -0,0 +1,86 @@
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.logging.logger import setup_logger
+
+log = setup_logger()
+
+
+class Autosaver:
+
+    def __init__(self, quiet_period: float = StorageConfig.AUTOSAVE_QUIET_SECONDS):
+        self.quiet_period = quiet_period
+        # Held by service mutations and while a save copies its changes, so a
+        # save never sees a collection change halfway through
+        self.lock = threading.RLock()
+        self._condition = threading.Condition()
+        self._pending: dict[Callable[[], Any], None] = {}
+        self._deadline: Optional[float] = None
+        self._flushing = False
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="autosave", daemon=True)
+        self._thread.start()
+
+    def mark_dirty(self, flush: Callable[[], Any]) -> None:
+        with self._condition:
+            self._pending[flush] = None
+            # Every edit pushes the deadline back, so a burst becomes one write
+            self._deadline = time.monotonic() + self.quiet_period
+            self._condition.notify()
+
+    def is_dirty(self) -> bool:
+        with self._condition:
+            return bool(self._pending) or self._flushing
+
+    def flush(self) -> None:
+        # Flush callables take self.lock only to copy their changes, so the
+        # disk write never blocks the next command
+        with self._condition:
+            pending, self._pending = list(self._pending), {}
+            self._deadline = None
+            self._flushing = True
+        try:
+            for flush in pending:
+                try:
+                    flush()
+                except Exception as e:
+                    # Keep it pending so the next flush or the exit save retries
+                    log.warning(f"Autosave failed: {e}")
+                    with self._condition:
+                        self._pending[flush] = None
+        finally:
+            with self._condition:
+                self._flushing = False
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._stopped and not self._is_due():
+                    timeout = (
+                        None
+                        if self._deadline is None
+                        else self._deadline - time.monotonic()
+                    )
+                    self._condition.wait(timeout)
+                if self._stopped:
+                    return
+            self.flush()
+
+    def _is_due(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
@@ -1,5 +1,9 @@
+import threading
+from contextlib import nullcontext
 from typing import Optional
 
+from src.application.exceptions.base import StorageException
+from src.application.services.autosaver import Autosaver
 from src.domain.address_book import AddressBook
 from src.domain.entities.contact import Contact
 from src.domain.utils.id_generator import IDGenerator
@@ -9,11 +13,18 @@ from src.domain.value_objects.email import Email
 from src.domain.value_objects.name import Name
 from src.domain.value_objects.phone import Phone
 from src.infrastructure.persistence.data_path_resolver import DEFAULT_CONTACTS_FILE
+from src.infrastructure.logging.logger import setup_logger
 from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.persistence.write_ahead_log import (
+    WriteAheadLog,
+    logged_mutation,
+)
 from src.infrastructure.serialization.json_serializer import JsonSerializer
 from src.infrastructure.storage.pickle_storage import PickleStorage
 from src.infrastructure.storage.storage import Storage
 
+log = setup_logger()
+
 
 class ContactService:
 
@@ -21,11 +32,18 @@ class ContactService:
         self,
         storage: Optional[Storage] = None,
         serializer: Optional[JsonSerializer] = None,
+        write_ahead_log: Optional[WriteAheadLog] = None,
+        autosaver: Optional[Autosaver] = None,
     ):
         raw_storage = storage if storage else PickleStorage()
         self.storage = DomainStorageAdapter(raw_storage, serializer)
         self.address_book = AddressBook()
         self._current_filename = DEFAULT_CONTACTS_FILE
+        self._wal = write_ahead_log
+        self._autosaver = autosaver
+        self._mutation_lock = autosaver.lock if autosaver else nullcontext()
+        # Taken before the mutation lock, so one save runs at a time
+        self._save_lock = threading.Lock()
 
     def load_address_book(
         self, filename: str | None = DEFAULT_CONTACTS_FILE, user_provided: bool = False
@@ -34,28 +52,58 @@ class ContactService:
             filename, user_provided=user_provided
         )
 
-        self.address_book = loaded_book if loaded_book else AddressBook()
+        self.address_book = loaded_book if loaded_book is not None else AddressBook()
         self._current_filename = normalized_filename
+        self._replay_log()
 
-        return len(self.address_book.data)
+        return len(self.address_book)
 
     def save_address_book(
         self, filename: Optional[str] = None, user_provided: bool = False
     ) -> str:
         target = filename if filename else self._current_filename
-
-        saved_filename = self.storage.save_contacts(
-            self.address_book, target, user_provided=user_provided
-        )
-        self._current_filename = saved_filename
+        with self._save_lock:
+            return self._save(target, user_provided)
+
+    def _save(self, target: str, user_provided: bool) -> str:
+        # Only copying the changes holds the mutation lock; commands keep
+        # running while the copy is written
+        with self._mutation_lock:
+            prepared = self.storage.prepare_contacts(
+                self.address_book, target, user_provided=user_provided
+            )
+            logged = None
+            if self._wal:
+                self.address_book.take_unlogged()
+                logged = self._wal.mark()
+        try:
+            saved_filename = prepared.write()
+        except BaseException:
+            with self._mutation_lock:
+                prepared.abort()
+            raise
+        with self._mutation_lock:
+            prepared.finish()
+            self._current_filename = saved_filename
+            if self._wal:
+                # The snapshot now holds every change logged before it started
+                self._wal.reset(logged)
         return saved_filename
 
+    def reload_changes(self) -> int:
+        with self._mutation_lock:
+            return self.storage.refresh_contacts(
+                self.address_book, self._current_filename
+            )
+
+    @logged_mutation
     def add_contact(self, name: Name, phone: Phone) -> str:
         try:
             # Try to find existing contact
             contact = self.address_book.find(name.value)
             try:
                 contact.add_phone(phone)
+                self.address_book.mark_modified(contact.id)
                 return f"Phone number {phone.value} added to existing contact {name.value}."
             except ValueError as e:
                 # Phone already exists for this contact
@@ -76,11 +124,14 @@ class ContactService:
             self.address_book.add_record(contact)
             return f"Contact {name.value} added with phone {phone.value}."
 
+    @logged_mutation
     def change_phone(self, name: str, old_phone: Phone, new_phone: Phone) -> str:
         contact = self.address_book.find(name)
         contact.edit_phone(old_phone, new_phone)
+        self.address_book.mark_modified(contact.id)
         return "Contact phone number updated."
 
+    @logged_mutation
     def edit_phone_by_id(
         self, contact_id: str, old_phone: Phone, new_phone: Phone
     ) -> str:
@@ -88,8 +139,10 @@ class ContactService:
         if not contact:
             raise KeyError(f"Contact with ID {contact_id} not found")
         contact.edit_phone(old_phone, new_phone)
+        self.address_book.mark_modified(contact.id)
         return "Contact phone number updated."
 
+    @logged_mutation
     def remove_phone_by_id(self, contact_id: str, phone: Phone) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
@@ -99,8 +152,10 @@ class ContactService:
                 f"Cannot remove the only phone number. Contact must have at least one phone."
             )
         contact.remove_phone(phone)
+        self.address_book.mark_modified(contact.id)
         return f"Phone number {phone.value} removed from {contact.name.value}."
 
+    @logged_mutation
     def remove_phone(self, name: str, phone: Phone) -> str:
         contact = self.address_book.find(name)
         if len(contact.phones) == 1:
@@ -108,12 +163,15 @@ class ContactService:
                 f"Cannot remove the only phone number. Contact must have at least one phone."
             )
         contact.remove_phone(phone)
+        self.address_book.mark_modified(contact.id)
         return f"Phone number {phone.value} removed from {name}."
 
+    @logged_mutation
     def delete_contact(self, name: str) -> str:
         self.address_book.delete(name)
         return "Contact deleted."
 
+    @logged_mutation
     def delete_contact_by_id(self, contact_id: str) -> str:
         self.address_book.delete_by_id(contact_id)
         return "Contact deleted."
@@ -121,6 +179,7 @@ class ContactService:
     def find_all_by_name(self, name: str) -> list[Contact]:
         return self.address_book.find_all(name)
 
+    @logged_mutation
     def add_phone_to_contact(self, contact_id: str, phone: Phone) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
@@ -128,12 +187,14 @@ class ContactService:
 
         try:
             contact.add_phone(phone)
+            self.address_book.mark_modified(contact.id)
             return f"Phone number {phone.value} added to existing contact {contact.name.value}."
         except ValueError as e:
             if "already exists" in str(e):
                 return f"Phone number {phone.value} already exists for {contact.name.value}."
             raise
 
+    @logged_mutation
     def create_new_contact(self, name: Name, phone: Phone) -> str:
         contact = Contact.create(
             name,
@@ -148,18 +209,22 @@ class ContactService:
         return [phone.value for phone in contact.phones]
 
     def get_all_contacts(self) -> list[Contact]:
-        return list(self.address_book.data.values())
+        return list(self.address_book.values())
 
+    @logged_mutation
     def add_birthday_by_id(self, contact_id: str, birthday: Birthday) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
             raise KeyError(f"Contact with ID {contact_id} not found")
         contact.add_birthday(birthday)
+        self.address_book.mark_modified(contact.id)
         return f"Birthday added for {contact.name.value}."
 
+    @logged_mutation
     def add_birthday(self, name: str, birthday: Birthday) -> str:
         contact = self.address_book.find(name)
         contact.add_birthday(birthday)
+        self.address_book.mark_modified(contact.id)
         return f"Birthday added for {name}."
 
     def get_birthday(self, name: str) -> Optional[str]:
@@ -169,6 +234,7 @@ class ContactService:
     def get_upcoming_birthdays(self, days_ahead) -> list[dict]:
         return self.address_book.get_upcoming_birthdays(days_ahead)
 
+    @logged_mutation
     def remove_birthday_by_id(self, contact_id: str) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
@@ -176,26 +242,32 @@ class ContactService:
         birthday = contact.birthday
         if contact.birthday:
             contact.remove_birthday()
+            self.address_book.mark_modified(contact.id)
             return f"Birthday {birthday} removed from {contact.name.value}."
         else:
             return f"{contact.name.value} has no birthday set."
 
+    @logged_mutation
     def remove_birthday(self, name: str) -> str:
         contact = self.address_book.find(name)
         birthday = contact.birthday
         if contact.birthday:
             contact.remove_birthday()
+            self.address_book.mark_modified(contact.id)
             return f"Birthday {birthday} removed from {name}."
         else:
             return f"{name} has no birthday set."
 
+    @logged_mutation
     def add_email_by_id(self, contact_id: str, email: Email) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
             raise KeyError(f"Contact with ID {contact_id} not found")
         contact.add_email(email)
+        self.address_book.mark_modified(contact.id)
         return f"Email added for {contact.name.value}."
 
+    @logged_mutation
     def edit_email_by_id(self, contact_id: str, email: Email) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
@@ -203,11 +275,14 @@ class ContactService:
         if contact.email:
             contact.remove_email()
             contact.add_email(email)
+            self.address_book.mark_modified(contact.id)
             return f"New email is set for {contact.name.value}"
         else:
             contact.add_email(email)
+            self.address_book.mark_modified(contact.id)
             return f"Email added for {contact.name.value}."
 
+    @logged_mutation
     def remove_email_by_id(self, contact_id: str) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
@@ -215,17 +290,21 @@ class ContactService:
         email = contact.email
         if contact.email:
             contact.remove_email()
+            self.address_book.mark_modified(contact.id)
             return f"Email {email} from {contact.name.value} removed successfully"
         else:
             raise ValueError(
                 f"Can't remove email for {contact.name.value}.\nEmail is not set yet."
             )
 
+    @logged_mutation
     def add_email(self, name: str, email: Email) -> str:
         contact = self.address_book.find(name)
         contact.add_email(email)
+        self.address_book.mark_modified(contact.id)
         return f"Email added for {name}."
 
+    @logged_mutation
     def edit_email(self, name: str, email: Email) -> str:
         contact = self.address_book.find(name)
         if contact.email:
@@ -235,26 +314,32 @@ class ContactService:
             # We could just reuse add and remove method here
             contact.remove_email()
             contact.add_email(email)
+            self.address_book.mark_modified(contact.id)
             return f"New email is set for {name}"
         else:
             return self.add_email(name, email)
 
+    @logged_mutation
     def remove_email(self, name: str) -> str:
         contact = self.address_book.find(name)
         email = contact.email
         if contact.email:
             contact.remove_email()
+            self.address_book.mark_modified(contact.id)
             return f"Email {email} from {name} removed successfully"
         else:
             raise ValueError(f"Can't remove email for {name}.\nEmail is not set yet.")
 
+    @logged_mutation
     def add_address_by_id(self, contact_id: str, address: Address) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
             raise KeyError(f"Contact with ID {contact_id} not found")
         contact.add_address(address)
+        self.address_book.mark_modified(contact.id)
         return f"Address added for {contact.name.value}."
 
+    @logged_mutation
     def edit_address_by_id(self, contact_id: str, address: Address) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
@@ -262,11 +347,14 @@ class ContactService:
         if contact.address:
             contact.remove_address()
             contact.add_address(address)
+            self.address_book.mark_modified(contact.id)
             return f"New address is set for {contact.name.value}"
         else:
             contact.add_address(address)
+            self.address_book.mark_modified(contact.id)
             return f"Address added for {contact.name.value}."
 
+    @logged_mutation
     def remove_address_by_id(self, contact_id: str) -> str:
         contact = self.address_book.find_by_id(contact_id)
         if not contact:
@@ -274,31 +362,38 @@ class ContactService:
         address = contact.address
         if contact.address:
             contact.remove_address()
+            self.address_book.mark_modified(contact.id)
             return f"Address {address} from {contact.name.value} removed successfully"
         else:
             raise ValueError(
                 f"Can't remove address for {contact.name.value}.\nAddress is not set yet."
             )
 
+    @logged_mutation
     def add_address(self, name: str, address: Address) -> str:
         contact = self.address_book.find(name)
         contact.add_address(address)
+        self.address_book.mark_modified(contact.id)
         return f"Address added for {name}."
 
+    @logged_mutation
     def edit_address(self, name: str, address: Address):
         contact = self.address_book.find(name)
         if contact.address:
             contact.remove_address()
             contact.add_address(address)
+            self.address_book.mark_modified(contact.id)
             return f"New address is set for {name}"
         else:
             return self.add_address(name, address)
 
+    @logged_mutation
     def remove_address(self, name: str) -> str:
         contact = self.address_book.find(name)
         address = contact.address
         if contact.address:
             contact.remove_address()
+            self.address_book.mark_modified(contact.id)
             return f"Address {address} from {name} removed successfully"
         else:
             raise ValueError(
@@ -306,11 +401,50 @@ class ContactService:
             )
 
     def search(self, search_text: str, exact=False) -> list[Contact]:
-        return list(
-            filter(
-                lambda c: c.is_matching(search_text, exact), self.address_book.values()
-            )
-        )
+        return self.address_book.search(search_text, exact)
+
+    def fuzzy_search(self, search_text: str) -> list[Contact]:
+        return self.address_book.fuzzy_search(search_text)
 
     def get_current_filename(self) -> str:
         return self._current_filename
+
+    def _log_changes(self) -> None:
+        changed = self.address_book.take_unlogged()
+        if not changed:
+            return
+        if self._autosaver:
+            self._autosaver.mark_dirty(self.save_address_book)
+        if not self._wal:
+            return
+        contacts = self.address_book.data
+        upserts = [
+            self.storage.serializer.contact_to_dict(contacts[contact_id])
+            for contact_id in sorted(changed)
+            if contact_id in contacts
+        ]
+        deleted = sorted(changed.difference(contacts))
+        self._wal.append(self._current_filename, upserts, deleted)
+
+        # Skipped while another save runs: it needs the mutation lock held
+        # here to finish, and this edit is already queued for the next one
+        if self._wal.snapshot_due() and self._save_lock.acquire(blocking=False):
+            try:
+                self._save(self._current_filename, False)
+            except (IOError, StorageException) as e:
+                # The change is already in the log, so the command still succeeds
+                log.warning(f"Address book snapshot failed: {e}")
+            finally:
+                self._save_lock.release()
+
+    def _replay_log(self) -> None:
+        if not self._wal:
+            return
+        for entry in self._wal.entries(self._current_filename):
+            for data in entry["upserts"]:
+                contact = self.storage.serializer.dict_to_contact(data)
+                self.address_book[contact.id] = contact
+            for contact_id in entry["deleted"]:
+                if contact_id in self.address_book:
+                    del self.address_book[contact_id]
+        self.address_book.take_unlogged()
@@ -1,19 +1,33 @@
+import threading
 from collections import defaultdict
-from typing import Optional, Set, Any
+from contextlib import nullcontext
+from typing import Callable, Optional, Set
 
+from src.application.exceptions.base import StorageException
+from src.application.services.autosaver import Autosaver
 from src.domain.entities.note import Note
+from src.domain.notebook import Notebook
 from src.domain.utils.id_generator import IDGenerator
 from src.domain.value_objects.tag import Tag
 from src.infrastructure.persistence.data_path_resolver import (
     DEFAULT_NOTES_FILE,
+    DEFAULT_NOTES_JOURNAL_FILE,
+    DEFAULT_NOTES_DBM_FILE,
     DEFAULT_ADDRESS_BOOK_DATABASE_NAME,
 )
+from src.infrastructure.logging.logger import setup_logger
 from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.persistence.write_ahead_log import (
+    WriteAheadLog,
+    logged_mutation,
+)
 from src.infrastructure.serialization.json_serializer import JsonSerializer
 from src.infrastructure.storage.json_storage import JsonStorage
 from src.infrastructure.storage.storage import Storage
 from src.infrastructure.storage.storage_type import StorageType
 
+log = setup_logger()
+
 
 class NoteService:
 
@@ -21,14 +35,27 @@ class NoteService:
         self,
         storage: Optional[Storage] = None,
         serializer: Optional[JsonSerializer] = None,
+        write_ahead_log: Optional[WriteAheadLog] = None,
+        autosaver: Optional[Autosaver] = None,
     ):
         raw_storage = storage if storage else JsonStorage()
         self.storage = DomainStorageAdapter(raw_storage, serializer)
-        self.notes: dict[Any, Any] = {}
+        self.notes: Notebook = Notebook()
         self.raw_storage = raw_storage
+        self._wal = write_ahead_log
+        self._autosaver = autosaver
+        self._mutation_lock = autosaver.lock if autosaver else nullcontext()
+        # Taken before the mutation lock, so one save runs at a time
+        self._save_lock = threading.Lock()
         if raw_storage.storage_type == StorageType.SQLITE:
             self._current_filename = DEFAULT_ADDRESS_BOOK_DATABASE_NAME
             self._default_filename = DEFAULT_ADDRESS_BOOK_DATABASE_NAME
+        elif raw_storage.storage_type == StorageType.JSONL:
+            self._current_filename = DEFAULT_NOTES_JOURNAL_FILE
+            self._default_filename = DEFAULT_NOTES_JOURNAL_FILE
+        elif raw_storage.storage_type == StorageType.DBM:
+            self._current_filename = DEFAULT_NOTES_DBM_FILE
+            self._default_filename = DEFAULT_NOTES_DBM_FILE
         else:
             self._current_filename = DEFAULT_NOTES_FILE
             self._default_filename = DEFAULT_NOTES_FILE
@@ -53,16 +80,43 @@ class NoteService:
             self._current_filename = self._default_filename
         else:
             self._current_filename = normalized_filename
+        self._replay_log()
 
         return len(self.notes)
 
     def save_notes(self, filename: Optional[str] = None) -> str:
         target = filename if filename else self._current_filename
-
-        saved_filename = self.storage.save_notes(self.notes, target)
-        self._current_filename = saved_filename
+        with self._save_lock:
+            return self._save(target)
+
+    def _save(self, target: str) -> str:
+        # Only copying the changes holds the mutation lock; commands keep
+        # running while the copy is written
+        with self._mutation_lock:
+            prepared = self.storage.prepare_notes(self.notes, target)
+            logged = None
+            if self._wal:
+                self.notes.take_unlogged()
+                logged = self._wal.mark()
+        try:
+            saved_filename = prepared.write()
+        except BaseException:
+            with self._mutation_lock:
+                prepared.abort()
+            raise
+        with self._mutation_lock:
+            prepared.finish()
+            self._current_filename = saved_filename
+            if self._wal:
+                # The snapshot now holds every change logged before it started
+                self._wal.reset(logged)
         return saved_filename
 
+    def reload_changes(self) -> int:
+        with self._mutation_lock:
+            return self.storage.refresh_notes(self.notes, self._current_filename)
+
+    @logged_mutation
     def add_note(self, title: str, text: str) -> str:
         note = Note.create(
             title, text, lambda: IDGenerator.generate_unique_id(lambda: self.get_ids())
@@ -70,24 +124,30 @@ class NoteService:
         self.notes[note.id] = note
         return note.id
 
+    @logged_mutation
     def edit_note(self, note_id: str, new_text: str) -> str:
         if note_id not in self.notes:
             raise KeyError("Note not found")
         self.notes[note_id].edit_text(new_text)
+        self.notes.mark_modified(note_id)
         return "Note updated."
 
+    @logged_mutation
     def rename_note(self, note_id: str, new_title: str) -> str:
         if note_id not in self.notes:
             raise KeyError("Note not found")
         self.notes[note_id].edit_title(new_title)
+        self.notes.mark_modified(note_id)
         return "Note title updated."
 
+    @logged_mutation
     def delete_note_by_id(self, note_id: str) -> str:
         if note_id not in self.notes:
             raise KeyError("Note not found")
         del self.notes[note_id]
         return "Note deleted."
 
+    @logged_mutation
     def delete_note_by_title(self, title: str) -> str:
         if not title or not title.strip():
             raise KeyError("Note title can't be empty")
@@ -96,6 +156,7 @@ class NoteService:
             self.delete_note_by_id(note.id)
         return "Note(s) deleted"
 
+    @logged_mutation
     def delete_note_by_tags(self, tag: str) -> str:
         if not tag or not tag.strip():
             raise KeyError("Note title can't be empty")
@@ -107,16 +168,20 @@ class NoteService:
             self.delete_note_by_id(note.id)
         return "Note(s) deleted"
 
+    @logged_mutation
     def add_tag(self, note_id: str, tag: Tag) -> str:
         if note_id not in self.notes:
             raise KeyError("Note not found")
         self.notes[note_id].add_tag(tag)
+        self.notes.mark_modified(note_id)
         return "Tag added."
 
+    @logged_mutation
     def remove_tag(self, note_id: str, tag: Tag) -> str:
         if note_id not in self.notes:
             raise KeyError("Note not found")
         self.notes[note_id].remove_tag(tag)
+        self.notes.mark_modified(note_id)
         return "Tag removed."
 
     def get_all_notes(self) -> list[Note]:
@@ -139,14 +204,56 @@ class NoteService:
 
     def search_notes_by_content(self, query: str) -> list[Note]:
         query_lower = query.lower()
-        return [
-            note for note in self.notes.values() if query_lower in note.text.lower()
-        ]
+        return self._search_text(
+            query, "text", lambda note: query_lower in note.text.lower()
+        )
 
     def search_notes_by_title(self, query: str) -> list[Note]:
         if not query or not query.strip():
             raise KeyError("Note title can't be empty")
-        return list(note for note in self.notes.values() if query in note.title.lower())
+        query_lower = query.lower()
+        return self._search_text(
+            query, "title", lambda note: query_lower in note.title.lower()
+        )
+
+    def _search_text(
+        self, query: str, column: str, matches: Callable[[Note], bool]
+    ) -> list[Note]:
+        # Saved, unsaved and scanned notes all go through the same substring rule
+        indexed = self._search_full_text(query, column, matches)
+        if indexed is not None:
+            return indexed
+        return [note for note in self.notes.values() if matches(note)]
+
+    def _search_full_text(
+        self, query: str, column: str, matches: Callable[[Note], bool]
+    ) -> Optional[list[Note]]:
+        storage = self.raw_storage
+        if storage.storage_type != StorageType.SQLITE or not hasattr(
+            storage, "search_note_ids"
+        ):
+            return None
+        # The index only reflects notes as last saved to this database
+        if not self.notes.is_flushed_to(storage.database_key(self._current_filename)):
+            return None
+
+        note_ids = storage.search_note_ids(self._current_filename, query, column)
+        if note_ids is None:
+            return None
+
+        unsaved = self.notes.pending_changes().upserted
+        # The index folds case slightly differently from str.lower; verify hits
+        results = [
+            self.notes[note_id]
+            for note_id in note_ids
+            if note_id in self.notes
+            and note_id not in unsaved
+            and matches(self.notes[note_id])
+        ]
+        results.extend(
+            self.notes[note_id] for note_id in unsaved if matches(self.notes[note_id])
+        )
+        return results
 
     def search_notes_by_tag(self, tag: str) -> list[Note]:
         tag_lower = tag.lower()
@@ -192,3 +299,42 @@ class NoteService:
 
     def get_current_filename(self) -> str:
         return self._current_filename
+
+    def _log_changes(self) -> None:
+        changed = self.notes.take_unlogged()
+        if not changed:
+            return
+        if self._autosaver:
+            self._autosaver.mark_dirty(self.save_notes)
+        if not self._wal:
+            return
+        upserts = [
+            self.storage.serializer.note_to_dict(self.notes.data[note_id])
+            for note_id in sorted(changed)
+            if note_id in self.notes.data
+        ]
+        deleted = sorted(changed.difference(self.notes.data))
+        self._wal.append(self._current_filename, upserts, deleted)
+
+        # Skipped while another save runs: it needs the mutation lock held
+        # here to finish, and this edit is already queued for the next one
+        if self._wal.snapshot_due() and self._save_lock.acquire(blocking=False):
+            try:
+                self._save(self._current_filename)
+            except (IOError, StorageException) as e:
+                # The change is already in the log, so the command still succeeds
+                log.warning(f"Notes snapshot failed: {e}")
+            finally:
+                self._save_lock.release()
+
+    def _replay_log(self) -> None:
+        if not self._wal:
+            return
+        for entry in self._wal.entries(self._current_filename):
+            for data in entry["upserts"]:
+                note = self.storage.serializer.dict_to_note(data)
+                self.notes[note.id] = note
+            for note_id in entry["deleted"]:
+                if note_id in self.notes:
+                    del self.notes[note_id]
+        self.notes.take_unlogged()
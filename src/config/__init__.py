@@ -10,6 +10,7 @@ from src.config.regex_patterns import RegexPatterns
 from src.config.date_format_config import DateFormatConfig
 from src.config.phone_config import PhoneConfig
 from src.config.command_args_config import CommandArgsConfig
+from src.config.search_config import SearchConfig
 
 __all__ = [
     "NLPConfig",
@@ -24,4 +25,5 @@ __all__ = [
     "DateFormatConfig",
     "PhoneConfig",
     "CommandArgsConfig",
+    "SearchConfig",
 ]
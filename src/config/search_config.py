@@ -0,0 +1,8 @@
+class SearchConfig:
+
+    # Fuzzy contact search
+    FUZZY_MIN_SIMILARITY = 0.5
+    """Share of the query's trigrams a contact must contain to count as a match."""
+
+    FUZZY_MAX_RESULTS = 10
+    """Most contacts a fuzzy search returns, best match first."""
@@ -2,4 +2,92 @@ class StorageConfig:
 
     # Default storage type can be configured here if needed
     # DEFAULT_STORAGE_TYPE = StorageType.SQLITE
-    pass
+
+    # SQLite schema version stored in PRAGMA user_version
+    SQLITE_SCHEMA_VERSION = 6
+    """v2: phone and tag tables, v3: notes_fts, v4: contact name and birthday indexes,
+    v5: notes_fts over trigrams, v6: record_changes log."""
+
+    # Rows per executemany batch and IDs per DELETE ... IN chunk
+    SQLITE_BULK_BATCH_SIZE = 500
+
+    # SQLite pragma profile: "compatible", "balanced" or "fast"
+    SQLITE_PERFORMANCE_PROFILE = "compatible"
+    """Rollback journal with synchronous=FULL, as before profiles existed.
+    "balanced" opts in to WAL, synchronous=NORMAL, mmap and a 64 MB page cache."""
+
+    # Load SQLite address books lazily and push lookups down to SQL
+    SQLITE_LAZY_ADDRESS_BOOK = False
+
+    # Saved contacts a lazy address book keeps cached between lookups
+    LAZY_CONTACT_CACHE_SIZE = 1024
+
+    # Rows read per batch while migrating legacy SQLite files
+    SQLITE_MIGRATION_BATCH_SIZE = 1000
+
+    # Compact a JSONL journal once it outgrows its snapshot and this many bytes
+    JSONL_COMPACTION_MIN_BYTES = 64 * 1024
+
+    # Run JSONL compaction on a background thread instead of inside save
+    JSONL_BACKGROUND_COMPACTION = True
+
+    # Parse JSON arrays one element at a time while loading domain objects
+    JSON_STREAMING_LOAD = True
+
+    # Characters read per chunk by the streaming JSON loader
+    JSON_STREAM_CHUNK_SIZE = 64 * 1024
+
+    # Skip value object validation for JSON files unchanged since their manifest
+    TRUSTED_LOAD = True
+
+    # Bump when validation rules or serialized fields change to distrust old files
+    TRUSTED_LOAD_FORMAT_VERSION = 1
+
+    # Hex digits of the ID hash that pick a shard: 2 gives up to 256 shard files
+    JSON_SHARD_PREFIX_LENGTH = 2
+
+    # Threads reading shard files in parallel on load
+    JSON_SHARD_LOAD_WORKERS = 8
+
+    # Compression levels for .gz, .xz and .zst storage files
+    GZIP_COMPRESSION_LEVEL = 6
+    LZMA_PRESET = 6
+    ZSTD_COMPRESSION_LEVEL = 3
+
+    # Snapshot a service's collection after this many write-ahead log entries
+    WAL_SNAPSHOT_EVERY_OPS = 50
+
+    # ...or once this many seconds have passed since the last snapshot
+    WAL_SNAPSHOT_INTERVAL_SECONDS = 300
+
+    # fsync each write-ahead log entry so a crash loses at most the current command
+    WAL_FSYNC = True
+
+    # Seconds without edits before the CLI autosaves in the background
+    AUTOSAVE_QUIET_SECONDS = 2.0
+
+    # Lock single-file stores across processes and merge their saves on write
+    FILE_LOCKING = True
+
+    # Seconds to wait for another process to release a storage lock
+    FILE_LOCK_TIMEOUT_SECONDS = 10.0
+
+    # Saves listed next to a single-file store, so reloads read only what changed
+    CHANGE_LOG_MAX_ENTRIES = 100
+
+    # Records per batch when streaming between storage formats
+    CONVERTER_BATCH_SIZE = 1000
+
+    # Deserialize large loads in a process pool; off by default
+    PARALLEL_LOAD = False
+
+    # Worker processes for parallel loads; None uses one per CPU
+    PARALLEL_LOAD_WORKERS = None
+
+    # Records each worker turns into domain objects at a time
+    PARALLEL_LOAD_CHUNK_SIZE = 20_000
+
+    # Content-defined chunk sizes for backups; the average must be a power of two
+    BACKUP_CHUNK_MIN_SIZE = 16 * 1024
+    BACKUP_CHUNK_AVG_SIZE = 64 * 1024
+    BACKUP_CHUNK_MAX_SIZE = 256 * 1024
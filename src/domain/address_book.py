@@ -1,56 +1,172 @@
-from collections import UserDict
 from datetime import date, timedelta
-from typing import Optional, Set
+from typing import Any, Iterable, Optional, Set
 
+from src.config.search_config import SearchConfig
 from src.domain.entities.contact import Contact
+from src.domain.indexes.birthday_index import BirthdayIndex
+from src.domain.indexes.contact_index import ContactIndex
+from src.domain.indexes.name_index import NameIndex
+from src.domain.indexes.phone_index import PhoneIndex
+from src.domain.indexes.trigram_index import TrigramIndex
+from src.domain.tracked_collection import TrackedCollection
+from src.domain.value_objects.name import Name
 from src.domain.utils.birthday_utils import get_next_birthday_date, parse_date
 
 DATE_FORMAT = "%d.%m.%Y"
+INDEX_ATTRIBUTES = ("_names", "_phones", "_text", "_birthdays")
 
 
-class AddressBook(UserDict):
+class AddressBook(TrackedCollection):
+
+    def __init__(self, *args, **kwargs):
+        self._create_indexes()
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key: str, value: Contact) -> None:
+        super().__setitem__(key, value)
+        self._index(value)
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._unindex(key)
+
+    def mark_modified(self, key: str) -> None:
+        super().mark_modified(key)
+        self._index(self.data[key])
+
+    def set_untracked(self, key: str, value: Contact) -> None:
+        super().set_untracked(key, value)
+        self._index(value)
+
+    def delete_untracked(self, key: str) -> None:
+        super().delete_untracked(key)
+        self._unindex(key)
 
     def get_ids(self) -> Set[str]:
         return set(self.data.keys())
 
     def add_record(self, contact: Contact) -> None:
         key = contact.id
-        if key in self.data:
+        if key in self:
             raise KeyError(f"Contact with ID '{key}' already exists")
-        self.data[key] = contact
+        self[key] = contact
 
-    def find(self, contact_name: str) -> Contact:
-        for contact in self.data.values():
-            if contact.name.value == contact_name:
-                return contact
-        raise KeyError("Contact not found")
-
-    def find_all(self, contact_name: str) -> list[Contact]:
-        matches = [
-            contact
-            for contact in self.data.values()
-            if contact.name.value == contact_name
+    def find(self, contact_name: str, ignore_case: bool = False) -> Contact:
+        ids = self._names.ids(contact_name, ignore_case)
+        if not ids:
+            raise KeyError("Contact not found")
+        return self.data[ids[0]]
+
+    def find_all(self, contact_name: str, ignore_case: bool = False) -> list[Contact]:
+        return [
+            self.data[contact_id]
+            for contact_id in self._names.ids(contact_name, ignore_case)
         ]
-        return matches
 
     def find_by_id(self, contact_id: str) -> Optional[Contact]:
         return self.data.get(contact_id)
 
     def delete(self, contact_name: str) -> None:
         contact = self.find(contact_name)
-        del self.data[contact.id]
+        del self[contact.id]
 
     def delete_by_id(self, contact_id: str) -> None:
-        if contact_id not in self.data:
+        if contact_id not in self:
+            raise KeyError("Contact not found")
+        del self[contact_id]
+
+    def rename(self, contact_id: str, name: Name) -> None:
+        contact = self.find_by_id(contact_id)
+        if contact is None:
             raise KeyError("Contact not found")
-        del self.data[contact_id]
+        contact.name = name
+        self.mark_modified(contact_id)
+
+    def find_by_phone(self, phone: str) -> list[Contact]:
+        return [self.data[contact_id] for contact_id in self._phones.ids(phone)]
+
+    def find_by_phone_suffix(self, digits: str) -> list[Contact]:
+        return [
+            self.data[contact_id] for contact_id in self._phones.ids_ending_with(digits)
+        ]
+
+    def search(self, search_text: str, exact: bool = False) -> list[Contact]:
+        digits = Contact.search_digits(search_text)
+        # Phones are matched through the phone index, other fields via trigrams
+        phone_matches = set(self._phones.matching_ids(digits)) if digits else set()
+        candidates = self._text.candidate_ids(search_text)
+        if candidates is None:
+            return [
+                contact
+                for contact_id, contact in self.data.items()
+                if contact_id in phone_matches
+                or contact.matches_text(search_text, exact)
+            ]
+
+        phone_matches.update(
+            contact_id
+            for contact_id in candidates
+            if self.data[contact_id].matches_text(search_text, exact)
+        )
+        ordered = self._text.in_order(phone_matches)
+        return [self.data[contact_id] for contact_id in ordered]
+
+    def fuzzy_search(
+        self,
+        search_text: str,
+        limit: int = SearchConfig.FUZZY_MAX_RESULTS,
+        min_similarity: float = SearchConfig.FUZZY_MIN_SIMILARITY,
+    ) -> list[Contact]:
+        scored = self._text.similar_ids(search_text, min_similarity)
+        return [self.data[contact_id] for contact_id, _ in scored[:limit]]
 
     def get_upcoming_birthdays(self, days_ahead) -> list[dict]:
+        return [
+            self._upcoming_birthday(self.data[contact_id], next_birthday_date)
+            for contact_id, next_birthday_date in self._birthdays.upcoming(
+                date.today(), days_ahead
+            )
+        ]
+
+    def _create_indexes(self) -> None:
+        self._names = NameIndex()
+        self._phones = PhoneIndex()
+        self._text = TrigramIndex()
+        self._birthdays = BirthdayIndex()
+
+    def _indexes(self) -> tuple[ContactIndex, ...]:
+        return self._names, self._phones, self._text, self._birthdays
+
+    def _index(self, contact: Contact) -> None:
+        for index in self._indexes():
+            index.update(contact)
+
+    def _unindex(self, contact_id: str) -> None:
+        for index in self._indexes():
+            index.discard(contact_id)
+
+    def __getstate__(self) -> dict:
+        # Indexes are rebuilt on load, so pickles keep their old layout
+        state = super().__getstate__()
+        for attribute in INDEX_ATTRIBUTES:
+            state.pop(attribute, None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._create_indexes()
+        for contact in self.data.values():
+            self._index(contact)
+
+    @staticmethod
+    def _collect_upcoming_birthdays(
+        contacts: Iterable[Contact], days_ahead
+    ) -> list[dict]:
         upcoming_birthdays = []
         today = date.today()
         next_n_days = today + timedelta(days=days_ahead)
 
-        for contact in self.data.values():
+        for contact in contacts:
             if contact.birthday is None:
                 continue
 
@@ -66,12 +182,18 @@ class AddressBook(UserDict):
 
             if today <= next_birthday_date <= next_n_days:
                 upcoming_birthdays.append(
-                    {
-                        "name": contact.name.value,
-                        "birthday": contact.birthday.value,  # Original birthday
-                        "congratulation_date": next_birthday_date.strftime(DATE_FORMAT),  # Next celebration date
-                        "birthdays_date": next_birthday_date,  # Date object for calculations
-                    }
+                    AddressBook._upcoming_birthday(contact, next_birthday_date)
                 )
 
+        # Soonest first, matching the order of the birthday index
+        upcoming_birthdays.sort(key=lambda item: item["birthdays_date"])
         return upcoming_birthdays
+
+    @staticmethod
+    def _upcoming_birthday(contact: Contact, next_birthday_date: date) -> dict:
+        return {
+            "name": contact.name.value,
+            "birthday": contact.birthday.value,  # Original birthday
+            "congratulation_date": next_birthday_date.strftime(DATE_FORMAT),  # Next celebration date
+            "birthdays_date": next_birthday_date,  # Date object for calculations
+        }
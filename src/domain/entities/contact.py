@@ -1,4 +1,4 @@
-from typing import Optional, Callable
+from typing import Any, Callable, Optional
 
 from src.domain.entities.entity import Entity
 from src.domain.value_objects.address import Address
@@ -9,6 +9,8 @@ from src.domain.value_objects.phone import Phone
 
 
 class Contact(Entity):
+    # Weak references let lazy books keep handing out the same instance
+    __slots__ = ("id", "name", "phones", "birthday", "email", "address", "__weakref__")
 
     def __init__(self, name: Name, contact_id: str):
         if not contact_id:
@@ -63,9 +65,22 @@ class Contact(Entity):
         self.address = None
 
     def add_address(self, address: Address) -> None:
-        self.address = address
+        self.address = address.interned()
 
     def is_matching(self, search_text: str, exact: bool) -> bool:
+        # Check if search text looks like a phone number (contains digits)
+        search_normalized = self.search_digits(search_text)
+        if search_normalized and self.has_phone_matching(search_normalized):
+            return True
+        return self.matches_text(search_text, exact)
+
+    def has_phone_matching(self, digits: str) -> bool:
+        # Phone.value already contains normalized digits only
+        return any(
+            digits in phone.value or phone.value in digits for phone in self.phones
+        )
+
+    def matches_text(self, search_text: str, exact: bool) -> bool:
         # Collect all searchable field values
         values = [str(self.name)]
         if self.email:
@@ -74,17 +89,6 @@ class Contact(Entity):
             values.append(str(self.address))
         values.extend(str(phone) for phone in self.phones)
 
-        # Normalize search text for phone number comparison (remove all non-digits)
-        search_normalized = ''.join(c for c in search_text if c.isdigit())
-
-        # Check if search text looks like a phone number (contains digits)
-        if search_normalized:
-            # Check against normalized phone values
-            for phone in self.phones:
-                # Phone.value already contains normalized digits only
-                if search_normalized in phone.value or phone.value in search_normalized:
-                    return True
-
         # Perform search
         if exact:
             return search_text in values
@@ -92,6 +96,17 @@ class Contact(Entity):
         search_lower = search_text.casefold()
         return any(search_lower in val.casefold() for val in values)
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        # Older pickles hold one Address per contact; share them like loads do
+        if self.address is not None:
+            self.address = self.address.interned()
+
+    @staticmethod
+    def search_digits(search_text: str) -> str:
+        # Normalize search text for phone number comparison (remove all non-digits)
+        return "".join(c for c in search_text if c.isdigit())
+
     def __str__(self) -> str:
         phones_str = "; ".join(p.value for p in self.phones) or "—"
         parts = [f"Contact name: {self.name.value}, phones: {phones_str}"]
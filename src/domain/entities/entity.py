@@ -1,2 +1,18 @@
+from typing import Any
+
+
 class Entity:
-    pass
+    # Subclasses list their attributes in __slots__, so instances carry no __dict__
+    __slots__ = ()
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The former __dict__ layout, so old and new pickles stay compatible
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name != "__weakref__" and hasattr(self, name)
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
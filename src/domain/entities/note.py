@@ -1,10 +1,11 @@
-from typing import Callable
+from typing import Any, Callable
 
 from src.domain.entities.entity import Entity
 from src.domain.value_objects.tag import Tag
 
 
 class Note(Entity):
+    __slots__ = ("id", "title", "text", "tags")
 
     def __init__(self, title: str, text: str, note_id: str):
         if not title or not title.strip():
@@ -27,7 +28,7 @@ class Note(Entity):
     def add_tag(self, tag: Tag) -> None:
         if tag in self.tags:
             raise ValueError("Tag already exists")
-        self.tags.append(tag)
+        self.tags.append(tag.interned())
 
     def remove_tag(self, tag: Tag) -> None:
         if tag not in self.tags:
@@ -44,6 +45,11 @@ class Note(Entity):
             raise ValueError("Note text cannot be empty")
         self.text = new_text.strip()
 
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        super().__setstate__(state)
+        # Older pickles hold one Tag per note; share them like loads do
+        self.tags = [tag.interned() for tag in self.tags]
+
     def __str__(self) -> str:
         tags_str = ", ".join(str(tag) for tag in self.tags) if self.tags else "no tags"
         preview = self.text[:50] + "..." if len(self.text) > 50 else self.text
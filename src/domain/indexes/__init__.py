@@ -0,0 +1,13 @@
+from src.domain.indexes.birthday_index import BirthdayIndex
+from src.domain.indexes.contact_index import ContactIndex
+from src.domain.indexes.name_index import NameIndex
+from src.domain.indexes.phone_index import PhoneIndex
+from src.domain.indexes.trigram_index import TrigramIndex
+
+__all__ = [
+    "BirthdayIndex",
+    "ContactIndex",
+    "NameIndex",
+    "PhoneIndex",
+    "TrigramIndex",
+]
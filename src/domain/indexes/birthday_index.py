@@ -0,0 +1,115 @@
+from array import array
+from bisect import bisect_left, insort
+from datetime import date, timedelta
+from typing import Optional
+
+from src.config.date_format_config import DateFormatConfig
+from src.domain.entities.contact import Contact
+from src.domain.indexes.contact_index import ContactIndex
+from src.domain.utils.birthday_utils import get_next_birthday_date, parse_date
+
+# Calendar entries pack (month, day) above the contact's position
+POSITION_BITS = 40
+POSITION_MASK = (1 << POSITION_BITS) - 1
+DAYS_IN_YEAR = 365
+
+
+def calendar_key(month: int, day: int) -> int:
+    return (month * 32 + day) << POSITION_BITS
+
+
+class BirthdayIndex(ContactIndex):
+
+    def __init__(self):
+        self._birthdays: dict[str, tuple[str, date]] = {}
+        # Positions follow insertion order, so ties keep the book's order
+        self._positions: dict[str, int] = {}
+        self._ids: dict[int, str] = {}
+        self._next_position = 0
+        # Sorted by (month, day), built on the first window query
+        self._calendar: Optional[array] = None
+
+    def add(self, contact: Contact) -> None:
+        self.update(contact)
+
+    def discard(self, contact_id: str) -> None:
+        position = self._positions.pop(contact_id, None)
+        if position is None:
+            return
+        self._unschedule(contact_id, position)
+        del self._ids[position]
+
+    def update(self, contact: Contact) -> None:
+        value = contact.birthday.value if contact.birthday else None
+        position = self._positions.get(contact.id)
+        if position is None:
+            position = self._next_position
+            self._next_position += 1
+            self._positions[contact.id] = position
+            self._ids[position] = contact.id
+        else:
+            old = self._birthdays.get(contact.id)
+            if (old[0] if old else None) == value:
+                return
+            self._unschedule(contact.id, position)
+
+        if value is None:
+            return
+        try:
+            birthday = parse_date(value, DateFormatConfig.PRIMARY_DATE_FORMAT)
+        except ValueError:
+            # Like the scan, birthdays that do not parse are never upcoming
+            return
+        self._birthdays[contact.id] = (value, birthday)
+        if self._calendar is not None:
+            insort(self._calendar, self._entry(birthday, position))
+
+    def upcoming(self, today: date, days_ahead: int) -> list[tuple[str, date]]:
+        if days_ahead < 0:
+            return []
+        last_day = today + timedelta(days=days_ahead)
+        matches = []
+        for entry in self._window(today, last_day, days_ahead):
+            position = entry & POSITION_MASK
+            contact_id = self._ids[position]
+            birthday = self._birthdays[contact_id][1]
+            # Shared with the scan, so Feb 29 moves to Mar 1 in the same way
+            next_birthday = get_next_birthday_date(birthday, today)
+            if next_birthday <= last_day:
+                matches.append((next_birthday, position, contact_id))
+        matches.sort()
+        return [(contact_id, next_birthday) for next_birthday, _, contact_id in matches]
+
+    def _window(self, today: date, last_day: date, days_ahead: int) -> list[int]:
+        calendar = self._calendar_entries()
+        if days_ahead >= DAYS_IN_YEAR:
+            return calendar.tolist()
+        start = bisect_left(calendar, calendar_key(today.month, today.day))
+        end = bisect_left(calendar, calendar_key(last_day.month, last_day.day + 1))
+        if (today.month, today.day) <= (last_day.month, last_day.day):
+            return calendar[start:end].tolist()
+        # The window wraps past the end of the year
+        return calendar[start:].tolist() + calendar[:end].tolist()
+
+    def _calendar_entries(self) -> array:
+        if self._calendar is None:
+            # Sorted once, so loading a book never pays for per-contact inserts
+            self._calendar = array(
+                "Q",
+                sorted(
+                    self._entry(birthday, self._positions[contact_id])
+                    for contact_id, (_, birthday) in self._birthdays.items()
+                ),
+            )
+        return self._calendar
+
+    def _unschedule(self, contact_id: str, position: int) -> None:
+        old = self._birthdays.pop(contact_id, None)
+        if old is None or self._calendar is None:
+            return
+        entry = self._entry(old[1], position)
+        del self._calendar[bisect_left(self._calendar, entry)]
+
+    @staticmethod
+    def _entry(birthday: date, position: int) -> int:
+        return calendar_key(birthday.month, birthday.day) | position
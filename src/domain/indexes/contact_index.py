@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+
+from src.domain.entities.contact import Contact
+
+
+class ContactIndex(ABC):
+
+    @abstractmethod
+    def add(self, contact: Contact) -> None:
+        pass
+
+    @abstractmethod
+    def discard(self, contact_id: str) -> None:
+        pass
+
+    def update(self, contact: Contact) -> None:
+        # Contacts are edited in place, so entries are found by ID, not old values
+        self.discard(contact.id)
+        self.add(contact)
+
+
+def add_posting(postings: dict[str, dict[str, None]], key: str, contact_id: str):
+    postings.setdefault(key, {})[contact_id] = None
+
+
+def remove_posting(postings: dict[str, dict[str, None]], key: str, contact_id: str):
+    ids = postings.get(key)
+    if ids is None:
+        return
+    ids.pop(contact_id, None)
+    if not ids:
+        del postings[key]
@@ -0,0 +1,38 @@
+from src.domain.entities.contact import Contact
+from src.domain.indexes.contact_index import (
+    ContactIndex,
+    add_posting,
+    remove_posting,
+)
+
+
+class NameIndex(ContactIndex):
+
+    def __init__(self):
+        # Dicts as ordered sets: matches come back in insertion order
+        self._exact: dict[str, dict[str, None]] = {}
+        self._folded: dict[str, dict[str, None]] = {}
+        self._names: dict[str, str] = {}
+
+    def add(self, contact: Contact) -> None:
+        name = contact.name.value
+        self._names[contact.id] = name
+        add_posting(self._exact, name, contact.id)
+        add_posting(self._folded, name.casefold(), contact.id)
+
+    def discard(self, contact_id: str) -> None:
+        name = self._names.pop(contact_id, None)
+        if name is None:
+            return
+        remove_posting(self._exact, name, contact_id)
+        remove_posting(self._folded, name.casefold(), contact_id)
+
+    def update(self, contact: Contact) -> None:
+        # Most edits leave the name alone; keep those contacts in place
+        if self._names.get(contact.id) != contact.name.value:
+            super().update(contact)
+
+    def ids(self, name: str, ignore_case: bool = False) -> list[str]:
+        if ignore_case:
+            return list(self._folded.get(name.casefold(), ()))
+        return list(self._exact.get(name, ()))
@@ -0,0 +1,154 @@
+from array import array
+from bisect import bisect_left
+from typing import Iterator, Optional
+
+from src.domain.entities.contact import Contact
+from src.domain.indexes.contact_index import (
+    ContactIndex,
+    add_posting,
+    remove_posting,
+)
+
+# Suffix entries pack a phone slot and a start offset into one unsigned int
+OFFSET_BITS = 6
+OFFSET_MASK = (1 << OFFSET_BITS) - 1
+
+
+class PhoneIndex(ContactIndex):
+
+    def __init__(self):
+        self._by_phone: dict[str, dict[str, None]] = {}
+        self._phones: dict[str, tuple[str, ...]] = {}
+        # Suffix array over every distinct phone, built on the first partial match
+        self._suffixes: Optional[array] = None
+        self._slots: dict[str, int] = {}
+        self._slot_phones: list[Optional[str]] = []
+        self._free_slots: list[int] = []
+
+    def add(self, contact: Contact) -> None:
+        self.update(contact)
+
+    def discard(self, contact_id: str) -> None:
+        for phone in self._phones.pop(contact_id, ()):
+            self._remove(phone, contact_id)
+
+    def update(self, contact: Contact) -> None:
+        # Diff against the indexed phones; a phone edit touches only that phone
+        old = self._phones.get(contact.id, ())
+        new = tuple(dict.fromkeys(phone.value for phone in contact.phones))
+        if old == new:
+            return
+        for phone in old:
+            if phone not in new:
+                self._remove(phone, contact.id)
+        for phone in new:
+            if phone not in old:
+                self._add(phone, contact.id)
+        if new:
+            self._phones[contact.id] = new
+        else:
+            self._phones.pop(contact.id, None)
+
+    def ids(self, digits: str) -> list[str]:
+        return list(self._by_phone.get(digits, ()))
+
+    def ids_ending_with(self, digits: str) -> list[str]:
+        return self._ids_of(
+            phone
+            for phone, offset in self._suffix_matches(digits)
+            if offset + len(digits) == len(phone)
+        )
+
+    def matching_ids(self, digits: str) -> list[str]:
+        # Same rule as Contact.has_phone_matching: the digits are part of a
+        # phone, or a whole phone is part of the digits
+        phones = dict.fromkeys(phone for phone, _ in self._suffix_matches(digits))
+        longest = min(len(digits), OFFSET_MASK + 1)
+        for length in range(1, longest + 1):
+            for start in range(len(digits) - length + 1):
+                part = digits[start : start + length]
+                if part in self._by_phone:
+                    phones[part] = None
+        return self._ids_of(phones)
+
+    def _add(self, phone: str, contact_id: str) -> None:
+        if phone not in self._by_phone and self._suffixes is not None:
+            self._insert_suffixes(phone)
+        add_posting(self._by_phone, phone, contact_id)
+
+    def _remove(self, phone: str, contact_id: str) -> None:
+        remove_posting(self._by_phone, phone, contact_id)
+        if phone not in self._by_phone and self._suffixes is not None:
+            self._delete_suffixes(phone)
+
+    def _ids_of(self, phones) -> list[str]:
+        ids: dict[str, None] = {}
+        for phone in phones:
+            ids.update(self._by_phone[phone])
+        return list(ids)
+
+    def _suffix_matches(self, digits: str) -> Iterator[tuple[str, int]]:
+        suffixes = self._suffix_array()
+        position = bisect_left(suffixes, digits, key=self._suffix)
+        while position < len(suffixes):
+            phone, offset = self._entry(suffixes[position])
+            if not phone.startswith(digits, offset):
+                return
+            yield phone, offset
+            position += 1
+
+    def _suffix_array(self) -> array:
+        if self._suffixes is None:
+            # Built once, then kept sorted entry by entry; bulk loads never pay
+            # for per-phone inserts
+            pairs = sorted(
+                (phone[entry & OFFSET_MASK :], entry)
+                for phone in self._by_phone
+                for entry in self._entries(self._slot_for(phone), phone)
+            )
+            self._suffixes = array("Q", [entry for _, entry in pairs])
+        return self._suffixes
+
+    def _insert_suffixes(self, phone: str) -> None:
+        for entry in self._entries(self._slot_for(phone), phone):
+            suffix = self._suffix(entry)
+            self._suffixes.insert(
+                bisect_left(self._suffixes, suffix, key=self._suffix), entry
+            )
+
+    def _delete_suffixes(self, phone: str) -> None:
+        slot = self._slots.pop(phone)
+        for entry in self._entries(slot, phone):
+            suffix = self._suffix(entry)
+            position = bisect_left(self._suffixes, suffix, key=self._suffix)
+            while self._suffixes[position] != entry:
+                position += 1
+            del self._suffixes[position]
+        self._slot_phones[slot] = None
+        self._free_slots.append(slot)
+
+    def _slot_for(self, phone: str) -> int:
+        slot = self._slots.get(phone)
+        if slot is None:
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self._slot_phones[slot] = phone
+            else:
+                slot = len(self._slot_phones)
+                self._slot_phones.append(phone)
+            self._slots[phone] = slot
+        return slot
+
+    @staticmethod
+    def _entries(slot: int, phone: str) -> list[int]:
+        return [
+            slot << OFFSET_BITS | offset
+            for offset in range(min(len(phone), OFFSET_MASK + 1))
+        ]
+
+    def _entry(self, entry: int) -> tuple[str, int]:
+        return self._slot_phones[entry >> OFFSET_BITS], entry & OFFSET_MASK
+
+    def _suffix(self, entry: int) -> str:
+        phone, offset = self._entry(entry)
+        return phone[offset:]
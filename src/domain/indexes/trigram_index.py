@@ -0,0 +1,129 @@
+from array import array
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Iterable, Optional
+
+from src.domain.entities.contact import Contact
+from src.domain.indexes.contact_index import ContactIndex
+
+GRAM_SIZE = 3
+# Stop narrowing once this few candidates are left; verifying them is cheaper
+ENOUGH_CANDIDATES = 64
+EMPTY_POSTING = array("Q")
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i : i + GRAM_SIZE] for i in range(len(text) - GRAM_SIZE + 1)}
+
+
+def searchable_texts(contact: Contact) -> tuple[str, ...]:
+    texts = [contact.name.value.casefold()]
+    if contact.email:
+        texts.append(str(contact.email).casefold())
+    if contact.address:
+        texts.append(str(contact.address).casefold())
+    return tuple(texts)
+
+
+def texts_trigrams(texts: tuple[str, ...]) -> set[str]:
+    # Per field, so no trigram spans the end of one field and the next
+    return set().union(*(trigrams(text) for text in texts))
+
+
+class TrigramIndex(ContactIndex):
+
+    def __init__(self):
+        # Posting lists hold sorted contact positions, not IDs, to stay compact
+        self._postings: dict[str, array] = {}
+        self._texts: dict[str, tuple[str, ...]] = {}
+        self._positions: dict[str, int] = {}
+        self._ids: dict[int, str] = {}
+        self._next_position = 0
+
+    def add(self, contact: Contact) -> None:
+        self.update(contact)
+
+    def discard(self, contact_id: str) -> None:
+        position = self._positions.pop(contact_id, None)
+        if position is None:
+            return
+        del self._ids[position]
+        for gram in texts_trigrams(self._texts.pop(contact_id)):
+            self._unpost(gram, position)
+
+    def update(self, contact: Contact) -> None:
+        texts = searchable_texts(contact)
+        old = self._texts.get(contact.id)
+        if old == texts:
+            return
+        position = self._positions.get(contact.id)
+        if position is None:
+            # Positions follow insertion order, like the book's own dict
+            position = self._next_position
+            self._next_position += 1
+            self._positions[contact.id] = position
+            self._ids[position] = contact.id
+
+        old_grams = texts_trigrams(old) if old else set()
+        new_grams = texts_trigrams(texts)
+        for gram in old_grams - new_grams:
+            self._unpost(gram, position)
+        for gram in new_grams - old_grams:
+            self._post(gram, position)
+        self._texts[contact.id] = texts
+
+    def candidate_ids(self, search_text: str) -> Optional[list[str]]:
+        grams = trigrams(search_text.casefold())
+        if not grams:
+            # Too short to narrow anything down
+            return None
+        postings = sorted(
+            (self._postings.get(gram, EMPTY_POSTING) for gram in grams), key=len
+        )
+        candidates = postings[0]
+        for posting in postings[1:]:
+            if len(candidates) <= ENOUGH_CANDIDATES:
+                break
+            candidates = [p for p in candidates if self._contains(posting, p)]
+        return [self._ids[position] for position in candidates]
+
+    def similar_ids(
+        self, search_text: str, min_similarity: float
+    ) -> list[tuple[str, float]]:
+        grams = trigrams(search_text.casefold())
+        if not grams:
+            return []
+        shared: Counter[int] = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, EMPTY_POSTING))
+        scored = [
+            (count / len(grams), position)
+            for position, count in shared.items()
+            if count / len(grams) >= min_similarity
+        ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self._ids[position], score) for score, position in scored]
+
+    def in_order(self, contact_ids: Iterable[str]) -> list[str]:
+        return sorted(contact_ids, key=self._positions.__getitem__)
+
+    def _post(self, gram: str, position: int) -> None:
+        posting = self._postings.get(gram)
+        if posting is None:
+            self._postings[gram] = array("Q", (position,))
+        elif posting[-1] < position:
+            # New contacts have the highest position, so loads only append
+            posting.append(position)
+        else:
+            insort(posting, position)
+
+    def _unpost(self, gram: str, position: int) -> None:
+        posting = self._postings[gram]
+        del posting[bisect_left(posting, position)]
+        if not posting:
+            del self._postings[gram]
+
+    @staticmethod
+    def _contains(posting: array, position: int) -> bool:
+        index = bisect_left(posting, position)
+        return index < len(posting) and posting[index] == position
@@ -0,0 +1,238 @@
+import heapq
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Iterator, Optional
+from weakref import WeakValueDictionary
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.config.search_config import SearchConfig
+from src.config.storage_config import StorageConfig
+from src.domain.indexes.contact_index import ContactIndex
+from src.domain.tracked_collection import ChangeSet
+from src.domain.indexes.trigram_index import (
+    searchable_texts,
+    texts_trigrams,
+    trigrams,
+)
+
+
+class LazyAddressBook(AddressBook, ABC):
+
+    def __init__(
+        self,
+        *args,
+        cache_size: int = StorageConfig.LAZY_CONTACT_CACHE_SIZE,
+        **kwargs,
+    ):
+        # self.data holds unsaved contacts and the most recently used saved ones
+        self._cache_size = cache_size
+        self._recent: OrderedDict[str, None] = OrderedDict()
+        # Contacts still held by callers, so lookups keep returning the same one
+        self._live: WeakValueDictionary[str, Contact] = WeakValueDictionary()
+        super().__init__(*args, **kwargs)
+
+    @abstractmethod
+    def _stored_count(self) -> int:
+        pass
+
+    @abstractmethod
+    def _stored_ids(self) -> Iterator[str]:
+        pass
+
+    @abstractmethod
+    def _is_stored(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def _fetch(self, key: str) -> Contact:
+        pass
+
+    def __len__(self) -> int:
+        changes = self.pending_changes()
+        return self._stored_count() + len(changes.created) - len(changes.deleted)
+
+    def __iter__(self) -> Iterator[str]:
+        changes = self.pending_changes()
+        for key in self._stored_ids():
+            if key not in changes.deleted:
+                yield key
+        yield from [key for key in self.data if key in changes.created]
+
+    def __contains__(self, key) -> bool:
+        if key in self.data:
+            return True
+        if key in self.pending_changes().deleted:
+            return False
+        return self._is_stored(key)
+
+    def __getitem__(self, key: str) -> Contact:
+        if key in self.data:
+            if key in self._recent:
+                self._recent.move_to_end(key)
+            return self.data[key]
+        if key in self.pending_changes().deleted:
+            raise KeyError(key)
+        contact = self._live.get(key)
+        if contact is None:
+            contact = self._fetch(key)
+        self._remember(key, contact)
+        return contact
+
+    def __setitem__(self, key: str, value: Contact) -> None:
+        if key not in self.data and key in self:
+            # Stored but not loaded yet: record the write as a modification
+            self.data[key] = value
+        self._recent.pop(key, None)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if key not in self.data:
+            self[key]
+        self._forget(key)
+        super().__delitem__(key)
+
+    def mark_modified(self, key: str) -> None:
+        if key not in self.data:
+            # Edited after leaving the cache; pin it again until it is saved
+            self[key]
+        # Unsaved edits stay in memory, so they never count towards the cache
+        self._recent.pop(key, None)
+        super().mark_modified(key)
+
+    def set_untracked(self, key: str, value: Contact) -> None:
+        self._forget(key)
+        super().set_untracked(key, value)
+        self._remember(key, value)
+
+    def delete_untracked(self, key: str) -> None:
+        self._forget(key)
+        super().delete_untracked(key)
+
+    def discard_cached(self, key: str) -> None:
+        # Saved elsewhere: the next read fetches the stored contact again
+        self._forget(key)
+        self.data.pop(key, None)
+
+    def mark_flushed(self, target: Optional[str] = None) -> None:
+        super().mark_flushed(target)
+        # Saved contacts are clean again and may leave the cache
+        for key, contact in list(self.data.items()):
+            if key not in self._recent:
+                self._remember(key, contact)
+
+    def finish_flush(self, written: ChangeSet, target: Optional[str] = None) -> None:
+        super().finish_flush(written, target)
+        pending = self.pending_changes().upserted
+        for key, contact in list(self.data.items()):
+            if key not in self._recent and key not in pending:
+                self._remember(key, contact)
+
+    def __getstate__(self) -> dict:
+        raise TypeError(f"{type(self).__name__} is bound to its storage")
+
+    def values(self) -> Iterator[Contact]:
+        # Streamed, so a pass over the book does not cache all of it
+        for key in self:
+            yield self._streamed(key, lambda: self._fetch(key))
+
+    def get_ids(self) -> set[str]:
+        return set(iter(self))
+
+    def find(self, contact_name: str, ignore_case: bool = False) -> Contact:
+        matches = self.find_all(contact_name, ignore_case)
+        if not matches:
+            raise KeyError("Contact not found")
+        return matches[0]
+
+    def find_all(self, contact_name: str, ignore_case: bool = False) -> list[Contact]:
+        return [
+            contact
+            for contact in self.values()
+            if self._has_name(contact, contact_name, ignore_case)
+        ]
+
+    def find_by_id(self, contact_id: str) -> Optional[Contact]:
+        try:
+            return self[contact_id]
+        except KeyError:
+            return None
+
+    def find_by_phone(self, phone: str) -> list[Contact]:
+        return [
+            contact
+            for contact in self.values()
+            if any(p.value == phone for p in contact.phones)
+        ]
+
+    def find_by_phone_suffix(self, digits: str) -> list[Contact]:
+        return [
+            contact
+            for contact in self.values()
+            if any(p.value.endswith(digits) for p in contact.phones)
+        ]
+
+    def search(self, search_text: str, exact: bool = False) -> list[Contact]:
+        return [
+            contact
+            for contact in self.values()
+            if contact.is_matching(search_text, exact)
+        ]
+
+    def fuzzy_search(
+        self,
+        search_text: str,
+        limit: int = SearchConfig.FUZZY_MAX_RESULTS,
+        min_similarity: float = SearchConfig.FUZZY_MIN_SIMILARITY,
+    ) -> list[Contact]:
+        grams = trigrams(search_text.casefold())
+        if not grams:
+            return []
+        scored = (
+            (-self._similarity(grams, contact), position, contact)
+            for position, contact in enumerate(self.values())
+        )
+        # nsmallest keeps only the best matches while the book streams past
+        best = heapq.nsmallest(
+            limit, (item for item in scored if -item[0] >= min_similarity)
+        )
+        return [contact for _, _, contact in best]
+
+    def get_upcoming_birthdays(self, days_ahead) -> list[dict]:
+        return self._collect_upcoming_birthdays(self.values(), days_ahead)
+
+    def _indexes(self) -> tuple[ContactIndex, ...]:
+        # Only part of the book is cached in memory, so lookups query storage
+        return ()
+
+    def _streamed(self, key: str, build: Callable[[], Contact]) -> Contact:
+        contact = self.data.get(key) or self._live.get(key)
+        if contact is None:
+            contact = build()
+            self._live[key] = contact
+        return contact
+
+    def _remember(self, key: str, contact: Contact) -> None:
+        self.data[key] = contact
+        self._live[key] = contact
+        self._recent[key] = None
+        self._recent.move_to_end(key)
+        upserted = self.pending_changes().upserted
+        while len(self._recent) > self._cache_size:
+            evicted, _ = self._recent.popitem(last=False)
+            if evicted not in upserted:
+                self.data.pop(evicted, None)
+
+    def _forget(self, key: str) -> None:
+        self._recent.pop(key, None)
+        self._live.pop(key, None)
+
+    @staticmethod
+    def _similarity(grams: set[str], contact: Contact) -> float:
+        return len(grams & texts_trigrams(searchable_texts(contact))) / len(grams)
+
+    @staticmethod
+    def _has_name(contact: Contact, contact_name: str, ignore_case: bool) -> bool:
+        if ignore_case:
+            return contact.name.value.casefold() == contact_name.casefold()
+        return contact.name.value == contact_name
@@ -1,5 +1,6 @@
 from src.domain.entities.contact import Contact
 from src.domain.models.dbcontact import DBContact
+from src.domain.models.dbcontact_phone import DBContactPhone
 from src.domain.value_objects.name import Name
 from src.domain.value_objects.phone import Phone
 from src.domain.value_objects.email import Email
@@ -14,7 +15,10 @@ class ContactMapper:
         return DBContact(
             id=data.id,
             name=data.name.value,
-            phones=",".join(phone.value for phone in data.phones),
+            phones=[
+                DBContactPhone(contact_id=data.id, position=position, phone=phone.value)
+                for position, phone in enumerate(data.phones)
+            ],
             birthday=data.birthday.value if data.birthday else None,
             email=data.email.value if data.email else None,
             address=data.address.value if data.address else None,
@@ -25,10 +29,9 @@ class ContactMapper:
         name_vo = Name(data.name)
         contact = Contact(name=name_vo, contact_id=data.id)
 
-        if data.phones:
-            for phone_str in data.phones.split(","):
-                phone_vo = Phone(phone_str)
-                contact.add_phone(phone_vo)
+        for db_phone in data.phones:
+            phone_vo = Phone(db_phone.phone)
+            contact.add_phone(phone_vo)
 
         if data.birthday:
             birthday_vo = Birthday(data.birthday)
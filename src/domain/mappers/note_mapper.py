@@ -1,5 +1,6 @@
 from src.domain.entities.note import Note
 from src.domain.models.dbnote import DBNote
+from src.domain.models.dbnote_tag import DBNoteTag
 from src.domain.value_objects.tag import Tag
 
 
@@ -11,15 +12,17 @@ class NoteMapper:
             id=data.id,
             title=data.title,
             text=data.text,
-            tags=",".join(str(tag) for tag in data.tags) if data.tags else None,
+            tags=[
+                DBNoteTag(note_id=data.id, position=position, tag=tag.value)
+                for position, tag in enumerate(data.tags)
+            ],
         )
 
     @staticmethod
     def from_dbmodel(data: DBNote) -> Note:
         note = Note(title=data.title, text=data.text, note_id=data.id)
 
-        if data.tags:
-            for tag_str in data.tags.split(","):
-                tag_vo = Tag(tag_str.strip())
-                note.add_tag(tag_vo)
+        for db_tag in data.tags:
+            tag_vo = Tag(db_tag.tag)
+            note.add_tag(tag_vo)
         return note
@@ -1,5 +1,7 @@
 from src.domain.models.dbbase import DBBase
 from src.domain.models.dbcontact import DBContact
+from src.domain.models.dbcontact_phone import DBContactPhone
 from src.domain.models.dbnote import DBNote
+from src.domain.models.dbnote_tag import DBNoteTag
 
-__all__ = ["DBBase", "DBContact", "DBNote"]
+__all__ = ["DBBase", "DBContact", "DBContactPhone", "DBNote", "DBNoteTag"]
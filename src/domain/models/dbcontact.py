@@ -1,15 +1,28 @@
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, String, text
+from sqlalchemy.orm import relationship
 
 from src.domain.models.dbbase import DBBase
+from src.domain.models.dbcontact_phone import DBContactPhone
+
+# Birthdays are stored as dd.mm.yyyy; this yields an "mmdd" sort key
+BIRTHDAY_MONTH_DAY_SQL = "substr(birthday, 4, 2) || substr(birthday, 1, 2)"
 
 
 class DBContact(DBBase):
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_birthday_month_day", text(BIRTHDAY_MONTH_DAY_SQL)),
+    )
 
     id = Column(String, primary_key=True)
-    name = Column(String, nullable=False)
+    name = Column(String, nullable=False, index=True)
     birthday = Column(String, nullable=True)
-    # Comma-separated phone numbers
-    phones = Column(String, nullable=True)
     email = Column(String, nullable=True)
     address = Column(String, nullable=True)
+
+    phones = relationship(
+        DBContactPhone,
+        cascade="all, delete-orphan",
+        order_by=DBContactPhone.position,
+        lazy="selectin",
+    )
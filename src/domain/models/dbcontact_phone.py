@@ -0,0 +1,14 @@
+from sqlalchemy import Column, ForeignKey, Integer, String
+
+from src.domain.models.dbbase import DBBase
+
+
+class DBContactPhone(DBBase):
+    __tablename__ = "contact_phones"
+
+    contact_id = Column(
+        String, ForeignKey("contacts.id", ondelete="CASCADE"), primary_key=True
+    )
+    position = Column(Integer, primary_key=True)
+    # Normalized digits only
+    phone = Column(String, nullable=False, index=True)
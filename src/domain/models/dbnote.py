@@ -1,6 +1,8 @@
 from sqlalchemy import Column, String
+from sqlalchemy.orm import relationship
 
 from src.domain.models.dbbase import DBBase
+from src.domain.models.dbnote_tag import DBNoteTag
 
 
 class DBNote(DBBase):
@@ -9,5 +11,10 @@ class DBNote(DBBase):
     id = Column(String, primary_key=True)
     title = Column(String, nullable=False)
     text = Column(String, nullable=False)
-    # Comma-separated tags
-    tags = Column(String, nullable=True)
+
+    tags = relationship(
+        DBNoteTag,
+        cascade="all, delete-orphan",
+        order_by=DBNoteTag.position,
+        lazy="selectin",
+    )
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, ForeignKey, Integer, String
+
+from src.domain.models.dbbase import DBBase
+
+
+class DBNoteTag(DBBase):
+    __tablename__ = "note_tags"
+
+    note_id = Column(
+        String, ForeignKey("notes.id", ondelete="CASCADE"), primary_key=True
+    )
+    position = Column(Integer, primary_key=True)
+    # Case-insensitive so tag lookups can use the index
+    tag = Column(String(collation="NOCASE"), nullable=False, index=True)
@@ -1,5 +1,5 @@
-from collections import UserDict
+from src.domain.tracked_collection import TrackedCollection
 
 
-class Notebook(UserDict):
+class Notebook(TrackedCollection):
     pass
@@ -0,0 +1,134 @@
+from collections import UserDict
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+
+@dataclass
+class ChangeSet:
+    created: set[str] = field(default_factory=set)
+    modified: set[str] = field(default_factory=set)
+    deleted: set[str] = field(default_factory=set)
+
+    @property
+    def upserted(self) -> set[str]:
+        return self.created | self.modified
+
+    def is_empty(self) -> bool:
+        return not (self.created or self.modified or self.deleted)
+
+
+class TrackedCollection(UserDict):
+
+    def __init__(self, *args, **kwargs):
+        self._changes = ChangeSet()
+        self._flushed_to: Optional[str] = None
+        self._unlogged: set[str] = set()
+        # Keys edited while a save runs outside the mutation lock
+        self._edited_in_flush: Optional[set[str]] = None
+        super().__init__(*args, **kwargs)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._touch(key)
+        if key in self._changes.deleted:
+            self._changes.deleted.discard(key)
+            self._changes.modified.add(key)
+        elif key not in self.data:
+            self._changes.created.add(key)
+        elif key not in self._changes.created:
+            self._changes.modified.add(key)
+        self.data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.data[key]
+        self._touch(key)
+        if key in self._changes.created:
+            self._changes.created.discard(key)
+        else:
+            self._changes.modified.discard(key)
+            self._changes.deleted.add(key)
+
+    def mark_modified(self, key: str) -> None:
+        if key not in self.data:
+            raise KeyError(key)
+        self._touch(key)
+        if key not in self._changes.created:
+            self._changes.modified.add(key)
+
+    def set_untracked(self, key: str, value: Any) -> None:
+        # For values already matching the saved state, such as merged remote saves
+        self.data[key] = value
+
+    def delete_untracked(self, key: str) -> None:
+        del self.data[key]
+
+    def pending_changes(self) -> ChangeSet:
+        return self._changes
+
+    @property
+    def flushed_to(self) -> Optional[str]:
+        return self._flushed_to
+
+    def take_unlogged(self) -> set[str]:
+        # Keys touched since the last call, for appending to a write-ahead log
+        keys, self._unlogged = self._unlogged, set()
+        return keys
+
+    def is_flushed_to(self, target: str) -> bool:
+        return self._flushed_to == target
+
+    def mark_flushed(self, target: Optional[str] = None) -> None:
+        self._changes = ChangeSet()
+        self._flushed_to = target
+
+    def begin_flush(self) -> ChangeSet:
+        # Copy of the changes handed to a save that runs while edits go on
+        self._edited_in_flush = set()
+        changes = self._changes
+        return ChangeSet(
+            set(changes.created), set(changes.modified), set(changes.deleted)
+        )
+
+    def finish_flush(self, written: ChangeSet, target: Optional[str] = None) -> None:
+        # Keys edited since begin_flush stay pending; the save wrote older state
+        edited = self._edited_in_flush or set()
+        self._edited_in_flush = None
+        changes = self._changes
+        changes.created -= written.created - edited
+        changes.modified -= written.modified - edited
+        changes.deleted -= written.deleted - edited
+        for key in edited & written.upserted:
+            if key not in self.data and key not in changes.deleted:
+                # Created and saved, then deleted before the save finished
+                changes.deleted.add(key)
+            elif key in changes.created:
+                changes.created.discard(key)
+                changes.modified.add(key)
+        self._flushed_to = target
+
+    def abort_flush(self) -> None:
+        self._edited_in_flush = None
+
+    def adopt_changes(self, changes: ChangeSet, target: Optional[str]) -> None:
+        # For a detached copy that is saved in place of the original
+        self._changes = changes
+        self._flushed_to = target
+
+    def _touch(self, key: str) -> None:
+        self._unlogged.add(key)
+        if self._edited_in_flush is not None:
+            self._edited_in_flush.add(key)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.pop("_changes", None)
+        state.pop("_flushed_to", None)
+        state.pop("_unlogged", None)
+        state.pop("_edited_in_flush", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._changes = ChangeSet()
+        self._flushed_to = None
+        self._unlogged = set()
+        self._edited_in_flush = None
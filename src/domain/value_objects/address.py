@@ -1,10 +1,14 @@
 from dataclasses import dataclass
+from weakref import WeakValueDictionary
 from src.domain.value_objects.field import Field
 from src.domain.validators.address_validator import AddressValidator
 
 
-@dataclass
+@dataclass(frozen=True)
 class Address(Field):
+    __slots__ = ("__weakref__",)
+    # Shared addresses, such as a bare city, repeat across many contacts
+    _interned = WeakValueDictionary()
 
     def __init__(self, address: str):
         AddressValidator.validate_and_raise(address)
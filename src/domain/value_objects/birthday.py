@@ -3,8 +3,9 @@ from src.domain.validators.birthday_validator import BirthdayValidator
 from src.domain.value_objects.field import Field
 
 
-@dataclass
+@dataclass(frozen=True)
 class Birthday(Field):
+    __slots__ = ()
 
     def __init__(self, value: str):
         validate_result = BirthdayValidator.validate(value)
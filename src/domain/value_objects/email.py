@@ -3,8 +3,9 @@ from src.domain.validators.email_validator import EmailValidator
 from src.domain.value_objects.field import Field
 
 
-@dataclass
+@dataclass(frozen=True)
 class Email(Field):
+    __slots__ = ()
 
     def __init__(self, value: str):
         EmailValidator.validate_and_raise(value)
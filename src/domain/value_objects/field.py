@@ -1,13 +1,38 @@
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, ClassVar, Optional
+from weakref import WeakValueDictionary
 
 
-@dataclass
+@dataclass(frozen=True)
 class Field:
+    # Slotted and immutable: no per-instance __dict__, and safe to share
+    __slots__ = ("value",)
     value: Any
+    # Subclasses with often repeated values share one instance per value;
+    # they need a __weakref__ slot so unused values are dropped
+    _interned: ClassVar[Optional[WeakValueDictionary]] = None
 
     def __init__(self, value: Any):
-        self.value = value
+        object.__setattr__(self, "value", value)
+
+    @classmethod
+    def from_trusted(cls, value: Any) -> "Field":
+        # Skips validation and normalization for values this app stored itself
+        field = cls.__new__(cls)
+        object.__setattr__(field, "value", value)
+        return field.interned()
+
+    def interned(self) -> "Field":
+        if self._interned is None:
+            return self
+        return self._interned.setdefault(self.value, self)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # The former __dict__ layout, so old and new pickles stay compatible
+        return {"value": self.value}
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        object.__setattr__(self, "value", state["value"])
 
     def __str__(self) -> str:
         return str(self.value) if self.value is not None else ""
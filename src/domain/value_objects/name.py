@@ -3,8 +3,9 @@ from src.domain.validators.name_validator import NameValidator
 from src.domain.value_objects.field import Field
 
 
-@dataclass
+@dataclass(frozen=True)
 class Name(Field):
+    __slots__ = ()
 
     def __init__(self, value: str):
         NameValidator.validate_and_raise(value)
@@ -3,8 +3,9 @@ from src.domain.validators.note_text_validator import NoteTextValidator
 from src.domain.value_objects.field import Field
 
 
-@dataclass
+@dataclass(frozen=True)
 class NoteText(Field):
+    __slots__ = ()
 
     def __init__(self, value: str):
         NoteTextValidator.validate_and_raise(value)
@@ -3,8 +3,9 @@ from src.domain.validators.phone_validator import PhoneValidator
 from src.domain.value_objects.field import Field
 
 
-@dataclass
+@dataclass(frozen=True)
 class Phone(Field):
+    __slots__ = ()
 
     def __init__(self, raw: str):
         digits = PhoneValidator.normalize(raw)
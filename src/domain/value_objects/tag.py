@@ -1,10 +1,14 @@
 from dataclasses import dataclass
+from weakref import WeakValueDictionary
 from src.domain.validators.tag_validator import TagValidator
 from src.domain.value_objects.field import Field
 
 
-@dataclass
+@dataclass(frozen=True)
 class Tag(Field):
+    __slots__ = ("__weakref__",)
+    # Few distinct tags repeat across many notes
+    _interned = WeakValueDictionary()
 
     def __init__(self, value: str):
         TagValidator.validate_and_raise(value)
@@ -0,0 +1,13 @@
+from src.infrastructure.backup.backup_store import (
+    BackupManifest,
+    BackupReport,
+    BackupStore,
+)
+from src.infrastructure.backup.chunker import Chunker
+
+__all__ = [
+    "BackupManifest",
+    "BackupReport",
+    "BackupStore",
+    "Chunker",
+]
@@ -0,0 +1,278 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.backup.chunker import Chunker
+from src.infrastructure.persistence.data_path_resolver import (
+    HOME_BACKUP_DIR,
+    HOME_DATA_DIR,
+)
+from src.infrastructure.storage.file_lock import LOCK_SUFFIX, FileLock
+
+CHUNKS_DIR = "chunks"
+MANIFESTS_DIR = "manifests"
+MANIFEST_FORMAT_VERSION = 1
+SQLITE_HEADER = b"SQLite format 3\x00"
+# Journal files are folded into the snapshot taken of their database
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm", "-journal")
+
+
+@dataclass
+class BackupReport:
+    backup_id: str
+    files: int = 0
+    total_bytes: int = 0
+    new_chunks: int = 0
+    new_bytes: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"Backup {self.backup_id}: {self.files} files, "
+            f"{self.total_bytes:,} bytes, {self.new_chunks} new chunks "
+            f"({self.new_bytes:,} bytes stored)"
+        )
+
+
+@dataclass
+class BackupManifest:
+    backup_id: str
+    created: str
+    files: dict[str, dict] = field(default_factory=dict)
+
+
+class BackupStore:
+
+    def __init__(
+        self, root: Path = Path(HOME_BACKUP_DIR), chunker: Optional[Chunker] = None
+    ):
+        self.root = Path(root)
+        self.chunker = chunker if chunker else Chunker()
+
+    def backup(self, data_dir: Path) -> BackupReport:
+        data_dir = Path(data_dir)
+        created = datetime.now(timezone.utc)
+        backup_id = created.strftime("%Y%m%dT%H%M%S%fZ")
+        report = BackupReport(backup_id)
+        manifest = BackupManifest(backup_id, created.isoformat())
+
+        for path in self._data_files(data_dir):
+            relative = path.relative_to(data_dir).as_posix()
+            manifest.files[relative] = self._backup_file(path, report)
+            report.files += 1
+
+        document = {
+            "format_version": MANIFEST_FORMAT_VERSION,
+            "id": manifest.backup_id,
+            "created": manifest.created,
+            "files": manifest.files,
+        }
+        # The manifest goes last: a crash before it leaves only unused chunks
+        self._write_atomic(
+            self._manifest_path(backup_id),
+            (json.dumps(document, indent=2).encode("utf-8"),),
+        )
+        return report
+
+    def list_backups(self) -> list[BackupManifest]:
+        directory = self.root / MANIFESTS_DIR
+        if not directory.is_dir():
+            return []
+        return [
+            self.manifest(path.stem) for path in sorted(directory.glob("*.json"))
+        ]
+
+    def manifest(self, backup_id: str) -> BackupManifest:
+        path = self._manifest_path(backup_id)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format_version") != MANIFEST_FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported manifest format: {data.get('format_version')}"
+                )
+            return BackupManifest(data["id"], data["created"], data["files"])
+        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+            raise IOError(f"Failed to read backup {backup_id}: {e}") from e
+
+    def iter_file(self, backup_id: str, relative_path: str) -> Iterator[bytes]:
+        entry = self.manifest(backup_id).files.get(relative_path)
+        if entry is None:
+            raise IOError(f"Backup {backup_id} has no file {relative_path}")
+        for digest in entry["chunks"]:
+            yield self._read_chunk(digest)
+
+    def restore(
+        self, backup_id: str, target_dir: Path, files: Optional[list[str]] = None
+    ) -> int:
+        manifest = self.manifest(backup_id)
+        target_dir = Path(target_dir)
+        # Every path is checked before anything is written
+        targets = [
+            (self._restore_path(target_dir, relative), entry)
+            for relative, entry in manifest.files.items()
+            if files is None or relative in files
+        ]
+        for path, entry in targets:
+            chunks = (self._read_chunk(digest) for digest in entry["chunks"])
+            self._write_atomic(path, chunks)
+        return len(targets)
+
+    @staticmethod
+    def _restore_path(target_dir: Path, relative: str) -> Path:
+        # A crafted manifest must not write outside the restore directory
+        root = target_dir.resolve()
+        path = (root / relative).resolve()
+        if not path.is_relative_to(root) or path == root:
+            raise IOError(f"Backup path {relative!r} is outside {target_dir}")
+        return path
+
+    def _backup_file(self, path: Path, report: BackupReport) -> dict:
+        digests = []
+        size = 0
+        try:
+            with self._stable_copy(path) as source, open(source, "rb") as f:
+                for chunk in self.chunker.chunks(f):
+                    digest = hashlib.sha256(chunk).hexdigest()
+                    if self._store_chunk(digest, chunk):
+                        report.new_chunks += 1
+                        report.new_bytes += len(chunk)
+                    digests.append(digest)
+                    size += len(chunk)
+        except (OSError, sqlite3.Error) as e:
+            raise IOError(f"Failed to back up {path.name}: {e}") from e
+        report.total_bytes += size
+        return {"size": size, "chunks": digests}
+
+    @contextmanager
+    def _stable_copy(self, path: Path) -> Iterator[Path]:
+        if not self._is_sqlite(path):
+            with self._read_lock(path):
+                yield path
+            return
+
+        # A live database may keep committed pages in its -wal file, so
+        # copy a consistent snapshot through SQLite instead of the raw file
+        self.root.mkdir(parents=True, exist_ok=True)
+        fd, name = tempfile.mkstemp(dir=self.root, prefix=f".{path.name}.")
+        os.close(fd)
+        snapshot = Path(name)
+        try:
+            source = sqlite3.connect(path)
+            try:
+                target = sqlite3.connect(snapshot)
+                try:
+                    source.backup(target)
+                finally:
+                    target.close()
+            finally:
+                source.close()
+            yield snapshot
+        finally:
+            snapshot.unlink(missing_ok=True)
+
+    @staticmethod
+    def _read_lock(path: Path):
+        # Shared lock, so a concurrent save cannot replace the file mid-read.
+        # Only files a storage has locked have a sidecar; others get none.
+        lock = FileLock(path, shared=True)
+        if StorageConfig.FILE_LOCKING and lock.path.exists():
+            return lock
+        return nullcontext()
+
+    @staticmethod
+    def _is_sqlite(path: Path) -> bool:
+        with open(path, "rb") as f:
+            return f.read(len(SQLITE_HEADER)) == SQLITE_HEADER
+
+    def _store_chunk(self, digest: str, chunk: bytes) -> bool:
+        path = self._chunk_path(digest)
+        if path.exists():
+            return False
+        self._write_atomic(path, (chunk,))
+        return True
+
+    def _read_chunk(self, digest: str) -> bytes:
+        try:
+            chunk = self._chunk_path(digest).read_bytes()
+        except OSError as e:
+            raise IOError(f"Failed to read chunk {digest}: {e}") from e
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise IOError(f"Chunk {digest} is corrupted")
+        return chunk
+
+    def _write_atomic(self, path: Path, chunks: Iterable[bytes]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=path.parent, delete=False, prefix=f".{path.name}."
+            ) as tmp:
+                tmp_file = Path(tmp.name)
+                for chunk in chunks:
+                    tmp.write(chunk)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            os.replace(tmp_file, path)
+        except OSError as e:
+            if tmp_file is not None:
+                tmp_file.unlink(missing_ok=True)
+            raise IOError(f"Failed to write {path.name}: {e}") from e
+
+    def _data_files(self, data_dir: Path) -> Iterator[Path]:
+        root = self.root.resolve()
+        for path in sorted(data_dir.rglob("*")):
+            if not path.is_file() or path.name.endswith(LOCK_SUFFIX):
+                continue
+            if path.name.endswith(SQLITE_SIDECAR_SUFFIXES):
+                continue
+            if path.resolve().is_relative_to(root):
+                continue
+            yield path
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.root / CHUNKS_DIR / digest[:2] / digest
+
+    def _manifest_path(self, backup_id: str) -> Path:
+        return self.root / MANIFESTS_DIR / f"{backup_id}.json"
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="Deduplicating backups of the data directory"
+    )
+    arg_parser.add_argument(
+        "--store", type=Path, default=Path(HOME_BACKUP_DIR), help="backup directory"
+    )
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("create", help="back up the data directory")
+    create.add_argument("data_dir", type=Path, nargs="?", default=Path(HOME_DATA_DIR))
+    commands.add_parser("list", help="list backups, oldest first")
+    restore = commands.add_parser("restore", help="restore a backup")
+    restore.add_argument("backup_id")
+    restore.add_argument("target_dir", type=Path)
+    restore.add_argument("files", nargs="*", help="only restore these files")
+    args = arg_parser.parse_args(argv)
+
+    store = BackupStore(args.store)
+    if args.command == "create":
+        print(store.backup(args.data_dir))
+    elif args.command == "list":
+        for manifest in store.list_backups():
+            size = sum(entry["size"] for entry in manifest.files.values())
+            print(f"{manifest.backup_id}  {len(manifest.files)} files  {size:,} bytes")
+    else:
+        restored = store.restore(args.backup_id, args.target_dir, args.files or None)
+        print(f"Restored {restored} files to {args.target_dir}")
+
+
+if __name__ == "__main__":
+    main()
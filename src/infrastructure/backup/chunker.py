@@ -0,0 +1,64 @@
+import random
+from typing import BinaryIO, Iterator
+
+from src.config.storage_config import StorageConfig
+
+READ_SIZE = 1024 * 1024
+HASH_MASK = (1 << 64) - 1
+
+# Fixed seed: chunk boundaries must be identical across runs and machines
+_gear_random = random.Random(0x6765_6172)
+GEAR = tuple(_gear_random.getrandbits(64) for _ in range(256))
+
+
+class Chunker:
+
+    def __init__(
+        self,
+        min_size: int = StorageConfig.BACKUP_CHUNK_MIN_SIZE,
+        avg_size: int = StorageConfig.BACKUP_CHUNK_AVG_SIZE,
+        max_size: int = StorageConfig.BACKUP_CHUNK_MAX_SIZE,
+    ):
+        if avg_size & (avg_size - 1):
+            raise ValueError("Average chunk size must be a power of two")
+        if not 0 < min_size <= avg_size <= max_size:
+            raise ValueError("Chunk sizes must satisfy 0 < min <= avg <= max")
+        self.min_size = min_size
+        self.max_size = max_size
+        # Test the high bits: in a gear hash they depend on the last 64 bytes
+        bits = avg_size.bit_length() - 1
+        self._mask = ((1 << bits) - 1) << (64 - bits)
+
+    def chunks(self, stream: BinaryIO) -> Iterator[bytes]:
+        buffer = b""
+        while True:
+            data = stream.read(READ_SIZE)
+            if not data:
+                break
+            buffer += data
+            start = 0
+            while len(buffer) - start >= self.max_size:
+                end = self._cut(buffer, start)
+                yield buffer[start:end]
+                start = end
+            buffer = buffer[start:]
+
+        start = 0
+        while start < len(buffer):
+            end = self._cut(buffer, start)
+            yield buffer[start:end]
+            start = end
+
+    def _cut(self, buffer: bytes, start: int) -> int:
+        end = min(start + self.max_size, len(buffer))
+        if end - start <= self.min_size:
+            return end
+        # Bytes inside the minimum size can never end a chunk, so skip hashing them
+        gear = GEAR
+        mask = self._mask
+        fingerprint = 0
+        for position in range(start + self.min_size, end):
+            fingerprint = ((fingerprint << 1) + gear[buffer[position]]) & HASH_MASK
+            if not fingerprint & mask:
+                return position + 1
+        return end
@@ -0,0 +1,199 @@
+import argparse
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+from src.config.storage_config import StorageConfig
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.notebook import Notebook
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.serialization.json_serializer import JsonSerializer
+from src.infrastructure.storage.storage import Storage
+from src.infrastructure.storage.storage_factory import StorageFactory
+from src.infrastructure.storage.storage_type import StorageType
+
+
+@dataclass(frozen=True)
+class ConversionReport:
+    kind: str
+    records: int
+    seconds: float
+
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds > 0 else float(self.records)
+
+    def __str__(self) -> str:
+        return (
+            f"Converted {self.records} {self.kind} in {self.seconds:.2f} s "
+            f"({self.records_per_second:,.0f} records/s)"
+        )
+
+
+class StorageConverter:
+
+    def __init__(
+        self,
+        serializer: Optional[JsonSerializer] = None,
+        batch_size: int = StorageConfig.CONVERTER_BATCH_SIZE,
+        progress: Optional[Callable[[int], None]] = None,
+    ):
+        self.serializer = serializer if serializer else JsonSerializer()
+        self.batch_size = batch_size
+        self.progress = progress
+
+    def convert_contacts(
+        self, source: Storage, source_name: str, target: Storage, target_name: str
+    ) -> ConversionReport:
+        started = time.perf_counter()
+        counter = self._counted(self._unique(self._read_contacts(source, source_name)))
+        self._write_contacts(target, target_name, counter)
+        elapsed = time.perf_counter() - started
+        return ConversionReport("contacts", counter.count, elapsed)
+
+    def convert_notes(
+        self, source: Storage, source_name: str, target: Storage, target_name: str
+    ) -> ConversionReport:
+        started = time.perf_counter()
+        counter = self._counted(self._unique(self._read_notes(source, source_name)))
+        self._write_notes(target, target_name, counter)
+        return ConversionReport("notes", counter.count, time.perf_counter() - started)
+
+    def _read_contacts(self, storage: Storage, filename: str) -> Iterator[Contact]:
+        if storage.storage_type == StorageType.SQLITE:
+            return storage.iter_contacts(filename, self.batch_size)
+        if storage.storage_type == StorageType.JSON:
+            trusted = storage.is_trusted(
+                filename, StorageConfig.TRUSTED_LOAD_FORMAT_VERSION
+            )
+            records = storage.iter_load(filename) or iter(())
+            return (self.serializer.dict_to_contact(r, trusted) for r in records)
+        # Pickle and the other formats only load as a whole
+        book, _ = DomainStorageAdapter(storage, self.serializer).load_contacts(filename)
+        return iter(book.values() if book is not None else ())
+
+    def _read_notes(self, storage: Storage, filename: str) -> Iterator[Note]:
+        if storage.storage_type == StorageType.SQLITE:
+            return storage.iter_notes(filename, self.batch_size)
+        if storage.storage_type == StorageType.JSON:
+            trusted = storage.is_trusted(
+                filename, StorageConfig.TRUSTED_LOAD_FORMAT_VERSION
+            )
+            records = storage.iter_load(filename) or iter(())
+            return (self.serializer.dict_to_note(r, trusted) for r in records)
+        notebook, _ = DomainStorageAdapter(storage, self.serializer).load_notes(
+            filename
+        )
+        return iter(notebook.values())
+
+    def _write_contacts(
+        self, storage: Storage, filename: str, contacts: Iterable[Contact]
+    ) -> None:
+        if storage.storage_type == StorageType.SQLITE:
+            storage.bulk_save_contacts(filename, contacts, self.batch_size)
+        elif storage.storage_type == StorageType.JSON:
+            storage.save(
+                (self.serializer.contact_to_dict(c) for c in contacts),
+                filename,
+                format_version=StorageConfig.TRUSTED_LOAD_FORMAT_VERSION,
+            )
+        else:
+            book = AddressBook()
+            for contact in contacts:
+                book.add_record(contact)
+            DomainStorageAdapter(storage, self.serializer).save_contacts(book, filename)
+
+    def _write_notes(
+        self, storage: Storage, filename: str, notes: Iterable[Note]
+    ) -> None:
+        if storage.storage_type == StorageType.SQLITE:
+            storage.bulk_save_notes(filename, notes, self.batch_size)
+        elif storage.storage_type == StorageType.JSON:
+            storage.save(
+                (self.serializer.note_to_dict(n) for n in notes),
+                filename,
+                format_version=StorageConfig.TRUSTED_LOAD_FORMAT_VERSION,
+            )
+        else:
+            notebook = Notebook()
+            for note in notes:
+                notebook[note.id] = note
+            adapter = DomainStorageAdapter(storage, self.serializer)
+            adapter.save_notes(notebook, filename)
+
+    @staticmethod
+    def _unique(records: Iterator) -> Iterator:
+        # Same rule as loading through the adapter: the first record of an ID wins
+        seen_ids = set()
+        for record in records:
+            if record.id not in seen_ids:
+                seen_ids.add(record.id)
+                yield record
+
+    def _counted(self, items: Iterator) -> "_Counter":
+        return _Counter(items, self.batch_size, self.progress)
+
+
+class _Counter:
+
+    def __init__(
+        self, items: Iterator, every: int, progress: Optional[Callable[[int], None]]
+    ):
+        self._items = items
+        self._every = every
+        self._progress = progress
+        self.count = 0
+
+    def __iter__(self) -> Iterator:
+        for item in self._items:
+            yield item
+            self.count += 1
+            if self._progress and self.count % self._every == 0:
+                self._progress(self.count)
+
+
+def open_storage(path: Path) -> tuple[Storage, str]:
+    storage_type = StorageFactory.storage_type_for(path.name)
+    return StorageFactory.create_storage(storage_type, path.parent), path.name
+
+
+def main(argv: Optional[list[str]] = None) -> ConversionReport:
+    arg_parser = argparse.ArgumentParser(
+        description="Convert contacts or notes between storage formats"
+    )
+    arg_parser.add_argument("source", type=Path, help="file to read")
+    arg_parser.add_argument(
+        "target",
+        type=Path,
+        help="file to write; files are replaced, SQLite records are upserted",
+    )
+    arg_parser.add_argument(
+        "--notes", action="store_true", help="convert notes instead of contacts"
+    )
+    arg_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=StorageConfig.CONVERTER_BATCH_SIZE,
+        help="records per read and write batch",
+    )
+    args = arg_parser.parse_args(argv)
+
+    source, source_name = open_storage(args.source)
+    target, target_name = open_storage(args.target)
+    converter = StorageConverter(
+        batch_size=args.batch_size,
+        progress=lambda count: print(f"{count} records...", end="\r", flush=True),
+    )
+    if args.notes:
+        report = converter.convert_notes(source, source_name, target, target_name)
+    else:
+        report = converter.convert_contacts(source, source_name, target, target_name)
+    print(report)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -6,11 +6,17 @@ from pathlib import Path
 APPLICATION_DIR = ".assistant-bot"
 DEFAULT_DATA_DIR = "data"
 HOME_DATA_DIR = str(Path.home() / APPLICATION_DIR / DEFAULT_DATA_DIR)
+DEFAULT_BACKUP_DIR = "backups"
+HOME_BACKUP_DIR = str(Path.home() / APPLICATION_DIR / DEFAULT_BACKUP_DIR)
 RESERVED_BASENAME = "addressbook"
 DEFAULT_CONTACTS_FILE = RESERVED_BASENAME + ".pkl"
 DEFAULT_ADDRESS_BOOK_DATABASE_NAME = RESERVED_BASENAME + ".db"
 DEFAULT_JSON_FILE = RESERVED_BASENAME + ".json"
 DEFAULT_NOTES_FILE = "notes.json"
+DEFAULT_NOTES_JOURNAL_FILE = "notes.jsonl"
+DEFAULT_NOTES_DBM_FILE = "notes.dbm"
+DEFAULT_CONTACTS_WAL_FILE = "contacts.wal"
+DEFAULT_NOTES_WAL_FILE = "notes.wal"
 
 
 class DataPathResolver:
@@ -30,6 +36,22 @@ class DataPathResolver:
     def ensure_json_suffix(filename: str) -> str:
         return filename if filename.endswith(".json") else f"{filename}.json"
 
+    @staticmethod
+    def ensure_jsonl_suffix(filename: str) -> str:
+        return filename if filename.endswith(".jsonl") else f"{filename}.jsonl"
+
+    @staticmethod
+    def ensure_shards_suffix(filename: str) -> str:
+        return filename if filename.endswith(".shards") else f"{filename}.shards"
+
+    @staticmethod
+    def ensure_snap_suffix(filename: str) -> str:
+        return filename if filename.endswith(".snap") else f"{filename}.snap"
+
+    @staticmethod
+    def ensure_dbm_suffix(filename: str) -> str:
+        return filename if filename.endswith(".dbm") else f"{filename}.dbm"
+
     @staticmethod
     def ensure_db_suffix(filename: str) -> str:
         return filename if filename.endswith(".db") else f"{filename}.db"
@@ -41,6 +63,10 @@ class DataPathResolver:
             ".pkl",
             ".pickle",
             ".json",
+            ".jsonl",
+            ".shards",
+            ".snap",
+            ".dbm",
             ".db",
             ".sqlite",
             ".sqlite3",
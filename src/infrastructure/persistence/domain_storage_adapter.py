@@ -1,9 +1,24 @@
+import copy
+from collections.abc import Iterator
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Optional
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.persistence.prepared_save import PreparedSave
 from src.infrastructure.serialization.json_serializer import JsonSerializer
+from src.infrastructure.serialization.parallel_deserializer import (
+    ParallelDeserializer,
+)
+from src.infrastructure.storage.change_log import ChangeLog
+from src.infrastructure.storage.file_lock import FileLock, Generation, file_generation
 from src.infrastructure.storage.storage import Storage
 from src.infrastructure.storage.storage_type import StorageType
 from src.application.exceptions.base import StorageException
 from src.domain.entities.note import Note
+from src.domain.lazy_address_book import LazyAddressBook
 from src.domain.notebook import Notebook
+from src.domain.tracked_collection import ChangeSet
 
 
 class DomainStorageAdapter:
@@ -12,6 +27,10 @@ class DomainStorageAdapter:
         self.storage = storage
         self.serializer = serializer if serializer else JsonSerializer()
         self.resolver = getattr(storage, "resolver", None)
+        # File state last read or written by this process, per data file
+        self._generations: dict[Path, Optional[Generation]] = {}
+        # Change log revision that state corresponds to
+        self._revisions: dict[Path, int] = {}
 
     @property
     def file_extension(self) -> str:
@@ -25,44 +44,145 @@ class DomainStorageAdapter:
         if self.storage.storage_type == StorageType.SQLITE:
             return filename
 
+        compression = getattr(self.storage, "compression", None)
+        if compression:
+            base_suffix = self.storage.file_extension[: -len(compression.suffix)]
+            return compression.ensure_suffix(filename, base_suffix)
+
         if self.storage.file_extension == ".json":
             return self.resolver.ensure_json_suffix(filename)
+        elif self.storage.file_extension == ".jsonl":
+            return self.resolver.ensure_jsonl_suffix(filename)
+        elif self.storage.file_extension == ".shards":
+            return self.resolver.ensure_shards_suffix(filename)
+        elif self.storage.file_extension == ".snap":
+            return self.resolver.ensure_snap_suffix(filename)
+        elif self.storage.file_extension == ".dbm":
+            return self.resolver.ensure_dbm_suffix(filename)
         elif self.storage.file_extension == ".pkl":
             return self.resolver.ensure_pkl_suffix(filename)
         return filename
 
     def save_contacts(self, address_book, filename: str, **kwargs) -> str:
-        if (
-            self.storage.storage_type == StorageType.PICKLE
-            or self.storage.storage_type == StorageType.SQLITE
-        ):
+        return self._locked_save(
+            address_book,
+            filename,
+            self.serializer.contact_to_dict,
+            self._remote_contacts(filename),
+            lambda: self._save_contacts(address_book, filename, **kwargs),
+        )
+
+    def prepare_contacts(self, address_book, filename: str, **kwargs) -> PreparedSave:
+        from src.domain.address_book import AddressBook
+
+        return self._prepare_save(
+            address_book,
+            filename,
+            AddressBook,
+            self.serializer.contact_to_dict,
+            self._remote_contacts(filename),
+            lambda detached: self._save_contacts(detached, filename, **kwargs),
+        )
+
+    def load_contacts(self, filename: str, **kwargs):
+        return self._locked_load(
+            filename, lambda: self._load_contacts(filename, **kwargs)
+        )
+
+    def refresh_contacts(self, address_book, filename: str) -> int:
+        return self._refresh(
+            address_book,
+            filename,
+            self.serializer.contact_to_dict,
+            self._remote_contacts(filename),
+            "contacts",
+        )
+
+    def save_notes(self, notes: Notebook | dict[str, Note], filename: str, **kwargs) -> str:
+        return self._locked_save(
+            notes,
+            filename,
+            self.serializer.note_to_dict,
+            self._remote_notes(filename),
+            lambda: self._save_notes(notes, filename, **kwargs),
+        )
+
+    def prepare_notes(self, notes: Notebook, filename: str, **kwargs) -> PreparedSave:
+        return self._prepare_save(
+            notes,
+            filename,
+            Notebook,
+            self.serializer.note_to_dict,
+            self._remote_notes(filename),
+            lambda detached: self._save_notes(detached, filename, **kwargs),
+        )
+
+    def load_notes(self, filename: str, **kwargs):
+        return self._locked_load(filename, lambda: self._load_notes(filename, **kwargs))
+
+    def refresh_notes(self, notes: Notebook, filename: str) -> int:
+        return self._refresh(
+            notes,
+            filename,
+            self.serializer.note_to_dict,
+            self._remote_notes(filename),
+            "notes",
+        )
+
+    def _save_contacts(self, address_book, filename: str, **kwargs) -> str:
+        from src.domain.address_book import AddressBook
+
+        if self.storage.storage_type == StorageType.PICKLE:
+            # Database-backed books are copied into a plain, picklable book
+            data = (
+                address_book
+                if type(address_book) is AddressBook
+                else AddressBook(address_book)
+            )
+        elif self.storage.storage_type in (StorageType.SQLITE, StorageType.SNAPSHOT):
             data = address_book
         elif self.storage.storage_type == StorageType.JSON:
             data = [
                 self.serializer.contact_to_dict(contact)
-                for contact in address_book.data.values()
+                for contact in address_book.values()
             ]
+            kwargs["format_version"] = StorageConfig.TRUSTED_LOAD_FORMAT_VERSION
+        elif self.storage.storage_type == StorageType.JSONL:
+            return self._save_journal(
+                address_book, filename, self.serializer.contact_to_dict, **kwargs
+            )
+        elif self.storage.storage_type == StorageType.JSON_SHARDED:
+            return self._save_shards(
+                address_book, filename, self.serializer.contact_to_dict, **kwargs
+            )
+        elif self.storage.storage_type == StorageType.DBM:
+            return self._save_records(
+                address_book, filename, self.serializer.contact_to_dict, **kwargs
+            )
         else:
             raise StorageException("Unsupported storage type for saving contacts")
 
         saved_filename = self.storage.save(data, filename, **kwargs)
+        self._mark_saved(address_book)
         return self.ensure_suffix(saved_filename)
 
-    def load_contacts(self, filename: str, **kwargs):
+    def _load_contacts(self, filename: str, **kwargs):
         from src.domain.address_book import AddressBook
 
-        loaded = self.storage.load(filename, **kwargs)
+        trusted = self._is_trusted(filename)
+        loaded = self._load_records(filename, **kwargs)
         normalized_filename = self.ensure_suffix(filename)
 
         if loaded is None:
             return None, normalized_filename
         elif hasattr(loaded, "data") and hasattr(loaded, "add_record"):
             return loaded, normalized_filename
-        elif isinstance(loaded, list):
+        elif isinstance(loaded, (list, Iterator)):
             address_book = AddressBook()
             seen_ids = set()
-            for contact_dict in loaded:
-                contact = self.serializer.dict_to_contact(contact_dict)
+            for contact in self._deserialize(
+                self.serializer.dict_to_contact, loaded, trusted
+            ):
                 if contact.id in seen_ids:
                     continue
                 seen_ids.add(contact.id)
@@ -70,48 +190,358 @@ class DomainStorageAdapter:
                     address_book.add_record(contact)
                 except KeyError:
                     continue
+            address_book.mark_flushed(self._flush_target(filename))
             return address_book, normalized_filename
         else:
             return None, normalized_filename
 
-    def save_notes(self, notes: dict[str, Note], filename: str, **kwargs) -> str:
+    def _save_notes(self, notes: Notebook | dict[str, Note], filename: str, **kwargs) -> str:
         if self.storage.storage_type == StorageType.PICKLE:
             data = notes
         elif self.storage.storage_type == StorageType.JSON:
             data = [self.serializer.note_to_dict(note) for note in notes.values()]
+            kwargs["format_version"] = StorageConfig.TRUSTED_LOAD_FORMAT_VERSION
         elif self.storage.storage_type == StorageType.SQLITE:
             # Convert notes dict to Notebook for SQLite storage
-            notebook = Notebook()
-            for note_id, note in notes.items():
-                notebook[note_id] = note
-            data = notebook
+            data = notes if isinstance(notes, Notebook) else Notebook(notes)
+        elif self.storage.storage_type == StorageType.JSONL:
+            notebook = notes if isinstance(notes, Notebook) else Notebook(notes)
+            return self._save_journal(
+                notebook, filename, self.serializer.note_to_dict, **kwargs
+            )
+        elif self.storage.storage_type == StorageType.JSON_SHARDED:
+            notebook = notes if isinstance(notes, Notebook) else Notebook(notes)
+            return self._save_shards(
+                notebook, filename, self.serializer.note_to_dict, **kwargs
+            )
+        elif self.storage.storage_type == StorageType.DBM:
+            notebook = notes if isinstance(notes, Notebook) else Notebook(notes)
+            return self._save_records(
+                notebook, filename, self.serializer.note_to_dict, **kwargs
+            )
         else:
             raise StorageException("Unsupported storage type for saving notes")
 
         saved_filename = self.storage.save(data, filename, **kwargs)
+        self._mark_saved(notes)
         return self.ensure_suffix(saved_filename)
 
-    def load_notes(self, filename: str, **kwargs):
+    def _load_notes(self, filename: str, **kwargs):
+        trusted = self._is_trusted(filename)
         # For SQLite, use load_notes method if available
         if self.storage.storage_type == StorageType.SQLITE and hasattr(
             self.storage, "load_notes"
         ):
             loaded = self.storage.load_notes(filename, **kwargs)
         else:
-            loaded = self.storage.load(filename, **kwargs)
+            loaded = self._load_records(filename, **kwargs)
 
         normalized_filename = self.ensure_suffix(filename)
-        notes_dict = {}
 
+        if isinstance(loaded, Notebook):
+            return loaded, normalized_filename
+
+        notebook = Notebook()
         if isinstance(loaded, dict):
-            notes_dict = loaded
-        elif isinstance(loaded, Notebook):
-            # Convert Notebook to dict
-            notes_dict = dict(loaded.data)
-        elif isinstance(loaded, list):
-            for note_dict in loaded:
-                note = self.serializer.dict_to_note(note_dict)
-                if note.id not in notes_dict:
-                    notes_dict[note.id] = note
-
-        return notes_dict, normalized_filename
+            notebook.update(loaded)
+        elif isinstance(loaded, (list, Iterator)):
+            for note in self._deserialize(
+                self.serializer.dict_to_note, loaded, trusted
+            ):
+                if note.id not in notebook:
+                    notebook[note.id] = note
+        notebook.mark_flushed(self._flush_target(filename))
+
+        return notebook, normalized_filename
+
+    def _lockable_path(self, filename: str) -> Optional[Path]:
+        if not StorageConfig.FILE_LOCKING:
+            return None
+        return self.storage.data_path(filename)
+
+    def _locked_load(self, filename: str, load):
+        path = self._lockable_path(filename)
+        if path is None:
+            return load()
+        with FileLock(path, shared=True):
+            generation = file_generation(path)
+            revision = ChangeLog(path).revision()
+            result = load()
+        self._generations[path] = generation
+        self._revisions[path] = revision
+        return result
+
+    def _locked_save(self, collection, filename: str, to_dict, load, save) -> str:
+        path = self._lockable_path(filename)
+        if path is None:
+            return save()
+        with FileLock(path):
+            changes = None
+            if path in self._generations and hasattr(collection, "pending_changes"):
+                # Fold in what other processes saved since our last read
+                self._merge_remote(collection, path, to_dict, load)
+                changes = collection.pending_changes()
+            saved_filename = save()
+            self._record_save(path, changes)
+        return saved_filename
+
+    def _prepare_save(
+        self, collection, filename: str, empty, to_dict, load, save
+    ) -> PreparedSave:
+        # Called under the mutation lock. The records to write are copied, so
+        # the file write can run while commands keep editing the collection.
+        path = self._lockable_path(filename)
+        held = ExitStack()
+        try:
+            synced = False
+            if path is not None:
+                held.enter_context(FileLock(path))
+                synced = path in self._generations
+                if synced:
+                    self._merge_remote(collection, path, to_dict, load)
+            changes = collection.begin_flush()
+            detached = empty()
+            for record in self._records_to_write(collection, filename, changes):
+                detached.set_untracked(record.id, copy.deepcopy(record))
+            detached.adopt_changes(changes, collection.flushed_to)
+        except BaseException:
+            held.close()
+            collection.abort_flush()
+            raise
+
+        def write() -> tuple[str, Optional[str]]:
+            saved_filename = save(detached)
+            if path is not None:
+                self._record_save(path, changes if synced else None)
+            return saved_filename, detached.flushed_to
+
+        def rebind(saved_filename: str) -> None:
+            if hasattr(collection, "rebind"):
+                # A book backed by the old file must read the new one
+                collection.rebind(self.storage.reader(saved_filename))
+
+        return PreparedSave(collection, changes, write, rebind, held.close)
+
+    def _records_to_write(self, collection, filename: str, changes) -> Iterator:
+        target = self._flush_target(filename)
+        if target is None or not collection.is_flushed_to(target):
+            return iter(collection.values())
+        return (collection[record_id] for record_id in changes.upserted)
+
+    def _refresh(self, collection, filename: str, to_dict, load, table: str) -> int:
+        if self.storage.storage_type == StorageType.SQLITE:
+            return self._refresh_rows(collection, filename, table)
+        path = self._lockable_path(filename)
+        if path is None or path not in self._generations:
+            return 0
+        if file_generation(path) == self._generations[path]:
+            return 0
+        with FileLock(path, shared=True):
+            return self._merge_remote(collection, path, to_dict, load)
+
+    def _refresh_rows(self, collection, filename: str, table: str) -> int:
+        # Database triggers log the IDs every writer changes; only those rows
+        # are read back
+        keys = self.storage.changed_ids(filename, table)
+        if not keys:
+            return 0
+        changes = collection.pending_changes()
+        if isinstance(collection, LazyAddressBook):
+            # Saved contacts are read from the database; cached copies are dropped
+            stale = keys - changes.upserted - changes.deleted
+            for key in stale:
+                collection.discard_cached(key)
+            return len(stale)
+        return self._merge_changed(
+            collection,
+            ChangeSet(modified=keys),
+            changes,
+            lambda found: self.storage.load_by_ids(filename, table, found),
+        )
+
+    def _record_save(self, path: Path, changes) -> None:
+        # Without changes, readers cannot tell what the save replaced
+        log = ChangeLog(path)
+        if changes is None:
+            self._revisions[path] = log.record(None)
+        else:
+            self._revisions[path] = log.record(changes.upserted, changes.deleted)
+        self._generations[path] = file_generation(path)
+
+    def _merge_remote(self, collection, path: Path, to_dict, load) -> int:
+        generation = file_generation(path)
+        if generation == self._generations.get(path):
+            return 0
+        revision, remote_changes = (
+            ChangeLog(path).changes_since(self._revisions[path])
+            if path in self._revisions
+            else (0, None)
+        )
+        self._generations[path] = generation
+        self._revisions[path] = revision
+
+        # Local unsaved edits win; everything else takes the saved state.
+        # Untracked writes keep remote records out of the change set.
+        changes = collection.pending_changes()
+        if remote_changes is not None:
+            return self._merge_changed(collection, remote_changes, changes, load)
+
+        remote = load(None)
+        merged = 0
+        for key in list(collection.data):
+            if key not in remote and key not in changes.upserted:
+                collection.delete_untracked(key)
+                merged += 1
+        for key, record in remote.items():
+            if key in changes.upserted or key in changes.deleted:
+                continue
+            local = collection.data.get(key)
+            if local is None or to_dict(local) != to_dict(record):
+                collection.set_untracked(key, record)
+                merged += 1
+        return merged
+
+    @staticmethod
+    def _merge_changed(collection, remote_changes, changes, load) -> int:
+        # The change log names the records other processes saved; only
+        # those are read and replaced
+        keys = {
+            key
+            for key in remote_changes.upserted | remote_changes.deleted
+            if key not in changes.upserted and key not in changes.deleted
+        }
+        remote = load(keys & remote_changes.upserted)
+        merged = 0
+        for key in keys:
+            if key in remote:
+                collection.set_untracked(key, remote[key])
+                merged += 1
+            elif key in collection.data:
+                collection.delete_untracked(key)
+                merged += 1
+        return merged
+
+    def _remote_contacts(self, filename: str):
+        return self._remote_loader(
+            filename, self.serializer.dict_to_contact, self._load_contacts
+        )
+
+    def _remote_notes(self, filename: str):
+        return self._remote_loader(
+            filename, self.serializer.dict_to_note, self._load_notes
+        )
+
+    def _remote_loader(self, filename: str, to_object, load):
+        def load_remote(keys: Optional[set[str]]):
+            # All saved records when keys is None, otherwise just those
+            if keys is not None and self.storage.storage_type == StorageType.JSON:
+                trusted = self._is_trusted(filename)
+                found = {}
+                for record in self._load_records(filename) or ():
+                    # Other records stay raw dicts; the first one of an ID wins
+                    if record["id"] in keys and record["id"] not in found:
+                        found[record["id"]] = to_object(record, trusted)
+                return found
+            remote, _ = load(filename)
+            remote = remote if remote is not None else {}
+            if keys is None:
+                return remote
+            return {key: remote[key] for key in keys if key in remote}
+
+        return load_remote
+
+    def _is_trusted(self, filename: str) -> bool:
+        # SQLite rows are always validated: other writers can change them
+        # without leaving a trace the database file would let us check
+        return (
+            StorageConfig.TRUSTED_LOAD
+            and self.storage.storage_type == StorageType.JSON
+            and self.storage.is_trusted(
+                filename, StorageConfig.TRUSTED_LOAD_FORMAT_VERSION
+            )
+        )
+
+    @staticmethod
+    def _deserialize(to_object, records, trusted: bool) -> Iterator:
+        if StorageConfig.PARALLEL_LOAD:
+            return ParallelDeserializer().map(to_object, records, trusted)
+        return (to_object(record, trusted) for record in records)
+
+    def _load_records(self, filename: str, **kwargs):
+        if (
+            StorageConfig.JSON_STREAMING_LOAD
+            and self.storage.storage_type == StorageType.JSON
+        ):
+            # Build domain objects while parsing instead of after a full json.load
+            records = self.storage.iter_load(filename, **kwargs)
+            return kwargs.get("default", None) if records is None else records
+        return self.storage.load(filename, **kwargs)
+
+    def _save_journal(self, collection, filename: str, to_dict, **kwargs) -> str:
+        target = self.storage.journal_key(filename)
+        if collection.is_flushed_to(target):
+            # Append only what changed since the collection was loaded or saved
+            changes = collection.pending_changes()
+            saved_filename = self.storage.append_changes(
+                filename,
+                (to_dict(collection[record_id]) for record_id in changes.upserted),
+                changes.deleted,
+            )
+        else:
+            saved_filename = self.storage.save(
+                [to_dict(record) for record in collection.values()], filename, **kwargs
+            )
+        collection.mark_flushed(target)
+        return self.ensure_suffix(saved_filename)
+
+    def _save_shards(self, collection, filename: str, to_dict, **kwargs) -> str:
+        target = self.storage.shard_key(filename)
+        if collection.is_flushed_to(target):
+            # Rebuild only the shards that hold a changed or deleted record
+            changes = collection.pending_changes()
+            saved_filename = self.storage.apply_changes(
+                filename,
+                (to_dict(collection[record_id]) for record_id in changes.upserted),
+                changes.deleted,
+            )
+        else:
+            saved_filename = self.storage.save(
+                (to_dict(record) for record in collection.values()), filename, **kwargs
+            )
+        collection.mark_flushed(target)
+        return self.ensure_suffix(saved_filename)
+
+    def _save_records(self, collection, filename: str, to_dict, **kwargs) -> str:
+        target = self.storage.store_key(filename)
+        if collection.is_flushed_to(target):
+            # Put and delete only the changed records and their index entries
+            changes = collection.pending_changes()
+            saved_filename = self.storage.apply_changes(
+                filename,
+                (to_dict(collection[record_id]) for record_id in changes.upserted),
+                changes.deleted,
+            )
+        else:
+            saved_filename = self.storage.save(
+                (to_dict(record) for record in collection.values()), filename, **kwargs
+            )
+        collection.mark_flushed(target)
+        return self.ensure_suffix(saved_filename)
+
+    def _mark_saved(self, collection) -> None:
+        # Whole-file saves write every record; once written, edits are no longer
+        # local and must not override other processes' saves in later merges
+        if self.storage.storage_type in (StorageType.JSON, StorageType.PICKLE):
+            if hasattr(collection, "mark_flushed"):
+                collection.mark_flushed()
+
+    def _flush_target(self, filename: str):
+        if self.storage.storage_type == StorageType.JSONL:
+            return self.storage.journal_key(filename)
+        elif self.storage.storage_type == StorageType.JSON_SHARDED:
+            return self.storage.shard_key(filename)
+        elif self.storage.storage_type == StorageType.DBM:
+            return self.storage.store_key(filename)
+        elif self.storage.storage_type == StorageType.SQLITE:
+            return self.storage.database_key(filename)
+        return None
@@ -0,0 +1,39 @@
+from typing import Callable, Optional
+
+from src.domain.tracked_collection import ChangeSet, TrackedCollection
+
+
+class PreparedSave:
+
+    def __init__(
+        self,
+        collection: TrackedCollection,
+        changes: ChangeSet,
+        write: Callable[[], tuple[str, Optional[str]]],
+        rebind: Callable[[str], None],
+        release: Callable[[], None],
+    ):
+        # Taken under the mutation lock; write() then runs without it
+        self._collection = collection
+        self._changes = changes
+        self._write = write
+        self._rebind = rebind
+        self._release = release
+        self._target: Optional[str] = None
+        self.filename: Optional[str] = None
+
+    def write(self) -> str:
+        try:
+            self.filename, self._target = self._write()
+        finally:
+            self._release()
+        return self.filename
+
+    def finish(self) -> None:
+        # Under the mutation lock again: only edits the write covered are cleared
+        self._rebind(self.filename)
+        self._collection.finish_flush(self._changes, self._target)
+
+    def abort(self) -> None:
+        self._release()
+        self._collection.abort_flush()
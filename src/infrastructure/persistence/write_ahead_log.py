@@ -0,0 +1,127 @@
+import json
+import os
+import time
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TextIO, TypeVar
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.logging.logger import setup_logger
+from src.infrastructure.storage.append_log import truncate_torn_tail
+
+log = setup_logger()
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class WriteAheadLog:
+
+    def __init__(
+        self,
+        path: Path,
+        snapshot_every_ops: int = StorageConfig.WAL_SNAPSHOT_EVERY_OPS,
+        snapshot_interval_seconds: float = StorageConfig.WAL_SNAPSHOT_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.path = Path(path)
+        self.snapshot_every_ops = snapshot_every_ops
+        self.snapshot_interval_seconds = snapshot_interval_seconds
+        self._clock = clock
+        self._file: Optional[TextIO] = None
+        self._ops_since_snapshot = 0
+        self._last_snapshot = clock()
+
+    def append(self, target: str, upserts: list[dict], deleted_ids: list[str]) -> None:
+        entry = {"target": target, "upserts": upserts, "deleted": deleted_ids}
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+        try:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                if truncate_torn_tail(self.path):
+                    log.warning(f"Dropped torn log entry in {self.path.name}")
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._file.flush()
+            if StorageConfig.WAL_FSYNC:
+                os.fsync(self._file.fileno())
+        except OSError as e:
+            raise IOError(f"Failed to append to {self.path.name}: {e}") from e
+        self._ops_since_snapshot += 1
+
+    def entries(self, target: str) -> Iterator[dict]:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    if not line.endswith("\n"):
+                        # Only the last append can be torn by a crash; an entry
+                        # counts once its newline is written
+                        log.warning(f"Ignoring torn log entry in {self.path.name}")
+                        return
+                    entry = json.loads(line)
+                    self._ops_since_snapshot += 1
+                    if entry["target"] == target:
+                        yield entry
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            raise IOError(f"Failed to read {self.path.name}: {e}") from e
+
+    def snapshot_due(self) -> bool:
+        if not self._ops_since_snapshot:
+            return False
+        return (
+            self._ops_since_snapshot >= self.snapshot_every_ops
+            or self._clock() - self._last_snapshot >= self.snapshot_interval_seconds
+        )
+
+    def mark(self) -> int:
+        # End of the log so far; reset(mark) keeps only entries added after it
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+        except OSError as e:
+            raise IOError(f"Failed to read {self.path.name}: {e}") from e
+
+    def reset(self, upto: Optional[int] = None) -> None:
+        # Called once a snapshot holds every change logged up to the mark
+        self.close()
+        try:
+            tail = b""
+            if upto is not None and self.path.exists():
+                with open(self.path, "rb") as f:
+                    f.seek(upto)
+                    tail = f.read()
+            if tail:
+                tmp_path = self.path.with_name(self.path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(tail)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            else:
+                self.path.unlink(missing_ok=True)
+        except OSError as e:
+            raise IOError(f"Failed to truncate {self.path.name}: {e}") from e
+        self._ops_since_snapshot = tail.count(b"\n")
+        self._last_snapshot = self._clock()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def logged_mutation(method: F) -> F:
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # The lock keeps a background autosave from reading a half-applied edit
+        with self._mutation_lock:
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._log_changes()
+
+    return wrapper
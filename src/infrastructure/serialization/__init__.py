@@ -1,5 +1,9 @@
 from src.infrastructure.serialization.json_serializer import JsonSerializer
+from src.infrastructure.serialization.parallel_deserializer import (
+    ParallelDeserializer,
+)
 
 __all__ = [
     "JsonSerializer",
+    "ParallelDeserializer",
 ]
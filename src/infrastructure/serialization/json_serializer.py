@@ -23,7 +23,10 @@ class JsonSerializer:
         }
 
     @staticmethod
-    def dict_to_contact(data: dict[str, Any]) -> Contact:
+    def dict_to_contact(data: dict[str, Any], trusted: bool = False) -> Contact:
+        if trusted:
+            return JsonSerializer._trusted_dict_to_contact(data)
+
         name_vo = Name(data["name"])
         contact = Contact(name_vo, contact_id=data["id"])
 
@@ -45,18 +48,39 @@ class JsonSerializer:
 
         return contact
 
+    @staticmethod
+    def _trusted_dict_to_contact(data: dict[str, Any]) -> Contact:
+        contact = Contact(Name.from_trusted(data["name"]), contact_id=data["id"])
+        contact.phones = [Phone.from_trusted(phone) for phone in data.get("phones", [])]
+
+        if data.get("birthday"):
+            contact.add_birthday(Birthday.from_trusted(data["birthday"]))
+
+        if data.get("email"):
+            contact.add_email(Email.from_trusted(data["email"]))
+
+        if data.get("address"):
+            contact.add_address(Address.from_trusted(data["address"]))
+
+        return contact
+
     @staticmethod
     def note_to_dict(note: Note) -> dict[str, Any]:
         return {
             "id": note.id,
+            "title": note.title,
             "text": note.text,
             "tags": [tag.value for tag in note.tags],
         }
 
     @staticmethod
-    def dict_to_note(data: dict[str, Any]) -> Note:
+    def dict_to_note(data: dict[str, Any], trusted: bool = False) -> Note:
         note = Note(data["title"], data["text"], note_id=data["id"])
 
+        if trusted:
+            note.tags = [Tag.from_trusted(tag) for tag in data.get("tags", [])]
+            return note
+
         for tag_str in data.get("tags", []):
             tag_vo = Tag(tag_str)
             note.add_tag(tag_vo)
@@ -0,0 +1,71 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from src.config.storage_config import StorageConfig
+
+T = TypeVar("T")
+
+# Chunks submitted ahead per worker; a streamed load never queues the whole file
+CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+class ParallelDeserializer:
+
+    def __init__(
+        self,
+        workers: Optional[int] = StorageConfig.PARALLEL_LOAD_WORKERS,
+        chunk_size: int = StorageConfig.PARALLEL_LOAD_CHUNK_SIZE,
+    ):
+        self.workers = workers if workers else os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+    def map(
+        self,
+        to_object: Callable[[dict[str, Any], bool], T],
+        records: Iterable[dict[str, Any]],
+        trusted: bool = False,
+    ) -> Iterator[T]:
+        chunks = self._chunks(records)
+        first = next(chunks, None)
+        if first is None:
+            return
+        second = next(chunks, None)
+        if second is None or self.workers == 1:
+            # Starting a pool costs more than a single chunk takes to build
+            for chunk in chain([first], [second] if second else [], chunks):
+                yield from deserialize_chunk(to_object, trusted, chunk)
+            return
+
+        window = self.workers * CHUNKS_IN_FLIGHT_PER_WORKER
+        pending: deque[Future] = deque()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                for chunk in chain([first, second], chunks):
+                    pending.append(
+                        executor.submit(deserialize_chunk, to_object, trusted, chunk)
+                    )
+                    if len(pending) >= window:
+                        # Results leave in submission order, so record order is kept
+                        yield from pending.popleft().result()
+                while pending:
+                    yield from pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _chunks(self, records: Iterable[dict[str, Any]]) -> Iterator[list[dict]]:
+        iterator = iter(records)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            yield chunk
+
+
+def deserialize_chunk(
+    to_object: Callable[[dict[str, Any], bool], T],
+    trusted: bool,
+    chunk: list[dict[str, Any]],
+) -> list[T]:
+    # Module level so worker processes can unpickle it by name
+    return [to_object(record, trusted) for record in chunk]
@@ -1,15 +1,23 @@
 from src.infrastructure.storage.storage import Storage
 from src.infrastructure.storage.storage_type import StorageType
 from src.infrastructure.storage.storage_factory import StorageFactory
+from src.infrastructure.storage.dbm_storage import DbmStorage
 from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.jsonl_storage import JsonlStorage
 from src.infrastructure.storage.pickle_storage import PickleStorage
+from src.infrastructure.storage.sharded_json_storage import ShardedJsonStorage
+from src.infrastructure.storage.snapshot_storage import SnapshotStorage
 from src.infrastructure.storage.sqlite_storage import SQLiteStorage
 
 __all__ = [
     "Storage",
     "StorageType",
     "StorageFactory",
+    "DbmStorage",
     "JsonStorage",
+    "JsonlStorage",
     "PickleStorage",
+    "ShardedJsonStorage",
+    "SnapshotStorage",
     "SQLiteStorage",
 ]
@@ -0,0 +1,45 @@
+import os
+from pathlib import Path
+
+TAIL_READ_SIZE = 64 * 1024
+
+
+def truncate_torn_tail(path: Path) -> bool:
+    # An append cut short by a crash leaves a last line without its newline;
+    # the next append would glue its entry onto that fragment
+    try:
+        with open(path, "r+b") as f:
+            end = f.seek(0, os.SEEK_END)
+            keep = 0
+            position = end
+            while position > 0:
+                start = max(0, position - TAIL_READ_SIZE)
+                f.seek(start)
+                newline = f.read(position - start).rfind(b"\n")
+                if newline != -1:
+                    keep = start + newline + 1
+                    break
+                position = start
+            if keep == end:
+                return False
+            f.truncate(keep)
+            f.flush()
+            os.fsync(f.fileno())
+            return True
+    except FileNotFoundError:
+        return False
+
+
+def fsync_directory(directory: Path) -> None:
+    # Makes renames and unlinks in the directory durable where the platform
+    # allows opening a directory, which Windows does not
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
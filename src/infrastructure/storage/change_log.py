@@ -0,0 +1,76 @@
+import json
+import os
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.config.storage_config import StorageConfig
+from src.domain.tracked_collection import ChangeSet
+from src.infrastructure.storage.file_lock import file_generation
+
+CHANGE_LOG_SUFFIX = ".changes"
+
+
+class ChangeLog:
+
+    def __init__(self, path: Path):
+        # Sidecar listing the IDs each save of a single-file store changed;
+        # read and written under the store's FileLock
+        self.data_path = path
+        self.path = path.with_name(path.name + CHANGE_LOG_SUFFIX)
+
+    def revision(self) -> int:
+        entries = self._read()
+        return entries[-1]["revision"] if entries else 0
+
+    def record(
+        self, upserted: Optional[Iterable[str]], deleted: Iterable[str] = ()
+    ) -> int:
+        # None for upserted marks a save whose changes are unknown
+        entries = self._read()
+        revision = entries[-1]["revision"] + 1 if entries else 1
+        entry = {"revision": revision, "file": file_generation(self.data_path)}
+        if upserted is None:
+            entry["complete"] = True
+        else:
+            entry["upserted"] = sorted(upserted)
+            entry["deleted"] = sorted(deleted)
+        entries = entries[-(StorageConfig.CHANGE_LOG_MAX_ENTRIES - 1) :] + [entry]
+
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for item in entries:
+                    f.write(json.dumps(item, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            raise IOError(f"Failed to write {self.path.name}: {e}") from e
+        return revision
+
+    def changes_since(self, revision: int) -> tuple[int, Optional[ChangeSet]]:
+        # None when the log cannot say what changed: entries were trimmed, a
+        # save did not list its IDs, or the file was written without the log
+        entries = self._read()
+        current = entries[-1]["revision"] if entries else 0
+        newer = [entry for entry in entries if entry["revision"] > revision]
+        if not newer or newer[0]["revision"] != revision + 1:
+            return current, None
+        if newer[-1]["file"] != list(file_generation(self.data_path) or ()):
+            return current, None
+        if any(entry.get("complete") for entry in newer):
+            return current, None
+
+        changes = ChangeSet()
+        for entry in newer:
+            changes.modified.update(entry["upserted"])
+            changes.deleted.difference_update(entry["upserted"])
+            changes.deleted.update(entry["deleted"])
+            changes.modified.difference_update(entry["deleted"])
+        return current, changes
+
+    def _read(self) -> list[dict]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            # A missing or damaged log only costs the next reload a full read
+            return []
@@ -0,0 +1,98 @@
+import bz2
+import gzip
+import io
+import lzma
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import BinaryIO, Callable, Iterator, Optional, TextIO
+
+from src.config.storage_config import StorageConfig
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+@dataclass(frozen=True)
+class CompressionCodec:
+    name: str
+    suffix: str
+    reader: Callable[[BinaryIO], BinaryIO]
+    writer: Callable[[BinaryIO], BinaryIO]
+
+    def ensure_suffix(self, filename: str, base_suffix: str) -> str:
+        if filename.endswith(base_suffix + self.suffix):
+            return filename
+        if not filename.endswith(base_suffix):
+            filename = f"{filename}{base_suffix}"
+        return f"{filename}{self.suffix}"
+
+    @contextmanager
+    def open_binary(self, fileobj: BinaryIO, mode: str) -> Iterator[BinaryIO]:
+        # Closing the codec stream flushes it but leaves fileobj open for fsync
+        stream = self.writer(fileobj) if "w" in mode else self.reader(fileobj)
+        try:
+            yield stream
+        finally:
+            stream.close()
+
+    @contextmanager
+    def open_text(self, fileobj: BinaryIO, mode: str) -> Iterator[TextIO]:
+        with self.open_binary(fileobj, mode) as stream:
+            text = io.TextIOWrapper(stream, encoding="utf-8")
+            try:
+                yield text
+            finally:
+                # Flushes pending text without closing the codec stream twice
+                text.detach()
+
+
+GZIP = CompressionCodec(
+    "gzip",
+    ".gz",
+    lambda f: gzip.GzipFile(fileobj=f, mode="rb"),
+    lambda f: gzip.GzipFile(
+        fileobj=f, mode="wb", compresslevel=StorageConfig.GZIP_COMPRESSION_LEVEL
+    ),
+)
+LZMA = CompressionCodec(
+    "lzma",
+    ".xz",
+    lambda f: lzma.LZMAFile(f, mode="rb"),
+    lambda f: lzma.LZMAFile(f, mode="wb", preset=StorageConfig.LZMA_PRESET),
+)
+BZ2 = CompressionCodec(
+    "bz2",
+    ".bz2",
+    lambda f: bz2.BZ2File(f, mode="rb"),
+    lambda f: bz2.BZ2File(f, mode="wb"),
+)
+
+CODECS: dict[str, CompressionCodec] = {
+    codec.suffix: codec for codec in (GZIP, LZMA, BZ2)
+}
+COMPRESSION_ERRORS: tuple[type[Exception], ...] = (OSError, EOFError, lzma.LZMAError)
+
+if zstandard is not None:
+    ZSTD = CompressionCodec(
+        "zstd",
+        ".zst",
+        lambda f: io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(f, closefd=False)
+        ),
+        lambda f: io.BufferedWriter(
+            zstandard.ZstdCompressor(
+                level=StorageConfig.ZSTD_COMPRESSION_LEVEL
+            ).stream_writer(f, closefd=False)
+        ),
+    )
+    CODECS[ZSTD.suffix] = ZSTD
+    COMPRESSION_ERRORS += (zstandard.ZstdError,)
+
+
+def codec_for(filename: str) -> Optional[CompressionCodec]:
+    for suffix, codec in CODECS.items():
+        if filename.lower().endswith(suffix):
+            return codec
+    return None
@@ -0,0 +1,241 @@
+import dbm
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from src.infrastructure.persistence.data_path_resolver import DataPathResolver
+from src.infrastructure.storage.file_lock import lock_if_enabled
+from src.infrastructure.storage.storage import Storage
+from src.infrastructure.storage.storage_type import StorageType
+
+RECORD_PREFIX = "record:"
+INDEXES = ("name", "phone", "tag")
+DBM_ERRORS = (OSError, TypeError, ValueError, KeyError, *dbm.error)
+# Files a dbm backend may create next to the given path
+DBM_SUFFIXES = ("", ".db", ".dir", ".pag", ".dat", ".bak")
+# Version 2 indexes hold one key per (value, id) instead of a JSON list of ids
+INDEX_FORMAT_KEY = "meta:index_format"
+INDEX_FORMAT = "2"
+
+
+class DbmStorage(Storage):
+
+    def __init__(self, data_dir: Path | None = None):
+        self.resolver = DataPathResolver(data_dir) if data_dir else DataPathResolver()
+
+    @property
+    def file_extension(self) -> str:
+        return ".dbm"
+
+    @property
+    def storage_type(self) -> StorageType:
+        return StorageType.DBM
+
+    def store_key(self, filename: str) -> str:
+        return str(self._path(self._normalize(filename)))
+
+    def save(self, data: Any, filename: str, **kwargs) -> str:
+        filename = self._normalize(filename)
+        path = self._path(filename)
+        built = path.with_name(path.name + ".tmp")
+        records: dict[str, dict] = {}
+        for record in data:
+            records[record["id"]] = record
+
+        try:
+            # Other processes may apply changes in place, so hold the lock
+            with lock_if_enabled(path):
+                # Built aside and renamed over the live database once complete
+                with dbm.open(str(built), "n") as db:
+                    for record_id, record in records.items():
+                        db[RECORD_PREFIX + record_id] = self._encode(record)
+                        for key in self._index_keys(record):
+                            self._index(db, key, record_id)
+                    db[INDEX_FORMAT_KEY] = INDEX_FORMAT
+                self._replace_database(built, path)
+        except DBM_ERRORS as e:
+            self._remove_database(built)
+            raise IOError(f"Failed to save data to {filename}: {e}") from e
+        return filename
+
+    def apply_changes(
+        self, filename: str, upserts: Iterable[dict], deleted_ids: Iterable[str]
+    ) -> str:
+        filename = self._normalize(filename)
+        path = self._path(filename)
+        try:
+            with lock_if_enabled(path), dbm.open(str(path), "c") as db:
+                self._upgrade_index(db)
+                for record in upserts:
+                    self._put(db, record)
+                for record_id in deleted_ids:
+                    self._delete(db, record_id)
+        except DBM_ERRORS as e:
+            raise IOError(f"Failed to save data to {filename}: {e}") from e
+        return filename
+
+    def load(self, filename: str, **kwargs) -> Optional[Any]:
+        default = kwargs.get("default", None)
+        filename = self._normalize(filename)
+        path = self._path(filename)
+        if not dbm.whichdb(str(path)):
+            return default
+
+        try:
+            with lock_if_enabled(path, shared=True), dbm.open(str(path), "r") as db:
+                prefix = RECORD_PREFIX.encode("utf-8")
+                return [
+                    json.loads(db[key]) for key in db.keys() if key.startswith(prefix)
+                ]
+        except (json.JSONDecodeError, *DBM_ERRORS) as e:
+            raise IOError(f"Failed to load data from {filename}: {e}") from e
+
+    def find_ids(self, filename: str, index: str, value: str) -> list[str]:
+        if index not in INDEXES:
+            raise ValueError(f"Unknown index: {index}")
+        filename = self._normalize(filename)
+        path = self._path(filename)
+        if not dbm.whichdb(str(path)):
+            return []
+
+        try:
+            with lock_if_enabled(path, shared=True), dbm.open(str(path), "r") as db:
+                key = self._index_key(index, value)
+                if db.get(INDEX_FORMAT_KEY) != INDEX_FORMAT.encode("utf-8"):
+                    return self._read_legacy_ids(db, key)
+                return self._read_ids(db, key)
+        except (json.JSONDecodeError, *DBM_ERRORS) as e:
+            raise IOError(f"Failed to load data from {filename}: {e}") from e
+
+    def _normalize(self, filename: str) -> str:
+        filename = self.resolver.ensure_dbm_suffix(filename)
+        self.resolver.validate_filename(filename, allowed_extensions=(".dbm",))
+        return filename
+
+    def _path(self, filename: str) -> Path:
+        return self.resolver.get_full_path(filename)
+
+    def _put(self, db, record: dict) -> None:
+        record_id = record["id"]
+        old = db.get(RECORD_PREFIX + record_id)
+        old_keys = self._index_keys(json.loads(old)) if old is not None else set()
+        new_keys = self._index_keys(record)
+
+        db[RECORD_PREFIX + record_id] = self._encode(record)
+        # Only index entries whose name, phone or tag changed are rewritten
+        for key in old_keys - new_keys:
+            self._unindex(db, key, record_id)
+        for key in new_keys - old_keys:
+            self._index(db, key, record_id)
+
+    def _delete(self, db, record_id: str) -> None:
+        old = db.get(RECORD_PREFIX + record_id)
+        if old is None:
+            return
+        for key in self._index_keys(json.loads(old)):
+            self._unindex(db, key, record_id)
+        del db[RECORD_PREFIX + record_id]
+
+    def _index(self, db, key: str, record_id: str) -> None:
+        # The value key counts its ids; each id has a slot and a slot lookup
+        owner = self._owner_key(key, record_id)
+        if owner in db:
+            return
+        count = self._count(db, key)
+        db[self._slot_key(key, count)] = record_id
+        db[owner] = str(count)
+        db[key] = str(count + 1)
+
+    def _unindex(self, db, key: str, record_id: str) -> None:
+        owner = self._owner_key(key, record_id)
+        slot = db.get(owner)
+        if slot is None:
+            return
+        slot = int(slot)
+        last = self._count(db, key) - 1
+        if slot != last:
+            # The last id fills the gap, so a removal never rewrites the others
+            moved = db[self._slot_key(key, last)].decode("utf-8")
+            db[self._slot_key(key, slot)] = moved
+            db[self._owner_key(key, moved)] = str(slot)
+        del db[self._slot_key(key, last)]
+        del db[owner]
+        if last:
+            db[key] = str(last)
+        else:
+            del db[key]
+
+    def _upgrade_index(self, db) -> None:
+        if db.get(INDEX_FORMAT_KEY) == INDEX_FORMAT.encode("utf-8"):
+            return
+        prefix = RECORD_PREFIX.encode("utf-8")
+        keys = list(db.keys())
+        for key in keys:
+            if not key.startswith(prefix):
+                del db[key]
+        for key in keys:
+            if key.startswith(prefix):
+                record = json.loads(db[key])
+                for index_key in self._index_keys(record):
+                    self._index(db, index_key, record["id"])
+        db[INDEX_FORMAT_KEY] = INDEX_FORMAT
+
+    @classmethod
+    def _read_ids(cls, db, key: str) -> list[str]:
+        return [
+            db[cls._slot_key(key, slot)].decode("utf-8")
+            for slot in range(cls._count(db, key))
+        ]
+
+    @staticmethod
+    def _read_legacy_ids(db, key: str) -> list[str]:
+        raw = db.get(key)
+        return json.loads(raw) if raw is not None else []
+
+    @staticmethod
+    def _count(db, key: str) -> int:
+        raw = db.get(key)
+        return int(raw) if raw is not None else 0
+
+    @staticmethod
+    def _slot_key(key: str, slot: int) -> str:
+        return f"{key}\0#{slot}"
+
+    @staticmethod
+    def _owner_key(key: str, record_id: str) -> str:
+        return f"{key}\0@{record_id}"
+
+    @staticmethod
+    def _replace_database(built: Path, path: Path) -> None:
+        # One rename for single-file backends; dbm.dumb moves its files in turn
+        for suffix in DBM_SUFFIXES:
+            source = Path(f"{built}{suffix}")
+            if source.exists():
+                os.replace(source, Path(f"{path}{suffix}"))
+
+    @staticmethod
+    def _remove_database(path: Path) -> None:
+        for suffix in DBM_SUFFIXES:
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    @classmethod
+    def _index_keys(cls, record: dict) -> set[str]:
+        keys = set()
+        if record.get("name"):
+            keys.add(cls._index_key("name", record["name"]))
+        for phone in record.get("phones", []):
+            keys.add(cls._index_key("phone", phone))
+        for tag in record.get("tags", []):
+            keys.add(cls._index_key("tag", tag))
+        return keys
+
+    @staticmethod
+    def _index_key(index: str, value: str) -> str:
+        return f"{index}:{value.casefold()}"
+
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
@@ -0,0 +1,96 @@
+import os
+import time
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import Optional
+
+from src.config.storage_config import StorageConfig
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+LOCK_SUFFIX = ".lock"
+POLL_INTERVAL = 0.01
+
+Generation = tuple[int, int, int]
+
+
+class FileLock:
+
+    def __init__(
+        self,
+        path: Path,
+        shared: bool = False,
+        timeout: Optional[float] = None,
+    ):
+        # Locks a sidecar file: the data file itself is replaced on every save
+        self.path = path.with_name(path.name + LOCK_SUFFIX)
+        self.shared = shared
+        self.timeout = (
+            StorageConfig.FILE_LOCK_TIMEOUT_SECONDS if timeout is None else timeout
+        )
+        self._fd: Optional[int] = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.release()
+
+    def acquire(self) -> None:
+        try:
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        except OSError as e:
+            raise IOError(f"Failed to open lock {self.path.name}: {e}") from e
+
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._try_lock(fd)
+                self._fd = fd
+                return
+            except (BlockingIOError, PermissionError):
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    raise IOError(f"Timed out waiting for lock {self.path.name}")
+                time.sleep(POLL_INTERVAL)
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def _try_lock(self, fd: int) -> None:
+        if fcntl is not None:
+            mode = fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX
+            fcntl.flock(fd, mode | fcntl.LOCK_NB)
+        else:
+            # msvcrt has no shared locks, so readers take the lock exclusively
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+
+def lock_if_enabled(path: Path, shared: bool = False) -> AbstractContextManager:
+    # For storages that update their files in place across processes
+    if StorageConfig.FILE_LOCKING:
+        return FileLock(path, shared=shared)
+    return nullcontext()
+
+
+def file_generation(path: Path) -> Optional[Generation]:
+    # Atomic saves replace the file, so a new inode marks every rewrite
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
@@ -1,44 +1,59 @@
+import io
 import json
 import os
 import tempfile
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterator, Optional, TextIO
 
+from src.config.storage_config import StorageConfig
+from src.infrastructure.storage.compression import COMPRESSION_ERRORS, CompressionCodec
+from src.infrastructure.storage.file_lock import file_generation
 from src.infrastructure.storage.storage import Storage
 from src.infrastructure.storage.storage_type import StorageType
 from src.infrastructure.persistence.data_path_resolver import DataPathResolver
 
+MANIFEST_SUFFIX = ".manifest"
+
 
 class JsonStorage(Storage):
 
-    def __init__(self, data_dir: Path | None = None):
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        compression: CompressionCodec | None = None,
+    ):
         self.resolver = DataPathResolver(data_dir) if data_dir else DataPathResolver()
+        self.compression = compression
 
     @property
     def file_extension(self) -> str:
-        return ".json"
+        return ".json" + self.compression.suffix if self.compression else ".json"
 
     @property
     def storage_type(self) -> StorageType:
         return StorageType.JSON
 
     def save(self, data: Any, filename: str, **kwargs) -> str:
-        filename = self.resolver.ensure_json_suffix(filename)
-        self.resolver.validate_filename(filename, allowed_extensions=(".json",))
+        format_version = kwargs.get("format_version", None)
+        filename = self._normalize(filename)
         filepath = self.resolver.get_full_path(filename)
 
         tmp_file = None
         try:
             with tempfile.NamedTemporaryFile(
-                mode="w",
+                mode="wb",
                 delete=False,
                 dir=str(self.resolver.data_dir),
                 prefix=Path(filename).stem + "_",
                 suffix=".tmp",
-                encoding="utf-8",
             ) as tmp:
                 tmp_file = Path(tmp.name)
-                json.dump(data, tmp, ensure_ascii=False, indent=2)
+                with self._text_stream(tmp, "w") as out:
+                    if isinstance(data, Iterator):
+                        self._dump_array(data, out)
+                    else:
+                        json.dump(data, out, ensure_ascii=False, indent=2)
                 tmp.flush()
                 os.fsync(tmp.fileno())
 
@@ -49,9 +64,10 @@ class JsonStorage(Storage):
             except OSError:
                 pass
 
+            self._write_manifest(filepath, format_version)
             return filename
 
-        except (OSError, TypeError, ValueError) as e:
+        except (OSError, TypeError, ValueError) + COMPRESSION_ERRORS as e:
             if tmp_file and tmp_file.exists():
                 try:
                     tmp_file.unlink()
@@ -61,8 +77,7 @@ class JsonStorage(Storage):
 
     def load(self, filename: str, **kwargs) -> Optional[Any]:
         default = kwargs.get("default", None)
-        filename = self.resolver.ensure_json_suffix(filename)
-        self.resolver.validate_filename(filename, allowed_extensions=(".json",))
+        filename = self._normalize(filename)
         filepath = self.resolver.get_full_path(filename)
 
         if not filepath.exists():
@@ -75,7 +90,151 @@ class JsonStorage(Storage):
             return default
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError, ValueError) as e:
+            with open(filepath, "rb") as f, self._text_stream(f, "r") as text:
+                return json.load(text)
+        except (OSError, json.JSONDecodeError, ValueError) + COMPRESSION_ERRORS as e:
+            raise IOError(f"Failed to load data from {filename}: {e}") from e
+
+    def is_trusted(self, filename: str, format_version: int) -> bool:
+        filename = self._normalize(filename)
+        filepath = self.resolver.get_full_path(filename)
+
+        try:
+            with open(self._manifest_path(filepath), "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("format_version") != format_version:
+                return False
+            # The file must still be the one this storage wrote: replacing or
+            # editing it changes its inode, mtime or size. Checked from stat
+            # alone, so trusting a file costs no extra read of it.
+            generation = file_generation(filepath)
+            return generation is not None and manifest.get("file") == list(generation)
+        except (OSError, json.JSONDecodeError, AttributeError):
+            return False
+
+    def iter_load(self, filename: str, **kwargs) -> Optional[Iterator[Any]]:
+        filename = self._normalize(filename)
+        filepath = self.resolver.get_full_path(filename)
+
+        try:
+            if not filepath.exists() or filepath.stat().st_size == 0:
+                return None
+        except OSError:
+            return None
+
+        return self._iter_array(filepath, filename)
+
+    def data_path(self, filename: str) -> Optional[Path]:
+        return self.resolver.get_full_path(self._normalize(filename))
+
+    def _normalize(self, filename: str) -> str:
+        if self.compression:
+            filename = self.compression.ensure_suffix(filename, ".json")
+        else:
+            filename = self.resolver.ensure_json_suffix(filename)
+        self.resolver.validate_filename(
+            filename, allowed_extensions=(self.file_extension,)
+        )
+        return filename
+
+    @contextmanager
+    def _text_stream(self, fileobj: BinaryIO, mode: str) -> Iterator[TextIO]:
+        if self.compression:
+            with self.compression.open_text(fileobj, mode) as text:
+                yield text
+            return
+
+        text = io.TextIOWrapper(fileobj, encoding="utf-8")
+        try:
+            yield text
+        finally:
+            text.detach()
+
+    @staticmethod
+    def _dump_array(items: Iterator[Any], out: TextIO) -> None:
+        # Writes one element at a time so a streamed save never holds the list
+        out.write("[")
+        separator = "\n  "
+        for item in items:
+            out.write(separator)
+            out.write(json.dumps(item, ensure_ascii=False))
+            separator = ",\n  "
+        out.write("\n]" if separator != "\n  " else "]")
+
+    def _iter_array(self, filepath: Path, filename: str) -> Iterator[Any]:
+        # Decode one array element at a time instead of the whole document
+        decoder = json.JSONDecoder()
+        chunk_size = StorageConfig.JSON_STREAM_CHUNK_SIZE
+
+        try:
+            with open(filepath, "rb") as raw, self._text_stream(raw, "r") as f:
+                buffer = ""
+                pos = 0
+                eof = False
+                expect_value = True
+                started = False
+                count = 0
+
+                while True:
+                    while pos < len(buffer) and buffer[pos].isspace():
+                        pos += 1
+                    if pos == len(buffer):
+                        if eof:
+                            raise ValueError("Unexpected end of JSON array")
+                        buffer = f.read(chunk_size)
+                        pos = 0
+                        eof = not buffer
+                        continue
+
+                    char = buffer[pos]
+                    if not started:
+                        if char != "[":
+                            raise ValueError("Expected a JSON array")
+                        started = True
+                        pos += 1
+                    elif char == "]" and (count == 0 or not expect_value):
+                        return
+                    elif char == "," and not expect_value:
+                        expect_value = True
+                        pos += 1
+                    elif expect_value:
+                        try:
+                            value, end = decoder.raw_decode(buffer, pos)
+                        except json.JSONDecodeError:
+                            if eof:
+                                raise
+                            value, end = None, None
+                        if end is None or (end == len(buffer) and not eof):
+                            # The element may continue in the next chunk
+                            more = f.read(chunk_size)
+                            eof = not more
+                            buffer = buffer[pos:] + more
+                            pos = 0
+                            continue
+                        yield value
+                        count += 1
+                        expect_value = False
+                        # Decode in place; the buffer is only sliced on refill
+                        pos = end
+                    else:
+                        raise ValueError(f"Unexpected {char!r} in JSON array")
+        except (OSError, json.JSONDecodeError, ValueError) + COMPRESSION_ERRORS as e:
             raise IOError(f"Failed to load data from {filename}: {e}") from e
+
+    @staticmethod
+    def _manifest_path(filepath: Path) -> Path:
+        return filepath.with_name(filepath.name + MANIFEST_SUFFIX)
+
+    def _write_manifest(self, filepath: Path, format_version: Optional[int]) -> None:
+        manifest_path = self._manifest_path(filepath)
+        if format_version is None:
+            manifest_path.unlink(missing_ok=True)
+            return
+
+        tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"format_version": format_version, "file": file_generation(filepath)},
+                f,
+            )
+        os.replace(tmp_path, manifest_path)
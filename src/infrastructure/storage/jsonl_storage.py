@@ -0,0 +1,323 @@
+import json
+import os
+import secrets
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.logging.logger import setup_logger
+from src.infrastructure.persistence.data_path_resolver import DataPathResolver
+from src.infrastructure.storage.append_log import fsync_directory, truncate_torn_tail
+from src.infrastructure.storage.file_lock import lock_if_enabled
+from src.infrastructure.storage.storage import Storage
+from src.infrastructure.storage.storage_type import StorageType
+
+log = setup_logger()
+
+JOURNAL_SUFFIX = "-journal"
+# First line of a snapshot and of its journal; a journal applies only to the
+# snapshot whose epoch it carries
+EPOCH_KEY = "epoch"
+
+
+class JsonlStorage(Storage):
+
+    _locks: dict[Path, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, data_dir: Path | None = None):
+        self.resolver = DataPathResolver(data_dir) if data_dir else DataPathResolver()
+        self._compactions: dict[Path, threading.Thread] = {}
+
+    @property
+    def file_extension(self) -> str:
+        return ".jsonl"
+
+    @property
+    def storage_type(self) -> StorageType:
+        return StorageType.JSONL
+
+    def journal_key(self, filename: str) -> str:
+        return str(self._snapshot_path(self._normalize(filename)))
+
+    def save(self, data: Any, filename: str, **kwargs) -> str:
+        filename = self._normalize(filename)
+        snapshot = self._snapshot_path(filename)
+
+        try:
+            with self._locked(snapshot):
+                # A new epoch, so a journal left by a crash before the unlink
+                # below is never replayed over this snapshot
+                epoch = secrets.token_hex(8)
+                tmp_file = self._write_snapshot_file(snapshot, data, epoch)
+                os.replace(tmp_file, snapshot)
+                fsync_directory(snapshot.parent)
+                self._journal_path(snapshot).unlink(missing_ok=True)
+        except (OSError, TypeError, ValueError) as e:
+            raise IOError(f"Failed to save data to {filename}: {e}") from e
+        return filename
+
+    def append_changes(
+        self, filename: str, upserts: Iterable[dict], deleted_ids: Iterable[str]
+    ) -> str:
+        filename = self._normalize(filename)
+        snapshot = self._snapshot_path(filename)
+
+        lines = [
+            json.dumps({"op": "put", "record": record}, ensure_ascii=False)
+            for record in upserts
+        ]
+        lines.extend(
+            json.dumps({"op": "delete", "id": record_id}, ensure_ascii=False)
+            for record_id in deleted_ids
+        )
+        if not lines:
+            return filename
+
+        try:
+            with self._locked(snapshot):
+                journal = self._journal_path(snapshot)
+                if truncate_torn_tail(journal):
+                    log.warning(f"Dropped torn journal entry in {journal.name}")
+                epoch = self._read_epoch(snapshot)
+                if self._file_size(journal) and self._read_epoch(journal) != epoch:
+                    log.warning(f"Discarding stale journal {journal.name}")
+                    journal.unlink()
+                if not self._file_size(journal) and epoch is not None:
+                    lines.insert(0, json.dumps({EPOCH_KEY: epoch}))
+                with open(journal, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+        except (OSError, TypeError, ValueError) as e:
+            raise IOError(f"Failed to append changes to {filename}: {e}") from e
+
+        self._compact_if_due(snapshot)
+        return filename
+
+    def load(self, filename: str, **kwargs) -> Optional[Any]:
+        default = kwargs.get("default", None)
+        filename = self._normalize(filename)
+        snapshot = self._snapshot_path(filename)
+
+        with self._locked(snapshot, shared=True):
+            if not snapshot.exists() and not self._journal_path(snapshot).exists():
+                return default
+            try:
+                records = self._replay(snapshot)
+            except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+                raise IOError(f"Failed to load data from {filename}: {e}") from e
+        return list(records.values())
+
+    def compact(self, filename: str) -> None:
+        self._compact(self._snapshot_path(self._normalize(filename)))
+
+    def wait_for_compaction(self, timeout: Optional[float] = None) -> None:
+        for thread in list(self._compactions.values()):
+            thread.join(timeout)
+
+    def _normalize(self, filename: str) -> str:
+        filename = self.resolver.ensure_jsonl_suffix(filename)
+        self.resolver.validate_filename(filename, allowed_extensions=(".jsonl",))
+        return filename
+
+    def _snapshot_path(self, filename: str) -> Path:
+        return self.resolver.get_full_path(filename)
+
+    @staticmethod
+    def _journal_path(snapshot: Path) -> Path:
+        return snapshot.with_name(snapshot.name + JOURNAL_SUFFIX)
+
+    @classmethod
+    def _lock_for(cls, snapshot: Path) -> threading.Lock:
+        with cls._locks_guard:
+            return cls._locks.setdefault(snapshot.resolve(), threading.Lock())
+
+    @contextmanager
+    def _locked(self, snapshot: Path, shared: bool = False) -> Iterator[None]:
+        # The thread lock orders this process; the file lock orders the others
+        with self._lock_for(snapshot), lock_if_enabled(snapshot, shared):
+            yield
+
+    def _replay(self, snapshot: Path) -> dict[str, dict]:
+        records: dict[str, dict] = {}
+        epoch = None
+        if snapshot.exists():
+            with open(snapshot, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        record = json.loads(line)
+                        if EPOCH_KEY in record and "id" not in record:
+                            epoch = record[EPOCH_KEY]
+                            continue
+                        records[record["id"]] = record
+
+        journal = self._journal_path(snapshot)
+        if journal.exists():
+            with open(journal, "r", encoding="utf-8") as f:
+                first = True
+                for line in f:
+                    if not line.strip():
+                        continue
+                    if not line.endswith("\n"):
+                        # Only the last append can be torn by a crash; an entry
+                        # counts once its newline is written
+                        log.warning(f"Ignoring torn journal entry in {journal.name}")
+                        break
+                    entry = json.loads(line)
+                    if first:
+                        first = False
+                        if entry.get(EPOCH_KEY) != epoch:
+                            # Written before the last full save replaced the
+                            # snapshot; its changes are already superseded
+                            log.warning(f"Ignoring stale journal {journal.name}")
+                            break
+                        if EPOCH_KEY in entry:
+                            continue
+                    if entry["op"] == "put":
+                        records[entry["record"]["id"]] = entry["record"]
+                    elif entry["op"] == "delete":
+                        records.pop(entry["id"], None)
+                    else:
+                        raise ValueError(f"Unknown journal operation: {entry['op']}")
+        return records
+
+    @staticmethod
+    def _read_epoch(path: Path) -> Optional[str]:
+        # Files written before epochs existed have none and match each other
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                first = f.readline()
+        except FileNotFoundError:
+            return None
+        if not first.endswith("\n"):
+            return None
+        try:
+            entry = json.loads(first)
+        except json.JSONDecodeError:
+            return None
+        return entry.get(EPOCH_KEY) if "id" not in entry else None
+
+    def _write_snapshot_file(
+        self, snapshot: Path, records: Iterable[dict], epoch: Optional[str]
+    ) -> Path:
+        tmp_file = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w",
+                delete=False,
+                dir=str(snapshot.parent),
+                prefix=snapshot.stem + "_",
+                suffix=".tmp",
+                encoding="utf-8",
+            ) as tmp:
+                tmp_file = Path(tmp.name)
+                if epoch is not None:
+                    tmp.write(json.dumps({EPOCH_KEY: epoch}) + "\n")
+                for record in records:
+                    tmp.write(json.dumps(record, ensure_ascii=False))
+                    tmp.write("\n")
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            try:
+                os.chmod(tmp_file, 0o600)
+            except OSError:
+                pass
+            return tmp_file
+
+        except (OSError, TypeError, ValueError):
+            if tmp_file and tmp_file.exists():
+                tmp_file.unlink(missing_ok=True)
+            raise
+
+    def _compact_if_due(self, snapshot: Path) -> None:
+        journal_size = self._file_size(self._journal_path(snapshot))
+        threshold = max(
+            self._file_size(snapshot), StorageConfig.JSONL_COMPACTION_MIN_BYTES
+        )
+        if journal_size < threshold:
+            return
+
+        if not StorageConfig.JSONL_BACKGROUND_COMPACTION:
+            self._compact(snapshot)
+            return
+
+        running = self._compactions.get(snapshot)
+        if running and running.is_alive():
+            return
+        thread = threading.Thread(
+            target=self._compact_in_background,
+            args=(snapshot,),
+            name=f"jsonl-compaction-{snapshot.name}",
+            daemon=True,
+        )
+        self._compactions[snapshot] = thread
+        thread.start()
+
+    def _compact_in_background(self, snapshot: Path) -> None:
+        try:
+            self._compact(snapshot)
+        except Exception as e:
+            log.error(f"Failed to compact {snapshot.name}: {e}")
+
+    def _compact(self, snapshot: Path) -> None:
+        journal = self._journal_path(snapshot)
+
+        with self._locked(snapshot):
+            if not journal.exists():
+                return
+            records = self._replay(snapshot)
+            offset = journal.stat().st_size
+            snapshot_id = self._file_id(snapshot)
+            # The epoch is kept: replaying the old journal over the compacted
+            # snapshot after a crash applies the same changes again
+            epoch = self._read_epoch(snapshot)
+
+        # Appends may continue while the new snapshot is being written
+        tmp_file = self._write_snapshot_file(snapshot, records.values(), epoch)
+
+        with self._locked(snapshot):
+            rewritten = self._file_id(snapshot) != snapshot_id
+            if rewritten or self._file_size(journal) < offset:
+                # The file was rewritten meanwhile, this snapshot is stale
+                tmp_file.unlink(missing_ok=True)
+                return
+
+            with open(journal, "rb") as f:
+                f.seek(offset)
+                tail = f.read()
+
+            os.replace(tmp_file, snapshot)
+            fsync_directory(snapshot.parent)
+            if not tail:
+                journal.unlink()
+                return
+
+            tail_file = journal.with_name(journal.name + ".tmp")
+            with open(tail_file, "wb") as f:
+                if epoch is not None:
+                    f.write((json.dumps({EPOCH_KEY: epoch}) + "\n").encode("utf-8"))
+                f.write(tail)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tail_file, journal)
+            fsync_directory(journal.parent)
+
+    @staticmethod
+    def _file_size(path: Path) -> int:
+        try:
+            return path.stat().st_size
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _file_id(path: Path) -> Optional[tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
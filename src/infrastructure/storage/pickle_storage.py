@@ -4,6 +4,7 @@ import tempfile
 from pathlib import Path
 from typing import Optional, Any
 
+from src.infrastructure.storage.compression import COMPRESSION_ERRORS, CompressionCodec
 from src.infrastructure.storage.storage import Storage
 from src.infrastructure.storage.storage_type import StorageType
 from src.infrastructure.persistence.data_path_resolver import DataPathResolver, RESERVED_BASENAME
@@ -11,12 +12,17 @@ from src.infrastructure.persistence.data_path_resolver import DataPathResolver,
 
 class PickleStorage(Storage):
 
-    def __init__(self, data_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        compression: Optional[CompressionCodec] = None,
+    ):
         self.resolver = DataPathResolver(data_dir) if data_dir else DataPathResolver()
+        self.compression = compression
 
     @property
     def file_extension(self) -> str:
-        return ".pkl"
+        return ".pkl" + self.compression.suffix if self.compression else ".pkl"
 
     @property
     def storage_type(self) -> StorageType:
@@ -27,8 +33,7 @@ class PickleStorage(Storage):
         if user_provided:
             self.resolver.raise_if_reserved(filename, RESERVED_BASENAME)
 
-        filename = self.resolver.ensure_pkl_suffix(filename)
-        self.resolver.validate_filename(filename, allowed_extensions=(".pkl",))
+        filename = self._normalize(filename)
         filepath = self.resolver.get_full_path(filename)
 
         tmp_file = None
@@ -45,7 +50,11 @@ class PickleStorage(Storage):
                     os.chmod(tmp.name, 0o600)
                 except OSError:
                     pass
-                pickle.dump(data, tmp, protocol=pickle.HIGHEST_PROTOCOL)
+                if self.compression:
+                    with self.compression.open_binary(tmp, "w") as out:
+                        pickle.dump(data, out, protocol=pickle.HIGHEST_PROTOCOL)
+                else:
+                    pickle.dump(data, tmp, protocol=pickle.HIGHEST_PROTOCOL)
                 tmp.flush()
                 os.fsync(tmp.fileno())
 
@@ -58,7 +67,7 @@ class PickleStorage(Storage):
 
             return filename
 
-        except (OSError, pickle.PicklingError) as e:
+        except (OSError, pickle.PicklingError) + COMPRESSION_ERRORS as e:
             if tmp_file and tmp_file.exists():
                 try:
                     tmp_file.unlink()
@@ -71,8 +80,7 @@ class PickleStorage(Storage):
         if user_provided:
             self.resolver.raise_if_reserved(filename, RESERVED_BASENAME)
 
-        filename = self.resolver.ensure_pkl_suffix(filename)
-        self.resolver.validate_filename(filename, allowed_extensions=(".pkl",))
+        filename = self._normalize(filename)
         filepath = self.resolver.get_full_path(filename)
 
         if not filepath.exists():
@@ -86,6 +94,27 @@ class PickleStorage(Storage):
 
         try:
             with open(filepath, "rb") as f:
-                return pickle.load(f)
-        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+                if not self.compression:
+                    return pickle.load(f)
+                with self.compression.open_binary(f, "r") as stream:
+                    return pickle.load(stream)
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+        ) + COMPRESSION_ERRORS as e:
             raise IOError(f"Failed to load data: {e}") from e
+
+    def data_path(self, filename: str) -> Optional[Path]:
+        return self.resolver.get_full_path(self._normalize(filename))
+
+    def _normalize(self, filename: str) -> str:
+        if self.compression:
+            filename = self.compression.ensure_suffix(filename, ".pkl")
+        else:
+            filename = self.resolver.ensure_pkl_suffix(filename)
+        self.resolver.validate_filename(
+            filename, allowed_extensions=(self.file_extension,)
+        )
+        return filename
@@ -0,0 +1,271 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.persistence.data_path_resolver import DataPathResolver
+from src.infrastructure.storage.storage import Storage
+from src.infrastructure.storage.storage_type import StorageType
+
+MANIFEST_NAME = "manifest.json"
+SHARD_FORMAT_VERSION = 2
+# Version 1 rewrote shards in place under names without a checksum
+LEGACY_SHARD_FORMAT_VERSION = 1
+
+
+class ShardedJsonStorage(Storage):
+
+    def __init__(self, data_dir: Path | None = None):
+        self.resolver = DataPathResolver(data_dir) if data_dir else DataPathResolver()
+
+    @property
+    def file_extension(self) -> str:
+        return ".shards"
+
+    @property
+    def storage_type(self) -> StorageType:
+        return StorageType.JSON_SHARDED
+
+    def shard_key(self, filename: str) -> str:
+        return str(self._directory(self._normalize(filename)))
+
+    def shard_locator(self, filename: str) -> Callable[[str], str]:
+        manifest = self._read_manifest(self._directory(self._normalize(filename)))
+        prefix_length = manifest.get(
+            "prefix_length", StorageConfig.JSON_SHARD_PREFIX_LENGTH
+        )
+        return lambda record_id: self._shard_of(record_id, prefix_length)
+
+    def save(self, data: Any, filename: str, **kwargs) -> str:
+        # Every shard is considered; shards whose content is unchanged are skipped
+        filename = self._normalize(filename)
+        directory = self._directory(filename)
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            manifest = self._read_manifest(directory)
+            prefix_length = StorageConfig.JSON_SHARD_PREFIX_LENGTH
+
+            grouped: dict[str, list[dict]] = defaultdict(list)
+            for record in data:
+                grouped[self._shard_of(record["id"], prefix_length)].append(record)
+            self._write_shards(directory, manifest, grouped, prefix_length, True)
+        except (OSError, TypeError, ValueError, KeyError) as e:
+            raise IOError(f"Failed to save data to {filename}: {e}") from e
+        return filename
+
+    def apply_changes(
+        self, filename: str, upserts: Iterable[dict], deleted_ids: Iterable[str]
+    ) -> str:
+        # Only changed IDs are hashed; the rest of each touched shard is read
+        # back from its current file
+        filename = self._normalize(filename)
+        directory = self._directory(filename)
+
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+            manifest = self._read_manifest(directory)
+            entries = self._shard_entries(manifest)
+            prefix_length = manifest.get(
+                "prefix_length", StorageConfig.JSON_SHARD_PREFIX_LENGTH
+            )
+
+            changes: dict[str, dict[str, Optional[dict]]] = defaultdict(dict)
+            for record in upserts:
+                record_id = record["id"]
+                changes[self._shard_of(record_id, prefix_length)][record_id] = record
+            for record_id in deleted_ids:
+                changes[self._shard_of(record_id, prefix_length)][record_id] = None
+
+            grouped: dict[str, list[dict]] = {}
+            for shard, changed in changes.items():
+                entry = entries.get(shard)
+                current = (
+                    self._read_shard(directory / entry["file"], entry["sha256"])
+                    if entry
+                    else []
+                )
+                grouped[shard] = [
+                    record for record in current if record["id"] not in changed
+                ]
+                grouped[shard].extend(r for r in changed.values() if r is not None)
+            self._write_shards(directory, manifest, grouped, prefix_length, False)
+        except (OSError, TypeError, ValueError, KeyError) as e:
+            raise IOError(f"Failed to save data to {filename}: {e}") from e
+        return filename
+
+    def load(self, filename: str, **kwargs) -> Optional[Any]:
+        default = kwargs.get("default", None)
+        filename = self._normalize(filename)
+        directory = self._directory(filename)
+
+        try:
+            if not (directory / MANIFEST_NAME).exists():
+                return default
+            for attempt in range(2):
+                manifest = self._read_manifest(directory)
+                if manifest.get("format_version") not in (
+                    SHARD_FORMAT_VERSION,
+                    LEGACY_SHARD_FORMAT_VERSION,
+                ):
+                    raise ValueError(
+                        f"Unsupported shard format: {manifest.get('format_version')}"
+                    )
+                try:
+                    shards = self._read_shards(directory, self._shard_entries(manifest))
+                    break
+                except FileNotFoundError:
+                    # A concurrent save swapped the manifest and removed old shards
+                    if attempt:
+                        raise
+        except (OSError, json.JSONDecodeError, KeyError, ValueError) as e:
+            raise IOError(f"Failed to load data from {filename}: {e}") from e
+
+        return [record for records in shards for record in records]
+
+    def _write_shards(
+        self,
+        directory: Path,
+        manifest: dict,
+        grouped: dict[str, list[dict]],
+        prefix_length: int,
+        complete: bool,
+    ) -> None:
+        # A complete grouping also empties listed shards it has no records for
+        entries = self._shard_entries(manifest)
+        targets = set(grouped) | (set(entries) if complete else set())
+
+        changed = False
+        for shard in sorted(targets):
+            records = grouped.get(shard)
+            if not records:
+                if entries.pop(shard, None) is not None:
+                    changed = True
+                continue
+
+            records.sort(key=lambda record: record["id"])
+            content = json.dumps(records, ensure_ascii=False).encode("utf-8")
+            checksum = hashlib.sha256(content).hexdigest()
+            if entries.get(shard, {}).get("sha256") == checksum:
+                continue
+            # A new name per content, so listed shards are never overwritten
+            name = self._shard_name(shard, checksum)
+            self._write_atomic(directory / name, content)
+            entries[shard] = {"file": name, "sha256": checksum}
+            changed = True
+
+        if (
+            changed
+            or manifest.get("prefix_length") != prefix_length
+            or manifest.get("format_version") != SHARD_FORMAT_VERSION
+        ):
+            # Swapping the manifest switches readers to the new shards at once
+            manifest = {
+                "format_version": SHARD_FORMAT_VERSION,
+                "prefix_length": prefix_length,
+                "shards": dict(sorted(entries.items())),
+            }
+            self._write_atomic(
+                directory / MANIFEST_NAME, json.dumps(manifest).encode("utf-8")
+            )
+            # Replaced shards go last, once no manifest lists them
+            self._remove_unlisted(directory, entries)
+
+    def _normalize(self, filename: str) -> str:
+        filename = self.resolver.ensure_shards_suffix(filename)
+        self.resolver.validate_filename(filename, allowed_extensions=(".shards",))
+        return filename
+
+    def _directory(self, filename: str) -> Path:
+        return self.resolver.get_full_path(filename)
+
+    @staticmethod
+    def _shard_of(record_id: str, prefix_length: int) -> str:
+        digest = hashlib.blake2b(record_id.encode("utf-8"), digest_size=8)
+        return digest.hexdigest()[:prefix_length]
+
+    @staticmethod
+    def _shard_name(shard: str, checksum: str) -> str:
+        return f"shard-{shard}-{checksum[:16]}.json"
+
+    @staticmethod
+    def _shard_entries(manifest: dict) -> dict[str, dict[str, str]]:
+        shards = manifest.get("shards", {})
+        if manifest.get("format_version") == LEGACY_SHARD_FORMAT_VERSION:
+            return {
+                shard: {"file": f"shard-{shard}.json", "sha256": checksum}
+                for shard, checksum in shards.items()
+            }
+        return {shard: dict(entry) for shard, entry in shards.items()}
+
+    @staticmethod
+    def _remove_unlisted(directory: Path, entries: dict[str, dict[str, str]]) -> None:
+        # Also clears shards left behind by a save that never swapped the manifest
+        listed = {entry["file"] for entry in entries.values()}
+        for path in directory.glob("shard-*.json"):
+            if path.name not in listed:
+                path.unlink(missing_ok=True)
+
+    @staticmethod
+    def _read_manifest(directory: Path) -> dict:
+        manifest_path = directory / MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _read_shards(
+        self, directory: Path, entries: dict[str, dict[str, str]]
+    ) -> list[list[dict]]:
+        with ThreadPoolExecutor(
+            max_workers=StorageConfig.JSON_SHARD_LOAD_WORKERS
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda entry: self._read_shard(
+                        directory / entry["file"], entry["sha256"]
+                    ),
+                    entries.values(),
+                )
+            )
+
+    @staticmethod
+    def _read_shard(path: Path, checksum: str) -> list[dict]:
+        with open(path, "rb") as f:
+            content = f.read()
+        if hashlib.sha256(content).hexdigest() != checksum:
+            raise ValueError(f"Checksum mismatch in {path.name}")
+        return json.loads(content.decode("utf-8"))
+
+    @staticmethod
+    def _write_atomic(path: Path, content: bytes) -> None:
+        tmp_file = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="wb",
+                delete=False,
+                dir=str(path.parent),
+                prefix=path.stem + "_",
+                suffix=".tmp",
+            ) as tmp:
+                tmp_file = Path(tmp.name)
+                tmp.write(content)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            os.replace(tmp_file, path)
+
+            try:
+                os.chmod(path, 0o600)
+            except OSError:
+                pass
+
+        except OSError:
+            if tmp_file and tmp_file.exists():
+                tmp_file.unlink(missing_ok=True)
+            raise
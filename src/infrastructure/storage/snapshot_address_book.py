@@ -0,0 +1,52 @@
+from functools import partial
+from typing import Iterator
+
+from src.domain.entities.contact import Contact
+from src.domain.lazy_address_book import LazyAddressBook
+from src.infrastructure.serialization.json_serializer import JsonSerializer
+from src.infrastructure.storage.snapshot_format import SnapshotReader
+
+
+class SnapshotAddressBook(LazyAddressBook):
+
+    def __init__(self, reader: SnapshotReader, serializer: JsonSerializer, **kwargs):
+        super().__init__(**kwargs)
+        self._reader = reader
+        self._serializer = serializer
+
+    def rebind(self, reader: SnapshotReader) -> None:
+        # Contacts decoded so far stay cached; the old mapping is released
+        self._reader.close()
+        self._reader = reader
+
+    def close(self) -> None:
+        self._reader.close()
+
+    def _stored_count(self) -> int:
+        return len(self._reader)
+
+    def _stored_ids(self) -> Iterator[str]:
+        return self._reader.ids()
+
+    def _is_stored(self, key: str) -> bool:
+        return self._reader.find(key) is not None
+
+    def _fetch(self, key: str) -> Contact:
+        position = self._reader.find(key)
+        if position is None:
+            raise KeyError(key)
+        return self._decode(position)
+
+    def values(self) -> Iterator[Contact]:
+        changes = self.pending_changes()
+        for position in range(len(self._reader)):
+            key = self._reader.record_id(position)
+            if key in changes.deleted:
+                continue
+            yield self._streamed(key, partial(self._decode, position))
+        yield from [
+            contact for key, contact in self.data.items() if key in changes.created
+        ]
+
+    def _decode(self, position: int) -> Contact:
+        return self._serializer.dict_to_contact(self._reader.record(position))
@@ -0,0 +1,202 @@
+import mmap
+import struct
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+from src.config.storage_config import StorageConfig
+
+MAGIC = b"ABOOKSNP"
+FORMAT_VERSION = 1
+NO_STRING = 0xFFFFFFFF
+
+# magic, version, reserved, record count, string count and section offsets
+HEADER = struct.Struct("<8sHHIIQQQQQ")
+# id, name, birthday, email, address, first phone slot, phone count
+RECORD = struct.Struct("<7I")
+STRING_SPAN = struct.Struct("<QQ")
+UINT32 = struct.Struct("<I")
+
+
+class SnapshotWriter:
+
+    @staticmethod
+    def write(stream: BinaryIO, records: Iterable[dict]) -> int:
+        strings: dict[str, int] = {}
+
+        def intern(value: Optional[str]) -> int:
+            if value is None:
+                return NO_STRING
+            index = strings.get(value)
+            if index is None:
+                index = strings[value] = len(strings)
+            return index
+
+        rows = bytearray()
+        phones: list[int] = []
+        ids: list[str] = []
+        for record in records:
+            phone_indexes = [intern(phone) for phone in record.get("phones", [])]
+            rows += RECORD.pack(
+                intern(record["id"]),
+                intern(record["name"]),
+                intern(record.get("birthday")),
+                intern(record.get("email")),
+                intern(record.get("address")),
+                len(phones),
+                len(phone_indexes),
+            )
+            phones.extend(phone_indexes)
+            ids.append(record["id"])
+
+        encoded = [value.encode("utf-8") for value in strings]
+        offsets = [0]
+        for value in encoded:
+            offsets.append(offsets[-1] + len(value))
+        # Record positions sorted by ID, searched with bisection on load
+        index = sorted(range(len(ids)), key=ids.__getitem__)
+
+        offsets_at = HEADER.size
+        data_at = offsets_at + 8 * len(offsets)
+        records_at = data_at + offsets[-1]
+        phones_at = records_at + len(rows)
+        index_at = phones_at + 4 * len(phones)
+
+        stream.write(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                0,
+                len(ids),
+                len(encoded),
+                offsets_at,
+                data_at,
+                records_at,
+                phones_at,
+                index_at,
+            )
+        )
+        stream.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        stream.write(b"".join(encoded))
+        stream.write(rows)
+        stream.write(struct.pack(f"<{len(phones)}I", *phones))
+        stream.write(struct.pack(f"<{len(index)}I", *index))
+        return len(ids)
+
+
+class SnapshotReader:
+
+    def __init__(
+        self, path: Path, cache_size: int = StorageConfig.LAZY_CONTACT_CACHE_SIZE
+    ):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        self._finalizer = weakref.finalize(self, self._release, self._map, self._file)
+
+        try:
+            (
+                magic,
+                version,
+                _,
+                self._count,
+                self._string_count,
+                self._offsets_at,
+                self._data_at,
+                self._records_at,
+                self._phones_at,
+                self._index_at,
+            ) = HEADER.unpack_from(self._map, 0)
+        except struct.error as e:
+            self.close()
+            raise ValueError(f"Truncated snapshot header: {e}") from e
+
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Not an address book snapshot")
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if self._index_at + 4 * self._count != len(self._map):
+            self.close()
+            raise ValueError("Snapshot size does not match its header")
+
+        # Recently decoded strings only; the mapped table is the full copy
+        self._strings: OrderedDict[int, str] = OrderedDict()
+        self._cache_size = cache_size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def string(self, index: int) -> Optional[str]:
+        if index == NO_STRING:
+            return None
+        value = self._strings.get(index)
+        if value is not None:
+            self._strings.move_to_end(index)
+            return value
+        span_at = self._offsets_at + 8 * index
+        start, end = STRING_SPAN.unpack_from(self._map, span_at)
+        value = self._map[self._data_at + start : self._data_at + end].decode("utf-8")
+        self._strings[index] = value
+        if len(self._strings) > self._cache_size:
+            self._strings.popitem(last=False)
+        return value
+
+    def record_id(self, position: int) -> str:
+        (id_index,) = UINT32.unpack_from(
+            self._map, self._records_at + RECORD.size * position
+        )
+        return self.string(id_index)
+
+    def record(self, position: int) -> dict:
+        (
+            id_index,
+            name_index,
+            birthday_index,
+            email_index,
+            address_index,
+            first_phone,
+            phone_count,
+        ) = RECORD.unpack_from(self._map, self._records_at + RECORD.size * position)
+        phones = struct.unpack_from(
+            f"<{phone_count}I", self._map, self._phones_at + 4 * first_phone
+        )
+        return {
+            "id": self.string(id_index),
+            "name": self.string(name_index),
+            "phones": [self.string(phone) for phone in phones],
+            "birthday": self.string(birthday_index),
+            "email": self.string(email_index),
+            "address": self.string(address_index),
+        }
+
+    def ids(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self.record_id(position)
+
+    def find(self, record_id: str) -> Optional[int]:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            (position,) = UINT32.unpack_from(self._map, self._index_at + 4 * middle)
+            current = self.record_id(position)
+            if current < record_id:
+                low = middle + 1
+            elif current > record_id:
+                high = middle
+            else:
+                return position
+        return None
+
+    def close(self) -> None:
+        self._finalizer()
+
+    @staticmethod
+    def _release(mapped: mmap.mmap, file: BinaryIO) -> None:
+        mapped.close()
+        file.close()
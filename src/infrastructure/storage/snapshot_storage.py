@@ -0,0 +1,104 @@
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from src.domain.address_book import AddressBook
+from src.infrastructure.persistence.data_path_resolver import DataPathResolver
+from src.infrastructure.serialization.json_serializer import JsonSerializer
+from src.infrastructure.storage.snapshot_address_book import SnapshotAddressBook
+from src.infrastructure.storage.snapshot_format import SnapshotReader, SnapshotWriter
+from src.infrastructure.storage.storage import Storage
+from src.infrastructure.storage.storage_type import StorageType
+
+
+class SnapshotStorage(Storage):
+
+    def __init__(
+        self,
+        data_dir: Path | None = None,
+        serializer: JsonSerializer | None = None,
+    ):
+        self.resolver = DataPathResolver(data_dir) if data_dir else DataPathResolver()
+        self.serializer = serializer if serializer else JsonSerializer()
+
+    @property
+    def file_extension(self) -> str:
+        return ".snap"
+
+    @property
+    def storage_type(self) -> StorageType:
+        return StorageType.SNAPSHOT
+
+    def snapshot_key(self, filename: str) -> str:
+        return str(self.resolver.get_full_path(self._normalize(filename)))
+
+    def save(self, data: Any, filename: str, **kwargs) -> str:
+        filename = self._normalize(filename)
+        filepath = self.resolver.get_full_path(filename)
+
+        tmp_file = None
+        try:
+            if not isinstance(data, AddressBook):
+                raise TypeError("Snapshots can only hold an AddressBook")
+
+            with tempfile.NamedTemporaryFile(
+                mode="wb",
+                delete=False,
+                dir=str(self.resolver.data_dir),
+                prefix=Path(filename).stem + "_",
+                suffix=".tmp",
+            ) as tmp:
+                tmp_file = Path(tmp.name)
+                SnapshotWriter.write(
+                    tmp,
+                    (self.serializer.contact_to_dict(c) for c in data.values()),
+                )
+                tmp.flush()
+                os.fsync(tmp.fileno())
+
+            os.replace(tmp_file, filepath)
+
+            try:
+                os.chmod(filepath, 0o600)
+            except OSError:
+                pass
+
+        except (OSError, TypeError, ValueError) as e:
+            if tmp_file and tmp_file.exists():
+                try:
+                    tmp_file.unlink()
+                except OSError:
+                    pass
+            raise IOError(f"Failed to save data to {filename}: {e}") from e
+
+        if isinstance(data, SnapshotAddressBook):
+            # The written file now holds every pending change of the book
+            data.rebind(SnapshotReader(filepath))
+            data.mark_flushed(str(filepath))
+        return filename
+
+    def load(self, filename: str, **kwargs) -> Optional[Any]:
+        default = kwargs.get("default", None)
+        filename = self._normalize(filename)
+        filepath = self.resolver.get_full_path(filename)
+
+        if not filepath.exists():
+            return default
+
+        reader = self.reader(filename)
+        address_book = SnapshotAddressBook(reader, self.serializer)
+        address_book.mark_flushed(str(filepath))
+        return address_book
+
+    def reader(self, filename: str) -> SnapshotReader:
+        filename = self._normalize(filename)
+        try:
+            return SnapshotReader(self.resolver.get_full_path(filename))
+        except (OSError, ValueError) as e:
+            raise IOError(f"Failed to load data from {filename}: {e}") from e
+
+    def _normalize(self, filename: str) -> str:
+        filename = self.resolver.ensure_snap_suffix(filename)
+        self.resolver.validate_filename(filename, allowed_extensions=(".snap",))
+        return filename
@@ -0,0 +1,205 @@
+from datetime import date, timedelta
+from functools import partial
+from typing import Callable, Iterator
+
+from sqlalchemy import and_, exists, func, literal_column, or_
+from sqlalchemy.orm import Query, sessionmaker
+
+from src.config.storage_config import StorageConfig
+from src.domain.entities.contact import Contact
+from src.domain.lazy_address_book import LazyAddressBook
+from src.domain.mappers.contact_mapper import ContactMapper
+from src.domain.models.dbcontact import BIRTHDAY_MONTH_DAY_SQL, DBContact
+from src.domain.models.dbcontact_phone import DBContactPhone
+
+LEAP_DAY = "0229"
+
+
+class SQLiteAddressBook(LazyAddressBook):
+
+    def __init__(self, session_factory: sessionmaker, **kwargs):
+        super().__init__(**kwargs)
+        self._session_factory = session_factory
+
+    def _stored_count(self) -> int:
+        with self._session_factory() as session:
+            return session.query(func.count(DBContact.id)).scalar()
+
+    def _stored_ids(self) -> Iterator[str]:
+        with self._session_factory() as session:
+            for (contact_id,) in session.query(DBContact.id).order_by(
+                literal_column("contacts.rowid")
+            ):
+                yield contact_id
+
+    def _is_stored(self, key: str) -> bool:
+        with self._session_factory() as session:
+            return session.get(DBContact, key) is not None
+
+    def _fetch(self, key: str) -> Contact:
+        with self._session_factory() as session:
+            db_contact = session.get(DBContact, key)
+            if db_contact is None:
+                raise KeyError(key)
+            return ContactMapper.from_dbmodel(db_contact)
+
+    def values(self) -> Iterator[Contact]:
+        return self._query(lambda query: query, lambda contact: True)
+
+    def find_all(self, contact_name: str, ignore_case: bool = False) -> list[Contact]:
+        if ignore_case:
+            # SQLite's lower() only folds ASCII, so compare with casefold()
+            folded = contact_name.casefold()
+            return list(
+                self._query(
+                    lambda query: query.filter(func.casefold(DBContact.name) == folded),
+                    lambda contact: contact.name.value.casefold() == folded,
+                )
+            )
+        return list(
+            self._query(
+                lambda query: query.filter(DBContact.name == contact_name),
+                lambda contact: contact.name.value == contact_name,
+            )
+        )
+
+    def find_by_phone(self, phone: str) -> list[Contact]:
+        return list(
+            self._query(
+                lambda query: query.filter(
+                    exists().where(
+                        and_(
+                            DBContactPhone.contact_id == DBContact.id,
+                            DBContactPhone.phone == phone,
+                        )
+                    )
+                ),
+                lambda contact: any(p.value == phone for p in contact.phones),
+            )
+        )
+
+    def find_by_phone_suffix(self, digits: str) -> list[Contact]:
+        return list(
+            self._query(
+                lambda query: query.filter(
+                    exists().where(
+                        and_(
+                            DBContactPhone.contact_id == DBContact.id,
+                            DBContactPhone.phone.endswith(digits, autoescape=True),
+                        )
+                    )
+                ),
+                lambda contact: any(p.value.endswith(digits) for p in contact.phones),
+            )
+        )
+
+    def search(self, search_text: str, exact: bool = False) -> list[Contact]:
+        digits = "".join(c for c in search_text if c.isdigit())
+        phone_matches = DBContactPhone.contact_id == DBContact.id
+        conditions = []
+
+        if digits:
+            conditions.append(
+                exists().where(
+                    and_(
+                        phone_matches,
+                        or_(
+                            func.instr(DBContactPhone.phone, digits) > 0,
+                            func.instr(digits, DBContactPhone.phone) > 0,
+                        ),
+                    )
+                )
+            )
+
+        if exact:
+            conditions.extend(
+                [
+                    DBContact.name == search_text,
+                    DBContact.email == search_text,
+                    DBContact.address == search_text,
+                    exists().where(
+                        and_(phone_matches, DBContactPhone.phone == search_text)
+                    ),
+                ]
+            )
+        else:
+            needle = search_text.casefold()
+            conditions.extend(
+                func.instr(func.casefold(column), needle) > 0
+                for column in (DBContact.name, DBContact.email, DBContact.address)
+            )
+            conditions.append(
+                exists().where(
+                    and_(
+                        phone_matches,
+                        func.instr(func.casefold(DBContactPhone.phone), needle) > 0,
+                    )
+                )
+            )
+
+        candidates = self._query(
+            lambda query: query.filter(or_(*conditions)),
+            lambda contact: True,
+        )
+        return [c for c in candidates if c.is_matching(search_text, exact)]
+
+    def get_upcoming_birthdays(self, days_ahead) -> list[dict]:
+        today = date.today()
+        month_day = literal_column(BIRTHDAY_MONTH_DAY_SQL)
+        start = today.strftime("%m%d")
+        end = (today + timedelta(days=days_ahead)).strftime("%m%d")
+
+        if days_ahead >= 365:
+            window = DBContact.birthday.isnot(None)
+        elif start <= end:
+            window = month_day.between(start, end)
+        else:
+            # The window wraps past the end of the year
+            window = or_(month_day >= start, month_day <= end)
+
+        # Feb 29 birthdays are celebrated on Mar 1 in common years
+        candidates = self._query(
+            lambda query: query.filter(or_(window, month_day == LEAP_DAY)),
+            lambda contact: contact.birthday is not None,
+        )
+        return self._collect_upcoming_birthdays(candidates, days_ahead)
+
+    def _query(
+        self,
+        apply_filter: Callable[[Query], Query],
+        matches: Callable[[Contact], bool],
+    ) -> Iterator[Contact]:
+        changes = self.pending_changes()
+        unsaved = changes.upserted
+        rowid = literal_column("contacts.rowid")
+        last_rowid = 0
+
+        # Keyset pages keep each read short and only one page in memory
+        while True:
+            with self._session_factory() as session:
+                page = (
+                    apply_filter(session.query(DBContact, rowid))
+                    .filter(rowid > last_rowid)
+                    .order_by(rowid)
+                    .limit(StorageConfig.SQLITE_BULK_BATCH_SIZE)
+                    .all()
+                )
+                contacts = [
+                    self._streamed(
+                        db_contact.id, partial(ContactMapper.from_dbmodel, db_contact)
+                    )
+                    for db_contact, _ in page
+                    if db_contact.id not in changes.deleted
+                    and db_contact.id not in unsaved
+                ]
+            yield from contacts
+            if len(page) < StorageConfig.SQLITE_BULK_BATCH_SIZE:
+                break
+            last_rowid = page[-1][1]
+
+        # Unsaved contacts are not in the database yet, check them in memory
+        yield from [
+            contact
+            for key, contact in self.data.items()
+            if key in unsaved and matches(contact)
+        ]
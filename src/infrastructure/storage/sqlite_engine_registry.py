@@ -0,0 +1,125 @@
+import threading
+import time
+from functools import partial
+from pathlib import Path
+from typing import Optional, Type
+
+from sqlalchemy import create_engine, event, text, Engine
+from sqlalchemy.orm import sessionmaker, DeclarativeBase
+
+from src.config import StorageConfig
+from src.infrastructure.storage.sqlite_migrations import SQLiteSchemaMigrator
+from src.infrastructure.storage.sqlite_profile import SQLiteProfile
+from ..logging.logger import setup_logger
+
+log = setup_logger()
+
+
+def _on_connect(profile: SQLiteProfile, dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for statement in profile.value.statements():
+            cursor.execute(statement)
+    finally:
+        cursor.close()
+
+    # Lets SQL filters use the same Unicode case folding as Contact.is_matching
+    dbapi_connection.create_function(
+        "casefold",
+        1,
+        lambda value: value.casefold() if value is not None else None,
+        deterministic=True,
+    )
+
+
+class SQLiteEngineRegistry:
+
+    _engines: dict[str, tuple[Engine, sessionmaker]] = {}
+    _profiles: dict[str, SQLiteProfile] = {}
+    _last_checkpoint: dict[str, float] = {}
+    _schemas: set[tuple[str, int]] = set()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _key(db_path: Path) -> str:
+        return str(Path(db_path).resolve())
+
+    @classmethod
+    def get(
+        cls,
+        db_path: Path,
+        base: Type[DeclarativeBase],
+        profile: Optional[SQLiteProfile] = None,
+    ) -> tuple[Engine, sessionmaker]:
+        key = cls._key(db_path)
+        entry = cls._engines.get(key)
+        if entry is not None and (key, id(base)) in cls._schemas:
+            return entry
+
+        with cls._lock:
+            entry = cls._engines.get(key)
+            if entry is None:
+                # The first caller for a path decides the profile
+                profile = profile or SQLiteProfile.from_string(
+                    StorageConfig.SQLITE_PERFORMANCE_PROFILE
+                )
+                log.debug(f"Initializing SQLite database at {key} ({profile.name})")
+                engine = create_engine(f"sqlite:///{key}", echo=False, future=True)
+                event.listen(engine, "connect", partial(_on_connect, profile))
+                session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+                entry = (engine, session_factory)
+                cls._engines[key] = entry
+                cls._profiles[key] = profile
+                cls._last_checkpoint[key] = time.monotonic()
+            if (key, id(base)) not in cls._schemas:
+                base.metadata.create_all(entry[0])
+                SQLiteSchemaMigrator.upgrade(entry[0])
+                cls._schemas.add((key, id(base)))
+        return entry
+
+    @classmethod
+    def get_profile(cls, db_path: Path) -> Optional[SQLiteProfile]:
+        return cls._profiles.get(cls._key(db_path))
+
+    @classmethod
+    def checkpoint_if_due(cls, db_path: Path) -> bool:
+        key = cls._key(db_path)
+        entry = cls._engines.get(key)
+        profile = cls._profiles.get(key)
+        if entry is None or profile is None:
+            return False
+
+        pragmas = profile.value
+        if pragmas.journal_mode != "WAL" or pragmas.checkpoint_interval <= 0:
+            return False
+        now = time.monotonic()
+        if now - cls._last_checkpoint.get(key, now) < pragmas.checkpoint_interval:
+            return False
+
+        cls._last_checkpoint[key] = now
+        # PASSIVE never waits for readers, so the Gradio process is not blocked
+        with entry[0].connect() as connection:
+            connection.execute(text("PRAGMA wal_checkpoint(PASSIVE)"))
+        return True
+
+    @classmethod
+    def dispose(cls, db_path: Path) -> None:
+        key = cls._key(db_path)
+        with cls._lock:
+            entry = cls._engines.pop(key, None)
+            cls._profiles.pop(key, None)
+            cls._last_checkpoint.pop(key, None)
+            cls._schemas = {schema for schema in cls._schemas if schema[0] != key}
+        if entry is not None:
+            entry[0].dispose()
+
+    @classmethod
+    def dispose_all(cls) -> None:
+        with cls._lock:
+            entries = list(cls._engines.values())
+            cls._engines.clear()
+            cls._profiles.clear()
+            cls._last_checkpoint.clear()
+            cls._schemas.clear()
+        for engine, _ in entries:
+            engine.dispose()
@@ -0,0 +1,218 @@
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateIndex
+
+from src.config import StorageConfig
+from src.domain.models.dbcontact import DBContact
+from src.domain.validators.phone_validator import PhoneValidator
+from ..logging.logger import setup_logger
+
+log = setup_logger()
+
+NOTES_FTS_TABLE = "notes_fts"
+# The trigram tokenizer matches substrings of at least three characters
+NOTES_FTS_MIN_QUERY_LENGTH = 3
+_NOTES_FTS_TRIGGERS = ("notes_fts_insert", "notes_fts_delete", "notes_fts_update")
+
+_NOTES_FTS_STATEMENTS = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {NOTES_FTS_TABLE} USING fts5("
+    "title, text, content='notes', content_rowid='rowid', tokenize='trigram')",
+    f"CREATE TRIGGER IF NOT EXISTS notes_fts_insert AFTER INSERT ON notes BEGIN "
+    f"INSERT INTO {NOTES_FTS_TABLE}(rowid, title, text) "
+    "VALUES (new.rowid, new.title, new.text); END",
+    f"CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN "
+    f"INSERT INTO {NOTES_FTS_TABLE}({NOTES_FTS_TABLE}, rowid, title, text) "
+    "VALUES ('delete', old.rowid, old.title, old.text); END",
+    f"CREATE TRIGGER IF NOT EXISTS notes_fts_update AFTER UPDATE OF title, text "
+    f"ON notes BEGIN "
+    f"INSERT INTO {NOTES_FTS_TABLE}({NOTES_FTS_TABLE}, rowid, title, text) "
+    "VALUES ('delete', old.rowid, old.title, old.text); "
+    f"INSERT INTO {NOTES_FTS_TABLE}(rowid, title, text) "
+    "VALUES (new.rowid, new.title, new.text); END",
+    f"INSERT INTO {NOTES_FTS_TABLE}({NOTES_FTS_TABLE}) VALUES ('rebuild')",
+)
+
+RECORD_CHANGES_TABLE = "record_changes"
+# Table whose rows are logged, the column naming the record and the record kind
+_LOGGED_TABLES = (
+    ("contacts", "id", "contacts"),
+    ("contact_phones", "contact_id", "contacts"),
+    ("notes", "id", "notes"),
+    ("note_tags", "note_id", "notes"),
+)
+
+
+def _record_change_statements() -> list[str]:
+    # One row per record, moved to a new seq on every change by any writer
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {RECORD_CHANGES_TABLE} ("
+        "seq INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, "
+        "record_id TEXT NOT NULL, UNIQUE (kind, record_id))"
+    ]
+    # Not INSERT OR REPLACE: an upsert's own conflict policy would override it
+    log_row = (
+        f"DELETE FROM {RECORD_CHANGES_TABLE} "
+        "WHERE kind = '{kind}' AND record_id = {row}.{column}; "
+        f"INSERT INTO {RECORD_CHANGES_TABLE} (kind, record_id) "
+        "VALUES ('{kind}', {row}.{column});"
+    )
+    for table, column, kind in _LOGGED_TABLES:
+        for event, row in (("INSERT", "new"), ("DELETE", "old"), ("UPDATE", "new")):
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS {table}_changes_{event.lower()} "
+                f"AFTER {event} ON {table} BEGIN "
+                + log_row.format(kind=kind, row=row, column=column)
+                + " END"
+            )
+    return statements
+
+
+class SQLiteSchemaMigrator:
+
+    @staticmethod
+    def get_version(connection: Connection) -> int:
+        return connection.execute(text("PRAGMA user_version")).scalar() or 0
+
+    @staticmethod
+    def upgrade(
+        engine: Engine, batch_size: int = StorageConfig.SQLITE_MIGRATION_BATCH_SIZE
+    ) -> None:
+        with engine.connect() as connection:
+            version = SQLiteSchemaMigrator.get_version(connection)
+        if version >= StorageConfig.SQLITE_SCHEMA_VERSION:
+            return
+
+        if version < 2:
+            SQLiteSchemaMigrator._split_legacy_column(
+                engine,
+                source_table="contacts",
+                source_column="phones",
+                target_table="contact_phones",
+                owner_column="contact_id",
+                value_column="phone",
+                normalize=PhoneValidator.normalize,
+                batch_size=batch_size,
+            )
+            SQLiteSchemaMigrator._split_legacy_column(
+                engine,
+                source_table="notes",
+                source_column="tags",
+                target_table="note_tags",
+                owner_column="note_id",
+                value_column="tag",
+                normalize=str.strip,
+                batch_size=batch_size,
+            )
+
+        if version < 4:
+            # create_all skips indexes of tables that already exist
+            with engine.begin() as connection:
+                for index in DBContact.__table__.indexes:
+                    connection.execute(CreateIndex(index, if_not_exists=True))
+
+        if version < 5:
+            # v3 tokenized words; v5 rebuilds the index over trigrams
+            SQLiteSchemaMigrator._create_notes_fulltext_index(engine)
+
+        if version < 6:
+            with engine.begin() as connection:
+                for statement in _record_change_statements():
+                    connection.execute(text(statement))
+
+        with engine.begin() as connection:
+            connection.execute(
+                text(f"PRAGMA user_version = {StorageConfig.SQLITE_SCHEMA_VERSION}")
+            )
+
+    @staticmethod
+    def has_table(connection: Connection, name: str) -> bool:
+        return (
+            connection.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = :name"), {"name": name}
+            ).first()
+            is not None
+        )
+
+    @staticmethod
+    def _create_notes_fulltext_index(engine: Engine) -> None:
+        # Dropped first and on its own, so a failed create leaves no stale index
+        with engine.begin() as connection:
+            for trigger in _NOTES_FTS_TRIGGERS:
+                connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger}"))
+            connection.execute(text(f"DROP TABLE IF EXISTS {NOTES_FTS_TABLE}"))
+        try:
+            with engine.begin() as connection:
+                for statement in _NOTES_FTS_STATEMENTS:
+                    connection.execute(text(statement))
+        except OperationalError as e:
+            # SQLite builds without FTS5 fall back to scanning notes in memory
+            log.warning(f"Full-text index for notes is not available: {e}")
+
+    @staticmethod
+    def _has_column(connection: Connection, table: str, column: str) -> bool:
+        rows = connection.execute(text(f"PRAGMA table_info({table})")).all()
+        return any(row[1] == column for row in rows)
+
+    @staticmethod
+    def _split_legacy_column(
+        engine: Engine,
+        source_table: str,
+        source_column: str,
+        target_table: str,
+        owner_column: str,
+        value_column: str,
+        normalize,
+        batch_size: int,
+    ) -> None:
+        with engine.connect() as connection:
+            if not SQLiteSchemaMigrator._has_column(
+                connection, source_table, source_column
+            ):
+                return
+
+        log.info(f"Migrating {source_table}.{source_column} to {target_table}")
+
+        select_batch = text(
+            f"SELECT rowid, id, {source_column} FROM {source_table} "
+            f"WHERE rowid > :last_rowid AND {source_column} IS NOT NULL "
+            f"ORDER BY rowid LIMIT :batch_size"
+        )
+        insert_value = text(
+            f"INSERT OR IGNORE INTO {target_table} "
+            f"({owner_column}, position, {value_column}) "
+            f"VALUES (:owner_id, :position, :value)"
+        )
+        clear_legacy = text(
+            f"UPDATE {source_table} SET {source_column} = NULL "
+            f"WHERE rowid > :first_rowid AND rowid <= :last_rowid"
+        )
+
+        last_rowid = 0
+        migrated = 0
+        while True:
+            with engine.begin() as connection:
+                rows = connection.execute(
+                    select_batch, {"last_rowid": last_rowid, "batch_size": batch_size}
+                ).all()
+                if not rows:
+                    break
+
+                values = []
+                for _, owner_id, packed in rows:
+                    items = [normalize(item) for item in packed.split(",")]
+                    for position, item in enumerate(i for i in items if i):
+                        values.append(
+                            {"owner_id": owner_id, "position": position, "value": item}
+                        )
+                if values:
+                    connection.execute(insert_value, values)
+
+                connection.execute(
+                    clear_legacy,
+                    {"first_rowid": last_rowid, "last_rowid": rows[-1][0]},
+                )
+                last_rowid = rows[-1][0]
+                migrated += len(rows)
+
+        if migrated:
+            log.info(f"Migrated {migrated} rows from {source_table}.{source_column}")
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+@dataclass(frozen=True)
+class SQLitePragmas:
+    journal_mode: str
+    synchronous: str
+    temp_store: str = "DEFAULT"
+    mmap_size: int = 0
+    # Negative values are KiB, positive values are pages
+    cache_size: int = -2000
+    checkpoint_interval: float = 0.0
+
+    def statements(self) -> list[str]:
+        return [
+            f"PRAGMA journal_mode = {self.journal_mode}",
+            f"PRAGMA synchronous = {self.synchronous}",
+            f"PRAGMA temp_store = {self.temp_store}",
+            f"PRAGMA mmap_size = {self.mmap_size}",
+            f"PRAGMA cache_size = {self.cache_size}",
+        ]
+
+
+class SQLiteProfile(Enum):
+    # SQLite defaults: rollback journal, fsync on every commit, no mmap
+    COMPATIBLE = SQLitePragmas(journal_mode="DELETE", synchronous="FULL")
+    # WAL lets readers run alongside a writer; NORMAL only fsyncs at checkpoints
+    BALANCED = SQLitePragmas(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        temp_store="MEMORY",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64000,
+        checkpoint_interval=60.0,
+    )
+    # No fsync at all; a power loss may drop the latest commits
+    FAST = SQLitePragmas(
+        journal_mode="WAL",
+        synchronous="OFF",
+        temp_store="MEMORY",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64000,
+        checkpoint_interval=60.0,
+    )
+
+    @classmethod
+    def from_string(cls, name: str) -> "SQLiteProfile":
+        try:
+            return cls[name.upper()]
+        except KeyError:
+            raise ValueError(f"Unknown SQLite profile: {name}") from None
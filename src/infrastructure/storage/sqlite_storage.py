@@ -1,21 +1,39 @@
+from contextlib import contextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Any, Optional, List, Type, TypeVar
+from typing import Any, Iterable, Iterator, Optional, List, Type, TypeVar
 
-from sqlalchemy import create_engine, Engine
+from sqlalchemy import Connection, Engine, Table, delete, insert, select, text
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 
 from src.infrastructure.storage.storage_type import StorageType
 from src.infrastructure.persistence.data_path_resolver import DataPathResolver
 from src.infrastructure.storage.storage import Storage
+from src.config import StorageConfig
+from src.infrastructure.storage.sqlite_address_book import SQLiteAddressBook
+from src.infrastructure.storage.sqlite_engine_registry import SQLiteEngineRegistry
+from src.infrastructure.storage.sqlite_profile import SQLiteProfile
+from src.infrastructure.storage.sqlite_migrations import (
+    NOTES_FTS_MIN_QUERY_LENGTH,
+    NOTES_FTS_TABLE,
+    RECORD_CHANGES_TABLE,
+    SQLiteSchemaMigrator,
+)
 from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
 from src.domain.notebook import Notebook
 from src.domain.mappers.contact_mapper import ContactMapper
 from src.domain.mappers.note_mapper import NoteMapper
 from src.domain.models.dbcontact import DBContact
+from src.domain.models.dbcontact_phone import DBContactPhone
 from src.domain.models.dbnote import DBNote
+from src.domain.models.dbnote_tag import DBNoteTag
 
 T = TypeVar("T")
 
+
 from ..logging.logger import setup_logger
 
 log = setup_logger()
@@ -24,6 +42,35 @@ log = setup_logger()
 # log = logging.getLogger(__name__)
 
 
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _to_row(table: Table, db_model) -> dict[str, Any]:
+    return {column.name: getattr(db_model, column.key) for column in table.columns}
+
+
+# Record kinds logged in record_changes, named after their tables
+_RECORD_MODELS = {
+    DBContact.__tablename__: (DBContact, ContactMapper.from_dbmodel),
+    DBNote.__tablename__: (DBNote, NoteMapper.from_dbmodel),
+}
+
+_SELECT_CHANGE_REVISION = text(
+    "SELECT seq FROM sqlite_sequence WHERE name = :name"
+).bindparams(name=RECORD_CHANGES_TABLE)
+# Writing sqlite_sequence, even no row of it, takes the database write lock
+_LOCK_CHANGE_REVISION = text(
+    "UPDATE sqlite_sequence SET seq = seq WHERE name = :name"
+).bindparams(name=RECORD_CHANGES_TABLE)
+_SELECT_CHANGES = text(
+    f"SELECT seq, record_id FROM {RECORD_CHANGES_TABLE} "
+    "WHERE seq > :since AND kind = :kind ORDER BY seq"
+)
+
+
 class SQLiteStorage(Storage):
 
     @property
@@ -34,12 +81,24 @@ class SQLiteStorage(Storage):
     def storage_type(self) -> StorageType:
         return StorageType.SQLITE
 
-    def __init__(self, base: Type[DeclarativeBase], data_dir: Path | None = None):
+    def __init__(
+        self,
+        base: Type[DeclarativeBase],
+        data_dir: Path | None = None,
+        profile: SQLiteProfile | None = None,
+    ):
         self.resolver = DataPathResolver(data_dir) if data_dir else DataPathResolver()
+        self._profile = profile
         self._is_initialized = False
         self._base_class = base
         self._session_factory = None
         self._engine: Engine | None = None
+        self._db_path: Path | None = None
+        self._has_notes_fts: bool | None = None
+        # record_changes seq each (database, table) was last read or written at
+        self._change_revisions: dict[tuple[str, str], int] = {}
+        # seq ranges of this storage's own incremental writes, per database
+        self._own_changes: dict[str, list[tuple[int, int]]] = {}
 
     def _create_session(self) -> Session:
         if not self._is_initialized:
@@ -54,11 +113,17 @@ class SQLiteStorage(Storage):
 
     def initialize(self, db_name: str) -> None:
         db_path = self.resolver.get_full_path(db_name)
-        print(f"Initializing SQLite database at {db_path}")
-        self._engine = create_engine(f"sqlite:///{db_path}", echo=False, future=True)
-        self._session_factory = sessionmaker(bind=self._engine, expire_on_commit=False)
+        if self._is_initialized and db_path == self._db_path:
+            return
+        self._engine, self._session_factory = SQLiteEngineRegistry.get(
+            db_path, self._base_class, self._profile
+        )
+        self._db_path = db_path
+        self._has_notes_fts = None
         self._is_initialized = True
-        self._base_class.metadata.create_all(self._engine)
+
+    def database_key(self, db_name: str) -> str:
+        return str(self.resolver.get_full_path(db_name))
 
     def save_entity(self, entity: T) -> T:
         log.debug(f"Saving entity of type {type(entity).__name__}")
@@ -100,79 +165,326 @@ class SQLiteStorage(Storage):
                 session.rollback()
                 raise
 
+    def find_contact_ids_by_phone(self, phone: str) -> List[str]:
+        with self._create_session() as session:
+            rows = (
+                session.query(DBContactPhone.contact_id)
+                .filter(DBContactPhone.phone == phone)
+                .distinct()
+                .all()
+            )
+            return [row.contact_id for row in rows]
+
+    def find_note_ids_by_tag(self, tag: str) -> List[str]:
+        with self._create_session() as session:
+            rows = (
+                session.query(DBNoteTag.note_id)
+                .filter(DBNoteTag.tag == tag)
+                .distinct()
+                .all()
+            )
+            return [row.note_id for row in rows]
+
+    def search_note_ids(
+        self, filename: str, query: str, column: str = "text"
+    ) -> Optional[List[str]]:
+        if column not in ("title", "text"):
+            raise ValueError(f"Unsupported note search column: {column}")
+        if len(query) < NOTES_FTS_MIN_QUERY_LENGTH:
+            # Trigrams cannot narrow down shorter substrings
+            return None
+
+        self.initialize(db_name=filename)
+        with self._engine.connect() as connection:
+            if self._has_notes_fts is None:
+                self._has_notes_fts = SQLiteSchemaMigrator.has_table(
+                    connection, NOTES_FTS_TABLE
+                )
+            if not self._has_notes_fts:
+                return None
+
+            # A phrase over the trigram index is a case-insensitive substring match
+            phrase = query.replace('"', '""')
+            match = f'{column}:"{phrase}"'
+            rows = connection.execute(
+                text(
+                    f"SELECT notes.id FROM {NOTES_FTS_TABLE} "
+                    f"JOIN notes ON notes.rowid = {NOTES_FTS_TABLE}.rowid "
+                    f"WHERE {NOTES_FTS_TABLE} MATCH :match "
+                    f"ORDER BY bm25({NOTES_FTS_TABLE})"
+                ),
+                {"match": match},
+            )
+            return [row.id for row in rows]
+
     def save(self, data: Any, filename: str, **kwargs) -> str:
         self.initialize(db_name=filename)
+        target = str(self._db_path)
 
         if isinstance(data, AddressBook):
-            # Clear existing contacts and save new ones
-            self._clear_and_save(
-                DBContact, data.data.values(), ContactMapper.to_dbmodel
-            )
+            self._save_collection(DBContact, data, ContactMapper.to_dbmodel, target)
             return filename
         elif isinstance(data, Notebook):
-            # Clear existing notes and save new ones
-            self._clear_and_save(DBNote, data.data.values(), NoteMapper.to_dbmodel)
+            self._save_collection(DBNote, data, NoteMapper.to_dbmodel, target)
             return filename
 
         return (
             "Unsupported data type for save operation. Supported: AddressBook, Notebook"
         )
 
+    def _save_collection(self, model_class, collection, mapper_func, target: str):
+        if collection.is_flushed_to(target):
+            # Collection mirrors this database; write only what changed since
+            self._save_changes(model_class, collection, mapper_func)
+        else:
+            # Clear existing records and save the whole collection
+            self._clear_and_save(model_class, collection.values(), mapper_func)
+        collection.mark_flushed(target)
+        SQLiteEngineRegistry.checkpoint_if_due(self._db_path)
+
+    def _save_changes(self, model_class, collection, mapper_func):
+        changes = collection.pending_changes()
+        if changes.is_empty():
+            return
+
+        try:
+            with self._own_write(model_class.__tablename__) as connection:
+                self._bulk_upsert(
+                    connection,
+                    model_class,
+                    (collection.data[entity_id] for entity_id in changes.upserted),
+                    mapper_func,
+                )
+                self._delete_by_ids(connection, model_class, changes.deleted)
+        except Exception as e:
+            log.error(f"Failed to save changes: {e}")
+            raise
+
     def _clear_and_save(self, model_class, entities, mapper_func):
-        with self._create_session() as session:
-            try:
-                # Get existing IDs from database
-                existing_ids = {
-                    record.id for record in session.query(model_class.id).all()
-                }
-
-                # Get IDs from entities to save
-                entity_ids = set()
-                entities_list = list(entities)
-
-                # Save/update all entities
-                for entity in entities_list:
-                    db_model = mapper_func(entity)
-                    entity_ids.add(db_model.id)
-                    merged_entity = session.merge(db_model)
-                    session.add(merged_entity)
+        table = model_class.__table__
+        entity_ids = set()
 
+        def track_ids(items):
+            for entity in items:
+                entity_ids.add(entity.id)
+                yield entity
+
+        try:
+            with self._own_write(table.name, complete=True) as connection:
+                existing_ids = set(connection.execute(select(table.c.id)).scalars())
+                self._bulk_upsert(
+                    connection, model_class, track_ids(entities), mapper_func
+                )
                 # Delete records that are no longer in the collection
-                ids_to_delete = existing_ids - entity_ids
-                if ids_to_delete:
-                    session.query(model_class).filter(
-                        model_class.id.in_(ids_to_delete)
-                    ).delete(synchronize_session=False)
+                self._delete_by_ids(connection, model_class, existing_ids - entity_ids)
+        except Exception as e:
+            log.error(f"Failed to clear and save: {e}")
+            raise
 
-                session.commit()
-            except Exception as e:
-                log.error(f"Failed to clear and save: {e}")
-                session.rollback()
-                raise
+    @contextmanager
+    def _own_write(self, table: str, complete: bool = False) -> Iterator[Connection]:
+        # Triggers log this write as well; its seq range is remembered so
+        # changed_ids leaves it out. The write lock is taken before reading
+        # the first seq, so no other writer can commit inside the range.
+        with self._engine.begin() as connection:
+            connection.execute(_LOCK_CHANGE_REVISION)
+            first = connection.execute(_SELECT_CHANGE_REVISION).scalar() or 0
+            yield connection
+            last = connection.execute(_SELECT_CHANGE_REVISION).scalar() or 0
+        database = str(self._db_path)
+        if complete:
+            # The table now holds exactly the written collection
+            self._change_revisions[(database, table)] = last
+        elif last > first:
+            self._own_changes.setdefault(database, []).append((first, last))
+
+    def _watch_changes(self, table: str) -> None:
+        # Before a load, so rows changed while it runs are read again later
+        with self._engine.connect() as connection:
+            revision = connection.execute(_SELECT_CHANGE_REVISION).scalar() or 0
+        self._change_revisions[(str(self._db_path), table)] = revision
+
+    def changed_ids(self, filename: str, table: str) -> Optional[set[str]]:
+        # IDs of contacts or notes other writers saved or deleted since this
+        # storage last loaded, wrote or asked; None before the first of those
+        self.initialize(db_name=filename)
+        database = str(self._db_path)
+        since = self._change_revisions.get((database, table))
+        if since is None:
+            return None
+        with self._engine.connect() as connection:
+            rows = connection.execute(
+                _SELECT_CHANGES, {"since": since, "kind": table}
+            ).all()
+        if not rows:
+            return set()
+        self._change_revisions[(database, table)] = rows[-1][0]
+
+        own = self._own_changes.get(database, [])
+        changed = {
+            record_id
+            for seq, record_id in rows
+            if not any(first < seq <= last for first, last in own)
+        }
+        # Ranges every watched table has read past can no longer match
+        oldest = min(
+            revision
+            for (key, _), revision in self._change_revisions.items()
+            if key == database
+        )
+        self._own_changes[database] = [r for r in own if r[1] > oldest]
+        return changed
+
+    def load_by_ids(self, filename: str, table: str, ids: Iterable[str]) -> dict:
+        self.initialize(db_name=filename)
+        model_class, mapper_func = _RECORD_MODELS[table]
+        found = {}
+        with self._create_session() as session:
+            for batch in _batched(ids, StorageConfig.SQLITE_BULK_BATCH_SIZE):
+                for db_model in session.query(model_class).filter(
+                    model_class.id.in_(batch)
+                ):
+                    found[db_model.id] = mapper_func(db_model)
+        return found
+
+    def iter_contacts(
+        self, filename: str, batch_size: int = StorageConfig.SQLITE_BULK_BATCH_SIZE
+    ) -> Iterator[Contact]:
+        self.initialize(db_name=filename)
+        return self._iter_entities(DBContact, ContactMapper.from_dbmodel, batch_size)
+
+    def iter_notes(
+        self, filename: str, batch_size: int = StorageConfig.SQLITE_BULK_BATCH_SIZE
+    ) -> Iterator[Note]:
+        self.initialize(db_name=filename)
+        return self._iter_entities(DBNote, NoteMapper.from_dbmodel, batch_size)
+
+    def _iter_entities(self, model_class, mapper_func, batch_size: int) -> Iterator:
+        # Keyset pagination: each page is a fresh short query after the last ID
+        last_id = None
+        while True:
+            with self._create_session() as session:
+                query = session.query(model_class).order_by(model_class.id)
+                if last_id is not None:
+                    query = query.filter(model_class.id > last_id)
+                batch = [mapper_func(db_model) for db_model in query.limit(batch_size)]
+            if not batch:
+                return
+            yield from batch
+            last_id = batch[-1].id
+
+    def bulk_save_contacts(
+        self,
+        filename: str,
+        contacts: Iterable[Contact],
+        batch_size: int = StorageConfig.SQLITE_BULK_BATCH_SIZE,
+    ) -> int:
+        self.initialize(db_name=filename)
+        with self._engine.begin() as connection:
+            return self._bulk_upsert(
+                connection, DBContact, contacts, ContactMapper.to_dbmodel, batch_size
+            )
+
+    def bulk_save_notes(
+        self,
+        filename: str,
+        notes: Iterable[Note],
+        batch_size: int = StorageConfig.SQLITE_BULK_BATCH_SIZE,
+    ) -> int:
+        self.initialize(db_name=filename)
+        with self._engine.begin() as connection:
+            return self._bulk_upsert(
+                connection, DBNote, notes, NoteMapper.to_dbmodel, batch_size
+            )
+
+    @staticmethod
+    def _bulk_upsert(
+        connection: Connection,
+        model_class,
+        entities: Iterable,
+        mapper_func,
+        batch_size: int = StorageConfig.SQLITE_BULK_BATCH_SIZE,
+    ) -> int:
+        table = model_class.__table__
+        statement = sqlite_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                column.name: statement.excluded[column.name]
+                for column in table.columns
+                if not column.primary_key
+            },
+        )
+        relationships = list(model_class.__mapper__.relationships)
+
+        saved = 0
+        for batch in _batched(entities, batch_size):
+            db_models = [mapper_func(entity) for entity in batch]
+            connection.execute(
+                statement, [_to_row(table, db_model) for db_model in db_models]
+            )
+
+            # Child rows are replaced wholesale for every upserted parent
+            ids = [db_model.id for db_model in db_models]
+            for relationship in relationships:
+                child_table = relationship.mapper.local_table
+                for owner_column in relationship.remote_side:
+                    connection.execute(
+                        delete(child_table).where(owner_column.in_(ids))
+                    )
+                child_rows = [
+                    _to_row(child_table, child)
+                    for db_model in db_models
+                    for child in getattr(db_model, relationship.key)
+                ]
+                if child_rows:
+                    connection.execute(insert(child_table), child_rows)
+            saved += len(db_models)
+        return saved
+
+    @staticmethod
+    def _delete_by_ids(connection: Connection, model_class, ids) -> None:
+        table = model_class.__table__
+        for batch in _batched(ids, StorageConfig.SQLITE_BULK_BATCH_SIZE):
+            # Core deletes skip ORM cascades, so remove child rows explicitly
+            for relationship in model_class.__mapper__.relationships:
+                for owner_column in relationship.remote_side:
+                    connection.execute(
+                        delete(relationship.mapper.local_table).where(
+                            owner_column.in_(batch)
+                        )
+                    )
+            connection.execute(delete(table).where(table.c.id.in_(batch)))
 
     def load(self, filename: str, **kwargs) -> Optional[Any]:
-        if not self._is_initialized:
-            self.initialize(db_name=filename)
+        self.initialize(db_name=filename)
+        self._watch_changes(DBContact.__tablename__)
+        if kwargs.get("lazy", StorageConfig.SQLITE_LAZY_ADDRESS_BOOK):
+            address_book = SQLiteAddressBook(self._session_factory)
+            address_book.mark_flushed(str(self._db_path))
+            return address_book
         try:
             db_contacts = self.get_all(DBContact)
             address_book = AddressBook()
             for db_contact in db_contacts:
                 contact = ContactMapper.from_dbmodel(db_contact)
                 address_book.add_record(contact)
+            address_book.mark_flushed(str(self._db_path))
             return address_book
         except Exception as e:
             log.error(f"Failed to load address book: {e}")
             return None
 
     def load_notes(self, filename: str, **kwargs) -> Optional[Notebook]:
-        if not self._is_initialized:
-            self.initialize(db_name=filename)
+        self.initialize(db_name=filename)
+        self._watch_changes(DBNote.__tablename__)
         try:
             db_notes = self.get_all(DBNote)
             notebook = Notebook()
             for db_note in db_notes:
                 note = NoteMapper.from_dbmodel(db_note)
                 notebook[note.id] = note
+            notebook.mark_flushed(str(self._db_path))
             return notebook
         except Exception as e:
             log.error(f"Failed to load notebook: {e}")
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any, Optional
 
 from src.infrastructure.storage.storage_type import StorageType
@@ -22,3 +23,7 @@ class Storage(ABC):
     @abstractmethod
     def storage_type(self) -> StorageType:
         pass
+
+    def data_path(self, filename: str) -> Optional[Path]:
+        # Single-file backends return their file to enable locking and reloads
+        return None
@@ -1,36 +1,95 @@
 from pathlib import Path
+from typing import Optional
 
+from src.infrastructure.storage.compression import CODECS, codec_for
 from src.infrastructure.storage.storage import Storage
+from src.infrastructure.storage.dbm_storage import DbmStorage
 from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.jsonl_storage import JsonlStorage
 from src.infrastructure.storage.pickle_storage import PickleStorage
+from src.infrastructure.storage.sharded_json_storage import ShardedJsonStorage
+from src.infrastructure.storage.snapshot_storage import SnapshotStorage
 from src.infrastructure.storage.sqlite_storage import SQLiteStorage
 from src.infrastructure.storage.storage_type import StorageType
 from src.infrastructure.persistence.data_path_resolver import DataPathResolver
 from src.domain.models.dbbase import DBBase
 
 
+EXTENSION_TYPES = {
+    ".json": StorageType.JSON,
+    ".jsonl": StorageType.JSONL,
+    ".shards": StorageType.JSON_SHARDED,
+    ".snap": StorageType.SNAPSHOT,
+    ".dbm": StorageType.DBM,
+    ".pkl": StorageType.PICKLE,
+    ".pickle": StorageType.PICKLE,
+    ".db": StorageType.SQLITE,
+    ".sqlite": StorageType.SQLITE,
+    ".sqlite3": StorageType.SQLITE,
+}
+
+
 class StorageFactory:
 
     @staticmethod
-    def create_storage(storage_type: StorageType) -> Storage:
+    def create_storage(
+        storage_type: StorageType, data_dir: Optional[Path] = None
+    ) -> Storage:
         if not storage_type:
             raise ValueError("Storage type cannot be None.")
         match storage_type:
             case StorageType.JSON:
-                return JsonStorage()
+                return JsonStorage(data_dir)
+            case StorageType.JSONL:
+                return JsonlStorage(data_dir)
+            case StorageType.JSON_SHARDED:
+                return ShardedJsonStorage(data_dir)
+            case StorageType.SNAPSHOT:
+                return SnapshotStorage(data_dir)
+            case StorageType.DBM:
+                return DbmStorage(data_dir)
             case StorageType.PICKLE:
-                return PickleStorage()
+                return PickleStorage(data_dir)
             case StorageType.SQLITE:
-                return SQLiteStorage(DBBase)
+                return SQLiteStorage(DBBase, data_dir)
             case _:
                 raise ValueError(f"Unsupported storage type: {storage_type}")
 
+    @staticmethod
+    def storage_type_for(filename: str) -> StorageType:
+        storage_type = EXTENSION_TYPES.get(Path(filename.lower()).suffix)
+        if storage_type is None:
+            raise ValueError(
+                f"Unsupported filetype: {filename}.\n"
+                f"Supported extensions: {', '.join(EXTENSION_TYPES)}"
+            )
+        return storage_type
+
     @staticmethod
     def get_storage(filepath: str) -> Storage:
+        codec = codec_for(filepath)
+        if codec:
+            base = filepath[: -len(codec.suffix)]
+            DataPathResolver.validate_filename(
+                base, allowed_extensions=(".json", ".pkl")
+            )
+            storage_path = Path(base.lower())
+            if storage_path.suffix == ".json":
+                return JsonStorage(storage_path, compression=codec)
+            return PickleStorage(storage_path, compression=codec)
+
         DataPathResolver.validate_filename(filepath)
         storage_path = Path(filepath.lower())
         if storage_path.suffix.endswith(".json"):
             return JsonStorage(storage_path)
+        elif storage_path.suffix.endswith(".jsonl"):
+            return JsonlStorage(storage_path)
+        elif storage_path.suffix.endswith(".shards"):
+            return ShardedJsonStorage(storage_path)
+        elif storage_path.suffix.endswith(".snap"):
+            return SnapshotStorage(storage_path)
+        elif storage_path.suffix.endswith(".dbm"):
+            return DbmStorage(storage_path)
         elif storage_path.suffix.endswith(".pkl") or storage_path.suffix.endswith(
             ".pickle"
         ):
@@ -43,5 +102,6 @@ class StorageFactory:
             return SQLiteStorage(DBBase, storage_path)
         else:
             raise ValueError(
-                f"Unsupported filetype: {storage_path}.\nSupported extensions: .json, .pkl, .pickle, .db, .sqlite, .sqlite3"
+                f"Unsupported filetype: {storage_path}.\nSupported extensions: .json, .jsonl, .shards, .snap, .dbm, .pkl, .pickle, .db, .sqlite, .sqlite3"
+                f"\nCompressed .json and .pkl files may end with: {', '.join(CODECS)}"
             )
@@ -5,3 +5,7 @@ class StorageType(Enum):
     PICKLE = 1
     JSON = 2
     SQLITE = 3
+    JSONL = 4
+    JSON_SHARDED = 5
+    SNAPSHOT = 6
+    DBM = 7
@@ -1,4 +1,5 @@
 import argparse
+from pathlib import Path
 from typing import Optional
 
 from src.domain.utils.styles_utils import stylize_text, stylize_error_message
@@ -10,6 +11,7 @@ from src.presentation.cli.input_processor import process_classic_input, process_
 from src.presentation.cli.mode_decider import CLIMode
 from src.presentation.cli.regex_gate import RegexCommandGate
 from src.presentation.cli.ui_messages import UIMessages
+from src.application.services.autosaver import Autosaver
 from src.application.services.contact_service import ContactService
 from src.application.services.note_service import NoteService
 from src.infrastructure.persistence.data_path_resolver import (
@@ -18,8 +20,11 @@ from src.infrastructure.persistence.data_path_resolver import (
     DEFAULT_ADDRESS_BOOK_DATABASE_NAME,
     DEFAULT_JSON_FILE,
     DEFAULT_CONTACTS_FILE,
+    DEFAULT_CONTACTS_WAL_FILE,
+    DEFAULT_NOTES_WAL_FILE,
 )
 from src.infrastructure.persistence.migrator import migrate_files
+from src.infrastructure.persistence.write_ahead_log import WriteAheadLog
 from src.infrastructure.storage.json_storage import JsonStorage
 from src.infrastructure.storage.pickle_storage import PickleStorage
 from src.infrastructure.storage.sqlite_storage import SQLiteStorage
@@ -55,6 +60,17 @@ def save_and_exit(
     print(UIMessages.GOODBYE)
 
 
+def reload_external_changes(
+    contact_service: ContactService, note_service: NoteService
+) -> None:
+    # Picks up records another process saved to the same files
+    try:
+        contact_service.reload_changes()
+        note_service.reload_changes()
+    except Exception as e:
+        print(stylize_error_message(message=f"Failed to reload changes: {e}"))
+
+
 def parse_cli_mode() -> CLIMode:
     arg_parser = argparse.ArgumentParser(description="Assistant Bot CLI")
     arg_parser.add_argument(
@@ -74,8 +90,18 @@ def main() -> None:
     migrate_files(DEFAULT_DATA_DIR, HOME_DATA_DIR)
     storage_type = StorageType.SQLITE
     storage = StorageFactory.create_storage(storage_type)
-    contact_service = ContactService(storage)
-    note_service = NoteService(storage)
+    # Commands are logged as they run and replayed on the next start after a crash
+    autosaver = Autosaver()
+    contact_service = ContactService(
+        storage,
+        write_ahead_log=WriteAheadLog(Path(HOME_DATA_DIR) / DEFAULT_CONTACTS_WAL_FILE),
+        autosaver=autosaver,
+    )
+    note_service = NoteService(
+        storage,
+        write_ahead_log=WriteAheadLog(Path(HOME_DATA_DIR) / DEFAULT_NOTES_WAL_FILE),
+        autosaver=autosaver,
+    )
 
     print(UIMessages.LOADING)
     try:
@@ -129,11 +155,13 @@ def main() -> None:
     # Show mode-appropriate help
     print(UIMessages.WELCOME + "\n\n" + UIMessages.get_command_list(is_nlp_mode))
 
+    autosaver.start()
     while True:
         try:
             user_input = input(stylize_text("Enter a command: ")).strip()
             if not user_input:
                 continue
+            reload_external_changes(contact_service, note_service)
 
             if mode == CLIMode.CLASSIC:
                 result = process_classic_input(user_input, parser, handler)
@@ -149,6 +177,7 @@ def main() -> None:
                 continue
 
             if result == "exit":
+                autosaver.stop()
                 save_and_exit(contact_service, note_service, storage_type)
                 break
 
@@ -159,6 +188,7 @@ def main() -> None:
 
         except KeyboardInterrupt:
             print()
+            autosaver.stop()
             save_and_exit(contact_service, note_service, storage_type)
             break
 
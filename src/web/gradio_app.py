@@ -5,6 +5,8 @@ Run with: python src/web/gradio_app.py
 Or: PYTHONPATH=. python src/web/gradio_app.py
 """
 
+import atexit
+from functools import wraps
 import gradio as gr
 from pathlib import Path
 from typing import Optional, Tuple
@@ -14,6 +16,7 @@ from src.infrastructure.storage.storage_factory import StorageFactory
 from src.infrastructure.storage.storage_type import StorageType
 from src.infrastructure.storage.json_storage import JsonStorage
 from src.infrastructure.persistence.data_path_resolver import DEFAULT_JSON_FILE, DEFAULT_NOTES_FILE
+from src.application.services.autosaver import Autosaver
 from src.application.services.note_service import NoteService
 from src.application.services.contact_service import ContactService
 
@@ -26,8 +29,10 @@ data_dir.mkdir(exist_ok=True)
 
 storage_type = StorageType.JSON
 storage = JsonStorage(data_dir=data_dir)  # Use project's data/ folder
-contact_service = ContactService(storage)
-note_service = NoteService(storage)
+# Handlers only mutate; edits are written in the background after a pause
+autosaver = Autosaver()
+contact_service = ContactService(storage, autosaver=autosaver)
+note_service = NoteService(storage, autosaver=autosaver)
 
 # Load existing data
 try:
@@ -41,67 +46,91 @@ except Exception:
     pass  # Start with empty notes if load fails
 
 
+def flush_on_exit() -> None:
+    autosaver.stop()
+    autosaver.flush()
+
+
+autosaver.start()
+atexit.register(flush_on_exit)
+
+
+def reloading(handler):
+    # The CLI and MCP server may share these files; pick up their saves first
+    @wraps(handler)
+    def with_fresh_data(*args, **kwargs):
+        try:
+            contact_service.reload_changes()
+            note_service.reload_changes()
+        except Exception as e:
+            return f"❌ Error: Failed to reload changes: {str(e)}"
+        return handler(*args, **kwargs)
+
+    return with_fresh_data
+
+
 # Contact Management Functions
+@reloading
 def add_contact_ui(name: str, phone: str) -> str:
     """Add a new contact"""
     if not name or not phone:
         return ""
     try:
         result = contact_service.add_contact(Name(name), Phone(phone))
-        contact_service.save_address_book()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def remove_contact_ui(name: str) -> str:
     """Remove a contact"""
     if not name:
         return ""
     try:
         result = contact_service.delete_contact(name)
-        contact_service.save_address_book()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def add_email_ui(name: str, email: str) -> str:
     """Add email to contact"""
     if not name or not email:
         return ""
     try:
         result = contact_service.add_email(name, Email(email))
-        contact_service.save_address_book()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def add_address_ui(name: str, address: str) -> str:
     """Add address to contact"""
     if not name or not address:
         return ""
     try:
         result = contact_service.add_address(name, Address(address))
-        contact_service.save_address_book()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def add_birthday_ui(name: str, birthday: str) -> str:
     """Add birthday to contact (format: DD.MM.YYYY)"""
     if not name or not birthday:
         return ""
     try:
         result = contact_service.add_birthday(name, Birthday(birthday))
-        contact_service.save_address_book()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def search_contacts_ui(query: str) -> str:
     """Search contacts by name or phone"""
     try:
@@ -128,6 +157,7 @@ def search_contacts_ui(query: str) -> str:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def list_all_contacts_ui() -> str:
     """List all contacts"""
     try:
@@ -150,6 +180,7 @@ def list_all_contacts_ui() -> str:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def get_birthdays_ui(days: int = 7) -> str:
     """Get upcoming birthdays"""
     try:
@@ -170,6 +201,7 @@ def get_birthdays_ui(days: int = 7) -> str:
 
 
 # Note Management Functions
+@reloading
 def add_note_ui(text, tags=""):
     """Add a new note (tags: comma-separated)"""
     if not text:
@@ -200,13 +232,13 @@ def add_note_ui(text, tags=""):
         for tag in tag_list:
             note_service.add_tag(note_id, tag)
 
-        note_service.save_notes()
         return f"✅ Note added with ID: {note_id}"
     except Exception as e:
         import traceback
         return f"❌ Error: {str(e)}\n{traceback.format_exc()}"
 
 
+@reloading
 def search_notes_ui(query: str) -> str:
     """Search notes by text or tags"""
     try:
@@ -232,6 +264,7 @@ def search_notes_ui(query: str) -> str:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def list_all_notes_ui() -> str:
     """List all notes"""
     try:
@@ -253,42 +286,43 @@ def list_all_notes_ui() -> str:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def delete_note_ui(note_id: str) -> str:
     """Delete a note by ID"""
     if not note_id:
         return ""
     try:
         result = note_service.delete_note_by_id(note_id)
-        note_service.save_notes()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def add_tag_to_note_ui(note_id: str, tag: str) -> str:
     """Add a tag to an existing note"""
     if not note_id or not tag:
         return ""
     try:
         result = note_service.add_tag(note_id, Tag(tag))
-        note_service.save_notes()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def remove_tag_from_note_ui(note_id: str, tag: str) -> str:
     """Remove a tag from a note"""
     if not note_id or not tag:
         return ""
     try:
         result = note_service.remove_tag(note_id, Tag(tag))
-        note_service.save_notes()
         return f"✅ {result}"
     except Exception as e:
         return f"❌ Error: {str(e)}"
 
 
+@reloading
 def search_by_tags_ui(tags: str) -> str:
     """Search notes by tags (comma-separated)"""
     try:
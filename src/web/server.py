@@ -1,3 +1,4 @@
+from functools import wraps
 from typing import Optional
 
 from fastmcp import FastMCP
@@ -18,10 +19,24 @@ contact_service = ContactService(storage)
 note_service = NoteService(storage)
 
 
+def tool(**kwargs):
+    # The CLI and web UI may share these files; pick up their saves first
+    def register(function):
+        @wraps(function)
+        def with_fresh_data(*args, **call_kwargs):
+            contact_service.reload_changes()
+            note_service.reload_changes()
+            return function(*args, **call_kwargs)
+
+        return mcp.tool(**kwargs)(with_fresh_data)
+
+    return register
+
+
 # Contact tools
 
 
-@mcp.tool(
+@tool(
     title="Add contact",
     tags={"address book", "add contact"},
     description="Add a contact to address book with selected name and phone number",
@@ -30,7 +45,7 @@ def add_contact(name: str, phone: str):
     return contact_service.add_contact(Name(name), Phone(phone))
 
 
-@mcp.tool(
+@tool(
     title="Remove contact",
     tags={"address book", "remove contact"},
     description="Remove a contact from the address book by name",
@@ -39,7 +54,7 @@ def remove_contact(name: str):
     return contact_service.delete_contact(name)
 
 
-@mcp.tool(
+@tool(
     title="Edit contact email",
     tags={"address book", "edit contact", "email"},
     description="Set or replace the email for an existing contact",
@@ -48,7 +63,7 @@ def edit_contact(name: str, email: str):
     return contact_service.edit_email(name, Email(email))
 
 
-@mcp.tool(
+@tool(
     title="Add email to contact",
     tags={"address book", "add email"},
     description="Add an email address to a contact",
@@ -57,7 +72,7 @@ def add_email(name: str, email: str):
     return contact_service.add_email(name, Email(email))
 
 
-@mcp.tool(
+@tool(
     title="Remove contact email",
     tags={"address book", "remove email"},
     description="Remove the email address from a contact",
@@ -66,7 +81,7 @@ def remove_email(name: str):
     return contact_service.remove_email(name)
 
 
-@mcp.tool(
+@tool(
     title="Edit contact address",
     tags={"address book", "edit address"},
     description="Set or replace the postal address for a contact",
@@ -75,7 +90,7 @@ def edit_address(name: str, address: str):
     return contact_service.edit_address(name, Address(address))
 
 
-@mcp.tool(
+@tool(
     title="Add address to contact",
     tags={"address book", "add address"},
     description="Add a postal address to a contact",
@@ -84,7 +99,7 @@ def add_address(name: str, address: str):
     return contact_service.add_address(name, Address(address))
 
 
-@mcp.tool(
+@tool(
     title="Remove contact address",
     tags={"address book", "remove address"},
     description="Remove the postal address from a contact",
@@ -93,7 +108,7 @@ def remove_address(name: str):
     return contact_service.remove_address(name)
 
 
-@mcp.tool(
+@tool(
     title="Save address book",
     tags={"address book", "save"},
     description="Save the current address book to a file or storage",
@@ -102,7 +117,7 @@ def save_address_book(filename: Optional[str] = None):
     return contact_service.save_address_book(filename)
 
 
-@mcp.tool(
+@tool(
     title="Load address book",
     tags={"address book", "load"},
     description="Load an address book from a file or storage",
@@ -113,7 +128,7 @@ def load_address_book(
     return contact_service.load_address_book(filename, user_provided=user_provided)
 
 
-@mcp.tool(
+@tool(
     title="List contacts",
     tags={"address book", "list"},
     description="Return all contacts in the loaded address book",
@@ -122,7 +137,7 @@ def list_contacts():
     return contact_service.get_all_contacts()
 
 
-@mcp.tool(
+@tool(
     title="Get contact birthday",
     tags={"address book", "birthday"},
     description="Get stored birthday for a contact (if any)",
@@ -131,7 +146,7 @@ def get_contact_birthday(name: str):
     return contact_service.get_birthday(name)
 
 
-@mcp.tool(
+@tool(
     title="Add birthday to contact",
     tags={"address book", "birthday", "add"},
     description="Add a birthday for a contact (format depends on domain rules)",
@@ -140,7 +155,7 @@ def add_birthday(name: str, birthday: str):
     return contact_service.add_birthday(name, Birthday(birthday))
 
 
-@mcp.tool(
+@tool(
     title="Get upcoming birthdays",
     tags={"address book", "birthday", "upcoming"},
     description="Return upcoming birthdays within given number of days",
@@ -149,7 +164,7 @@ def get_upcoming_birthdays(days_ahead: int):
     return contact_service.get_upcoming_birthdays(days_ahead)
 
 
-@mcp.tool(
+@tool(
     title="Get contact phones",
     tags={"address book", "phones", "lookup"},
     description="Return phone numbers for a contact",
@@ -158,7 +173,7 @@ def get_contact_phone(name: str):
     return contact_service.get_phones(name)
 
 
-@mcp.tool(
+@tool(
     title="Change contact phone",
     tags={"address book", "phones", "change"},
     description="Replace an existing phone number for a contact with a new one",
@@ -167,7 +182,7 @@ def change_phone(name: str, old_phone: str, new_phone: str):
     return contact_service.change_phone(name, Phone(old_phone), Phone(new_phone))
 
 
-@mcp.tool(
+@tool(
     title="Search contacts",
     tags={"address book", "search"},
     description="Search contacts by text. Set exact=True for exact matching.",
@@ -176,7 +191,17 @@ def search_contacts(search_text: str, exact: bool = False):
     return contact_service.search(search_text, exact)
 
 
-@mcp.tool(
+@tool(
+    title="Fuzzy search contacts",
+    tags={"address book", "search"},
+    description="Search contact names, emails and addresses allowing typos, "
+    "best match first.",
+)
+def fuzzy_search_contacts(search_text: str):
+    return contact_service.fuzzy_search(search_text)
+
+
+@tool(
     title="Get contacts current filename",
     tags={"address book", "metadata"},
     description="Get the filename currently used for the address book storage",
@@ -188,7 +213,7 @@ def get_contacts_current_filename():
 # Notes tools
 
 
-@mcp.tool(
+@tool(
     title="Add numbers",
     tags={"math", "utility"},
     description="Add two integers and return the result",
@@ -198,7 +223,7 @@ def add(a: int, b: int) -> int:
     return a + b
 
 
-@mcp.tool(
+@tool(
     title="Add note",
     tags={"notes", "add"},
     description="Create a new note with title and text",
@@ -207,7 +232,7 @@ def add_note(title: str, text: str):
     return note_service.add_note(title, text)
 
 
-@mcp.tool(
+@tool(
     title="Get note ids",
     tags={"notes", "ids"},
     description="Return set of currently loaded note ids",
@@ -216,7 +241,7 @@ def get_note_ids():
     return note_service.get_ids()
 
 
-@mcp.tool(
+@tool(
     title="Delete note",
     tags={"notes", "delete"},
     description="Delete a note by id, title or tag. Set 'by' to 'id', 'title' or 'tag'.",
@@ -232,7 +257,7 @@ def remove_note(identifier: str, by: str = "id"):
         raise ValueError("'by' must be one of 'id', 'title', or 'tag'")
 
 
-@mcp.tool(
+@tool(
     title="Delete note by id",
     tags={"notes", "delete", "id"},
     description="Delete a single note by its id",
@@ -241,7 +266,7 @@ def delete_note_by_id(note_id: str):
     return note_service.delete_note_by_id(note_id)
 
 
-@mcp.tool(
+@tool(
     title="Delete note by title",
     tags={"notes", "delete", "title"},
     description="Delete notes that have the given title",
@@ -250,7 +275,7 @@ def delete_note_by_title(title: str):
     return note_service.delete_note_by_title(title)
 
 
-@mcp.tool(
+@tool(
     title="Delete notes by tag",
     tags={"notes", "delete", "tag"},
     description="Delete all notes that contain the given tag",
@@ -259,7 +284,7 @@ def delete_notes_by_tag(tag: str):
     return note_service.delete_note_by_tags(tag)
 
 
-@mcp.tool(
+@tool(
     title="Edit note",
     tags={"notes", "edit"},
     description="Edit the text of an existing note by id",
@@ -268,7 +293,7 @@ def edit_note(note_id: str, new_text: str):
     return note_service.edit_note(note_id, new_text)
 
 
-@mcp.tool(
+@tool(
     title="Rename note",
     tags={"notes", "edit", "title"},
     description="Change the title of an existing note",
@@ -277,7 +302,7 @@ def rename_note(note_id: str, new_title: str):
     return note_service.rename_note(note_id, new_title)
 
 
-@mcp.tool(
+@tool(
     title="Add tag to note",
     tags={"notes", "tags", "add"},
     description="Add a tag to a note (provide tag string)",
@@ -286,7 +311,7 @@ def add_tag(note_id: str, tag: str):
     return note_service.add_tag(note_id, Tag(tag))
 
 
-@mcp.tool(
+@tool(
     title="Remove tag from note",
     tags={"notes", "tags", "remove"},
     description="Remove a tag from a note (provide tag string)",
@@ -295,14 +320,14 @@ def remove_tag(note_id: str, tag: str):
     return note_service.remove_tag(note_id, Tag(tag))
 
 
-@mcp.tool(
+@tool(
     title="Get all notes", tags={"notes", "list"}, description="Return all loaded notes"
 )
 def get_all_notes():
     return note_service.get_all_notes()
 
 
-@mcp.tool(
+@tool(
     title="Find note by title",
     tags={"notes", "lookup", "title"},
     description="Return the note that matches the given title (or None)",
@@ -311,7 +336,7 @@ def get_note_by_title(title: str):
     return note_service.get_note_id_by_title(title)
 
 
-@mcp.tool(
+@tool(
     title="Search notes by content",
     tags={"notes", "search", "content"},
     description="Search notes by content substring (case-insensitive)",
@@ -320,7 +345,7 @@ def search_notes_by_content(query: str):
     return note_service.search_notes_by_content(query)
 
 
-@mcp.tool(
+@tool(
     title="Search notes by title",
     tags={"notes", "search", "title"},
     description="Search notes by title (exact match)",
@@ -329,7 +354,7 @@ def search_notes_by_title(title: str):
     return note_service.search_notes_by_title(title)
 
 
-@mcp.tool(
+@tool(
     title="Search notes by tag",
     tags={"notes", "search", "tag"},
     description="Search notes that contain a tag (case-insensitive)",
@@ -338,7 +363,7 @@ def search_notes_by_tag(tag: str):
     return note_service.search_notes_by_tag(tag)
 
 
-@mcp.tool(
+@tool(
     title="List tags",
     tags={"notes", "tags", "list"},
     description="Return a mapping of tag -> count across all notes",
@@ -347,7 +372,7 @@ def list_tags():
     return note_service.list_tags()
 
 
-@mcp.tool(
+@tool(
     title="Get notes grouped by tag",
     tags={"notes", "tags", "group"},
     description="Return notes grouped by their tags",
@@ -356,7 +381,7 @@ def get_notes_sorted_by_tag():
     return note_service.get_notes_sorted_by_tag()
 
 
-@mcp.tool(
+@tool(
     title="Save notes",
     tags={"notes", "save"},
     description="Save notes to storage (optional filename)",
@@ -365,7 +390,7 @@ def save_notes(filename: Optional[str] = None):
     return note_service.save_notes(filename)
 
 
-@mcp.tool(
+@tool(
     title="Load notes",
     tags={"notes", "load"},
     description="Load notes from storage (optional filename)",
@@ -374,7 +399,7 @@ def load_notes(filename: Optional[str] | None = None):
     return note_service.load_notes(filename)
 
 
-@mcp.tool(
+@tool(
     title="Get notes current filename",
     tags={"notes", "metadata"},
     description="Get the filename currently used for notes storage",
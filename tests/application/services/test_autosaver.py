@@ -0,0 +1,151 @@
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.application.services.autosaver import Autosaver
+from src.application.services.contact_service import ContactService
+from src.application.services.note_service import NoteService
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.pickle_storage import PickleStorage
+
+QUIET = 0.05
+
+
+def wait_until(condition, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+@pytest.fixture
+def autosaver():
+    """Provides a running autosaver with a short quiet period."""
+    saver = Autosaver(quiet_period=QUIET)
+    saver.start()
+    yield saver
+    saver.stop()
+
+
+class TestAutosaver:
+    """Tests for the debounced background autosave."""
+
+    def test_burst_is_coalesced_into_one_flush(self, autosaver):
+        """Test that several edits inside the quiet period cause one write."""
+        calls = []
+        flush = lambda: calls.append(time.monotonic())
+
+        for _ in range(5):
+            autosaver.mark_dirty(flush)
+            time.sleep(QUIET / 5)
+
+        assert wait_until(lambda: calls)
+        time.sleep(QUIET * 3)
+        assert len(calls) == 1
+        assert not autosaver.is_dirty()
+
+    def test_flush_runs_on_background_thread(self, autosaver):
+        """Test that mark_dirty returns at once and the save runs elsewhere."""
+        threads = []
+        autosaver.mark_dirty(lambda: threads.append(threading.current_thread()))
+
+        assert wait_until(lambda: threads)
+        assert threads[0] is not threading.main_thread()
+
+    def test_each_flush_runs_once_per_burst(self, autosaver):
+        """Test that each marked flush runs once however often it was marked."""
+        calls = []
+        first = lambda: calls.append("first")
+        second = lambda: calls.append("second")
+
+        autosaver.mark_dirty(first)
+        autosaver.mark_dirty(second)
+        autosaver.mark_dirty(first)
+
+        assert wait_until(lambda: len(calls) == 2)
+        assert sorted(calls) == ["first", "second"]
+
+    def test_failed_flush_stays_pending(self):
+        """Test that a failing save is retried by the next flush."""
+        saver = Autosaver(quiet_period=QUIET)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise IOError("disk full")
+
+        saver.mark_dirty(flaky)
+        saver.flush()
+        assert saver.is_dirty()
+
+        saver.flush()
+        assert len(attempts) == 2
+        assert not saver.is_dirty()
+
+    def test_stop_without_start(self):
+        """Test that stopping an autosaver that never started is harmless."""
+        Autosaver().stop()
+
+
+class TestServiceAutosave:
+    """Tests for services marking the autosaver dirty."""
+
+    def test_contact_edits_are_saved_in_background(self, autosaver, tmp_path: Path):
+        """Test that contacts reach the disk without an explicit save."""
+        service = ContactService(PickleStorage(tmp_path), autosaver=autosaver)
+        service.add_contact(Name("Alice"), Phone("1234567890"))
+        service.add_contact(Name("Bob"), Phone("0987654321"))
+
+        assert wait_until(lambda: not autosaver.is_dirty())
+        reloaded = ContactService(PickleStorage(tmp_path))
+        assert reloaded.load_address_book() == 2
+
+    def test_reads_do_not_mark_dirty(self, tmp_path: Path):
+        """Test that only mutations schedule a save."""
+        saver = Autosaver(quiet_period=QUIET)
+        service = NoteService(JsonStorage(tmp_path), autosaver=saver)
+
+        service.get_all_notes()
+        assert not saver.is_dirty()
+
+        service.add_note("Title", "Some text")
+        assert saver.is_dirty()
+
+    def test_mutation_runs_during_slow_save(self, tmp_path: Path):
+        """Test that edits go ahead while a save writes and stay pending."""
+        started, release = threading.Event(), threading.Event()
+
+        class SlowStorage(PickleStorage):
+            def save(self, data, filename, **kwargs):
+                started.set()
+                release.wait(2)
+                return super().save(data, filename, **kwargs)
+
+        saver = Autosaver(quiet_period=QUIET)
+        service = ContactService(SlowStorage(tmp_path), autosaver=saver)
+        service.add_contact(Name("Alice"), Phone("1234567890"))
+        flusher = threading.Thread(target=saver.flush)
+        flusher.start()
+        started.wait(2)
+
+        editor = threading.Thread(
+            target=service.add_contact, args=(Name("Bob"), Phone("0987654321"))
+        )
+        editor.start()
+        editor.join(2)
+        assert not editor.is_alive()
+
+        release.set()
+        flusher.join(2)
+        assert ContactService(PickleStorage(tmp_path)).load_address_book() == 1
+        assert saver.is_dirty()
+
+        saver.flush()
+        assert ContactService(PickleStorage(tmp_path)).load_address_book() == 2
@@ -189,6 +189,11 @@ class TestContactService:
         assert len(results) == 1
         assert results[0].name.value == "John Doe"
 
+    def test_fuzzy_search(self, contact_service, sample_contact):
+        """Test fuzzy search tolerates a misspelled name."""
+        results = contact_service.fuzzy_search("Jon Doe")
+        assert [contact.name.value for contact in results] == ["John Doe"]
+
     def test_load_address_book(self, contact_service, mock_storage):
         """Test loading an address book from storage."""
         mock_address_book = AddressBook()
@@ -203,10 +208,19 @@ class TestContactService:
 
     def test_save_address_book(self, contact_service, mock_storage):
         """Test saving an address book to storage."""
-        mock_storage.save_contacts.return_value = "saved.pkl"
+        prepared = mock_storage.prepare_contacts.return_value
+        prepared.write.return_value = "saved.pkl"
         filename = contact_service.save_address_book("saved.pkl")
-        mock_storage.save_contacts.assert_called_once_with(
+        mock_storage.prepare_contacts.assert_called_once_with(
             contact_service.address_book, "saved.pkl", user_provided=False
         )
+        prepared.finish.assert_called_once_with()
         assert filename == "saved.pkl"
         assert contact_service.get_current_filename() == "saved.pkl"
+
+    def test_edits_are_tracked_as_modified(self, contact_service, sample_contact):
+        """Test that contact edits are recorded in the address book change set."""
+        contact_service.address_book.mark_flushed("saved.db")
+        contact_service.add_email("John Doe", Email("john@example.com"))
+        changes = contact_service.address_book.pending_changes()
+        assert changes.modified == {sample_contact.id}
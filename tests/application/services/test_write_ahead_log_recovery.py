@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+
+from src.application.services.contact_service import ContactService
+from src.application.services.note_service import NoteService
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.persistence.write_ahead_log import WriteAheadLog
+from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.pickle_storage import PickleStorage
+
+
+def make_wal(path: Path, snapshot_every_ops: int = 100) -> WriteAheadLog:
+    return WriteAheadLog(
+        path, snapshot_every_ops=snapshot_every_ops, snapshot_interval_seconds=3600
+    )
+
+
+@pytest.fixture
+def contacts(tmp_path: Path) -> ContactService:
+    """Provides a ContactService with a write-ahead log over pickle storage."""
+    service = ContactService(
+        PickleStorage(tmp_path), write_ahead_log=make_wal(tmp_path / "contacts.wal")
+    )
+    service.load_address_book("book.pkl")
+    return service
+
+
+def restart(tmp_path: Path, snapshot_every_ops: int = 100) -> ContactService:
+    service = ContactService(
+        PickleStorage(tmp_path),
+        write_ahead_log=make_wal(tmp_path / "contacts.wal", snapshot_every_ops),
+    )
+    service.load_address_book("book.pkl")
+    return service
+
+
+class TestContactServiceRecovery:
+    """Tests for recovering contacts from the write-ahead log after a crash."""
+
+    def test_unsaved_changes_survive_a_crash(self, contacts, tmp_path):
+        """Test that logged commands are replayed when nothing was saved."""
+        contacts.add_contact(Name("Alice"), Phone("1234567890"))
+        contacts.add_contact(Name("Bob"), Phone("0987654321"))
+        contacts.add_email(Name("Alice").value, Email("alice@example.com"))
+        contacts.delete_contact("Bob")
+
+        recovered = restart(tmp_path)
+
+        assert [c.name.value for c in recovered.get_all_contacts()] == ["Alice"]
+        assert recovered.address_book.find("Alice").email.value == "alice@example.com"
+
+    def test_log_is_replayed_over_the_snapshot(self, contacts, tmp_path):
+        """Test that recovery applies only changes made after the last save."""
+        contacts.add_contact(Name("Alice"), Phone("1234567890"))
+        contacts.save_address_book()
+        contacts.add_contact(Name("Alice"), Phone("1112223333"))
+
+        recovered = restart(tmp_path)
+
+        assert recovered.get_phones("Alice") == ["1234567890", "1112223333"]
+        assert not recovered.address_book.pending_changes().is_empty()
+
+    def test_save_truncates_log(self, contacts, tmp_path):
+        """Test that a save makes the log empty."""
+        contacts.add_contact(Name("Alice"), Phone("1234567890"))
+        assert (tmp_path / "contacts.wal").exists()
+
+        contacts.save_address_book()
+
+        assert not (tmp_path / "contacts.wal").exists()
+
+    def test_snapshot_every_n_operations(self, tmp_path):
+        """Test that the service snapshots on its own after N logged commands."""
+        service = restart(tmp_path, snapshot_every_ops=2)
+        service.add_contact(Name("Alice"), Phone("1234567890"))
+        assert not (tmp_path / "book.pkl").exists()
+
+        service.add_contact(Name("Bob"), Phone("0987654321"))
+
+        assert (tmp_path / "book.pkl").exists()
+        assert not (tmp_path / "contacts.wal").exists()
+        saved = ContactService(PickleStorage(tmp_path))
+        assert saved.load_address_book("book.pkl") == 2
+
+    def test_failed_command_logs_nothing(self, contacts, tmp_path):
+        """Test that a command that changes nothing appends no entry."""
+        with pytest.raises(KeyError):
+            contacts.add_birthday("Nobody", None)
+
+        assert not (tmp_path / "contacts.wal").exists()
+
+
+class TestNoteServiceRecovery:
+    """Tests for recovering notes from the write-ahead log after a crash."""
+
+    def test_unsaved_notes_survive_a_crash(self, tmp_path):
+        """Test that note edits and deletions are replayed on load."""
+        wal_path = tmp_path / "notes.wal"
+        service = NoteService(JsonStorage(tmp_path), write_ahead_log=make_wal(wal_path))
+        service.load_notes()
+        kept = service.add_note("Kept", "First text")
+        dropped = service.add_note("Dropped", "Second text")
+        service.edit_note(kept, "Edited text")
+        service.delete_note_by_id(dropped)
+
+        recovered = NoteService(
+            JsonStorage(tmp_path), write_ahead_log=make_wal(wal_path)
+        )
+        recovered.load_notes()
+
+        notes = recovered.get_all_notes()
+        assert [(n.id, n.title, n.text) for n in notes] == [
+            (kept, "Kept", "Edited text")
+        ]
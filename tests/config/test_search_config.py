@@ -0,0 +1,14 @@
+from src.config.search_config import SearchConfig
+
+
+class TestSearchConfig:
+    """Tests for the SearchConfig class."""
+
+    def test_fuzzy_min_similarity_is_a_share(self):
+        """Test that FUZZY_MIN_SIMILARITY lies between 0 and 1."""
+        assert 0 < SearchConfig.FUZZY_MIN_SIMILARITY <= 1
+
+    def test_fuzzy_max_results_is_positive(self):
+        """Test that FUZZY_MAX_RESULTS is a positive integer."""
+        assert isinstance(SearchConfig.FUZZY_MAX_RESULTS, int)
+        assert SearchConfig.FUZZY_MAX_RESULTS > 0
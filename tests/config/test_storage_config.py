@@ -5,18 +5,86 @@ from src.config.storage_config import StorageConfig
 class TestStorageConfig:
     """Tests for the StorageConfig class."""
 
-    def test_storage_config_is_empty(self):
-        """Test that StorageConfig is currently empty."""
-        # This test is designed to fail if any attributes are added to StorageConfig,
-        # prompting a review of the tests for the new configuration.
+    def test_sqlite_schema_version(self):
+        """Test the SQLite schema version used by migrations."""
+        assert StorageConfig.SQLITE_SCHEMA_VERSION == 6
+
+    def test_sqlite_migration_batch_size(self):
+        """Test that migration batches are bounded."""
+        assert isinstance(StorageConfig.SQLITE_MIGRATION_BATCH_SIZE, int)
+        assert StorageConfig.SQLITE_MIGRATION_BATCH_SIZE > 0
+
+    def test_sqlite_lazy_address_book_is_opt_in(self):
+        """Test that lazy SQLite address books are disabled by default."""
+        assert StorageConfig.SQLITE_LAZY_ADDRESS_BOOK is False
+
+    def test_lazy_contact_cache_size(self):
+        """Test that lazy address books keep a bounded cache."""
+        assert isinstance(StorageConfig.LAZY_CONTACT_CACHE_SIZE, int)
+        assert StorageConfig.LAZY_CONTACT_CACHE_SIZE > 0
+
+    def test_sqlite_performance_profile(self):
+        """Test that faster SQLite profiles are opt-in."""
+        assert StorageConfig.SQLITE_PERFORMANCE_PROFILE == "compatible"
+
+    def test_sqlite_bulk_batch_size(self):
+        """Test that bulk writes use bounded batches."""
+        assert isinstance(StorageConfig.SQLITE_BULK_BATCH_SIZE, int)
+        assert StorageConfig.SQLITE_BULK_BATCH_SIZE > 0
+
+    def test_jsonl_compaction_settings(self):
+        """Test that JSONL journals are compacted in the background."""
+        assert StorageConfig.JSONL_COMPACTION_MIN_BYTES > 0
+        assert StorageConfig.JSONL_BACKGROUND_COMPACTION is True
+
+    def test_json_streaming_load(self):
+        """Test that JSON loads stream the array in bounded chunks."""
+        assert StorageConfig.JSON_STREAMING_LOAD is True
+        assert StorageConfig.JSON_STREAM_CHUNK_SIZE > 0
+
+    def test_json_shard_settings(self):
+        """Test that sharded JSON uses a short hash prefix and parallel loads."""
+        assert StorageConfig.JSON_SHARD_PREFIX_LENGTH == 2
+        assert StorageConfig.JSON_SHARD_LOAD_WORKERS > 0
+
+    def test_compression_levels(self):
+        """Test that codecs default to balanced compression levels."""
+        assert 1 <= StorageConfig.GZIP_COMPRESSION_LEVEL <= 9
+        assert 0 <= StorageConfig.LZMA_PRESET <= 9
+        assert StorageConfig.ZSTD_COMPRESSION_LEVEL > 0
+
+    def test_write_ahead_log_settings(self):
+        """Test that services snapshot periodically and fsync each log entry."""
+        assert StorageConfig.WAL_SNAPSHOT_EVERY_OPS > 0
+        assert StorageConfig.WAL_SNAPSHOT_INTERVAL_SECONDS > 0
+        assert StorageConfig.WAL_FSYNC is True
+
+    def test_autosave_quiet_period(self):
+        """Test that autosave waits for a short pause in editing."""
+        assert StorageConfig.AUTOSAVE_QUIET_SECONDS > 0
+
+    def test_file_locking_settings(self):
+        """Test that single-file stores are locked with a bounded wait."""
+        assert StorageConfig.FILE_LOCKING is True
+        assert StorageConfig.FILE_LOCK_TIMEOUT_SECONDS > 0
+
+    def test_converter_batch_size(self):
+        """Test that the converter streams records in bounded batches."""
+        assert StorageConfig.CONVERTER_BATCH_SIZE > 0
+
+    def test_parallel_load_settings(self):
+        """Test that parallel loading is opt-in and chunks are non-empty."""
+        assert StorageConfig.PARALLEL_LOAD is False
+        assert StorageConfig.PARALLEL_LOAD_WORKERS is None
+        assert StorageConfig.PARALLEL_LOAD_CHUNK_SIZE > 0
+
+    def test_backup_chunk_sizes(self):
+        """Test that backup chunk sizes are ordered around a power-of-two average."""
         assert (
-            len(
-                [
-                    attr
-                    for attr in dir(StorageConfig)
-                    if not attr.startswith("__")
-                    and not callable(getattr(StorageConfig, attr))
-                ]
-            )
-            == 0
+            0
+            < StorageConfig.BACKUP_CHUNK_MIN_SIZE
+            <= StorageConfig.BACKUP_CHUNK_AVG_SIZE
+            <= StorageConfig.BACKUP_CHUNK_MAX_SIZE
         )
+        average = StorageConfig.BACKUP_CHUNK_AVG_SIZE
+        assert average & (average - 1) == 0
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from unittest.mock import Mock
 from src.domain.entities.contact import Contact
@@ -161,3 +163,38 @@ class TestContact:
         """Test the string representation of a contact with minimal information."""
         expected = "Contact name: John Doe, phones: —"
         assert str(sample_contact) == expected
+
+    def test_contact_has_no_instance_dict(self, sample_contact):
+        """Test that contact attributes live in slots."""
+        assert not hasattr(sample_contact, "__dict__")
+        with pytest.raises(AttributeError):
+            sample_contact.nickname = "Johnny"
+
+    def test_pickle_keeps_the_dict_layout(self, sample_contact):
+        """Test that pickles carry the same state as before slots."""
+        sample_contact.add_phone(Phone("1234567890"))
+        state = sample_contact.__getstate__()
+        assert set(state) == {"id", "name", "phones", "birthday", "email", "address"}
+
+        loaded = pickle.loads(pickle.dumps(sample_contact))
+        assert str(loaded) == str(sample_contact)
+
+    def test_loads_pickles_written_before_slots(self):
+        """Test that a contact pickled with a plain __dict__ still loads."""
+
+        class OldPickle:
+            def __reduce_ex__(self, protocol):
+                state = {
+                    "id": "old-1",
+                    "name": Name("John Doe"),
+                    "phones": [Phone("1234567890")],
+                    "birthday": None,
+                    "email": None,
+                    "address": Address("Kyiv, Ukraine"),
+                }
+                return object.__new__, (Contact,), state
+
+        loaded = pickle.loads(pickle.dumps(OldPickle()))
+        assert isinstance(loaded, Contact)
+        assert loaded.phones == [Phone("1234567890")]
+        assert loaded.address is Address.from_trusted("Kyiv, Ukraine")
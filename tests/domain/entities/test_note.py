@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 from unittest.mock import Mock
 from src.domain.entities.note import Note
@@ -100,3 +102,22 @@ class TestNote:
         note = Note(test_title, "Short note.", "id-2")
         expected = "Note 'Test note title'\n[no tags]:\nShort note."
         assert str(note) == expected
+
+    def test_tags_are_shared_across_notes(self):
+        """Test that notes with the same tag hold one Tag instance."""
+        first = Note(test_title, "First.", "id-1")
+        second = Note(test_title, "Second.", "id-2")
+        first.add_tag(Tag("work"))
+        second.add_tag(Tag("work"))
+        assert first.tags[0] is second.tags[0]
+
+    def test_pickle_round_trip(self):
+        """Test that a slotted note pickles with its former state layout."""
+        note = Note(test_title, "Short note.", "id-1")
+        note.add_tag(Tag("work"))
+        assert set(note.__getstate__()) == {"id", "title", "text", "tags"}
+
+        loaded = pickle.loads(pickle.dumps(note))
+        assert not hasattr(loaded, "__dict__")
+        assert str(loaded) == str(note)
+        assert loaded.tags[0] is note.tags[0]
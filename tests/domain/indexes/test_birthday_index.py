@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+
+from src.domain.entities.contact import Contact
+from src.domain.indexes.birthday_index import BirthdayIndex
+from src.domain.value_objects.birthday import Birthday
+from src.domain.value_objects.name import Name
+
+
+def make_contact(contact_id: str, birthday: str = None) -> Contact:
+    contact = Contact(Name("Contact"), contact_id)
+    if birthday:
+        contact.add_birthday(Birthday(birthday))
+    return contact
+
+
+@pytest.fixture
+def index() -> BirthdayIndex:
+    """Provides an index over birthdays spread across the year."""
+    index = BirthdayIndex()
+    index.add(make_contact("new-year", "01.01.1990"))
+    index.add(make_contact("leap", "29.02.1988"))
+    index.add(make_contact("march", "01.03.1985"))
+    index.add(make_contact("none"))
+    index.add(make_contact("december", "30.12.1970"))
+    return index
+
+
+def ids(index: BirthdayIndex, today: date, days_ahead: int) -> list[str]:
+    return [contact_id for contact_id, _ in index.upcoming(today, days_ahead)]
+
+
+class TestBirthdayIndex:
+    """Tests for birthday window queries over the calendar index."""
+
+    def test_window_within_the_year(self, index):
+        """Test that only birthdays inside the window are returned."""
+        assert ids(index, date(2025, 12, 25), 5) == ["december"]
+        assert ids(index, date(2025, 12, 31), 0) == []
+
+    def test_window_wraps_past_new_year(self, index):
+        """Test that a window crossing Dec 31 continues in January."""
+        assert index.upcoming(date(2025, 12, 29), 7) == [
+            ("december", date(2025, 12, 30)),
+            ("new-year", date(2026, 1, 1)),
+        ]
+
+    def test_leap_day_in_common_year(self, index):
+        """Test that Feb 29 birthdays move to Mar 1 in common years."""
+        assert index.upcoming(date(2025, 2, 27), 2) == [
+            ("leap", date(2025, 3, 1)),
+            ("march", date(2025, 3, 1)),
+        ]
+        assert ids(index, date(2025, 2, 27), 1) == []
+        assert ids(index, date(2028, 2, 28), 1) == ["leap"]
+
+    def test_whole_year(self, index):
+        """Test that a year-long window returns every birthday, soonest first."""
+        assert ids(index, date(2025, 6, 1), 365) == [
+            "december",
+            "new-year",
+            "leap",
+            "march",
+        ]
+        assert ids(index, date(2025, 6, 1), -1) == []
+
+    def test_update_and_discard(self, index):
+        """Test that changed and removed birthdays leave the calendar."""
+        ids(index, date(2025, 1, 1), 1)
+        index.update(make_contact("new-year"))
+        index.update(make_contact("none", "02.01.2000"))
+        index.discard("december")
+
+        assert ids(index, date(2024, 12, 29), 7) == ["none"]
+
+    def test_edits_before_the_first_query(self):
+        """Test that the calendar built lazily reflects earlier edits."""
+        index = BirthdayIndex()
+        index.add(make_contact("1", "05.05.1990"))
+        index.update(make_contact("1", "06.05.1990"))
+
+        assert index.upcoming(date(2025, 5, 1), 10) == [("1", date(2025, 5, 6))]
@@ -0,0 +1,63 @@
+from src.domain.entities.contact import Contact
+from src.domain.indexes.name_index import NameIndex
+from src.domain.value_objects.name import Name
+
+
+def make_contact(name: str, contact_id: str) -> Contact:
+    return Contact(Name(name), contact_id)
+
+
+class TestNameIndex:
+    """Tests for the name-to-ID multimap."""
+
+    def test_exact_and_casefolded_lookup(self):
+        """Test that both exact and case-insensitive keys are kept."""
+        index = NameIndex()
+        index.add(make_contact("Straße", "1"))
+        index.add(make_contact("STRASSE", "2"))
+
+        assert index.ids("Straße") == ["1"]
+        assert index.ids("strasse", ignore_case=True) == ["1", "2"]
+        assert index.ids("strasse") == []
+
+    def test_duplicate_names_keep_insertion_order(self):
+        """Test that contacts sharing a name come back in the order added."""
+        index = NameIndex()
+        for contact_id in ("b", "a", "c"):
+            index.add(make_contact("John", contact_id))
+
+        assert index.ids("John") == ["b", "a", "c"]
+
+    def test_discard(self):
+        """Test that discarding removes the ID from both keys."""
+        index = NameIndex()
+        index.add(make_contact("John", "1"))
+
+        index.discard("1")
+        index.discard("missing")
+
+        assert index.ids("John") == []
+        assert index.ids("john", ignore_case=True) == []
+
+    def test_update_after_rename(self):
+        """Test that an in-place rename moves the ID to the new name."""
+        index = NameIndex()
+        contact = make_contact("John", "1")
+        index.add(contact)
+
+        contact.name = Name("Jane")
+        index.update(contact)
+
+        assert index.ids("John") == []
+        assert index.ids("Jane") == ["1"]
+
+    def test_update_without_rename_keeps_order(self):
+        """Test that editing other fields does not reorder duplicates."""
+        index = NameIndex()
+        first, second = make_contact("John", "1"), make_contact("John", "2")
+        index.add(first)
+        index.add(second)
+
+        index.update(first)
+
+        assert index.ids("John") == ["1", "2"]
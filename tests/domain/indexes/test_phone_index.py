@@ -0,0 +1,88 @@
+import random
+
+import pytest
+
+from src.domain.entities.contact import Contact
+from src.domain.indexes.phone_index import PhoneIndex
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+
+
+def make_contact(contact_id: str, *phones: str) -> Contact:
+    contact = Contact(Name("John"), contact_id)
+    for phone in phones:
+        contact.add_phone(Phone(phone))
+    return contact
+
+
+@pytest.fixture
+def index() -> PhoneIndex:
+    """Provides an index over three contacts, two sharing a number."""
+    index = PhoneIndex()
+    index.add(make_contact("1", "380501234567", "0441112233"))
+    index.add(make_contact("2", "380671234567"))
+    index.add(make_contact("3", "0441112233"))
+    return index
+
+
+class TestPhoneIndex:
+    """Tests for exact, suffix and partial phone lookups."""
+
+    def test_exact(self, index):
+        """Test lookups of a whole phone number."""
+        assert index.ids("0441112233") == ["1", "3"]
+        assert index.ids("0441112") == []
+
+    def test_suffix(self, index):
+        """Test that only phones ending with the digits match."""
+        assert index.ids_ending_with("1234567") == ["1", "2"]
+        assert index.ids_ending_with("50123") == []
+        assert index.ids_ending_with("380501234567") == ["1"]
+
+    def test_partial_match_inside_a_phone(self, index):
+        """Test that digits anywhere in a phone match."""
+        assert index.matching_ids("5012") == ["1"]
+        assert sorted(index.matching_ids("1234567")) == ["1", "2"]
+
+    def test_partial_match_of_a_longer_query(self, index):
+        """Test that a phone contained in the query matches."""
+        assert sorted(index.matching_ids("3804411122335")) == ["1", "3"]
+
+    def test_edits_keep_the_suffix_array_current(self, index):
+        """Test that adds, edits and removals after the first query are seen."""
+        assert index.matching_ids("999") == []
+        contact = make_contact("4", "0999999999")
+        index.add(contact)
+        assert index.ids_ending_with("999") == ["4"]
+
+        contact.edit_phone(Phone("0999999999"), Phone("0888888888"))
+        index.update(contact)
+        index.discard("2")
+
+        assert index.matching_ids("999") == []
+        assert index.ids_ending_with("888") == ["4"]
+        assert index.matching_ids("0671") == []
+
+    def test_shared_phone_stays_while_one_owner_remains(self, index):
+        """Test that a number used by two contacts survives one removal."""
+        index.matching_ids("0")
+        index.discard("1")
+
+        assert index.ids_ending_with("1112233") == ["3"]
+
+    def test_agrees_with_contact_matching(self):
+        """Test the index against Contact.has_phone_matching on random data."""
+        rng = random.Random(7)
+        contacts = [
+            make_contact(
+                str(i), *{f"{rng.randrange(10**9, 10**10)}" for _ in range(2)}
+            )
+            for i in range(200)
+        ]
+        index = PhoneIndex()
+        for contact in contacts:
+            index.add(contact)
+
+        for digits in ["1", "42", "123", "9876", "5555555", "0"]:
+            expected = {c.id for c in contacts if c.has_phone_matching(digits)}
+            assert set(index.matching_ids(digits)) == expected
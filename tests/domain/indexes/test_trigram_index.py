@@ -0,0 +1,72 @@
+import pytest
+
+from src.domain.entities.contact import Contact
+from src.domain.indexes.trigram_index import TrigramIndex, trigrams
+from src.domain.value_objects.address import Address
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+
+
+def make_contact(contact_id: str, name: str, email: str = None) -> Contact:
+    contact = Contact(Name(name), contact_id)
+    if email:
+        contact.add_email(Email(email))
+    return contact
+
+
+@pytest.fixture
+def index() -> TrigramIndex:
+    """Provides an index over three contacts."""
+    index = TrigramIndex()
+    index.add(make_contact("1", "John Smith", "john@example.com"))
+    index.add(make_contact("2", "Jane Doe", "jane@example.org"))
+    index.add(make_contact("3", "Johnny Walker"))
+    return index
+
+
+class TestTrigramIndex:
+    """Tests for trigram candidates, fuzzy scores and ordering."""
+
+    def test_trigrams(self):
+        """Test that a text yields its overlapping three-letter slices."""
+        assert trigrams("john") == {"joh", "ohn"}
+        assert trigrams("jo") == set()
+
+    def test_candidates_contain_every_match(self, index):
+        """Test that contacts holding the substring are candidates."""
+        assert sorted(index.candidate_ids("JOHN")) == ["1", "3"]
+        assert index.candidate_ids("example.org") == ["2"]
+        assert index.candidate_ids("zzz") == []
+
+    def test_short_queries_are_not_narrowed(self, index):
+        """Test that a query under three characters gives no candidate list."""
+        assert index.candidate_ids("jo") is None
+
+    def test_trigrams_do_not_span_fields(self, index):
+        """Test that the end of a name and the start of an email never join."""
+        assert index.candidate_ids("smithjohn") == []
+
+    def test_update_and_discard(self, index):
+        """Test that edits and removals are reflected in the postings."""
+        contact = make_contact("2", "Jane Doe")
+        contact.add_address(Address("Baker Street"))
+        index.update(contact)
+        index.discard("1")
+
+        assert index.candidate_ids("example.org") == []
+        assert index.candidate_ids("baker") == ["2"]
+        assert index.candidate_ids("smith") == []
+
+    def test_similar_ids_rank_typos(self, index):
+        """Test that a misspelt query ranks the closest contact first."""
+        ranked = index.similar_ids("jonh smith", min_similarity=0.3)
+
+        assert ranked[0][0] == "1"
+        assert all(score >= 0.3 for _, score in ranked)
+        assert index.similar_ids("xq", min_similarity=0.1) == []
+
+    def test_in_order_follows_insertion(self, index):
+        """Test that IDs are ordered the way the contacts were added."""
+        index.update(make_contact("1", "John Smithers"))
+
+        assert index.in_order({"3", "1", "2"}) == ["1", "2", "3"]
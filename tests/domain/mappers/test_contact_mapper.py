@@ -2,6 +2,7 @@ import pytest
 from src.domain.mappers.contact_mapper import ContactMapper
 from src.domain.entities.contact import Contact
 from src.domain.models.dbcontact import DBContact
+from src.domain.models.dbcontact_phone import DBContactPhone
 from src.domain.value_objects.name import Name
 from src.domain.value_objects.phone import Phone
 from src.domain.value_objects.email import Email
@@ -26,7 +27,9 @@ class TestContactMapper:
         assert isinstance(db_contact, DBContact)
         assert db_contact.id == "test-id"
         assert db_contact.name == "John Doe"
-        assert db_contact.phones == "1234567890,0987654321"
+        assert [p.phone for p in db_contact.phones] == ["1234567890", "0987654321"]
+        assert [p.position for p in db_contact.phones] == [0, 1]
+        assert all(p.contact_id == "test-id" for p in db_contact.phones)
         assert db_contact.birthday == "01.01.1990"
         assert db_contact.email == "john.doe@example.com"
         assert db_contact.address == "123 Main St"
@@ -40,7 +43,7 @@ class TestContactMapper:
         assert isinstance(db_contact, DBContact)
         assert db_contact.id == "test-id-2"
         assert db_contact.name == "Jane Doe"
-        assert db_contact.phones == ""
+        assert db_contact.phones == []
         assert db_contact.birthday is None
         assert db_contact.email is None
         assert db_contact.address is None
@@ -50,7 +53,10 @@ class TestContactMapper:
         db_contact = DBContact(
             id="test-id",
             name="John Doe",
-            phones="1234567890,0987654321",
+            phones=[
+                DBContactPhone(contact_id="test-id", position=0, phone="1234567890"),
+                DBContactPhone(contact_id="test-id", position=1, phone="0987654321"),
+            ],
             birthday="01.01.1990",
             email="john.doe@example.com",
             address="123 Main St",
@@ -73,7 +79,6 @@ class TestContactMapper:
         db_contact = DBContact(
             id="test-id-2",
             name="Jane Doe",
-            phones=None,
             birthday=None,
             email=None,
             address=None,
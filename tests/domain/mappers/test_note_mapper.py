@@ -1,6 +1,7 @@
 from src.domain.entities.note import Note
 from src.domain.mappers.note_mapper import NoteMapper
 from src.domain.models.dbnote import DBNote
+from src.domain.models.dbnote_tag import DBNoteTag
 from src.domain.value_objects.tag import Tag
 
 test_title = "Test note title"
@@ -20,7 +21,8 @@ class TestNoteMapper:
         assert isinstance(db_note, DBNote)
         assert db_note.id == "test-id-1"
         assert db_note.text == "Test note text"
-        assert db_note.tags == "tag1,tag2"
+        assert [t.tag for t in db_note.tags] == ["tag1", "tag2"]
+        assert all(t.note_id == "test-id-1" for t in db_note.tags)
 
     def test_to_dbmodel_no_tags(self):
         """Test mapping a Note entity with no tags to a DBNote model."""
@@ -31,7 +33,7 @@ class TestNoteMapper:
         assert isinstance(db_note, DBNote)
         assert db_note.id == "test-id-2"
         assert db_note.text == "Another note"
-        assert db_note.tags is None
+        assert db_note.tags == []
 
     def test_from_dbmodel_full(self):
         """Test mapping a full DBNote model to a Note entity."""
@@ -39,7 +41,10 @@ class TestNoteMapper:
             id="test-id-1",
             title=test_title,
             text="Test note text",
-            tags="tag1, tag2, tag3",
+            tags=[
+                DBNoteTag(note_id="test-id-1", position=i, tag=tag)
+                for i, tag in enumerate(["tag1", "tag2", "tag3"])
+            ],
         )
 
         note = NoteMapper.from_dbmodel(db_note)
@@ -54,9 +59,7 @@ class TestNoteMapper:
 
     def test_from_dbmodel_no_tags(self):
         """Test mapping a DBNote model with no tags to a Note entity."""
-        db_note = DBNote(
-            id="test-id-2", title=test_title, text="Another note", tags=None
-        )
+        db_note = DBNote(id="test-id-2", title=test_title, text="Another note")
 
         note = NoteMapper.from_dbmodel(db_note)
 
@@ -0,0 +1,248 @@
+import pickle
+from datetime import date, timedelta
+
+import pytest
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.address import Address
+from src.domain.value_objects.birthday import Birthday
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+
+
+@pytest.fixture
+def book() -> AddressBook:
+    """Provides a book with two Johns and one Jane."""
+    book = AddressBook()
+    for contact_id, name in (("1", "John"), ("2", "Jane"), ("3", "John")):
+        book.add_record(Contact(Name(name), contact_id))
+    return book
+
+
+class TestAddressBookNameIndex:
+    """Tests for name lookups through the AddressBook name index."""
+
+    def test_find_and_find_all(self, book):
+        """Test exact lookups, first match first."""
+        assert book.find("John").id == "1"
+        assert [c.id for c in book.find_all("John")] == ["1", "3"]
+        assert book.find_all("Nobody") == []
+        with pytest.raises(KeyError):
+            book.find("john")
+
+    def test_ignore_case(self, book):
+        """Test casefolded lookups."""
+        assert book.find("jANE", ignore_case=True).id == "2"
+        assert len(book.find_all("JOHN", ignore_case=True)) == 2
+
+    def test_delete_by_name_and_id(self, book):
+        """Test that deleted contacts leave the index."""
+        book.delete("John")
+        book.delete_by_id("2")
+
+        assert [c.id for c in book.find_all("John")] == ["3"]
+        assert book.find_all("Jane") == []
+
+    def test_rename(self, book):
+        """Test that rename re-indexes the contact and marks it modified."""
+        book.mark_flushed()
+
+        book.rename("2", Name("Janet"))
+
+        assert book.find("Janet").id == "2"
+        assert book.find_all("Jane") == []
+        assert book.pending_changes().modified == {"2"}
+
+    def test_rename_unknown_contact(self, book):
+        """Test that renaming a missing contact raises KeyError."""
+        with pytest.raises(KeyError):
+            book.rename("missing", Name("Nobody"))
+
+    def test_mark_modified_picks_up_direct_edits(self, book):
+        """Test that a name assigned in place is indexed on mark_modified."""
+        book["1"].name = Name("Johnny")
+        book.mark_modified("1")
+
+        assert book.find("Johnny").id == "1"
+
+    def test_replacing_a_record(self, book):
+        """Test that storing a new object under an ID replaces its entry."""
+        book["3"] = Contact(Name("Jack"), "3")
+
+        assert [c.id for c in book.find_all("John")] == ["1"]
+        assert book.find("Jack").id == "3"
+
+    def test_untracked_writes_are_indexed(self, book):
+        """Test that merged records are indexed without being tracked."""
+        book.mark_flushed()
+
+        book.set_untracked("4", Contact(Name("Remote"), "4"))
+        book.delete_untracked("2")
+
+        assert book.find("Remote").id == "4"
+        assert book.find_all("Jane") == []
+        assert book.pending_changes().is_empty()
+
+    def test_pickle_rebuilds_index(self, book):
+        """Test that the index is left out of pickles and rebuilt on load."""
+        data = pickle.dumps(book)
+
+        loaded = pickle.loads(data)
+
+        assert b"_names" not in data
+        assert [c.id for c in loaded.find_all("John")] == ["1", "3"]
+
+    def test_copy_constructor(self, book):
+        """Test that a copied book gets its own index."""
+        copy = AddressBook(book)
+        copy.delete_by_id("1")
+
+        assert [c.id for c in book.find_all("John")] == ["1", "3"]
+        assert [c.id for c in copy.find_all("John")] == ["3"]
+
+
+class TestAddressBookPhoneIndex:
+    """Tests for phone lookups and phone search through the phone index."""
+
+    @pytest.fixture
+    def book(self) -> AddressBook:
+        """Provides a book whose contacts also carry emails and addresses."""
+        book = AddressBook()
+        for i, phone in enumerate(["0501234567", "0671234567", "0449990000"]):
+            contact = Contact(Name("John"), str(i))
+            contact.add_phone(Phone(phone))
+            book.add_record(contact)
+        book["2"].add_address(Address("12 Main Street"))
+        book.mark_modified("2")
+        return book
+
+    def test_find_by_phone(self, book):
+        """Test exact and last-digits lookups."""
+        assert [c.id for c in book.find_by_phone("0671234567")] == ["1"]
+        assert [c.id for c in book.find_by_phone_suffix("1234567")] == ["0", "1"]
+
+    def test_search_matches_phones_and_text(self, book):
+        """Test that digits match phones and other fields, in book order."""
+        assert [c.id for c in book.search("123")] == ["0", "1"]
+        assert [c.id for c in book.search("12")] == ["0", "1", "2"]
+        assert [c.id for c in book.search("main")] == ["2"]
+
+    def test_search_sees_phone_edits(self, book):
+        """Test that edited phones are searchable after mark_modified."""
+        book.search("0")
+        book["2"].add_phone(Phone("0931112233"))
+        book.mark_modified("2")
+        book["0"].remove_phone(Phone("0501234567"))
+        book.mark_modified("0")
+
+        assert [c.id for c in book.search("093111")] == ["2"]
+        assert [c.id for c in book.search("050123")] == []
+
+    def test_search_agrees_with_is_matching(self, book):
+        """Test that indexed search returns what a full scan would."""
+        for text in ["0", "123", "+38 (067) 123-45-67", "john", "12 Main Street"]:
+            for exact in (False, True):
+                expected = [
+                    c for c in book.data.values() if c.is_matching(text, exact)
+                ]
+                assert book.search(text, exact) == expected
+
+
+class TestAddressBookTextSearch:
+    """Tests for text and fuzzy search through the trigram index."""
+
+    @pytest.fixture
+    def book(self) -> AddressBook:
+        """Provides a book with names, emails and an address."""
+        book = AddressBook()
+        for i, name in enumerate(["John Smith", "Jane Doe", "Johnny Walker"]):
+            contact = Contact(Name(name), str(i))
+            contact.add_phone(Phone(f"050{i}234567"))
+            book.add_record(contact)
+        book["1"].add_email(Email("jane.doe@example.com"))
+        book["2"].add_address(Address("12 Baker Street"))
+        for contact_id in ("1", "2"):
+            book.mark_modified(contact_id)
+        return book
+
+    def test_search_agrees_with_is_matching(self, book):
+        """Test that indexed search returns what a full scan would."""
+        queries = ["john", "JOHN SMITH", "example", "baker", "12", "0501", "jo", ""]
+        for text in queries + ["Jane Doe", "jane.doe@example.com"]:
+            for exact in (False, True):
+                expected = [
+                    c for c in book.data.values() if c.is_matching(text, exact)
+                ]
+                assert book.search(text, exact) == expected
+
+    def test_search_follows_book_order_after_replacement(self, book):
+        """Test that results keep book order when a contact is replaced."""
+        del book["0"]
+        book.add_record(Contact(Name("John Smith"), "0"))
+
+        assert [c.id for c in book.search("john")] == ["2", "0"]
+
+    def test_fuzzy_search(self, book):
+        """Test that typos still find the closest contacts first."""
+        assert [c.id for c in book.fuzzy_search("Jonh Smith")][:1] == ["0"]
+        assert [c.id for c in book.fuzzy_search("bakr street")] == ["2"]
+        assert book.fuzzy_search("qqqq") == []
+
+    def test_fuzzy_search_limit(self, book):
+        """Test that the number of fuzzy results is capped."""
+        assert len(book.fuzzy_search("john", limit=1, min_similarity=0.1)) == 1
+
+
+class TestAddressBookUpcomingBirthdays:
+    """Tests for upcoming birthdays through the birthday index."""
+
+    @pytest.fixture
+    def book(self) -> AddressBook:
+        """Provides a book with birthdays every 40 days, starting today."""
+        book = AddressBook()
+        today = date.today()
+        for i in range(10):
+            contact = Contact(Name(f"Person {chr(65 + i)}"), str(i))
+            birthday = (today + timedelta(days=40 * i)).replace(year=1988)
+            contact.add_birthday(Birthday(birthday.strftime("%d.%m.%Y")))
+            book.add_record(contact)
+        book.add_record(Contact(Name("Nobody"), "none"))
+        return book
+
+    def test_agrees_with_scan(self, book):
+        """Test that every window returns what a scan of all contacts would."""
+        for days_ahead in range(0, 400, 7):
+            expected = book._collect_upcoming_birthdays(book.data.values(), days_ahead)
+            assert book.get_upcoming_birthdays(days_ahead) == expected
+
+    def test_output_format(self, book):
+        """Test that entries keep the name, dates and date object keys."""
+        today = date.today()
+        assert book.get_upcoming_birthdays(0) == [
+            {
+                "name": "Person A",
+                "birthday": book["0"].birthday.value,
+                "congratulation_date": today.strftime("%d.%m.%Y"),
+                "birthdays_date": today,
+            }
+        ]
+
+    def test_birthday_edits_are_indexed(self, book):
+        """Test that added, removed and deleted birthdays are reflected."""
+        book.get_upcoming_birthdays(0)
+        book["0"].remove_birthday()
+        book.mark_modified("0")
+        book["none"].add_birthday(Birthday(book["1"].birthday.value))
+        book.mark_modified("none")
+        book.delete_by_id("1")
+
+        names = [item["name"] for item in book.get_upcoming_birthdays(40)]
+        assert names == ["Nobody"]
+
+    def test_pickle_rebuilds_index(self, book):
+        """Test that a loaded book still answers birthday windows."""
+        loaded = pickle.loads(pickle.dumps(book))
+        assert "_birthdays" not in loaded.__getstate__()
+        assert loaded.get_upcoming_birthdays(80) == book.get_upcoming_birthdays(80)
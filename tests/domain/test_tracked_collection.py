@@ -0,0 +1,120 @@
+import pickle
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.notebook import Notebook
+from src.domain.value_objects.name import Name
+
+
+def make_contact(contact_id: str, name: str = "John Doe") -> Contact:
+    return Contact(Name(name), contact_id)
+
+
+class TestTrackedCollection:
+    """Tests for change tracking on AddressBook and Notebook."""
+
+    def test_add_record_marks_created(self):
+        """Test that a new record is reported as created."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        changes = book.pending_changes()
+        assert changes.created == {"id-1"}
+        assert changes.modified == set()
+        assert changes.deleted == set()
+
+    def test_mark_modified_after_flush(self):
+        """Test that edits after a flush are reported as modified."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        book.mark_flushed("target")
+        book.mark_modified("id-1")
+        assert book.pending_changes().modified == {"id-1"}
+        assert book.pending_changes().created == set()
+
+    def test_mark_modified_keeps_created_state(self):
+        """Test that editing an unflushed record keeps it as created."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        book.mark_modified("id-1")
+        assert book.pending_changes().created == {"id-1"}
+        assert book.pending_changes().modified == set()
+
+    def test_delete_of_unflushed_record_leaves_no_change(self):
+        """Test that creating and deleting before a flush cancels out."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        book.delete_by_id("id-1")
+        assert book.pending_changes().is_empty()
+
+    def test_delete_of_flushed_record_marks_deleted(self):
+        """Test that deleting a flushed record is reported as deleted."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1", "Jane"))
+        book.mark_flushed("target")
+        book.mark_modified("id-1")
+        book.delete("Jane")
+        changes = book.pending_changes()
+        assert changes.deleted == {"id-1"}
+        assert changes.modified == set()
+
+    def test_mark_flushed_sets_target(self):
+        """Test that mark_flushed clears changes and remembers the target."""
+        notebook = Notebook()
+        notebook["n-1"] = object()
+        notebook.mark_flushed("db-path")
+        assert notebook.pending_changes().is_empty()
+        assert notebook.is_flushed_to("db-path")
+        assert not notebook.is_flushed_to("other-path")
+
+    def test_pickle_round_trip_drops_tracking_state(self):
+        """Test that unpickled collections start with no pending changes."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        book.mark_flushed("target")
+        book.mark_modified("id-1")
+
+        restored = pickle.loads(pickle.dumps(book))
+
+        assert "id-1" in restored
+        assert restored.pending_changes().is_empty()
+        assert not restored.is_flushed_to("target")
+
+    def test_take_unlogged_returns_touched_keys_once(self):
+        """Test that keys touched since the last call are handed out once."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        book.add_record(make_contact("id-2"))
+        book.mark_flushed("target")
+        book.mark_modified("id-1")
+        book.delete_by_id("id-2")
+
+        assert book.take_unlogged() == {"id-1", "id-2"}
+        assert book.take_unlogged() == set()
+        assert book.pending_changes().modified == {"id-1"}
+
+    def test_finish_flush_keeps_edits_made_during_the_save(self):
+        """Test that only changes the save covered are cleared."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        book.add_record(make_contact("id-2"))
+        written = book.begin_flush()
+
+        book.mark_modified("id-2")
+        book.add_record(make_contact("id-3"))
+        book.finish_flush(written, "target")
+
+        changes = book.pending_changes()
+        assert changes.created == {"id-3"}
+        assert changes.modified == {"id-2"}
+        assert book.is_flushed_to("target")
+
+    def test_delete_during_flush_of_created_record_is_kept(self):
+        """Test that a record saved by the flush is still deleted afterwards."""
+        book = AddressBook()
+        book.add_record(make_contact("id-1"))
+        written = book.begin_flush()
+
+        book.delete_by_id("id-1")
+        book.finish_flush(written, "target")
+
+        assert book.pending_changes().deleted == {"id-1"}
@@ -0,0 +1,40 @@
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+from src.domain.value_objects.address import Address
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.domain.value_objects.tag import Tag
+
+
+class TestField:
+    """Tests for the slotted, immutable value object base."""
+
+    def test_value_objects_are_immutable(self):
+        """Test that a value cannot be changed after construction."""
+        phone = Phone("0501234567")
+        with pytest.raises(FrozenInstanceError):
+            phone.value = "0509999999"
+
+    def test_value_objects_have_no_instance_dict(self):
+        """Test that value objects store their value in a slot."""
+        for field in (Name("John"), Phone("0501234567"), Tag("work")):
+            assert not hasattr(field, "__dict__")
+
+    def test_equal_values_hash_alike(self):
+        """Test that value objects can be used in sets and as dict keys."""
+        assert len({Tag("work"), Tag("work"), Tag("home")}) == 2
+
+    def test_pickle_keeps_the_dict_layout(self):
+        """Test that pickles carry the same state as before slots."""
+        name = Name("John")
+        assert name.__getstate__() == {"value": "John"}
+        assert pickle.loads(pickle.dumps(name)) == name
+
+    def test_repeated_values_are_interned(self):
+        """Test that trusted tags and addresses share one instance per value."""
+        assert Tag.from_trusted("work") is Tag.from_trusted("work")
+        address = Address("Kyiv, Ukraine").interned()
+        assert Address.from_trusted("Kyiv, Ukraine") is address
+        assert Name.from_trusted("John") is not Name.from_trusted("John")
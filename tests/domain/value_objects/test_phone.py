@@ -73,3 +73,15 @@ def test_phone_creation_with_non_string_input(non_string_input):
     """
     with pytest.raises(ValueError):
         Phone(non_string_input)
+
+
+def test_phone_from_trusted_skips_validation():
+    """
+    Tests that a trusted Phone keeps the stored value as is and compares
+    equal to a validated Phone with the same digits.
+    """
+    trusted = Phone.from_trusted("1234567890")
+
+    assert isinstance(trusted, Phone)
+    assert trusted == Phone("(123) 456-7890")
+    assert Phone.from_trusted("12345").value == "12345"
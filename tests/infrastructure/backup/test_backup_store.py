@@ -0,0 +1,197 @@
+import json
+import random
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.backup.backup_store import BackupStore, main
+from src.infrastructure.backup.chunker import Chunker
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    """Provides a data directory with a large book and a small notes file."""
+    directory = tmp_path / "data"
+    directory.mkdir()
+    (directory / "addressbook.json").write_bytes(random.Random(1).randbytes(200_000))
+    (directory / "notes.json").write_text('[{"id": "n1"}]', encoding="utf-8")
+    (directory / "addressbook.json.lock").write_bytes(b"")
+    return directory
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> BackupStore:
+    """Provides a backup store with small chunks."""
+    return BackupStore(tmp_path / "backups", Chunker(1024, 4096, 16384))
+
+
+def snapshot(directory: Path) -> dict[str, bytes]:
+    return {
+        path.relative_to(directory).as_posix(): path.read_bytes()
+        for path in directory.rglob("*")
+        if path.is_file() and not path.name.endswith(".lock")
+    }
+
+
+class TestBackupStore:
+    """Tests for deduplicating backups and restores."""
+
+    def test_backup_and_restore(self, store, data_dir, tmp_path: Path):
+        """Test that a restore reproduces every data file."""
+        report = store.backup(data_dir)
+
+        restored = store.restore(report.backup_id, tmp_path / "restored")
+
+        assert restored == 2
+        assert snapshot(tmp_path / "restored") == snapshot(data_dir)
+        assert report.files == 2
+        assert report.new_bytes == report.total_bytes
+
+    def test_unchanged_backup_stores_nothing(self, store, data_dir):
+        """Test that backing up the same files again adds no chunks."""
+        store.backup(data_dir)
+
+        report = store.backup(data_dir)
+
+        assert report.new_chunks == 0
+        assert report.total_bytes > 0
+
+    def test_small_edit_stores_only_changed_chunks(self, store, data_dir):
+        """Test that an edit in the middle of a file costs a few chunks."""
+        first = store.backup(data_dir)
+        book = data_dir / "addressbook.json"
+        data = book.read_bytes()
+        book.write_bytes(data[:100_000] + b"new contact" + data[100_000:])
+
+        second = store.backup(data_dir)
+
+        assert 0 < second.new_chunks <= 3
+        assert second.new_bytes < first.total_bytes / 10
+
+    def test_restore_point_in_time(self, store, data_dir, tmp_path: Path):
+        """Test that an older backup restores the older contents."""
+        first = store.backup(data_dir)
+        (data_dir / "notes.json").write_text("[]", encoding="utf-8")
+        store.backup(data_dir)
+
+        store.restore(first.backup_id, tmp_path / "old", ["notes.json"])
+
+        assert (tmp_path / "old" / "notes.json").read_text() == '[{"id": "n1"}]'
+        assert not (tmp_path / "old" / "addressbook.json").exists()
+
+    def test_iter_file_streams_chunks(self, store, data_dir):
+        """Test that a backed up file can be read chunk by chunk."""
+        report = store.backup(data_dir)
+
+        chunks = list(store.iter_file(report.backup_id, "addressbook.json"))
+
+        assert len(chunks) > 1
+        assert b"".join(chunks) == (data_dir / "addressbook.json").read_bytes()
+
+    def test_iter_unknown_file(self, store, data_dir):
+        """Test that asking for a file outside the backup fails."""
+        report = store.backup(data_dir)
+
+        with pytest.raises(IOError, match="has no file"):
+            list(store.iter_file(report.backup_id, "missing.json"))
+
+    def test_list_backups_oldest_first(self, store, data_dir):
+        """Test that backups are listed in creation order."""
+        ids = [store.backup(data_dir).backup_id for _ in range(3)]
+
+        assert [m.backup_id for m in store.list_backups()] == ids
+
+    def test_corrupted_chunk_is_detected(self, store, data_dir, tmp_path: Path):
+        """Test that a restore refuses a chunk whose contents changed."""
+        report = store.backup(data_dir)
+        chunk = next((store.root / "chunks").rglob("*/*"))
+        chunk.write_bytes(b"garbage")
+
+        with pytest.raises(IOError, match="corrupted"):
+            store.restore(report.backup_id, tmp_path / "restored")
+
+    def test_store_inside_data_dir_is_skipped(self, data_dir):
+        """Test that a backup never includes its own chunk store."""
+        store = BackupStore(data_dir / "backups")
+        store.backup(data_dir)
+
+        report = store.backup(data_dir)
+
+        assert report.files == 2
+
+    def test_live_sqlite_database_is_snapshotted(
+        self, store, data_dir, tmp_path: Path
+    ):
+        """Test that rows still in the -wal file reach the backup."""
+        connection = sqlite3.connect(data_dir / "contacts.db")
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA wal_autocheckpoint=0")
+        connection.execute("CREATE TABLE contacts (name TEXT)")
+        connection.execute("INSERT INTO contacts VALUES ('Alice')")
+        connection.commit()
+        try:
+            assert (data_dir / "contacts.db-wal").stat().st_size > 0
+            report = store.backup(data_dir)
+        finally:
+            connection.close()
+
+        store.restore(report.backup_id, tmp_path / "restored")
+
+        manifest = store.manifest(report.backup_id)
+        assert "contacts.db" in manifest.files
+        assert not any(name.startswith("contacts.db-") for name in manifest.files)
+        restored = sqlite3.connect(tmp_path / "restored" / "contacts.db")
+        try:
+            assert restored.execute("SELECT name FROM contacts").fetchall() == [
+                ("Alice",)
+            ]
+        finally:
+            restored.close()
+
+    def test_backup_creates_no_lock_files(self, store, data_dir):
+        """Test that only files a storage already locks are locked."""
+        before = sorted(path.name for path in data_dir.iterdir())
+
+        store.backup(data_dir)
+
+        assert sorted(path.name for path in data_dir.iterdir()) == before
+
+    @pytest.mark.parametrize("relative", ["../escaped.json", "{tmp}/escaped.json"])
+    def test_restore_rejects_paths_outside_target(
+        self, store, data_dir, tmp_path: Path, relative: str
+    ):
+        """Test that a tampered manifest cannot write outside the target."""
+        report = store.backup(data_dir)
+        manifest_path = store.root / "manifests" / f"{report.backup_id}.json"
+        document = json.loads(manifest_path.read_text())
+        relative = relative.format(tmp=tmp_path)
+        document["files"][relative] = document["files"].pop("notes.json")
+        manifest_path.write_text(json.dumps(document))
+        target = tmp_path / "restored"
+
+        with pytest.raises(IOError, match="outside"):
+            store.restore(report.backup_id, target)
+
+        assert not (tmp_path / "escaped.json").exists()
+        assert not target.exists()
+
+    def test_unknown_backup(self, store):
+        """Test that a missing backup raises IOError."""
+        with pytest.raises(IOError, match="Failed to read backup"):
+            store.manifest("missing")
+
+
+class TestBackupCommand:
+    """Tests for the command-line entry point."""
+
+    def test_create_list_restore(self, data_dir, tmp_path: Path, capsys):
+        """Test a full round trip through the commands."""
+        backups = str(tmp_path / "backups")
+        main(["--store", backups, "create", str(data_dir)])
+        main(["--store", backups, "list"])
+        backup_id = capsys.readouterr().out.splitlines()[-1].split()[0]
+
+        main(["--store", backups, "restore", backup_id, str(tmp_path / "out")])
+
+        assert snapshot(tmp_path / "out") == snapshot(data_dir)
@@ -0,0 +1,67 @@
+import io
+import random
+
+import pytest
+
+from src.infrastructure.backup.chunker import Chunker
+
+
+def random_bytes(size: int, seed: int = 1) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+@pytest.fixture
+def chunker() -> Chunker:
+    """Provides a chunker with small sizes so tests stay fast."""
+    return Chunker(min_size=256, avg_size=1024, max_size=4096)
+
+
+class TestChunker:
+    """Tests for content-defined chunking."""
+
+    def test_chunks_rebuild_the_input(self, chunker):
+        """Test that joining the chunks gives back the original bytes."""
+        data = random_bytes(50_000)
+
+        chunks = list(chunker.chunks(io.BytesIO(data)))
+
+        assert b"".join(chunks) == data
+        assert len(chunks) > 1
+
+    def test_chunk_sizes_are_bounded(self, chunker):
+        """Test that every chunk but the last lies between min and max size."""
+        chunks = list(chunker.chunks(io.BytesIO(random_bytes(100_000))))
+
+        assert all(256 < len(chunk) <= 4096 for chunk in chunks[:-1])
+
+    def test_insert_only_changes_nearby_chunks(self, chunker):
+        """Test that boundaries resynchronise after an insertion."""
+        data = random_bytes(100_000)
+        edited = data[:50_000] + b"inserted text" + data[50_000:]
+
+        before = set(chunker.chunks(io.BytesIO(data)))
+        after = list(chunker.chunks(io.BytesIO(edited)))
+
+        changed = [chunk for chunk in after if chunk not in before]
+        assert len(changed) <= 2
+
+    def test_boundaries_do_not_depend_on_read_size(self, chunker, monkeypatch):
+        """Test that chunks are the same however the stream is read."""
+        data = random_bytes(30_000)
+        expected = list(chunker.chunks(io.BytesIO(data)))
+
+        monkeypatch.setattr("src.infrastructure.backup.chunker.READ_SIZE", 1000)
+
+        assert list(chunker.chunks(io.BytesIO(data))) == expected
+
+    def test_empty_stream(self, chunker):
+        """Test that an empty stream has no chunks."""
+        assert list(chunker.chunks(io.BytesIO(b""))) == []
+
+    @pytest.mark.parametrize(
+        "sizes", [(256, 1000, 4096), (2048, 1024, 4096), (256, 8192, 4096)]
+    )
+    def test_invalid_sizes(self, sizes):
+        """Test that sizes must be ordered and the average a power of two."""
+        with pytest.raises(ValueError):
+            Chunker(*sizes)
@@ -0,0 +1,282 @@
+from pathlib import Path
+
+import pytest
+
+from src.application.services.contact_service import ContactService
+from src.application.services.note_service import NoteService
+from src.config.storage_config import StorageConfig
+from src.domain.models.dbbase import DBBase
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.storage.change_log import ChangeLog
+from src.infrastructure.storage.file_lock import FileLock
+from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.pickle_storage import PickleStorage
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+
+@pytest.fixture(params=[JsonStorage, PickleStorage], ids=["json", "pickle"])
+def open_service(request, tmp_path: Path):
+    """Opens a ContactService over the shared file, as another process would."""
+
+    def factory() -> ContactService:
+        service = ContactService(request.param(tmp_path))
+        service.load_address_book("shared")
+        return service
+
+    return factory
+
+
+class TestConcurrentSaves:
+    """Tests for writers sharing one data file."""
+
+    def test_saves_do_not_clobber_each_other(self, open_service):
+        """Test that two writers keep both sets of changes."""
+        first, second = open_service(), open_service()
+        first.add_contact(Name("Alice"), Phone("1234567890"))
+        second.add_contact(Name("Bob"), Phone("0987654321"))
+
+        first.save_address_book()
+        second.save_address_book()
+
+        names = {c.name.value for c in open_service().get_all_contacts()}
+        assert names == {"Alice", "Bob"}
+
+    def test_local_edit_wins_over_older_saved_state(self, open_service):
+        """Test that a record edited locally is not reverted by the merge."""
+        setup = open_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.save_address_book()
+        first, second = open_service(), open_service()
+
+        first.add_email("Alice", Email("first@example.com"))
+        first.save_address_book()
+        second.add_email("Alice", Email("second@example.com"))
+        second.save_address_book()
+
+        alice = open_service().address_book.find("Alice")
+        assert alice.email.value == "second@example.com"
+
+    def test_saved_edit_survives_later_save_by_other_writer(self, open_service):
+        """Test that an edit saved by one writer is kept by the next writer."""
+        setup = open_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.save_address_book()
+        first, second = open_service(), open_service()
+        # A previous save by the same writer must not pin its old copy
+        first.add_contact(Name("Bob"), Phone("0987654321"))
+        first.save_address_book()
+
+        second.add_email("Alice", Email("alice@example.com"))
+        second.save_address_book()
+        first.add_contact(Name("Zed"), Phone("5555555555"))
+        first.save_address_book()
+
+        book = open_service().address_book
+        assert book.find("Alice").email.value == "alice@example.com"
+        assert {c.name.value for c in book.values()} == {"Alice", "Bob", "Zed"}
+        assert first.address_book.pending_changes().is_empty()
+
+    def test_remote_deletion_is_applied(self, open_service):
+        """Test that a record deleted elsewhere is not written back."""
+        setup = open_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.add_contact(Name("Bob"), Phone("0987654321"))
+        setup.save_address_book()
+        first, second = open_service(), open_service()
+
+        first.delete_contact("Bob")
+        first.save_address_book()
+        second.add_contact(Name("Carol"), Phone("5555555555"))
+        second.save_address_book()
+
+        names = {c.name.value for c in open_service().get_all_contacts()}
+        assert names == {"Alice", "Carol"}
+
+    def test_save_waits_for_lock(self, open_service, monkeypatch):
+        """Test that a save fails cleanly while another process holds the lock."""
+        service = open_service()
+        service.add_contact(Name("Alice"), Phone("1234567890"))
+        path = service.storage.storage.data_path("shared")
+        monkeypatch.setattr(StorageConfig, "FILE_LOCK_TIMEOUT_SECONDS", 0.05)
+
+        with FileLock(path):
+            with pytest.raises(IOError, match="Timed out"):
+                service.save_address_book()
+
+
+class TestReloadChanges:
+    """Tests for picking up records another process saved."""
+
+    def test_unchanged_file_is_not_reread(self, open_service, monkeypatch):
+        """Test that a reload without a new save does nothing."""
+        service = open_service()
+        monkeypatch.setattr(service.storage, "_load_contacts", None)
+
+        assert service.reload_changes() == 0
+
+    def test_reload_merges_only_changed_records(self, open_service):
+        """Test that changed records are replaced and unchanged ones kept."""
+        setup = open_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.add_contact(Name("Bob"), Phone("0987654321"))
+        setup.save_address_book()
+        reader, writer = open_service(), open_service()
+        alice_before = reader.address_book.find("Alice")
+        reader.add_contact(Name("Dave"), Phone("4444444444"))
+
+        writer.add_email("Bob", Email("bob@example.com"))
+        writer.delete_contact("Alice")
+        writer.add_contact(Name("Carol"), Phone("5555555555"))
+        writer.save_address_book()
+
+        merged = reader.reload_changes()
+
+        book = reader.address_book
+        assert merged == 3
+        assert {c.name.value for c in book.values()} == {"Bob", "Carol", "Dave"}
+        assert book.find("Bob").email.value == "bob@example.com"
+        assert alice_before not in book.values()
+        # Only the local, unsaved contact is still pending
+        assert len(book.pending_changes().created) == 1
+        assert reader.reload_changes() == 0
+
+    def test_reload_builds_only_logged_records(self, open_service, monkeypatch):
+        """Test that a reload uses the change log instead of comparing records."""
+        setup = open_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.add_contact(Name("Bob"), Phone("0987654321"))
+        setup.save_address_book()
+        reader, writer = open_service(), open_service()
+        writer.add_email("Bob", Email("bob@example.com"))
+        writer.save_address_book()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("unchanged records were compared")
+
+        monkeypatch.setattr(reader.storage.serializer, "contact_to_dict", fail)
+        if isinstance(reader.storage.storage, JsonStorage):
+            monkeypatch.setattr(reader.storage, "_load_contacts", fail)
+
+        assert reader.reload_changes() == 1
+        assert reader.address_book.find("Bob").email.value == "bob@example.com"
+
+    def test_reload_without_change_log_compares_everything(self, open_service):
+        """Test that a missing change log falls back to a full merge."""
+        setup = open_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.save_address_book()
+        reader, writer = open_service(), open_service()
+        writer.delete_contact("Alice")
+        writer.add_contact(Name("Carol"), Phone("5555555555"))
+        writer.save_address_book()
+        path = writer.storage.storage.data_path("shared")
+        ChangeLog(path).path.unlink()
+
+        assert reader.reload_changes() == 2
+        assert {c.name.value for c in reader.get_all_contacts()} == {"Carol"}
+
+    def test_notes_reload(self, tmp_path):
+        """Test that notes saved elsewhere appear after a reload."""
+        reader = NoteService(JsonStorage(tmp_path))
+        reader.load_notes()
+        writer = NoteService(JsonStorage(tmp_path))
+        writer.load_notes()
+        note_id = writer.add_note("Title", "From another process")
+        writer.save_notes()
+
+        assert reader.reload_changes() == 1
+        assert reader.get_note_by_id(note_id).text == "From another process"
+
+    def test_locking_can_be_disabled(self, open_service, monkeypatch):
+        """Test that FILE_LOCKING turns merging and reloads off."""
+        monkeypatch.setattr(StorageConfig, "FILE_LOCKING", False)
+        first, second = open_service(), open_service()
+        first.add_contact(Name("Alice"), Phone("1234567890"))
+        second.add_contact(Name("Bob"), Phone("0987654321"))
+        first.save_address_book()
+
+        assert second.reload_changes() == 0
+        second.save_address_book()
+        names = {c.name.value for c in open_service().get_all_contacts()}
+        assert names == {"Bob"}
+
+
+@pytest.fixture(params=[False, True], ids=["eager", "lazy"])
+def open_sqlite_service(request, tmp_path: Path, monkeypatch):
+    """Opens a ContactService over a shared SQLite database."""
+    monkeypatch.setattr(StorageConfig, "SQLITE_LAZY_ADDRESS_BOOK", request.param)
+
+    def factory() -> ContactService:
+        service = ContactService(SQLiteStorage(DBBase, data_dir=tmp_path))
+        service.load_address_book("shared.db")
+        return service
+
+    return factory
+
+
+class TestSQLiteReload:
+    """Tests for reloading rows other writers changed in a SQLite database."""
+
+    def test_reload_reads_only_changed_rows(self, open_sqlite_service, monkeypatch):
+        """Test that a reload fetches just the rows the change log names."""
+        setup = open_sqlite_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.add_contact(Name("Bob"), Phone("0987654321"))
+        setup.save_address_book()
+        reader, writer = open_sqlite_service(), open_sqlite_service()
+        bob_before = reader.address_book.find("Bob")
+        bob_id = bob_before.id
+        fetched = []
+        load_by_ids = reader.storage.storage.load_by_ids
+
+        def tracked(filename, table, ids):
+            fetched.extend(ids)
+            return load_by_ids(filename, table, ids)
+
+        monkeypatch.setattr(reader.storage.storage, "load_by_ids", tracked)
+        writer.add_email("Bob", Email("bob@example.com"))
+        writer.save_address_book()
+
+        assert reader.reload_changes() == 1
+        # Lazy books drop the stale copy and read Bob when asked for him
+        assert fetched in ([bob_id], [])
+        assert reader.address_book.find("Bob").email.value == "bob@example.com"
+        assert bob_before.email is None
+        assert reader.reload_changes() == 0
+
+    def test_remote_deletion_is_applied(self, open_sqlite_service):
+        """Test that a contact deleted elsewhere leaves the reader's book."""
+        setup = open_sqlite_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.save_address_book()
+        reader, writer = open_sqlite_service(), open_sqlite_service()
+        reader.address_book.find("Alice")
+        writer.delete_contact("Alice")
+        writer.save_address_book()
+
+        reader.reload_changes()
+
+        assert reader.get_all_contacts() == []
+
+    def test_local_edit_wins(self, open_sqlite_service):
+        """Test that a reload keeps the reader's unsaved edits."""
+        setup = open_sqlite_service()
+        setup.add_contact(Name("Alice"), Phone("1234567890"))
+        setup.save_address_book()
+        reader, writer = open_sqlite_service(), open_sqlite_service()
+        reader.add_email("Alice", Email("local@example.com"))
+        writer.add_email("Alice", Email("remote@example.com"))
+        writer.save_address_book()
+
+        assert reader.reload_changes() == 0
+        assert reader.address_book.find("Alice").email.value == "local@example.com"
+
+    def test_own_save_is_not_reloaded(self, open_sqlite_service):
+        """Test that a writer does not read back its own save."""
+        service = open_sqlite_service()
+        service.add_contact(Name("Alice"), Phone("1234567890"))
+        service.save_address_book()
+
+        assert service.reload_changes() == 0
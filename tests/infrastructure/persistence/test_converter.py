@@ -0,0 +1,200 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.notebook import Notebook
+from src.domain.models.dbbase import DBBase
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.domain.value_objects.tag import Tag
+from src.infrastructure.persistence.converter import (
+    ConversionReport,
+    StorageConverter,
+    main,
+)
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.serialization.json_serializer import JsonSerializer
+from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.pickle_storage import PickleStorage
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+
+def make_book(count: int) -> AddressBook:
+    book = AddressBook()
+    for i in range(count):
+        contact = Contact(Name(f"Contact {chr(ord('A') + i % 26)}"), f"id-{i:04d}")
+        contact.add_phone(Phone(f"{1000000000 + i}"))
+        book.add_record(contact)
+    return book
+
+
+def phones_by_id(book) -> dict[str, list[str]]:
+    return {c.id: [p.value for p in c.phones] for c in book.values()}
+
+
+@pytest.fixture
+def converter() -> StorageConverter:
+    """Provides a converter with small batches."""
+    return StorageConverter(batch_size=7)
+
+
+class TestStorageConverter:
+    """Tests for streaming records between storage formats."""
+
+    def test_json_to_sqlite_to_json(self, converter, tmp_path: Path):
+        """Test that contacts survive a round trip through SQLite."""
+        book = make_book(30)
+        DomainStorageAdapter(JsonStorage(tmp_path)).save_contacts(book, "in")
+        sqlite = SQLiteStorage(DBBase, tmp_path)
+
+        first = converter.convert_contacts(
+            JsonStorage(tmp_path), "in.json", sqlite, "book.db"
+        )
+        second = converter.convert_contacts(
+            sqlite, "book.db", JsonStorage(tmp_path), "out.json"
+        )
+
+        loaded, _ = DomainStorageAdapter(JsonStorage(tmp_path)).load_contacts("out")
+        assert first.records == second.records == 30
+        assert phones_by_id(loaded) == phones_by_id(book)
+
+    def test_pickle_to_json(self, converter, tmp_path: Path):
+        """Test that formats without streaming reads still convert."""
+        book = make_book(5)
+        PickleStorage(tmp_path).save(book, "book")
+
+        report = converter.convert_contacts(
+            PickleStorage(tmp_path), "book.pkl", JsonStorage(tmp_path), "book.json"
+        )
+
+        saved = json.loads((tmp_path / "book.json").read_text(encoding="utf-8"))
+        assert report.records == 5
+        assert [record["id"] for record in saved] == sorted(book.keys())
+
+    def test_json_to_pickle(self, converter, tmp_path: Path):
+        """Test that a pickle target receives a plain address book."""
+        DomainStorageAdapter(JsonStorage(tmp_path)).save_contacts(make_book(3), "in")
+
+        converter.convert_contacts(
+            JsonStorage(tmp_path), "in.json", PickleStorage(tmp_path), "out.pkl"
+        )
+
+        assert len(PickleStorage(tmp_path).load("out")) == 3
+
+    def test_notes(self, converter, tmp_path: Path):
+        """Test that notes and their tags are converted."""
+        notebook = Notebook()
+        note = Note("Title", "Text", "n1")
+        note.add_tag(Tag("work"))
+        notebook["n1"] = note
+        DomainStorageAdapter(JsonStorage(tmp_path)).save_notes(notebook, "notes")
+        sqlite = SQLiteStorage(DBBase, tmp_path)
+
+        report = converter.convert_notes(
+            JsonStorage(tmp_path), "notes.json", sqlite, "book.db"
+        )
+
+        assert report.kind == "notes"
+        assert [t.value for t in sqlite.load_notes("book.db")["n1"].tags] == ["work"]
+
+    def test_missing_source_converts_nothing(self, converter, tmp_path: Path):
+        """Test that a missing source yields an empty target."""
+        report = converter.convert_contacts(
+            JsonStorage(tmp_path), "none.json", JsonStorage(tmp_path), "out.json"
+        )
+
+        assert report.records == 0
+        assert json.loads((tmp_path / "out.json").read_text()) == []
+
+    def test_progress_is_reported_per_batch(self, tmp_path: Path):
+        """Test that progress is called after every full batch."""
+        DomainStorageAdapter(JsonStorage(tmp_path)).save_contacts(make_book(20), "in")
+        seen = []
+        converter = StorageConverter(batch_size=8, progress=seen.append)
+
+        converter.convert_contacts(
+            JsonStorage(tmp_path), "in.json", JsonStorage(tmp_path), "out.json"
+        )
+
+        assert seen == [8, 16]
+
+
+    @pytest.mark.parametrize("target_name", ["out.pkl", "out.db"])
+    def test_duplicate_ids_keep_the_first_record(
+        self, converter, tmp_path: Path, target_name: str
+    ):
+        """Test that a repeated ID is skipped like the adapter does on load."""
+        first = Contact(Name("First"), "dup")
+        first.add_phone(Phone("1111111111"))
+        second = Contact(Name("Second"), "dup")
+        second.add_phone(Phone("2222222222"))
+        serializer = JsonSerializer()
+        JsonStorage(tmp_path).save(
+            [serializer.contact_to_dict(c) for c in (first, second)], "in"
+        )
+        target = (
+            SQLiteStorage(DBBase, tmp_path)
+            if target_name.endswith(".db")
+            else PickleStorage(tmp_path)
+        )
+
+        report = converter.convert_contacts(
+            JsonStorage(tmp_path), "in.json", target, target_name
+        )
+
+        loaded, _ = DomainStorageAdapter(target).load_contacts(target_name)
+        assert report.records == 1
+        assert loaded["dup"].name.value == "First"
+
+    def test_sqlite_writes_use_the_batch_size(self, tmp_path: Path, monkeypatch):
+        """Test that the converter's batch size reaches the bulk writer."""
+        DomainStorageAdapter(JsonStorage(tmp_path)).save_contacts(make_book(5), "in")
+        sqlite = SQLiteStorage(DBBase, tmp_path)
+        sizes = []
+        bulk_save = sqlite.bulk_save_contacts
+
+        def recording_bulk_save(filename, contacts, batch_size):
+            sizes.append(batch_size)
+            return bulk_save(filename, contacts, batch_size)
+
+        monkeypatch.setattr(sqlite, "bulk_save_contacts", recording_bulk_save)
+
+        StorageConverter(batch_size=2).convert_contacts(
+            JsonStorage(tmp_path), "in.json", sqlite, "book.db"
+        )
+
+        assert sizes == [2]
+        assert len(sqlite.load("book.db")) == 5
+
+class TestConversionReport:
+    """Tests for the conversion summary."""
+
+    def test_records_per_second(self):
+        """Test the rate and its printed form."""
+        report = ConversionReport("contacts", 5000, 2.0)
+
+        assert report.records_per_second == 2500
+        assert str(report) == "Converted 5000 contacts in 2.00 s (2,500 records/s)"
+
+
+class TestConverterCommand:
+    """Tests for the command-line entry point."""
+
+    def test_main_converts_by_extension(self, tmp_path: Path, capsys):
+        """Test that storage types are picked from the file names."""
+        DomainStorageAdapter(JsonStorage(tmp_path)).save_contacts(make_book(4), "in")
+
+        report = main([str(tmp_path / "in.json"), str(tmp_path / "out.db")])
+
+        assert report.records == 4
+        assert "records/s" in capsys.readouterr().out
+        assert len(SQLiteStorage(DBBase, tmp_path).load("out.db")) == 4
+
+    def test_main_rejects_unknown_extension(self, tmp_path: Path):
+        """Test that an unsupported file type is refused."""
+        with pytest.raises(ValueError, match="Unsupported filetype"):
+            main([str(tmp_path / "in.txt"), str(tmp_path / "out.db")])
@@ -0,0 +1,127 @@
+from pathlib import Path
+
+import pytest
+
+from src.infrastructure.persistence.write_ahead_log import WriteAheadLog
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Provides a manually advanced clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def wal(tmp_path: Path, clock: FakeClock) -> WriteAheadLog:
+    """Provides a log that snapshots every 3 entries or 60 seconds."""
+    log = WriteAheadLog(
+        tmp_path / "contacts.wal",
+        snapshot_every_ops=3,
+        snapshot_interval_seconds=60,
+        clock=clock,
+    )
+    yield log
+    log.close()
+
+
+class TestWriteAheadLog:
+    """Tests for the service write-ahead log."""
+
+    def test_entries_round_trip(self, wal):
+        """Test that appended entries are read back in order."""
+        wal.append("book.pkl", [{"id": "a"}], [])
+        wal.append("book.pkl", [], ["b"])
+
+        entries = list(wal.entries("book.pkl"))
+
+        assert entries == [
+            {"target": "book.pkl", "upserts": [{"id": "a"}], "deleted": []},
+            {"target": "book.pkl", "upserts": [], "deleted": ["b"]},
+        ]
+
+    def test_entries_filter_by_target(self, wal):
+        """Test that entries for another file are not replayed."""
+        wal.append("other.pkl", [{"id": "a"}], [])
+
+        assert list(wal.entries("book.pkl")) == []
+
+    def test_missing_log_has_no_entries(self, wal):
+        """Test that a log that was never written is empty."""
+        assert list(wal.entries("book.pkl")) == []
+
+    def test_snapshot_due_after_operations(self, wal):
+        """Test that a snapshot is due after the configured number of entries."""
+        assert not wal.snapshot_due()
+        wal.append("book.pkl", [{"id": "a"}], [])
+        wal.append("book.pkl", [{"id": "b"}], [])
+        assert not wal.snapshot_due()
+        wal.append("book.pkl", [{"id": "c"}], [])
+        assert wal.snapshot_due()
+
+    def test_snapshot_due_after_interval(self, wal, clock):
+        """Test that a snapshot is due once the interval passes with changes."""
+        clock.now = 120
+        assert not wal.snapshot_due()
+        wal.append("book.pkl", [{"id": "a"}], [])
+        assert wal.snapshot_due()
+
+    def test_reset_removes_log(self, wal, clock):
+        """Test that a reset truncates the log and restarts both counters."""
+        for i in range(3):
+            wal.append("book.pkl", [{"id": str(i)}], [])
+        clock.now = 120
+
+        wal.reset()
+
+        assert not wal.path.exists()
+        assert not wal.snapshot_due()
+        assert list(wal.entries("book.pkl")) == []
+
+    def test_reset_to_mark_keeps_later_entries(self, wal):
+        """Test that entries appended after the mark survive the reset."""
+        wal.append("book.pkl", [{"id": "1"}], [])
+        mark = wal.mark()
+        wal.append("book.pkl", [{"id": "2"}], [])
+
+        wal.reset(mark)
+
+        assert [e["upserts"] for e in wal.entries("book.pkl")] == [[{"id": "2"}]]
+
+    def test_torn_last_entry_is_ignored(self, wal):
+        """Test that a partial trailing line from a crash is skipped."""
+        wal.append("book.pkl", [{"id": "a"}], [])
+        wal.close()
+        with open(wal.path, "a", encoding="utf-8") as f:
+            f.write('{"target": "book.pkl", "ups')
+
+        assert [e["upserts"] for e in wal.entries("book.pkl")] == [[{"id": "a"}]]
+
+    def test_append_after_torn_entry_drops_the_fragment(self, wal):
+        """Test that logging after a crash does not corrupt the log."""
+        wal.append("book.pkl", [{"id": "a"}], [])
+        wal.close()
+        with open(wal.path, "a", encoding="utf-8") as f:
+            f.write('{"target": "book.pkl", "ups')
+        restarted = WriteAheadLog(wal.path)
+        list(restarted.entries("book.pkl"))
+
+        restarted.append("book.pkl", [{"id": "b"}], [])
+        restarted.close()
+
+        upserts = [e["upserts"] for e in WriteAheadLog(wal.path).entries("book.pkl")]
+        assert upserts == [[{"id": "a"}], [{"id": "b"}]]
+
+    def test_corrupt_entry_raises(self, wal):
+        """Test that a damaged line before the end raises IOError."""
+        wal.path.write_text('not json\n{"target": "x", "upserts": [], "deleted": []}\n')
+
+        with pytest.raises(IOError, match="Failed to read contacts.wal"):
+            list(wal.entries("book.pkl"))
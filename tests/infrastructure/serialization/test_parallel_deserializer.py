@@ -0,0 +1,129 @@
+from pathlib import Path
+
+import pytest
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.serialization.json_serializer import JsonSerializer
+from src.infrastructure.serialization.parallel_deserializer import (
+    ParallelDeserializer,
+)
+from src.infrastructure.storage.json_storage import JsonStorage
+
+
+def make_records(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"id-{i}",
+            "name": f"Contact {chr(ord('A') + i % 26)}",
+            "phones": [f"{1000000000 + i}"],
+            "birthday": "01.02.1990",
+            "email": None,
+            "address": None,
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def parallel_load(monkeypatch):
+    """Turns parallel loading on with chunks small enough to need a pool."""
+    monkeypatch.setattr(StorageConfig, "PARALLEL_LOAD", True)
+    monkeypatch.setattr(StorageConfig, "PARALLEL_LOAD_WORKERS", 2)
+    monkeypatch.setattr(StorageConfig, "PARALLEL_LOAD_CHUNK_SIZE", 3)
+
+
+class TestParallelDeserializer:
+    """Tests for chunked deserialization in a process pool."""
+
+    def test_keeps_record_order_across_chunks(self):
+        """Test that objects come back in the order of their records."""
+        deserializer = ParallelDeserializer(workers=2, chunk_size=4)
+
+        contacts = list(
+            deserializer.map(JsonSerializer.dict_to_contact, iter(make_records(10)))
+        )
+
+        assert [c.id for c in contacts] == [f"id-{i}" for i in range(10)]
+        assert contacts[9].phones[0].value == "1000000009"
+        assert contacts[0].birthday is not None
+
+    def test_submits_a_bounded_window_of_chunks(self):
+        """Test that records are read only a few chunks ahead of the caller."""
+        consumed = []
+
+        def records():
+            for record in make_records(100):
+                consumed.append(record)
+                yield record
+
+        deserializer = ParallelDeserializer(workers=2, chunk_size=2)
+        contacts = deserializer.map(JsonSerializer.dict_to_contact, records())
+
+        assert next(contacts).id == "id-0"
+        assert len(consumed) <= 2 * 2 * 2
+        assert [c.id for c in contacts][-1] == "id-99"
+
+    def test_single_chunk_runs_in_process(self, monkeypatch):
+        """Test that a load smaller than one chunk never starts a pool."""
+        monkeypatch.setattr(
+            "src.infrastructure.serialization.parallel_deserializer"
+            ".ProcessPoolExecutor",
+            None,
+        )
+        deserializer = ParallelDeserializer(workers=4, chunk_size=10)
+
+        notes = list(
+            deserializer.map(
+                JsonSerializer.dict_to_note,
+                [{"id": "n1", "title": "T", "text": "Text", "tags": ["work"]}],
+            )
+        )
+
+        assert [n.id for n in notes] == ["n1"]
+
+    def test_empty_records(self):
+        """Test that no records yield no objects."""
+        deserializer = ParallelDeserializer(workers=2, chunk_size=2)
+        assert list(deserializer.map(JsonSerializer.dict_to_contact, [])) == []
+
+    def test_worker_errors_propagate(self):
+        """Test that an invalid record fails the load as it does sequentially."""
+        records = make_records(4)
+        records[3]["phones"] = ["not a phone"]
+        deserializer = ParallelDeserializer(workers=2, chunk_size=2)
+
+        with pytest.raises(ValueError):
+            list(deserializer.map(JsonSerializer.dict_to_contact, records))
+
+    def test_defaults_to_one_worker_per_cpu(self):
+        """Test that no worker count means one per CPU."""
+        assert ParallelDeserializer(workers=None).workers >= 1
+
+
+class TestParallelAdapterLoad:
+    """Tests for DomainStorageAdapter loads with PARALLEL_LOAD enabled."""
+
+    def test_load_contacts_keeps_first_duplicate(self, tmp_path: Path, parallel_load):
+        """Test that the first record wins when an ID appears twice."""
+        records = make_records(8)
+        duplicate = dict(records[1], name="Duplicate")
+        JsonStorage(tmp_path).save(records + [duplicate], "contacts")
+
+        book, _ = DomainStorageAdapter(JsonStorage(tmp_path)).load_contacts("contacts")
+
+        assert len(book) == 8
+        assert book["id-1"].name.value == "Contact B"
+        assert book.pending_changes().is_empty()
+
+    def test_load_notes(self, tmp_path: Path, parallel_load):
+        """Test that notes load through the pool in file order."""
+        records = [
+            {"id": f"n{i}", "title": f"Note {i}", "text": "Text", "tags": []}
+            for i in range(7)
+        ]
+        JsonStorage(tmp_path).save(records, "notes")
+
+        notebook, _ = DomainStorageAdapter(JsonStorage(tmp_path)).load_notes("notes")
+
+        assert list(notebook) == [f"n{i}" for i in range(7)]
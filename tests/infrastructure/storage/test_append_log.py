@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from src.infrastructure.storage import append_log
+from src.infrastructure.storage.append_log import fsync_directory, truncate_torn_tail
+
+
+class TestTruncateTornTail:
+    """Tests for dropping a partial last line from an append-only file."""
+
+    def test_partial_last_line_is_removed(self, tmp_path: Path):
+        """Test that bytes after the last newline are truncated."""
+        path = tmp_path / "log"
+        path.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c"')
+
+        assert truncate_torn_tail(path)
+        assert path.read_bytes() == b'{"a": 1}\n{"b": 2}\n'
+
+    def test_complete_file_is_left_alone(self, tmp_path: Path):
+        """Test that a file ending in a newline, or empty, is unchanged."""
+        path = tmp_path / "log"
+        for content in (b'{"a": 1}\n', b""):
+            path.write_bytes(content)
+            assert not truncate_torn_tail(path)
+            assert path.read_bytes() == content
+
+    def test_fragment_longer_than_a_read(self, tmp_path: Path, monkeypatch):
+        """Test that the last newline is found across several tail reads."""
+        monkeypatch.setattr(append_log, "TAIL_READ_SIZE", 4)
+        path = tmp_path / "log"
+        path.write_bytes(b"first\n" + b"x" * 30)
+
+        assert truncate_torn_tail(path)
+        assert path.read_bytes() == b"first\n"
+
+    def test_single_fragment_and_missing_file(self, tmp_path: Path):
+        """Test that a lone fragment empties the file and a missing file is fine."""
+        path = tmp_path / "log"
+        path.write_bytes(b'{"op"')
+
+        assert truncate_torn_tail(path)
+        assert path.read_bytes() == b""
+        assert not truncate_torn_tail(tmp_path / "missing")
+
+
+class TestFsyncDirectory:
+    """Tests for making renames in a directory durable."""
+
+    def test_syncs_existing_directory(self, tmp_path: Path, monkeypatch):
+        """Test that the directory itself is opened and synced."""
+        synced = []
+        monkeypatch.setattr(append_log.os, "fsync", synced.append)
+
+        fsync_directory(tmp_path)
+
+        assert len(synced) == 1
+
+    def test_missing_directory_is_ignored(self, tmp_path: Path):
+        """Test that a directory that cannot be opened is skipped."""
+        fsync_directory(tmp_path / "missing")
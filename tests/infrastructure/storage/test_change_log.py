@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import pytest
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.storage.change_log import ChangeLog
+
+
+@pytest.fixture
+def log(tmp_path: Path) -> ChangeLog:
+    """Provides a change log next to a data file."""
+    path = tmp_path / "data.json"
+    path.write_text("[]")
+    return ChangeLog(path)
+
+
+def save(log: ChangeLog, content: str, upserted=(), deleted=()) -> int:
+    log.data_path.write_text(content)
+    return log.record(upserted, deleted)
+
+
+class TestChangeLog:
+    """Tests for the per-save list of changed record IDs."""
+
+    def test_changes_since_combine_later_saves(self, log):
+        """Test that later saves override earlier ones for the same ID."""
+        first = save(log, "[1]", ["a", "b"])
+        save(log, "[2]", ["c"], ["a"])
+        save(log, "[3]", ["a"], ["c"])
+
+        revision, changes = log.changes_since(first - 1)
+
+        assert revision == 3
+        assert changes.modified == {"a", "b"}
+        assert changes.deleted == {"c"}
+
+    def test_no_new_entries_means_unknown_changes(self, log):
+        """Test that a file changed without a log entry is not trusted."""
+        revision = save(log, "[1]", ["a"])
+        log.data_path.write_text("[1, 2]")
+
+        assert log.changes_since(revision) == (revision, None)
+
+    def test_trimmed_history_means_unknown_changes(self, log, monkeypatch):
+        """Test that a reader older than the kept entries gets no change set."""
+        monkeypatch.setattr(StorageConfig, "CHANGE_LOG_MAX_ENTRIES", 2)
+        for i in range(4):
+            save(log, f"[{i}]", [str(i)])
+
+        assert log.changes_since(1)[1] is None
+        assert log.changes_since(2)[1].modified == {"2", "3"}
+
+    def test_complete_save_means_unknown_changes(self, log):
+        """Test that a save without listed IDs forces a full comparison."""
+        save(log, "[1]", ["a"])
+        log.data_path.write_text("[2]")
+        log.record(None)
+
+        assert log.changes_since(1) == (2, None)
+
+    def test_missing_log_has_revision_zero(self, log):
+        """Test that a store without a log starts at revision zero."""
+        assert log.revision() == 0
+        assert log.changes_since(0) == (0, None)
@@ -0,0 +1,122 @@
+from pathlib import Path
+
+import pytest
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.storage.compression import BZ2, CODECS, GZIP, LZMA, codec_for
+from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.pickle_storage import PickleStorage
+
+RECORDS = [{"id": f"id-{i}", "name": "Contact", "note": "x" * 50} for i in range(200)]
+
+
+@pytest.fixture(params=list(CODECS.values()), ids=list(CODECS))
+def codec(request):
+    """Provides every available compression codec."""
+    return request.param
+
+
+class TestCompressionCodec:
+    """Tests for codec lookup and filename handling."""
+
+    def test_codec_for_suffix(self):
+        """Test that codecs are found by the trailing suffix."""
+        assert codec_for("data.json.gz") is GZIP
+        assert codec_for("data.pkl.XZ") is LZMA
+        assert codec_for("data.json.bz2") is BZ2
+        assert codec_for("data.json") is None
+
+    def test_ensure_suffix(self):
+        """Test that base and codec suffixes are added once."""
+        assert GZIP.ensure_suffix("data", ".json") == "data.json.gz"
+        assert GZIP.ensure_suffix("data.json", ".json") == "data.json.gz"
+        assert GZIP.ensure_suffix("data.json.gz", ".json") == "data.json.gz"
+
+
+class TestCompressedJsonStorage:
+    """Tests for JsonStorage writing through a codec."""
+
+    def test_round_trip(self, tmp_path: Path, codec):
+        """Test that compressed JSON is smaller and loads back unchanged."""
+        storage = JsonStorage(tmp_path, compression=codec)
+
+        saved = storage.save(RECORDS, "data")
+
+        path = tmp_path / saved
+        assert saved == f"data.json{codec.suffix}"
+        assert path.stat().st_size < len(str(RECORDS))
+        assert storage.load("data") == RECORDS
+        assert list(storage.iter_load("data")) == RECORDS
+
+    def test_file_is_not_plain_json(self, tmp_path: Path):
+        """Test that the stored bytes are the codec's format."""
+        storage = JsonStorage(tmp_path, compression=GZIP)
+        storage.save(RECORDS, "data")
+
+        assert (tmp_path / "data.json.gz").read_bytes()[:2] == b"\x1f\x8b"
+
+    def test_no_temp_files_left(self, tmp_path: Path):
+        """Test that the atomic save leaves only the final file."""
+        storage = JsonStorage(tmp_path, compression=LZMA)
+        storage.save(RECORDS, "data")
+        storage.save(RECORDS[:5], "data")
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["data.json.xz"]
+        assert storage.load("data") == RECORDS[:5]
+
+    def test_corrupt_file_raises(self, tmp_path: Path, codec):
+        """Test that a damaged compressed file raises IOError."""
+        storage = JsonStorage(tmp_path, compression=codec)
+        (tmp_path / f"data.json{codec.suffix}").write_bytes(b"not compressed data")
+
+        with pytest.raises(IOError, match="Failed to load data"):
+            storage.load("data")
+        with pytest.raises(IOError, match="Failed to load data"):
+            list(storage.iter_load("data"))
+
+
+class TestCompressedPickleStorage:
+    """Tests for PickleStorage writing through a codec."""
+
+    def test_round_trip(self, tmp_path: Path, codec):
+        """Test that compressed pickles load back unchanged."""
+        storage = PickleStorage(tmp_path, compression=codec)
+
+        saved = storage.save(RECORDS, "data")
+
+        assert saved == f"data.pkl{codec.suffix}"
+        assert storage.load("data") == RECORDS
+
+    def test_truncated_file_raises(self, tmp_path: Path, codec):
+        """Test that a truncated compressed pickle raises IOError."""
+        storage = PickleStorage(tmp_path, compression=codec)
+        storage.save(RECORDS, "data")
+        path = tmp_path / f"data.pkl{codec.suffix}"
+        path.write_bytes(path.read_bytes()[:20])
+
+        with pytest.raises(IOError, match="Failed to load data"):
+            storage.load("data")
+
+
+class TestCompressedDomainStorageAdapter:
+    """Tests for saving domain collections into compressed files."""
+
+    @pytest.mark.parametrize("storage_class", [JsonStorage, PickleStorage])
+    def test_contacts_round_trip(self, tmp_path: Path, storage_class):
+        """Test that contacts keep their filename and fields when compressed."""
+        adapter = DomainStorageAdapter(storage_class(tmp_path, compression=GZIP))
+        book = AddressBook()
+        contact = Contact(Name("Alice"), "id-1")
+        contact.add_phone(Phone("1234567890"))
+        book.add_record(contact)
+
+        saved = adapter.save_contacts(book, "contacts")
+        loaded, filename = adapter.load_contacts("contacts")
+
+        assert saved == filename
+        assert filename.endswith(".gz")
+        assert loaded["id-1"].phones[0].value == "1234567890"
@@ -0,0 +1,253 @@
+import dbm
+import json
+from pathlib import Path
+
+import pytest
+
+from src.application.services.note_service import NoteService
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.notebook import Notebook
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.domain.value_objects.tag import Tag
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.config.storage_config import StorageConfig
+from src.infrastructure.storage.dbm_storage import RECORD_PREFIX, DbmStorage
+from src.infrastructure.storage.file_lock import FileLock
+from src.infrastructure.storage.storage_type import StorageType
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> DbmStorage:
+    """Provides a DbmStorage instance in a temporary directory."""
+    return DbmStorage(data_dir=tmp_path)
+
+
+def contact_record(record_id: str, name: str, *phones: str) -> dict:
+    return {"id": record_id, "name": name, "phones": list(phones)}
+
+
+def make_contact(contact_id: str, name: str, phone: str) -> Contact:
+    contact = Contact(Name(name), contact_id)
+    contact.add_phone(Phone(phone))
+    return contact
+
+
+def stored_keys(storage: DbmStorage, filename: str) -> set[str]:
+    with dbm.open(storage.store_key(filename), "r") as db:
+        return {key.decode("utf-8") for key in db.keys()}
+
+
+class TestDbmStorage:
+    """Tests for the dbm key-value storage."""
+
+    def test_properties(self, storage):
+        """Test the file_extension and storage_type properties."""
+        assert storage.file_extension == ".dbm"
+        assert storage.storage_type == StorageType.DBM
+
+    def test_load_missing_returns_default(self, storage):
+        """Test that loading a missing database returns the default value."""
+        assert storage.load("missing") is None
+        assert storage.load("missing", default=[]) == []
+        assert storage.find_ids("missing", "name", "Alice") == []
+
+    def test_save_and_load_round_trip(self, storage):
+        """Test that every record is stored under its own key."""
+        records = [
+            contact_record("a", "Alice", "1234567890"),
+            contact_record("b", "Bob", "0987654321"),
+        ]
+
+        saved = storage.save(records, "contacts")
+
+        assert saved == "contacts.dbm"
+        assert sorted(storage.load("contacts"), key=lambda r: r["id"]) == records
+        assert {RECORD_PREFIX + "a", RECORD_PREFIX + "b"} <= stored_keys(
+            storage, "contacts"
+        )
+
+    def test_full_save_drops_missing_records(self, storage):
+        """Test that a full save replaces the previous contents."""
+        storage.save([contact_record("a", "Alice", "1234567890")], "contacts")
+
+        storage.save([contact_record("b", "Bob", "0987654321")], "contacts")
+
+        assert [r["id"] for r in storage.load("contacts")] == ["b"]
+        assert storage.find_ids("contacts", "name", "Alice") == []
+
+    def test_secondary_indexes(self, storage):
+        """Test the name, phone and tag lookups."""
+        storage.save(
+            [
+                contact_record("a", "Alice", "1234567890"),
+                contact_record("b", "alice", "1112223333"),
+                {"id": "n", "title": "T", "text": "x", "tags": ["Work"]},
+            ],
+            "mixed",
+        )
+
+        assert sorted(storage.find_ids("mixed", "name", "ALICE")) == ["a", "b"]
+        assert storage.find_ids("mixed", "phone", "1112223333") == ["b"]
+        assert storage.find_ids("mixed", "tag", "work") == ["n"]
+        with pytest.raises(ValueError, match="Unknown index"):
+            storage.find_ids("mixed", "email", "x")
+
+    def test_apply_changes_updates_records_and_indexes(self, storage):
+        """Test per-record puts and deletes keep the indexes in step."""
+        storage.save(
+            [
+                contact_record("a", "Alice", "1234567890"),
+                contact_record("b", "Bob", "0987654321"),
+            ],
+            "contacts",
+        )
+
+        storage.apply_changes(
+            "contacts",
+            [
+                contact_record("a", "Alicia", "1234567890"),
+                contact_record("c", "Bob", "5555555555"),
+            ],
+            ["b", "missing"],
+        )
+
+        assert sorted(r["id"] for r in storage.load("contacts")) == ["a", "c"]
+        assert storage.find_ids("contacts", "name", "Alice") == []
+        assert storage.find_ids("contacts", "name", "Alicia") == ["a"]
+        assert storage.find_ids("contacts", "name", "Bob") == ["c"]
+        assert storage.find_ids("contacts", "phone", "0987654321") == []
+        assert "phone:0987654321" not in stored_keys(storage, "contacts")
+
+    def test_index_keeps_one_key_per_id(self, storage):
+        """Test that removing an id from a shared value leaves the others."""
+        storage.save(
+            [
+                {"id": f"n{i}", "title": "T", "text": "x", "tags": ["work"]}
+                for i in range(4)
+            ],
+            "notes",
+        )
+
+        storage.apply_changes("notes", [], ["n1"])
+
+        assert sorted(storage.find_ids("notes", "tag", "work")) == ["n0", "n2", "n3"]
+        with dbm.open(storage.store_key("notes"), "r") as db:
+            assert db["tag:work"] == b"3"
+        assert not any(key.endswith("@n1") for key in stored_keys(storage, "notes"))
+
+    def test_failed_save_keeps_previous_database(self, storage):
+        """Test that a save is built aside and never truncates the live file."""
+        storage.save([contact_record("a", "Alice", "1234567890")], "contacts")
+
+        with pytest.raises(IOError, match="Failed to save data to contacts.dbm"):
+            storage.save([{"id": "b", "name": "Bob", "bad": object()}], "contacts")
+
+        assert [r["id"] for r in storage.load("contacts")] == ["a"]
+        assert storage.find_ids("contacts", "name", "Alice") == ["a"]
+        assert not list(Path(storage.store_key("contacts")).parent.glob("*.tmp*"))
+
+    def test_upgrades_list_indexes_from_version_one(self, storage):
+        """Test that indexes stored as JSON lists are read and then rebuilt."""
+        with dbm.open(storage.store_key("contacts"), "n") as db:
+            for record in (
+                contact_record("a", "Alice", "1234567890"),
+                contact_record("b", "Alice", "0987654321"),
+            ):
+                db[RECORD_PREFIX + record["id"]] = json.dumps(record)
+            db["name:alice"] = json.dumps(["a", "b"])
+            db["phone:1234567890"] = json.dumps(["a"])
+            db["phone:0987654321"] = json.dumps(["b"])
+
+        assert storage.find_ids("contacts", "name", "Alice") == ["a", "b"]
+        storage.apply_changes("contacts", [], ["a"])
+
+        assert storage.find_ids("contacts", "name", "Alice") == ["b"]
+        assert storage.find_ids("contacts", "phone", "0987654321") == ["b"]
+        assert storage.find_ids("contacts", "phone", "1234567890") == []
+
+    def test_writers_wait_for_other_processes(self, storage, monkeypatch):
+        """Test that saves and in-place changes take the file lock."""
+        monkeypatch.setattr(StorageConfig, "FILE_LOCK_TIMEOUT_SECONDS", 0.05)
+        storage.save([contact_record("a", "Alice", "1234567890")], "contacts")
+
+        with FileLock(Path(storage.store_key("contacts"))):
+            with pytest.raises(IOError, match="Timed out waiting for lock"):
+                storage.apply_changes("contacts", [], ["a"])
+            with pytest.raises(IOError, match="Timed out waiting for lock"):
+                storage.save([], "contacts")
+
+        assert [r["id"] for r in storage.load("contacts")] == ["a"]
+
+    def test_invalid_filename_is_rejected(self, storage):
+        """Test that directory traversal is rejected."""
+        with pytest.raises(ValueError):
+            storage.save([], "../contacts")
+
+
+class TestDbmDomainStorageAdapter:
+    """Tests for saving domain collections into a dbm database."""
+
+    def test_contacts_round_trip(self, storage):
+        """Test that contacts saved into dbm can be loaded back."""
+        adapter = DomainStorageAdapter(storage)
+        book = AddressBook()
+        book.add_record(make_contact("id-1", "Alice", "1234567890"))
+
+        saved = adapter.save_contacts(book, "contacts")
+        loaded, filename = adapter.load_contacts("contacts")
+
+        assert saved == filename == "contacts.dbm"
+        assert loaded["id-1"].phones[0].value == "1234567890"
+
+    def test_save_after_load_writes_only_changes(self, storage, monkeypatch):
+        """Test that a loaded book saves through per-record operations."""
+        adapter = DomainStorageAdapter(storage)
+        book = AddressBook()
+        for i in range(5):
+            book.add_record(make_contact(f"id-{i}", "Alice", f"123456789{i}"))
+        adapter.save_contacts(book, "contacts")
+        loaded, _ = adapter.load_contacts("contacts")
+
+        calls = []
+        original = storage.apply_changes
+
+        def spy(filename, upserts, deleted_ids):
+            upserts = list(upserts)
+            calls.append(([r["id"] for r in upserts], set(deleted_ids)))
+            return original(filename, upserts, deleted_ids)
+
+        monkeypatch.setattr(storage, "apply_changes", spy)
+        monkeypatch.setattr(storage, "save", None)
+        loaded.delete_by_id("id-1")
+        loaded["id-2"].add_phone(Phone("5555555555"))
+        loaded.mark_modified("id-2")
+        adapter.save_contacts(loaded, "contacts")
+
+        assert calls == [(["id-2"], {"id-1"})]
+        assert storage.find_ids("contacts", "phone", "5555555555") == ["id-2"]
+        reloaded, _ = adapter.load_contacts("contacts")
+        assert len(reloaded) == 4
+
+    def test_notes_round_trip(self, storage):
+        """Test that notes keep their fields and tag index."""
+        adapter = DomainStorageAdapter(storage)
+        notebook = Notebook()
+        note = Note("First", "Text one", "n1")
+        note.add_tag(Tag("work"))
+        notebook["n1"] = note
+        adapter.save_notes(notebook, "notes")
+
+        loaded, _ = adapter.load_notes("notes")
+
+        assert loaded["n1"].title == "First"
+        assert storage.find_ids("notes", "tag", "work") == ["n1"]
+
+    def test_note_service_uses_dbm_default_file(self, storage):
+        """Test that notes default to notes.dbm with the dbm backend."""
+        service = NoteService(storage)
+        service.add_note("Title", "Some text")
+
+        assert service.save_notes() == "notes.dbm"
@@ -0,0 +1,85 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.storage.file_lock import (
+    FileLock,
+    file_generation,
+    lock_if_enabled,
+)
+
+
+@pytest.fixture
+def data_file(tmp_path: Path) -> Path:
+    """Provides a data file path in a temporary directory."""
+    return tmp_path / "contacts.json"
+
+
+class TestFileLock:
+    """Tests for the advisory storage lock."""
+
+    def test_lock_uses_sidecar_file(self, data_file):
+        """Test that the lock lives next to the data file."""
+        with FileLock(data_file) as lock:
+            assert lock.path == data_file.with_name("contacts.json.lock")
+            assert lock.path.exists()
+        assert not data_file.exists()
+
+    def test_exclusive_lock_blocks_others(self, data_file):
+        """Test that a second writer times out while the lock is held."""
+        with FileLock(data_file):
+            with pytest.raises(IOError, match="Timed out waiting for lock"):
+                with FileLock(data_file, timeout=0.05):
+                    pass
+
+        with FileLock(data_file, timeout=0.05):
+            pass
+
+    @pytest.mark.skipif(os.name == "nt", reason="msvcrt has no shared locks")
+    def test_shared_locks_coexist(self, data_file):
+        """Test that readers share the lock but exclude a writer."""
+        with FileLock(data_file, shared=True):
+            with FileLock(data_file, shared=True, timeout=0.05):
+                pass
+            with pytest.raises(IOError):
+                with FileLock(data_file, timeout=0.05):
+                    pass
+
+    def test_release_is_idempotent(self, data_file):
+        """Test that releasing twice is harmless."""
+        lock = FileLock(data_file)
+        lock.acquire()
+        lock.release()
+        lock.release()
+
+    def test_lock_if_enabled_follows_config(self, data_file, monkeypatch):
+        """Test that no lock file is touched when locking is turned off."""
+        monkeypatch.setattr(StorageConfig, "FILE_LOCKING", False)
+        with lock_if_enabled(data_file):
+            assert not data_file.with_name("contacts.json.lock").exists()
+
+        monkeypatch.setattr(StorageConfig, "FILE_LOCKING", True)
+        with lock_if_enabled(data_file) as lock:
+            assert isinstance(lock, FileLock)
+
+
+class TestFileGeneration:
+    """Tests for detecting rewritten data files."""
+
+    def test_missing_file(self, data_file):
+        """Test that a missing file has no generation."""
+        assert file_generation(data_file) is None
+
+    def test_replace_changes_generation(self, data_file, tmp_path):
+        """Test that an atomic replace is seen as a new generation."""
+        data_file.write_text("[]")
+        before = file_generation(data_file)
+        assert file_generation(data_file) == before
+
+        tmp = tmp_path / "tmp"
+        tmp.write_text("[]")
+        os.replace(tmp, data_file)
+
+        assert file_generation(data_file) != before
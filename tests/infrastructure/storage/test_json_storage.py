@@ -3,7 +3,13 @@ import pytest
 from pathlib import Path
 from typing import Any
 
-from src.infrastructure.storage.json_storage import JsonStorage
+from src.config.storage_config import StorageConfig
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.storage.json_storage import MANIFEST_SUFFIX, JsonStorage
 from src.infrastructure.storage.storage_type import StorageType
 
 
@@ -136,3 +142,153 @@ def test_save_with_invalid_filename(storage: JsonStorage, invalid_filename: str)
     """Tests that attempting to save with a malicious filename raises an error."""
     with pytest.raises(ValueError, match="Filename must not contain directories"):
         storage.save({"data": "test"}, invalid_filename)
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    """Forces the streaming loader to read a few characters at a time."""
+    monkeypatch.setattr(StorageConfig, "JSON_STREAM_CHUNK_SIZE", 3)
+
+
+def test_iter_load_streams_array_elements(storage: JsonStorage, small_chunks):
+    """Tests that array elements split across chunks are decoded one by one."""
+    test_data = [
+        {"id": "a", "text": "brackets ] and, commas [", "n": 12345},
+        {"id": "b", "tags": ["x", "y"], "nested": {"k": [1, 2]}},
+        67890,
+        "Юнікод",
+    ]
+    storage.save(test_data, "stream")
+
+    records = storage.iter_load("stream")
+
+    assert next(records) == test_data[0]
+    assert list(records) == test_data[1:]
+
+
+def test_iter_load_decodes_chunk_in_place(storage: JsonStorage, monkeypatch):
+    """Tests that elements are decoded at offsets without copying the chunk."""
+    test_data = [{"id": str(i)} for i in range(1000)]
+    storage.save(test_data, "many")
+    buffers = set()
+    raw_decode = json.JSONDecoder.raw_decode
+
+    def tracking_raw_decode(self, s, idx=0):
+        buffers.add(id(s))
+        return raw_decode(self, s, idx)
+
+    monkeypatch.setattr(json.JSONDecoder, "raw_decode", tracking_raw_decode)
+
+    assert list(storage.iter_load("many")) == test_data
+    assert len(buffers) == 1
+
+
+def test_iter_load_empty_array(storage: JsonStorage, small_chunks):
+    """Tests that an empty array yields nothing."""
+    storage.save([], "empty_array")
+    assert list(storage.iter_load("empty_array")) == []
+
+
+def test_iter_load_missing_file(storage: JsonStorage):
+    """Tests that streaming a missing file returns None."""
+    assert storage.iter_load("non_existent_file") is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    ['{"id": "a"}', '[{"id": "a"}', '[{"id": "a"},]', '[{"id": "a"} {"id": "b"}]'],
+)
+def test_iter_load_malformed_array(storage: JsonStorage, small_chunks, content: str):
+    """Tests that malformed or non-array documents raise IOError."""
+    (storage.resolver.data_dir / "broken.json").write_text(content, encoding="utf-8")
+
+    with pytest.raises(IOError, match="Failed to load data from broken.json"):
+        list(storage.iter_load("broken"))
+
+
+def test_adapter_builds_address_book_from_stream(storage: JsonStorage, small_chunks):
+    """Tests that contacts are loaded through the streaming path."""
+    adapter = DomainStorageAdapter(storage)
+    book = AddressBook()
+    for i in range(3):
+        contact = Contact(Name(f"Contact {chr(ord('A') + i)}"), f"id-{i}")
+        contact.add_phone(Phone(f"12345678{i:02d}"))
+        book.add_record(contact)
+    adapter.save_contacts(book, "contacts")
+
+    loaded, filename = adapter.load_contacts("contacts")
+
+    assert filename == "contacts.json"
+    assert set(loaded.keys()) == {"id-0", "id-1", "id-2"}
+    assert loaded["id-2"].phones[0].value == "1234567802"
+    assert loaded.pending_changes().is_empty()
+
+
+def test_is_trusted_requires_matching_manifest(storage: JsonStorage):
+    """Tests that only unmodified files saved with a format version are trusted."""
+    storage.save([{"id": "a"}], "plain")
+    storage.save([{"id": "a"}], "versioned", format_version=1)
+
+    assert storage.is_trusted("plain", 1) is False
+    assert storage.is_trusted("versioned", 1) is True
+    assert storage.is_trusted("versioned", 2) is False
+    assert (storage.resolver.data_dir / f"versioned.json{MANIFEST_SUFFIX}").exists()
+
+
+def test_is_trusted_rejects_modified_file(storage: JsonStorage):
+    """Tests that editing the file after save invalidates the manifest."""
+    storage.save([{"id": "a"}], "edited", format_version=1)
+    (storage.resolver.data_dir / "edited.json").write_text('[{"id": "b"}]')
+
+    assert storage.is_trusted("edited", 1) is False
+
+
+def test_is_trusted_rejects_replaced_file(storage: JsonStorage):
+    """Tests that a copy with the same bytes is not the file that was saved."""
+    storage.save([{"id": "a"}], "copied", format_version=1)
+    path = storage.resolver.data_dir / "copied.json"
+    copy = path.with_name("copy.tmp")
+    copy.write_bytes(path.read_bytes())
+    copy.replace(path)
+
+    assert storage.is_trusted("copied", 1) is False
+
+
+def test_save_without_version_removes_stale_manifest(storage: JsonStorage):
+    """Tests that an unversioned save drops the previous manifest."""
+    storage.save([{"id": "a"}], "data", format_version=1)
+    storage.save([{"id": "b"}], "data")
+
+    assert not (storage.resolver.data_dir / f"data.json{MANIFEST_SUFFIX}").exists()
+    assert storage.is_trusted("data", 1) is False
+
+
+def test_adapter_validates_untrusted_file(storage: JsonStorage):
+    """Tests that a hand-edited file is loaded through full validation."""
+    adapter = DomainStorageAdapter(storage)
+    book = AddressBook()
+    book.add_record(Contact(Name("Alice"), "id-0"))
+    adapter.save_contacts(book, "contacts")
+
+    record = {"id": "id-0", "name": "Alice", "phones": ["123"]}
+    (storage.resolver.data_dir / "contacts.json").write_text(json.dumps([record]))
+
+    with pytest.raises(ValueError, match="between 8 and 15 digits"):
+        adapter.load_contacts("contacts")
+
+
+def test_save_streams_iterator(storage: JsonStorage):
+    """Tests that an iterator is written as a JSON array element by element."""
+    records = [{"id": str(i), "name": f"Name {i}"} for i in range(3)]
+
+    storage.save(iter(records), "streamed")
+
+    assert storage.load("streamed") == records
+    assert list(storage.iter_load("streamed")) == records
+
+
+def test_save_streams_empty_iterator(storage: JsonStorage):
+    """Tests that an empty iterator is saved as an empty array."""
+    storage.save(iter(()), "empty")
+
+    assert storage.load("empty") == []
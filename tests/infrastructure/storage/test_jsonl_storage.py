@@ -0,0 +1,242 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.config.storage_config import StorageConfig
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.notebook import Notebook
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.storage.jsonl_storage import (
+    EPOCH_KEY,
+    JOURNAL_SUFFIX,
+    JsonlStorage,
+)
+from src.infrastructure.storage.file_lock import FileLock
+from src.infrastructure.storage.storage_type import StorageType
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> JsonlStorage:
+    """Provides a JsonlStorage instance in a temporary directory."""
+    return JsonlStorage(data_dir=tmp_path)
+
+
+@pytest.fixture
+def adapter(storage: JsonlStorage) -> DomainStorageAdapter:
+    """Provides a DomainStorageAdapter over the JSONL storage."""
+    return DomainStorageAdapter(storage)
+
+
+def read_lines(path: Path) -> list[dict]:
+    lines = [json.loads(line) for line in path.read_text("utf-8").splitlines()]
+    # Snapshots and journals start with the epoch that pairs them
+    return [line for line in lines if EPOCH_KEY not in line]
+
+
+def make_contact(index: int) -> Contact:
+    contact = Contact(Name(f"Contact {chr(ord('A') + index)}"), f"id-{index}")
+    contact.add_phone(Phone(f"12345678{index:02d}"))
+    return contact
+
+
+class TestJsonlStorage:
+    """Tests for the append-only JSON Lines storage."""
+
+    def test_properties(self, storage):
+        """Test the file_extension and storage_type properties."""
+        assert storage.file_extension == ".jsonl"
+        assert storage.storage_type == StorageType.JSONL
+
+    def test_load_missing_file_returns_default(self, storage):
+        """Test that loading a missing file returns the default value."""
+        assert storage.load("missing") is None
+        assert storage.load("missing", default=[]) == []
+
+    def test_save_writes_snapshot_and_removes_journal(self, storage, tmp_path):
+        """Test that a full save writes one line per record."""
+        storage.append_changes("data", [{"id": "a"}], [])
+        saved = storage.save([{"id": "a", "v": 1}, {"id": "b", "v": 2}], "data")
+
+        assert saved == "data.jsonl"
+        assert read_lines(tmp_path / "data.jsonl") == [
+            {"id": "a", "v": 1},
+            {"id": "b", "v": 2},
+        ]
+        assert not (tmp_path / f"data.jsonl{JOURNAL_SUFFIX}").exists()
+
+    def test_append_changes_writes_only_the_change(self, storage, tmp_path):
+        """Test that appends leave the snapshot untouched."""
+        storage.save([{"id": "a", "v": 1}, {"id": "b", "v": 2}], "data")
+        snapshot = (tmp_path / "data.jsonl").read_bytes()
+
+        storage.append_changes("data", [{"id": "a", "v": 3}], ["b"])
+
+        assert (tmp_path / "data.jsonl").read_bytes() == snapshot
+        assert read_lines(tmp_path / f"data.jsonl{JOURNAL_SUFFIX}") == [
+            {"op": "put", "record": {"id": "a", "v": 3}},
+            {"op": "delete", "id": "b"},
+        ]
+
+    def test_load_replays_journal_over_snapshot(self, storage):
+        """Test that journal entries override snapshot records in order."""
+        storage.save([{"id": "a", "v": 1}, {"id": "b", "v": 2}], "data")
+        storage.append_changes("data", [{"id": "c", "v": 5}], ["b"])
+        storage.append_changes("data", [{"id": "a", "v": 4}], [])
+
+        assert storage.load("data") == [{"id": "a", "v": 4}, {"id": "c", "v": 5}]
+
+    def test_load_ignores_torn_last_entry(self, storage, tmp_path):
+        """Test that an incomplete trailing journal line is skipped."""
+        storage.save([{"id": "a", "v": 1}], "data")
+        storage.append_changes("data", [{"id": "b", "v": 2}], [])
+        with open(tmp_path / f"data.jsonl{JOURNAL_SUFFIX}", "a") as f:
+            f.write('{"op": "put", "rec')
+
+        assert storage.load("data") == [{"id": "a", "v": 1}, {"id": "b", "v": 2}]
+
+    def test_append_after_torn_entry_drops_the_fragment(self, storage, tmp_path):
+        """Test that an append after a crash does not corrupt the journal."""
+        storage.save([{"id": "a", "v": 1}], "data")
+        storage.append_changes("data", [{"id": "b", "v": 2}], [])
+        journal = tmp_path / f"data.jsonl{JOURNAL_SUFFIX}"
+        with open(journal, "a") as f:
+            f.write('{"op": "put", "rec')
+        storage.load("data")
+
+        storage.append_changes("data", [{"id": "c", "v": 3}], [])
+
+        assert storage.load("data") == [
+            {"id": "a", "v": 1},
+            {"id": "b", "v": 2},
+            {"id": "c", "v": 3},
+        ]
+        assert len(read_lines(journal)) == 2
+
+    def test_journal_left_by_crashed_save_is_ignored(self, storage, tmp_path):
+        """Test that a journal older than the snapshot is never replayed."""
+        storage.save([{"id": "a", "v": 1}], "data")
+        storage.append_changes("data", [{"id": "b", "v": 2}], ["a"])
+        journal = tmp_path / f"data.jsonl{JOURNAL_SUFFIX}"
+        stale = journal.read_bytes()
+        storage.save([{"id": "a", "v": 3}], "data")
+        # As if the process died between replacing the snapshot and the unlink
+        journal.write_bytes(stale)
+
+        assert storage.load("data") == [{"id": "a", "v": 3}]
+
+        storage.append_changes("data", [{"id": "c", "v": 4}], [])
+        assert storage.load("data") == [{"id": "a", "v": 3}, {"id": "c", "v": 4}]
+        assert read_lines(journal) == [{"op": "put", "record": {"id": "c", "v": 4}}]
+
+    def test_files_without_epochs_still_replay(self, storage, tmp_path):
+        """Test that snapshots and journals written before epochs still load."""
+        (tmp_path / "data.jsonl").write_text('{"id": "a", "v": 1}\n')
+        (tmp_path / f"data.jsonl{JOURNAL_SUFFIX}").write_text(
+            '{"op": "put", "record": {"id": "b", "v": 2}}\n'
+        )
+
+        storage.append_changes("data", [], ["a"])
+
+        assert storage.load("data") == [{"id": "b", "v": 2}]
+
+    def test_writers_wait_for_other_processes(self, storage, tmp_path, monkeypatch):
+        """Test that saves, appends and compaction take the file lock."""
+        monkeypatch.setattr(StorageConfig, "FILE_LOCK_TIMEOUT_SECONDS", 0.05)
+        storage.save([{"id": "a", "v": 1}], "data")
+        storage.append_changes("data", [{"id": "b", "v": 2}], [])
+
+        with FileLock(tmp_path / "data.jsonl"):
+            with pytest.raises(IOError, match="Timed out waiting for lock"):
+                storage.append_changes("data", [{"id": "c", "v": 3}], [])
+            with pytest.raises(IOError, match="Timed out waiting for lock"):
+                storage.save([], "data")
+            with pytest.raises(IOError, match="Timed out waiting for lock"):
+                storage.compact("data")
+
+        assert storage.load("data") == [{"id": "a", "v": 1}, {"id": "b", "v": 2}]
+
+    def test_load_corrupt_snapshot_raises(self, storage, tmp_path):
+        """Test that a corrupt snapshot raises IOError."""
+        (tmp_path / "data.jsonl").write_text("not json\n")
+
+        with pytest.raises(IOError, match="Failed to load data from data.jsonl"):
+            storage.load("data")
+
+    def test_compact_folds_journal_into_snapshot(self, storage, tmp_path):
+        """Test that compaction rewrites the snapshot and drops the journal."""
+        storage.save([{"id": "a", "v": 1}], "data")
+        storage.append_changes("data", [{"id": "b", "v": 2}], ["a"])
+
+        storage.compact("data")
+
+        assert read_lines(tmp_path / "data.jsonl") == [{"id": "b", "v": 2}]
+        assert not (tmp_path / f"data.jsonl{JOURNAL_SUFFIX}").exists()
+
+    def test_background_compaction_when_journal_outgrows_snapshot(
+        self, storage, tmp_path, monkeypatch
+    ):
+        """Test that a large journal is compacted on a background thread."""
+        monkeypatch.setattr(StorageConfig, "JSONL_COMPACTION_MIN_BYTES", 1)
+        storage.save([{"id": "a", "v": 1}], "data")
+
+        storage.append_changes("data", [{"id": "a", "v": 2}, {"id": "b", "v": 3}], [])
+        storage.wait_for_compaction()
+
+        assert not (tmp_path / f"data.jsonl{JOURNAL_SUFFIX}").exists()
+        assert storage.load("data") == [{"id": "a", "v": 2}, {"id": "b", "v": 3}]
+
+    def test_invalid_filename_raises(self, storage):
+        """Test that filenames with directories are rejected."""
+        with pytest.raises(ValueError, match="must not contain directories"):
+            storage.save([], "../data.jsonl")
+
+
+class TestJsonlDomainStorageAdapter:
+    """Tests for saving domain collections through the JSONL journal."""
+
+    def test_contacts_round_trip(self, adapter):
+        """Test that contacts saved fully can be loaded back."""
+        book = AddressBook()
+        for i in range(3):
+            book.add_record(make_contact(i))
+
+        saved = adapter.save_contacts(book, "contacts")
+        loaded, filename = adapter.load_contacts("contacts")
+
+        assert saved == filename == "contacts.jsonl"
+        assert set(loaded.keys()) == {"id-0", "id-1", "id-2"}
+        assert loaded["id-1"].phones[0].value == "1234567801"
+
+    def test_save_after_load_appends_changes(self, adapter, tmp_path):
+        """Test that a loaded book appends only its changes to the journal."""
+        book = AddressBook()
+        for i in range(3):
+            book.add_record(make_contact(i))
+        adapter.save_contacts(book, "contacts")
+
+        loaded, _ = adapter.load_contacts("contacts")
+        loaded.add_record(make_contact(3))
+        loaded.delete_by_id("id-0")
+        adapter.save_contacts(loaded, "contacts")
+
+        journal = read_lines(tmp_path / f"contacts.jsonl{JOURNAL_SUFFIX}")
+        assert [entry["op"] for entry in journal] == ["put", "delete"]
+        reloaded, _ = adapter.load_contacts("contacts")
+        assert set(reloaded.keys()) == {"id-1", "id-2", "id-3"}
+
+    def test_notes_round_trip_with_appends(self, adapter):
+        """Test that notes keep their titles through snapshot and journal."""
+        notebook = Notebook()
+        notebook["n1"] = Note("First", "Text one", "n1")
+        adapter.save_notes(notebook, "notes")
+
+        notebook["n2"] = Note("Second", "Text two", "n2")
+        adapter.save_notes(notebook, "notes")
+
+        loaded, _ = adapter.load_notes("notes")
+        assert {note.title for note in loaded.values()} == {"First", "Second"}
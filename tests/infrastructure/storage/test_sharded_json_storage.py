@@ -0,0 +1,266 @@
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.config.storage_config import StorageConfig
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.notebook import Notebook
+from src.domain.value_objects.name import Name
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.storage.sharded_json_storage import (
+    MANIFEST_NAME,
+    SHARD_FORMAT_VERSION,
+    ShardedJsonStorage,
+)
+from src.infrastructure.storage.storage_type import StorageType
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> ShardedJsonStorage:
+    """Provides a ShardedJsonStorage instance in a temporary directory."""
+    return ShardedJsonStorage(data_dir=tmp_path)
+
+
+@pytest.fixture
+def adapter(storage: ShardedJsonStorage) -> DomainStorageAdapter:
+    """Provides a DomainStorageAdapter over the sharded storage."""
+    return DomainStorageAdapter(storage)
+
+
+def make_records(count: int) -> list[dict]:
+    return [{"id": f"id-{i}", "value": i} for i in range(count)]
+
+
+def shard_mtimes(directory: Path) -> dict[str, int]:
+    return {
+        path.name: path.stat().st_mtime_ns for path in directory.glob("shard-*.json")
+    }
+
+
+def shard_prefix(name: str) -> str:
+    return name.split("-")[1]
+
+
+def make_book(count: int) -> AddressBook:
+    book = AddressBook()
+    for i in range(count):
+        book.add_record(Contact(Name(f"Contact {chr(ord('A') + i % 26)}"), f"id-{i}"))
+    return book
+
+
+class TestShardedJsonStorage:
+    """Tests for the sharded JSON storage layout."""
+
+    def test_properties(self, storage):
+        """Test the file_extension and storage_type properties."""
+        assert storage.file_extension == ".shards"
+        assert storage.storage_type == StorageType.JSON_SHARDED
+
+    def test_load_missing_returns_default(self, storage):
+        """Test that loading a missing directory returns the default value."""
+        assert storage.load("missing") is None
+        assert storage.load("missing", default=[]) == []
+
+    def test_save_and_load_round_trip(self, storage, tmp_path):
+        """Test that records are spread over shards and loaded back."""
+        records = make_records(50)
+
+        saved = storage.save(records, "data")
+        loaded = storage.load("data")
+
+        directory = tmp_path / "data.shards"
+        manifest = json.loads((directory / MANIFEST_NAME).read_text())
+        assert saved == "data.shards"
+        assert manifest["prefix_length"] == StorageConfig.JSON_SHARD_PREFIX_LENGTH
+        assert len(manifest["shards"]) == len(list(directory.glob("shard-*.json")))
+        assert len(manifest["shards"]) > 1
+        assert sorted(loaded, key=lambda r: r["value"]) == records
+
+    def test_unchanged_shards_are_not_rewritten(self, storage, tmp_path):
+        """Test that a full save rewrites only shards whose content changed."""
+        records = make_records(50)
+        storage.save(records, "data")
+        directory = tmp_path / "data.shards"
+        for path in directory.glob("shard-*.json"):
+            os.utime(path, ns=(0, 0))
+
+        records[7] = {"id": "id-7", "value": "changed"}
+        storage.save(records, "data")
+
+        rewritten = [name for name, mtime in shard_mtimes(directory).items() if mtime]
+        shard = storage.shard_locator("data")("id-7")
+        assert [shard_prefix(name) for name in rewritten] == [shard]
+
+    def test_apply_changes_keeps_other_records_of_the_shard(self, storage, tmp_path):
+        """Test that a changed shard is rebuilt from its file plus the changes."""
+        storage.save(make_records(50), "data")
+        directory = tmp_path / "data.shards"
+        for path in directory.glob("shard-*.json"):
+            os.utime(path, ns=(0, 0))
+
+        storage.apply_changes("data", [{"id": "id-5", "value": "changed"}], ["id-3"])
+
+        records = {record["id"]: record for record in storage.load("data")}
+        assert "id-3" not in records
+        assert records["id-5"]["value"] == "changed"
+        assert len(records) == 49
+        shard_of = storage.shard_locator("data")
+        rewritten = [name for name, mtime in shard_mtimes(directory).items() if mtime]
+        assert {shard_prefix(name) for name in rewritten} <= {
+            shard_of("id-3"),
+            shard_of("id-5"),
+        }
+
+    def test_apply_changes_hashes_only_changed_ids(self, storage, monkeypatch):
+        """Test that unchanged records are not located again on save."""
+        storage.save(make_records(50), "data")
+        located = []
+        shard_of = ShardedJsonStorage._shard_of
+
+        def counting_shard_of(record_id: str, prefix_length: int) -> str:
+            located.append(record_id)
+            return shard_of(record_id, prefix_length)
+
+        monkeypatch.setattr(
+            ShardedJsonStorage, "_shard_of", staticmethod(counting_shard_of)
+        )
+        storage.apply_changes("data", [{"id": "id-5", "value": "changed"}], ["id-3"])
+
+        assert sorted(located) == ["id-3", "id-5"]
+
+    def test_emptied_shard_is_removed(self, storage, tmp_path):
+        """Test that a shard without records is deleted with its manifest entry."""
+        storage.save([{"id": "only", "value": 1}], "data")
+
+        storage.save([], "data")
+
+        directory = tmp_path / "data.shards"
+        assert list(directory.glob("shard-*.json")) == []
+        assert storage.load("data") == []
+
+    def test_prefix_length_change_reshards_on_full_save(
+        self, storage, tmp_path, monkeypatch
+    ):
+        """Test that a full save moves records to the configured layout."""
+        storage.save(make_records(20), "data")
+        monkeypatch.setattr(StorageConfig, "JSON_SHARD_PREFIX_LENGTH", 1)
+
+        storage.save(make_records(20), "data")
+
+        names = [path.name for path in (tmp_path / "data.shards").glob("shard-*")]
+        assert all(len(shard_prefix(name)) == 1 for name in names)
+        assert len(storage.load("data")) == 20
+
+    def test_corrupt_shard_raises(self, storage, tmp_path):
+        """Test that an unreadable shard raises IOError."""
+        storage.save(make_records(5), "data")
+        next((tmp_path / "data.shards").glob("shard-*.json")).write_text("{")
+
+        with pytest.raises(IOError, match="Failed to load data from data.shards"):
+            storage.load("data")
+
+
+    def test_tampered_shard_fails_checksum(self, storage, tmp_path):
+        """Test that a shard whose bytes differ from the manifest is rejected."""
+        storage.save([{"id": "only", "value": 1}], "data")
+        path = next((tmp_path / "data.shards").glob("shard-*.json"))
+        path.write_text(path.read_text().replace("1", "2"))
+
+        with pytest.raises(IOError, match="Checksum mismatch"):
+            storage.load("data")
+
+    def test_save_interrupted_before_manifest_keeps_old_data(
+        self, storage, tmp_path, monkeypatch
+    ):
+        """Test that shards of an unfinished save never replace listed ones."""
+        records = make_records(20)
+        storage.save(records, "data")
+        write_atomic = ShardedJsonStorage._write_atomic
+
+        def crash_on_manifest(path: Path, content: bytes) -> None:
+            if path.name == MANIFEST_NAME:
+                raise OSError("disk full")
+            write_atomic(path, content)
+
+        monkeypatch.setattr(
+            ShardedJsonStorage, "_write_atomic", staticmethod(crash_on_manifest)
+        )
+        with pytest.raises(IOError):
+            storage.save([{**r, "value": -1} for r in records], "data")
+        monkeypatch.undo()
+
+        assert sorted(storage.load("data"), key=lambda r: r["value"]) == records
+        storage.save(records[:10], "data")
+        directory = tmp_path / "data.shards"
+        manifest = json.loads((directory / MANIFEST_NAME).read_text())
+        listed = {entry["file"] for entry in manifest["shards"].values()}
+        assert set(shard_mtimes(directory)) == listed
+
+    def test_loads_and_upgrades_version_one_layout(self, storage, tmp_path):
+        """Test that shards written in place by version 1 still load."""
+        directory = tmp_path / "data.shards"
+        directory.mkdir()
+        content = json.dumps([{"id": "a", "value": 1}]).encode("utf-8")
+        (directory / "shard-ab.json").write_bytes(content)
+        manifest = {
+            "format_version": 1,
+            "prefix_length": 2,
+            "shards": {"ab": hashlib.sha256(content).hexdigest()},
+        }
+        (directory / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+        assert storage.load("data") == [{"id": "a", "value": 1}]
+        storage.apply_changes("data", [{"id": "b", "value": 2}], [])
+
+        manifest = json.loads((directory / MANIFEST_NAME).read_text())
+        assert manifest["format_version"] == SHARD_FORMAT_VERSION
+        assert manifest["shards"]["ab"]["file"] == "shard-ab.json"
+        assert len(storage.load("data")) == 2
+
+
+class TestShardedDomainStorageAdapter:
+    """Tests for saving domain collections into shards."""
+
+    def test_contacts_round_trip(self, adapter):
+        """Test that contacts saved into shards can be loaded back."""
+        adapter.save_contacts(make_book(30), "contacts")
+
+        loaded, filename = adapter.load_contacts("contacts")
+
+        assert filename == "contacts.shards"
+        assert set(loaded.keys()) == {f"id-{i}" for i in range(30)}
+
+    def test_save_after_load_rewrites_changed_shards(self, adapter, tmp_path):
+        """Test that only shards holding changed records are written."""
+        adapter.save_contacts(make_book(30), "contacts")
+        loaded, _ = adapter.load_contacts("contacts")
+        directory = tmp_path / "contacts.shards"
+        for path in directory.glob("shard-*.json"):
+            os.utime(path, ns=(0, 0))
+
+        loaded.delete_by_id("id-4")
+        adapter.save_contacts(loaded, "contacts")
+
+        shard = adapter.storage.shard_locator("contacts")("id-4")
+        rewritten = [name for name, mtime in shard_mtimes(directory).items() if mtime]
+        # The shard is rewritten, or removed if id-4 was its only record
+        assert {shard_prefix(name) for name in rewritten} <= {shard}
+        reloaded, _ = adapter.load_contacts("contacts")
+        assert "id-4" not in reloaded
+        assert len(reloaded) == 29
+
+    def test_notes_round_trip(self, adapter):
+        """Test that notes keep their fields through the sharded layout."""
+        notebook = Notebook()
+        notebook["n1"] = Note("First", "Text one", "n1")
+        notebook["n2"] = Note("Second", "Text two", "n2")
+        adapter.save_notes(notebook, "notes")
+
+        loaded, _ = adapter.load_notes("notes")
+
+        assert {note.title for note in loaded.values()} == {"First", "Second"}
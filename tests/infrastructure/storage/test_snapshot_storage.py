@@ -0,0 +1,184 @@
+import pickle
+from pathlib import Path
+
+import pytest
+
+from src.application.exceptions.base import StorageException
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.notebook import Notebook
+from src.domain.value_objects.address import Address
+from src.domain.value_objects.birthday import Birthday
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.storage.snapshot_address_book import SnapshotAddressBook
+from src.infrastructure.storage.snapshot_format import SnapshotReader
+from src.infrastructure.storage.snapshot_storage import SnapshotStorage
+from src.infrastructure.storage.storage_type import StorageType
+
+
+def make_contact(index: int) -> Contact:
+    contact = Contact(Name(f"Contact {chr(ord('A') + index % 26)}"), f"id-{index:03d}")
+    contact.add_phone(Phone(f"12345678{index % 100:02d}"))
+    contact.add_phone(Phone("0987654321"))
+    return contact
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SnapshotStorage:
+    """Provides a SnapshotStorage instance in a temporary directory."""
+    return SnapshotStorage(data_dir=tmp_path)
+
+
+@pytest.fixture
+def book(storage) -> SnapshotAddressBook:
+    """Saves 30 contacts and loads them back from the snapshot."""
+    source = AddressBook()
+    for i in range(30):
+        source.add_record(make_contact(i))
+    special = Contact(Name("Olena"), "id-special")
+    special.add_phone(Phone("5551234567"))
+    special.add_birthday(Birthday("29.02.1988"))
+    special.add_email(Email("olena@example.com"))
+    special.add_address(Address("12 Main Street, Kyiv"))
+    source.add_record(special)
+    storage.save(source, "contacts")
+    return storage.load("contacts")
+
+
+class TestSnapshotStorage:
+    """Tests for the memory-mapped address book snapshot."""
+
+    def test_properties(self, storage):
+        """Test the file_extension and storage_type properties."""
+        assert storage.file_extension == ".snap"
+        assert storage.storage_type == StorageType.SNAPSHOT
+
+    def test_load_missing_returns_default(self, storage):
+        """Test that loading a missing snapshot returns the default value."""
+        assert storage.load("missing") is None
+
+    def test_load_decodes_nothing_up_front(self, book):
+        """Test that a load only maps the file."""
+        assert isinstance(book, SnapshotAddressBook)
+        assert len(book) == 31
+        assert book.data == {}
+
+    def test_contact_is_decoded_on_access(self, book):
+        """Test that a lookup decodes and caches a single contact."""
+        contact = book["id-special"]
+
+        assert list(book.data) == ["id-special"]
+        assert contact.name.value == "Olena"
+        assert [phone.value for phone in contact.phones] == ["5551234567"]
+        assert contact.birthday.value == "29.02.1988"
+        assert contact.email.value == "olena@example.com"
+        assert contact.address.value == "12 Main Street, Kyiv"
+        assert book["id-special"] is contact
+
+    def test_id_index_lookups(self, book):
+        """Test membership and missing keys through the ID index."""
+        assert "id-000" in book
+        assert "id-029" in book
+        assert "id-999" not in book
+        assert book.find_by_id("id-999") is None
+        with pytest.raises(KeyError):
+            book["id-999"]
+
+    def test_decoded_strings_are_bounded(self, book, tmp_path):
+        """Test that lookups keep only recently decoded strings."""
+        reader = SnapshotReader(tmp_path / "contacts.snap", cache_size=4)
+        try:
+            assert len(list(reader.ids())) == 31
+            assert reader.find("id-017") is not None
+            assert len(reader._strings) == 4
+            assert reader.record(reader.find("id-special"))["name"] == "Olena"
+        finally:
+            reader.close()
+
+    def test_iteration_keeps_saved_order(self, book):
+        """Test that keys and values follow the saved order."""
+        keys = list(book)
+
+        assert keys[:3] == ["id-000", "id-001", "id-002"]
+        assert [contact.id for contact in book.values()] == keys
+
+    def test_search_and_find(self, book):
+        """Test that inherited lookups work over the lazy book."""
+        assert {c.id for c in book.find_all("Contact B")} == {"id-001", "id-027"}
+        assert [c.id for c in book.search("olena")] == ["id-special"]
+
+    def test_changes_are_visible_and_saved(self, storage, book):
+        """Test that pending changes merge with the snapshot and persist."""
+        book.add_record(make_contact(100))
+        book.delete_by_id("id-005")
+        book["id-006"].add_email(Email("six@example.com"))
+        book.mark_modified("id-006")
+
+        assert len(book) == 31
+        assert "id-005" not in book
+
+        storage.save(book, "contacts")
+        assert book.pending_changes().is_empty()
+        assert len(book) == 31
+        assert "id-100" in book
+
+        reloaded = storage.load("contacts")
+        assert "id-005" not in reloaded
+        assert reloaded["id-100"].name.value == "Contact W"
+        assert reloaded["id-006"].email.value == "six@example.com"
+
+    def test_lazy_book_cannot_be_pickled(self, book):
+        """Test that the mapped book refuses to pickle itself."""
+        with pytest.raises(TypeError, match="bound to its storage"):
+            pickle.dumps(book)
+
+    def test_corrupt_file_raises(self, storage, tmp_path):
+        """Test that a file without the snapshot header raises IOError."""
+        (tmp_path / "broken.snap").write_bytes(b"not a snapshot at all, clearly")
+
+        with pytest.raises(IOError, match="Failed to load data from broken.snap"):
+            storage.load("broken")
+
+    def test_truncated_file_raises(self, storage, book, tmp_path):
+        """Test that a snapshot cut short is rejected."""
+        data = (tmp_path / "contacts.snap").read_bytes()
+        (tmp_path / "cut.snap").write_bytes(data[:-4])
+
+        with pytest.raises(IOError, match="does not match its header"):
+            storage.load("cut")
+
+    def test_empty_book_round_trip(self, storage):
+        """Test that an empty book produces a readable snapshot."""
+        storage.save(AddressBook(), "empty")
+
+        loaded = storage.load("empty")
+
+        assert len(loaded) == 0
+        assert list(loaded.values()) == []
+
+
+class TestSnapshotDomainStorageAdapter:
+    """Tests for using snapshots through the DomainStorageAdapter."""
+
+    def test_contacts_round_trip(self, storage):
+        """Test that contacts are saved and loaded as a lazy book."""
+        adapter = DomainStorageAdapter(storage)
+        source = AddressBook()
+        source.add_record(make_contact(1))
+
+        saved = adapter.save_contacts(source, "contacts")
+        loaded, filename = adapter.load_contacts("contacts")
+
+        assert saved == filename == "contacts.snap"
+        assert isinstance(loaded, SnapshotAddressBook)
+        assert loaded["id-001"].phones[0].value == "1234567801"
+
+    def test_notes_are_not_supported(self, storage):
+        """Test that notes cannot be stored as an address book snapshot."""
+        adapter = DomainStorageAdapter(storage)
+
+        with pytest.raises(StorageException):
+            adapter.save_notes(Notebook(), "notes")
@@ -0,0 +1,215 @@
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, event, text
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.lazy_address_book import LazyAddressBook
+from src.domain.models.dbbase import DBBase
+from src.domain.value_objects.birthday import Birthday
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.storage.sqlite_address_book import SQLiteAddressBook
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+DB_NAME = "lazy.db"
+
+
+def make_contact(contact_id, name, phone, email=None, birthday=None) -> Contact:
+    contact = Contact(Name(name), contact_id)
+    contact.add_phone(Phone(phone))
+    if email:
+        contact.add_email(Email(email))
+    if birthday:
+        contact.add_birthday(Birthday(birthday))
+    return contact
+
+
+def birthday_in(days: int) -> str:
+    target = date.today() + timedelta(days=days)
+    # 1988 is a leap year, so Feb 29 is a valid birth date
+    return target.replace(year=1988).strftime("%d.%m.%Y")
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SQLiteStorage:
+    """Provides a SQLiteStorage with a saved address book."""
+    storage = SQLiteStorage(DBBase, data_dir=tmp_path)
+    book = AddressBook()
+    book.add_record(make_contact("c-1", "John", "1234567890", "john@example.com"))
+    book.add_record(make_contact("c-2", "Jane", "0987654321", birthday=birthday_in(3)))
+    book.add_record(make_contact("c-3", "John", "5556667777", birthday=birthday_in(40)))
+    storage.save(book, DB_NAME)
+    return storage
+
+
+@pytest.fixture
+def book(storage) -> SQLiteAddressBook:
+    """Loads the saved address book lazily."""
+    return storage.load(DB_NAME, lazy=True)
+
+
+class TestSQLiteAddressBook:
+    """Tests for the database-backed lazy AddressBook."""
+
+    def test_load_does_not_read_contacts(self, book):
+        """Test that a lazy load returns an empty cache."""
+        assert isinstance(book, SQLiteAddressBook)
+        assert book.data == {}
+        assert len(book) == 3
+
+    def test_lazy_book_is_abstract(self):
+        """Test that the storage hooks must be implemented by subclasses."""
+        with pytest.raises(TypeError):
+            LazyAddressBook()
+
+    def test_scans_do_not_cache_the_book(self, book):
+        """Test that full scans stream contacts instead of caching them."""
+        assert [c.id for c in book.values()] == ["c-1", "c-2", "c-3"]
+        assert len(book.find_all("JOHN", ignore_case=True)) == 2
+        assert [c.id for c in book.fuzzy_search("jhon@example.com")] == ["c-1"]
+        assert len(book.get_upcoming_birthdays(60)) == 2
+        assert book.data == {}
+
+    def test_cache_keeps_recent_contacts_only(self, storage):
+        """Test that the least recently used saved contact is evicted."""
+        book = SQLiteAddressBook(storage._session_factory, cache_size=2)
+        book.find_by_id("c-1")
+        book.find_by_id("c-2")
+        book.find_by_id("c-1")
+        book.find_by_id("c-3")
+
+        assert set(book.data) == {"c-1", "c-3"}
+
+    def test_edit_after_eviction_is_saved(self, storage):
+        """Test that a contact edited after leaving the cache is not lost."""
+        book = SQLiteAddressBook(storage._session_factory, cache_size=1)
+        book.mark_flushed(str(storage._db_path))
+        jane = book.find_by_id("c-2")
+        book.find_by_id("c-1")
+        assert "c-2" not in book.data
+
+        jane.name = Name("Joanna")
+        book.mark_modified(jane.id)
+        book.find_by_id("c-3")
+        assert book.find_by_id("c-2") is jane
+        storage.save(book, DB_NAME)
+
+        assert storage.load(DB_NAME).find("Joanna").id == "c-2"
+
+    def test_find_all_and_find_by_id(self, book):
+        """Test name and ID lookups run against the database."""
+        assert [c.id for c in book.find_all("John")] == ["c-1", "c-3"]
+        assert book.find("Jane").id == "c-2"
+        assert book.find_by_id("c-3").phones[0].value == "5556667777"
+        assert book.find_by_id("missing") is None
+        with pytest.raises(KeyError):
+            book.find("Nobody")
+
+    def test_find_ignoring_case(self, book):
+        """Test casefolded name lookups on a database-backed book."""
+        assert [c.id for c in book.find_all("JOHN", ignore_case=True)] == [
+            "c-1",
+            "c-3",
+        ]
+        assert book.find("jane", ignore_case=True).id == "c-2"
+
+    def test_lookups_return_the_same_instance(self, book):
+        """Test that loaded contacts are cached so edits are not lost."""
+        assert book.find("Jane") is book.find_by_id("c-2")
+
+    def test_find_by_phone(self, book):
+        """Test exact and suffix phone lookups run against the database."""
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", before_execute)
+        try:
+            assert [c.id for c in book.find_by_phone("0987654321")] == ["c-2"]
+            assert book.find_by_phone("654321") == []
+            assert [c.id for c in book.find_by_phone_suffix("7777")] == ["c-3"]
+            assert book.find_by_phone_suffix("%") == []
+        finally:
+            event.remove(Engine, "before_cursor_execute", before_execute)
+
+        assert sum("contact_phones.phone = ?" in s for s in statements) == 2
+        assert sum("contact_phones.phone LIKE" in s for s in statements) == 2
+
+    def test_unsaved_phones_are_found(self, book):
+        """Test that pending phone edits affect phone lookups."""
+        jane = book.find_by_id("c-2")
+        jane.edit_phone(Phone("0987654321"), Phone("0987657777"))
+        book.mark_modified(jane.id)
+
+        assert book.find_by_phone("0987654321") == []
+        assert [c.id for c in book.find_by_phone_suffix("7777")] == ["c-3", "c-2"]
+
+    def test_search(self, book):
+        """Test substring, exact and phone searches."""
+        assert [c.id for c in book.search("JOHN@")] == ["c-1"]
+        assert [c.id for c in book.search("7890")] == ["c-1"]
+        assert [c.id for c in book.search("Jane", exact=True)] == ["c-2"]
+        assert book.search("Jan", exact=True) == []
+
+    def test_fuzzy_search(self, book):
+        """Test misspelled queries rank the closest contacts first."""
+        assert [c.id for c in book.fuzzy_search("jhon@example.com")] == ["c-1"]
+        assert book.fuzzy_search("jo") == []
+
+    def test_upcoming_birthdays(self, book):
+        """Test that only contacts in the window are returned."""
+        names = [item["name"] for item in book.get_upcoming_birthdays(7)]
+        assert names == ["Jane"]
+        assert len(book.get_upcoming_birthdays(60)) == 2
+
+    def test_name_lookup_uses_index(self, storage):
+        """Test that the name filter is served by an index."""
+        with storage._engine.connect() as connection:
+            plan = connection.execute(
+                text("EXPLAIN QUERY PLAN SELECT id FROM contacts WHERE name = 'John'")
+            ).all()
+        assert any("ix_contacts_name" in row[-1] for row in plan)
+
+    def test_unsaved_changes_are_visible(self, book):
+        """Test that pending adds, edits and deletes affect query results."""
+        book.add_record(make_contact("c-4", "John", "1112223333"))
+        book.delete_by_id("c-1")
+        jane = book.find("Jane")
+        jane.name = Name("Joanna")
+        book.mark_modified(jane.id)
+
+        assert [c.id for c in book.find_all("John")] == ["c-3", "c-4"]
+        assert book.find_all("Jane") == []
+        assert [c.id for c in book.find_all("Joanna")] == ["c-2"]
+        assert len(book) == 3
+        assert book.get_ids() == {"c-2", "c-3", "c-4"}
+
+    def test_save_writes_changes(self, storage, book):
+        """Test that saving a lazy book persists only pending changes."""
+        book.add_record(make_contact("c-4", "Alex", "1112223333"))
+        book.delete_by_id("c-1")
+        storage.save(book, DB_NAME)
+
+        reloaded = storage.load(DB_NAME)
+        assert set(reloaded.keys()) == {"c-2", "c-3", "c-4"}
+
+    def test_first_access_loads_single_contact(self, book):
+        """Test that a lookup by ID reads only the requested contact."""
+        statements = []
+
+        def before_execute(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", before_execute)
+        try:
+            book.find_by_id("c-2")
+        finally:
+            event.remove(Engine, "before_cursor_execute", before_execute)
+
+        assert list(book.data) == ["c-2"]
+        assert len(statements) == 2
@@ -0,0 +1,117 @@
+from pathlib import Path
+
+import pytest
+
+from src.config.storage_config import StorageConfig
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.models.dbbase import DBBase
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.domain.value_objects.tag import Tag
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+DB_NAME = "test_bulk.db"
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SQLiteStorage:
+    """Provides a SQLiteStorage instance in a temporary directory."""
+    return SQLiteStorage(DBBase, data_dir=tmp_path)
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    """Forces several batches for a handful of records."""
+    monkeypatch.setattr(StorageConfig, "SQLITE_BULK_BATCH_SIZE", 2)
+
+
+def make_contacts(count: int) -> list[Contact]:
+    contacts = []
+    for i in range(count):
+        contact = Contact(Name(f"Contact {chr(ord('A') + i)}"), f"id-{i}")
+        contact.add_phone(Phone(f"12345678{i:02d}"))
+        contacts.append(contact)
+    return contacts
+
+
+class TestSQLiteBulkSave:
+    """Tests for the batched Core insert path of SQLiteStorage."""
+
+    def test_bulk_save_contacts_across_batches(self, storage, small_batches):
+        """Test that every contact and phone is written when batches split."""
+        saved = storage.bulk_save_contacts(DB_NAME, make_contacts(5))
+
+        loaded = storage.load(DB_NAME)
+        assert saved == 5
+        assert len(loaded) == 5
+        assert loaded["id-4"].phones[0].value == "1234567804"
+
+    def test_bulk_save_contacts_upserts_existing(self, storage):
+        """Test that saving an existing ID replaces its fields and phones."""
+        storage.bulk_save_contacts(DB_NAME, make_contacts(2))
+        updated = Contact(Name("Renamed"), "id-1")
+        updated.add_phone(Phone("0987654321"))
+
+        storage.bulk_save_contacts(DB_NAME, [updated])
+
+        loaded = storage.load(DB_NAME)
+        assert len(loaded) == 2
+        assert loaded["id-1"].name.value == "Renamed"
+        assert [phone.value for phone in loaded["id-1"].phones] == ["0987654321"]
+        assert storage.find_contact_ids_by_phone("1234567801") == []
+
+    def test_bulk_save_notes(self, storage, small_batches):
+        """Test that notes and their tags are saved in batches."""
+        notes = []
+        for i in range(3):
+            note = Note(f"Title {i}", f"Text {i}", f"note-{i}")
+            note.add_tag(Tag(f"tag{i}"))
+            notes.append(note)
+
+        saved = storage.bulk_save_notes(DB_NAME, notes)
+
+        loaded = storage.load_notes(DB_NAME)
+        assert saved == 3
+        assert set(loaded.keys()) == {"note-0", "note-1", "note-2"}
+        assert storage.find_note_ids_by_tag("tag2") == ["note-2"]
+
+    def test_full_save_deletes_missing_in_chunks(self, storage, small_batches):
+        """Test that a full save removes stale rows and their phones."""
+        storage.bulk_save_contacts(DB_NAME, make_contacts(5))
+        loaded = storage.load(DB_NAME)
+        book = type(loaded)()
+        book.add_record(loaded["id-0"])
+
+        storage.save(book, DB_NAME)
+
+        assert set(storage.load(DB_NAME).keys()) == {"id-0"}
+        assert storage.find_contact_ids_by_phone("1234567803") == []
+
+
+class TestSQLiteStreamingRead:
+    """Tests for the keyset-paginated reads of SQLiteStorage."""
+
+    def test_iter_contacts_across_pages(self, storage):
+        """Test that every contact is yielded once, in ID order."""
+        storage.bulk_save_contacts(DB_NAME, make_contacts(7))
+
+        contacts = list(storage.iter_contacts(DB_NAME, batch_size=3))
+
+        assert [c.id for c in contacts] == [f"id-{i}" for i in range(7)]
+        assert contacts[6].phones[0].value == "1234567806"
+
+    def test_iter_notes(self, storage):
+        """Test that notes are streamed with their tags."""
+        note = Note("Title", "Text", "n1")
+        note.add_tag(Tag("work"))
+        storage.bulk_save_notes(DB_NAME, [note])
+
+        notes = list(storage.iter_notes(DB_NAME, batch_size=1))
+
+        assert [n.id for n in notes] == ["n1"]
+        assert [t.value for t in notes[0].tags] == ["work"]
+
+    def test_iter_empty_database(self, storage):
+        """Test that an empty database yields nothing."""
+        assert list(storage.iter_contacts(DB_NAME)) == []
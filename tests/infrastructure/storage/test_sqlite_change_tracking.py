@@ -0,0 +1,158 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, event
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.models.dbbase import DBBase
+from src.domain.notebook import Notebook
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+DB_NAME = "test_tracking.db"
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SQLiteStorage:
+    """Provides a SQLiteStorage instance in a temporary directory."""
+    return SQLiteStorage(DBBase, data_dir=tmp_path)
+
+
+def make_book(count: int) -> AddressBook:
+    book = AddressBook()
+    for i in range(count):
+        contact = Contact(Name(f"Contact {chr(ord('A') + i)}"), f"id-{i}")
+        contact.add_phone(Phone(f"12345678{i:02d}"))
+        book.add_record(contact)
+    return book
+
+
+def count_writes(action) -> list[tuple[str, str]]:
+    statements: list[tuple[str, str]] = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if "sqlite_sequence" in statement:
+            # Locks the change log for the save; writes no record
+            return
+        if statement.lstrip().upper().startswith(("INSERT", "UPDATE", "DELETE")):
+            statements.append((statement, str(parameters)))
+
+    event.listen(Engine, "before_cursor_execute", before_execute)
+    try:
+        action()
+    finally:
+        event.remove(Engine, "before_cursor_execute", before_execute)
+    return statements
+
+
+class TestSQLiteIncrementalSave:
+    """Tests for saving only changed records to SQLite."""
+
+    def test_first_save_writes_whole_book(self, storage):
+        """Test that a book never flushed to the database is saved fully."""
+        book = make_book(3)
+        storage.save(book, DB_NAME)
+
+        loaded = storage.load(DB_NAME)
+        assert set(loaded.keys()) == {"id-0", "id-1", "id-2"}
+        assert book.pending_changes().is_empty()
+
+    def test_save_after_load_writes_only_changes(self, storage):
+        """Test that unchanged rows are not touched after a load."""
+        storage.save(make_book(5), DB_NAME)
+        book = storage.load(DB_NAME)
+
+        contact = book.find_by_id("id-2")
+        contact.add_phone(Phone("5555555555"))
+        book.mark_modified(contact.id)
+        book.delete_by_id("id-4")
+
+        writes = count_writes(lambda: storage.save(book, DB_NAME))
+
+        assert len(writes) == 5
+        assert all("id-2" in params or "id-4" in params for _, params in writes)
+        reloaded = storage.load(DB_NAME)
+        assert "id-4" not in reloaded
+        assert [p.value for p in reloaded["id-2"].phones] == [
+            "1234567802",
+            "5555555555",
+        ]
+
+    def test_save_without_changes_writes_nothing(self, storage):
+        """Test that saving an unchanged book issues no writes."""
+        storage.save(make_book(3), DB_NAME)
+        book = storage.load(DB_NAME)
+
+        writes = count_writes(lambda: storage.save(book, DB_NAME))
+
+        assert writes == []
+
+    def test_notebook_changes_are_saved(self, storage):
+        """Test incremental saving of notes."""
+        notebook = Notebook()
+        notebook["n-1"] = Note("First", "First text", "n-1")
+        notebook["n-2"] = Note("Second", "Second text", "n-2")
+        storage.save(notebook, DB_NAME)
+
+        notebook["n-1"].edit_text("Edited text")
+        notebook.mark_modified("n-1")
+        del notebook["n-2"]
+        notebook["n-3"] = Note("Third", "Third text", "n-3")
+        storage.save(notebook, DB_NAME)
+
+        reloaded = storage.load_notes(DB_NAME)
+        assert set(reloaded.keys()) == {"n-1", "n-3"}
+        assert reloaded["n-1"].text == "Edited text"
+
+
+class TestSQLiteChangedIds:
+    """Tests for finding records other writers changed in the database."""
+
+    def test_unknown_before_first_load(self, storage):
+        """Test that a table never loaded or saved has no known changes."""
+        assert storage.changed_ids(DB_NAME, "contacts") is None
+
+    def test_own_saves_are_not_reported(self, storage):
+        """Test that a storage skips the rows it wrote itself."""
+        storage.save(make_book(3), DB_NAME)
+        book = storage.load(DB_NAME)
+        book.delete_by_id("id-1")
+        storage.save(book, DB_NAME)
+
+        assert storage.changed_ids(DB_NAME, "contacts") == set()
+
+    def test_other_writers_changes_are_reported_once(self, storage, tmp_path):
+        """Test that saves through another storage are reported by ID."""
+        storage.save(make_book(3), DB_NAME)
+        storage.load(DB_NAME)
+        storage.load_notes(DB_NAME)
+        other = SQLiteStorage(DBBase, data_dir=tmp_path)
+        book = other.load(DB_NAME)
+        book["id-0"].add_phone(Phone("5555555555"))
+        book.mark_modified("id-0")
+        book.delete_by_id("id-2")
+        other.save(book, DB_NAME)
+
+        assert storage.changed_ids(DB_NAME, "contacts") == {"id-0", "id-2"}
+        assert storage.changed_ids(DB_NAME, "contacts") == set()
+        assert storage.changed_ids(DB_NAME, "notes") == set()
+
+    def test_edits_outside_the_app_are_reported(self, storage, tmp_path):
+        """Test that triggers log a phone row changed by another tool."""
+        storage.save(make_book(2), DB_NAME)
+        storage.load(DB_NAME)
+        with sqlite3.connect(tmp_path / DB_NAME) as connection:
+            connection.execute(
+                "UPDATE contact_phones SET phone = '5555555555' "
+                "WHERE contact_id = 'id-1'"
+            )
+
+        changed = storage.changed_ids(DB_NAME, "contacts")
+
+        assert changed == {"id-1"}
+        found = storage.load_by_ids(DB_NAME, "contacts", changed)
+        assert [p.value for p in found["id-1"].phones] == ["5555555555"]
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+from src.domain.address_book import AddressBook
+from src.domain.models.dbbase import DBBase
+from src.infrastructure.storage.sqlite_engine_registry import SQLiteEngineRegistry
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+
+class TestSQLiteEngineRegistry:
+    """Tests for the per-database-path engine registry."""
+
+    def test_same_path_returns_same_engine(self, tmp_path: Path):
+        """Test that the engine and session factory are reused for a path."""
+        db_path = tmp_path / "registry.db"
+        first = SQLiteEngineRegistry.get(db_path, DBBase)
+        second = SQLiteEngineRegistry.get(db_path, DBBase)
+        assert first[0] is second[0]
+        assert first[1] is second[1]
+
+    def test_different_paths_get_different_engines(self, tmp_path: Path):
+        """Test that each database path has its own engine."""
+        first, _ = SQLiteEngineRegistry.get(tmp_path / "one.db", DBBase)
+        second, _ = SQLiteEngineRegistry.get(tmp_path / "two.db", DBBase)
+        assert first is not second
+
+    def test_dispose_drops_cached_engine(self, tmp_path: Path):
+        """Test that a disposed path gets a fresh engine on next access."""
+        db_path = tmp_path / "dispose.db"
+        engine, _ = SQLiteEngineRegistry.get(db_path, DBBase)
+        SQLiteEngineRegistry.dispose(db_path)
+        new_engine, _ = SQLiteEngineRegistry.get(db_path, DBBase)
+        assert new_engine is not engine
+
+    def test_storages_share_engine_across_saves(self, tmp_path: Path):
+        """Test that repeated saves and loads reuse one engine."""
+        storage = SQLiteStorage(DBBase, data_dir=tmp_path)
+        storage.save(AddressBook(), "shared.db")
+        engine = storage._engine
+
+        storage.save(AddressBook(), "shared.db")
+        other = SQLiteStorage(DBBase, data_dir=tmp_path)
+        other.load("shared.db")
+
+        assert storage._engine is engine
+        assert other._engine is engine
@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import pytest
+
+from src.application.services.note_service import NoteService
+from src.domain.entities.note import Note
+from src.domain.models.dbbase import DBBase
+from src.domain.notebook import Notebook
+from src.infrastructure.persistence.data_path_resolver import (
+    DEFAULT_ADDRESS_BOOK_DATABASE_NAME,
+)
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+DB_NAME = DEFAULT_ADDRESS_BOOK_DATABASE_NAME
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> SQLiteStorage:
+    """Provides a SQLiteStorage with a few saved notes."""
+    storage = SQLiteStorage(DBBase, data_dir=tmp_path)
+    notebook = Notebook()
+    notebook["n-1"] = Note("Python basics", "Learning python programming", "n-1")
+    notebook["n-2"] = Note("Groceries", "Buy milk and bread", "n-2")
+    notebook["n-3"] = Note(
+        "Python testing", "Testing python code with pytest and python mocks", "n-3"
+    )
+    storage.save(notebook, DB_NAME)
+    return storage
+
+
+class TestSQLiteFullTextSearch:
+    """Tests for the FTS5 trigram index over notes."""
+
+    def test_substring_match_on_text(self, storage):
+        """Test that queries match anywhere inside a word, ignoring case."""
+        assert storage.search_note_ids(DB_NAME, "ILK", "text") == ["n-2"]
+        assert set(storage.search_note_ids(DB_NAME, "ogram", "text")) == {"n-1"}
+
+    def test_query_is_one_substring(self, storage):
+        """Test that a multi-word query matches as a whole, like the scan."""
+        assert storage.search_note_ids(DB_NAME, "python code", "text") == ["n-3"]
+        assert storage.search_note_ids(DB_NAME, "python pytest", "text") == []
+
+    def test_results_are_ranked(self, storage):
+        """Test that notes with more hits rank first."""
+        assert storage.search_note_ids(DB_NAME, "python", "text") == ["n-3", "n-1"]
+
+    def test_title_column(self, storage):
+        """Test searching titles only."""
+        assert storage.search_note_ids(DB_NAME, "roc", "title") == ["n-2"]
+        assert storage.search_note_ids(DB_NAME, "milk", "title") == []
+
+    def test_index_follows_updates_and_deletes(self, storage):
+        """Test that triggers keep the index in sync with the notes table."""
+        notebook = storage.load_notes(DB_NAME)
+        notebook["n-2"].edit_text("Buy cheese")
+        notebook.mark_modified("n-2")
+        del notebook["n-1"]
+        storage.save(notebook, DB_NAME)
+
+        assert storage.search_note_ids(DB_NAME, "milk", "text") == []
+        assert storage.search_note_ids(DB_NAME, "cheese", "text") == ["n-2"]
+        assert storage.search_note_ids(DB_NAME, "programming", "text") == []
+
+    def test_short_query_returns_none(self, storage):
+        """Test that queries under three characters fall back to scanning."""
+        assert storage.search_note_ids(DB_NAME, "py", "text") is None
+
+    def test_quotes_in_query(self, storage):
+        """Test that double quotes are matched literally."""
+        assert storage.search_note_ids(DB_NAME, 'say "hi"', "text") == []
+
+
+class TestNoteServiceFullTextSearch:
+    """Tests for NoteService searches backed by the full-text index."""
+
+    @pytest.fixture
+    def service(self, storage):
+        service = NoteService(storage)
+        service.load_notes()
+        return service
+
+    def test_search_by_content_uses_index(self, service):
+        """Test that content search returns ranked notes."""
+        results = service.search_notes_by_content("python")
+        assert [note.id for note in results] == ["n-3", "n-1"]
+
+    def test_search_by_title_uses_index(self, service):
+        """Test that title search returns matching notes."""
+        results = service.search_notes_by_title("testing")
+        assert [note.id for note in results] == ["n-3"]
+
+    def test_unsaved_edits_are_included(self, service):
+        """Test that notes changed since the last save are checked in memory."""
+        note_id = service.add_note("Recipes", "Python shaped cookies")
+        service.edit_note("n-1", "Learning rust")
+
+        results = service.search_notes_by_content("python")
+
+        assert {note.id for note in results} == {"n-3", note_id}
+
+    def test_saved_and_unsaved_notes_match_alike(self, service):
+        """Test that results do not change when a note gets saved."""
+        note_id = service.add_note("Shopping", "buy oat milk")
+        before = [note.id for note in service.search_notes_by_content("ilk")]
+        service.save_notes()
+        after = [note.id for note in service.search_notes_by_content("ilk")]
+
+        assert set(before) == set(after) == {"n-2", note_id}
+
+    def test_title_search_ignores_case(self, service):
+        """Test that title search folds case when scanning and when indexed."""
+        assert [n.id for n in service.search_notes_by_title("PYTHON T")] == ["n-3"]
+        assert [n.id for n in service.search_notes_by_title("Py")] == ["n-1", "n-3"]
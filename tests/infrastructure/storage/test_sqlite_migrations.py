@@ -0,0 +1,130 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from src.config import StorageConfig
+from src.domain.models.dbbase import DBBase
+from src.infrastructure.storage.sqlite_engine_registry import SQLiteEngineRegistry
+from src.infrastructure.storage.sqlite_migrations import SQLiteSchemaMigrator
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+DB_NAME = "legacy.db"
+
+
+@pytest.fixture
+def legacy_db(tmp_path: Path) -> Path:
+    """Creates a database file with the comma-separated v1 schema."""
+    db_path = tmp_path / DB_NAME
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE contacts (id VARCHAR PRIMARY KEY, name VARCHAR NOT NULL, "
+            "birthday VARCHAR, phones VARCHAR, email VARCHAR, address VARCHAR)"
+        )
+        connection.execute(
+            "CREATE TABLE notes (id VARCHAR PRIMARY KEY, title VARCHAR NOT NULL, "
+            "text VARCHAR NOT NULL, tags VARCHAR)"
+        )
+        connection.executemany(
+            "INSERT INTO contacts (id, name, phones) VALUES (?, ?, ?)",
+            [
+                ("c-1", "John", "1234567890,0987654321"),
+                ("c-2", "Jane", "+380501234567"),
+                ("c-3", "Alex", None),
+                ("c-4", "Mary", "1112223333"),
+            ],
+        )
+        connection.executemany(
+            "INSERT INTO notes (id, title, text, tags) VALUES (?, ?, ?, ?)",
+            [
+                ("n-1", "First", "First text", "work, Python"),
+                ("n-2", "Second", "Second text", None),
+            ],
+        )
+    yield db_path
+    SQLiteEngineRegistry.dispose(db_path)
+
+
+class TestSQLiteSchemaMigrator:
+    """Tests for migrating legacy SQLite files to the normalized schema."""
+
+    def test_legacy_file_is_migrated_on_load(self, tmp_path, legacy_db):
+        """Test that phones and tags are readable after migration."""
+        storage = SQLiteStorage(DBBase, data_dir=tmp_path)
+
+        book = storage.load(DB_NAME)
+        notes = storage.load_notes(DB_NAME)
+
+        assert [p.value for p in book["c-1"].phones] == ["1234567890", "0987654321"]
+        assert [p.value for p in book["c-2"].phones] == ["380501234567"]
+        assert book["c-3"].phones == []
+        assert [t.value for t in notes["n-1"].tags] == ["work", "Python"]
+        assert notes["n-2"].tags == []
+
+    def test_migration_runs_in_batches_and_sets_version(self, legacy_db):
+        """Test that small batches migrate every row and bump the version."""
+        engine, _ = SQLiteEngineRegistry.get(legacy_db, DBBase)
+        with engine.begin() as connection:
+            connection.execute(text("PRAGMA user_version = 0"))
+            connection.execute(
+                text("UPDATE contacts SET phones = '5556667777' WHERE id = 'c-3'")
+            )
+
+        SQLiteSchemaMigrator.upgrade(engine, batch_size=1)
+
+        with engine.connect() as connection:
+            assert (
+                SQLiteSchemaMigrator.get_version(connection)
+                == StorageConfig.SQLITE_SCHEMA_VERSION
+            )
+            remaining = connection.execute(
+                text("SELECT COUNT(*) FROM contacts WHERE phones IS NOT NULL")
+            ).scalar()
+            phones = connection.execute(
+                text("SELECT phone FROM contact_phones WHERE contact_id = 'c-3'")
+            ).scalars().all()
+        assert remaining == 0
+        assert phones == ["5556667777"]
+
+    def test_phone_and_tag_lookups_use_indexes(self, tmp_path, legacy_db):
+        """Test indexed lookups by normalized phone and case-insensitive tag."""
+        storage = SQLiteStorage(DBBase, data_dir=tmp_path)
+        storage.initialize(DB_NAME)
+
+        assert storage.find_contact_ids_by_phone("0987654321") == ["c-1"]
+        assert storage.find_note_ids_by_tag("python") == ["n-1"]
+
+        with storage._engine.connect() as connection:
+            plan = connection.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT contact_id FROM contact_phones "
+                    "WHERE phone = '0987654321'"
+                )
+            ).all()
+        assert any("ix_contact_phones_phone" in row[-1] for row in plan)
+
+    def test_word_index_is_rebuilt_over_trigrams(self, legacy_db):
+        """Test that a v4 word-tokenized notes index becomes a trigram index."""
+        engine, _ = SQLiteEngineRegistry.get(legacy_db, DBBase)
+        SQLiteSchemaMigrator.upgrade(engine)
+        with engine.begin() as connection:
+            connection.execute(text("DROP TABLE notes_fts"))
+            connection.execute(
+                text(
+                    "CREATE VIRTUAL TABLE notes_fts USING fts5(title, text, "
+                    "content='notes', content_rowid='rowid', tokenize='unicode61')"
+                )
+            )
+            connection.execute(text("PRAGMA user_version = 4"))
+
+        SQLiteSchemaMigrator.upgrade(engine)
+
+        with engine.connect() as connection:
+            ids = connection.execute(
+                text(
+                    "SELECT notes.id FROM notes_fts JOIN notes "
+                    "ON notes.rowid = notes_fts.rowid WHERE notes_fts MATCH '\"econ\"'"
+                )
+            ).scalars().all()
+        assert ids == ["n-2"]
@@ -0,0 +1,90 @@
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.models.dbbase import DBBase
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.storage.sqlite_engine_registry import SQLiteEngineRegistry
+from src.infrastructure.storage.sqlite_profile import SQLiteProfile
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+
+def read_pragma(engine, name: str):
+    with engine.connect() as connection:
+        return connection.execute(text(f"PRAGMA {name}")).scalar()
+
+
+class TestSQLiteProfile:
+    """Tests for SQLite performance profiles."""
+
+    def test_from_string(self):
+        """Test looking up profiles by name."""
+        assert SQLiteProfile.from_string("fast") is SQLiteProfile.FAST
+        with pytest.raises(ValueError, match="Unknown SQLite profile"):
+            SQLiteProfile.from_string("turbo")
+
+    @pytest.mark.parametrize(
+        "profile, journal_mode, synchronous",
+        [
+            (SQLiteProfile.COMPATIBLE, "delete", 2),
+            (SQLiteProfile.BALANCED, "wal", 1),
+            (SQLiteProfile.FAST, "wal", 0),
+        ],
+    )
+    def test_pragmas_are_applied_on_connect(
+        self, tmp_path: Path, profile, journal_mode, synchronous
+    ):
+        """Test that every pooled connection gets the profile pragmas."""
+        engine, _ = SQLiteEngineRegistry.get(tmp_path / "profile.db", DBBase, profile)
+        assert read_pragma(engine, "journal_mode") == journal_mode
+        assert read_pragma(engine, "synchronous") == synchronous
+        assert read_pragma(engine, "cache_size") == profile.value.cache_size
+        assert SQLiteEngineRegistry.get_profile(tmp_path / "profile.db") is profile
+
+    def test_reader_does_not_block_writer_in_wal(self, tmp_path: Path):
+        """Test that an open read transaction does not stop a save."""
+        storage = SQLiteStorage(DBBase, tmp_path, profile=SQLiteProfile.BALANCED)
+        book = AddressBook()
+        contact = Contact(Name("John"), "c-1")
+        contact.add_phone(Phone("1234567890"))
+        book.add_record(contact)
+        storage.save(book, "wal.db")
+
+        reader = sqlite3.connect(tmp_path / "wal.db", timeout=0)
+        try:
+            reader.execute("BEGIN")
+            reader.execute("SELECT * FROM contacts").fetchall()
+
+            contact.add_phone(Phone("0987654321"))
+            book.mark_modified(contact.id)
+            storage.save(book, "wal.db")
+        finally:
+            reader.close()
+
+        assert len(storage.load("wal.db")["c-1"].phones) == 2
+
+    def test_checkpoint_runs_only_when_due(self, tmp_path: Path, monkeypatch):
+        """Test that WAL checkpoints honour the profile interval."""
+        db_path = tmp_path / "checkpoint.db"
+        SQLiteEngineRegistry.get(db_path, DBBase, SQLiteProfile.BALANCED)
+        assert SQLiteEngineRegistry.checkpoint_if_due(db_path) is False
+
+        monkeypatch.setitem(
+            SQLiteEngineRegistry._last_checkpoint, str(db_path.resolve()), 0.0
+        )
+        assert SQLiteEngineRegistry.checkpoint_if_due(db_path) is True
+        assert SQLiteEngineRegistry.checkpoint_if_due(db_path) is False
+
+    def test_no_checkpoint_without_wal(self, tmp_path: Path, monkeypatch):
+        """Test that rollback-journal databases are never checkpointed."""
+        db_path = tmp_path / "journal.db"
+        SQLiteEngineRegistry.get(db_path, DBBase, SQLiteProfile.COMPATIBLE)
+        monkeypatch.setitem(
+            SQLiteEngineRegistry._last_checkpoint, str(db_path.resolve()), 0.0
+        )
+        assert SQLiteEngineRegistry.checkpoint_if_due(db_path) is False
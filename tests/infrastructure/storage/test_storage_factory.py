@@ -6,18 +6,52 @@ from src.infrastructure.storage.storage_factory import StorageFactory
 
 # Mocked dependencies, which will be replaced by conftest.py
 from src.infrastructure.storage.storage_type import StorageType
+from src.infrastructure.storage.dbm_storage import DbmStorage
 from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.jsonl_storage import JsonlStorage
 from src.infrastructure.storage.pickle_storage import PickleStorage
+from src.infrastructure.storage.sharded_json_storage import ShardedJsonStorage
+from src.infrastructure.storage.snapshot_storage import SnapshotStorage
 from src.infrastructure.storage.sqlite_storage import SQLiteStorage
 from tests.infrastructure.storage.mock_storage_type import MockStorageType
 
 
+@pytest.fixture
+def in_tmp_path(tmp_path, monkeypatch):
+    """Runs the test from tmp_path, since a storage creates its data directory."""
+    monkeypatch.chdir(tmp_path)
+
+
 def test_create_storage_json():
     """Tests that creating a JSON storage returns the correct type."""
     storage = StorageFactory.create_storage(StorageType.JSON)
     assert isinstance(storage, JsonStorage)
 
 
+def test_create_storage_jsonl():
+    """Tests that creating a JSONL storage returns the correct type."""
+    storage = StorageFactory.create_storage(StorageType.JSONL)
+    assert isinstance(storage, JsonlStorage)
+
+
+def test_create_storage_json_sharded():
+    """Tests that creating a JSON_SHARDED storage returns the correct type."""
+    storage = StorageFactory.create_storage(StorageType.JSON_SHARDED)
+    assert isinstance(storage, ShardedJsonStorage)
+
+
+def test_create_storage_snapshot():
+    """Tests that creating a SNAPSHOT storage returns the correct type."""
+    storage = StorageFactory.create_storage(StorageType.SNAPSHOT)
+    assert isinstance(storage, SnapshotStorage)
+
+
+def test_create_storage_dbm():
+    """Tests that creating a DBM storage returns the correct type."""
+    storage = StorageFactory.create_storage(StorageType.DBM)
+    assert isinstance(storage, DbmStorage)
+
+
 def test_create_storage_pickle():
     """Tests that creating a PICKLE storage returns the correct type."""
     storage = StorageFactory.create_storage(StorageType.PICKLE)
@@ -46,6 +80,10 @@ def test_create_storage_with_unsupported_type():
     "filepath, expected_type",
     [
         ("data.json", JsonStorage),
+        ("data.jsonl", JsonlStorage),
+        ("data.shards", ShardedJsonStorage),
+        ("data.snap", SnapshotStorage),
+        ("data.dbm", DbmStorage),
         ("data.pkl", PickleStorage),
         ("data.pickle", PickleStorage),
         ("database.db", SQLiteStorage),
@@ -53,18 +91,39 @@ def test_create_storage_with_unsupported_type():
         ("database.sqlite3", SQLiteStorage),
     ],
 )
-def test_get_storage_by_extension(filepath, expected_type):
+def test_get_storage_by_extension(filepath, expected_type, in_tmp_path):
     """Tests getting the correct storage type based on file extension."""
     storage = StorageFactory.get_storage(filepath)
     assert isinstance(storage, expected_type)
 
 
+@pytest.mark.parametrize(
+    "filepath, expected_type, suffix",
+    [
+        ("data.json.gz", JsonStorage, ".json.gz"),
+        ("data.json.xz", JsonStorage, ".json.xz"),
+        ("data.pkl.bz2", PickleStorage, ".pkl.bz2"),
+    ],
+)
+def test_get_storage_with_compression(filepath, expected_type, suffix, in_tmp_path):
+    """Tests that a codec suffix selects a compressed JSON or pickle storage."""
+    storage = StorageFactory.get_storage(filepath)
+    assert isinstance(storage, expected_type)
+    assert storage.file_extension == suffix
+
+
+def test_get_storage_rejects_compressed_unsupported_type():
+    """Tests that only JSON and pickle files can be compressed."""
+    with pytest.raises(ValueError, match="Only .json, .pkl files are allowed"):
+        StorageFactory.get_storage("database.db.gz")
+
+
 def test_get_storage_with_unsupported_extension():
     """Tests that a ValueError is raised for an unsupported file extension."""
     filepath = "document.txt"
     with pytest.raises(
         ValueError,
-        match="Only .pkl, .pickle, .json, .db, .sqlite, .sqlite3 files are allowed",
+        match="Only .pkl, .pickle, .json, .jsonl, .shards, .snap, .dbm, .db, .sqlite, .sqlite3 files are allowed",
     ):
         StorageFactory.get_storage(filepath)
 
@@ -74,3 +133,23 @@ def test_get_storage_with_empty_filepath():
     empty_path = ""
     with pytest.raises(ValueError, match="Filename must be a non-empty string"):
         StorageFactory.get_storage(empty_path)
+
+
+def test_create_storage_in_data_dir(tmp_path):
+    """Tests that create_storage places the storage in the given directory."""
+    storage = StorageFactory.create_storage(StorageType.JSON, tmp_path)
+    assert storage.resolver.data_dir == tmp_path
+
+
+@pytest.mark.parametrize(
+    "filename, expected",
+    [
+        ("book.json", StorageType.JSON),
+        ("BOOK.PKL", StorageType.PICKLE),
+        ("book.sqlite3", StorageType.SQLITE),
+        ("book.dbm", StorageType.DBM),
+    ],
+)
+def test_storage_type_for(filename, expected):
+    """Tests mapping a file extension to its storage type."""
+    assert StorageFactory.storage_type_for(filename) == expected
@@ -0,0 +1,39 @@
+import time
+from pathlib import Path
+
+from src.infrastructure.backup.backup_store import BackupStore
+from src.infrastructure.storage.json_storage import JsonStorage
+from tests.performance.test_trusted_load_benchmark import make_records
+
+CONTACTS = 20_000
+
+
+def timed_backup(store: BackupStore, data_dir: Path):
+    started = time.perf_counter()
+    report = store.backup(data_dir)
+    return report, time.perf_counter() - started
+
+
+def test_incremental_backup_cost(tmp_path: Path):
+    """Compares a first backup with one taken after a single contact changed."""
+    data_dir = tmp_path / "data"
+    records = make_records(CONTACTS)
+    JsonStorage(data_dir).save(records, "addressbook")
+    store = BackupStore(tmp_path / "backups")
+
+    first, first_seconds = timed_backup(store, data_dir)
+    records[CONTACTS // 2]["email"] = "changed@example.com"
+    JsonStorage(data_dir).save(records, "addressbook")
+    second, second_seconds = timed_backup(store, data_dir)
+
+    print()
+    print(f"{'backup':<12}{'total KB':>10}{'stored KB':>11}{'chunks':>8}{'s':>8}")
+    for name, report, seconds in (
+        ("FULL", first, first_seconds),
+        ("INCREMENTAL", second, second_seconds),
+    ):
+        print(
+            f"{name:<12}{report.total_bytes / 1024:>10.0f}"
+            f"{report.new_bytes / 1024:>11.0f}{report.new_chunks:>8}{seconds:>8.2f}"
+        )
+    assert second.new_bytes < first.new_bytes / 10
@@ -0,0 +1,43 @@
+import random
+import time
+from datetime import date, timedelta
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.birthday import Birthday
+from src.domain.value_objects.name import Name
+
+CONTACTS = 100_000
+QUERIES = 20
+
+
+def test_upcoming_birthdays_speed():
+    """Compares the birthday index with parsing every contact's birthday."""
+    rng = random.Random(7)
+    book = AddressBook()
+    start = date(1960, 1, 1)
+    for i in range(CONTACTS):
+        contact = Contact(Name.from_trusted("Contact"), f"c-{i}")
+        birthday = start + timedelta(days=rng.randrange(365 * 40))
+        contact.birthday = Birthday.from_trusted(birthday.strftime("%d.%m.%Y"))
+        book.add_record(contact)
+
+    started = time.perf_counter()
+    book.get_upcoming_birthdays(0)
+    built = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(QUERIES):
+        indexed = book.get_upcoming_birthdays(7)
+    indexed_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned = book._collect_upcoming_birthdays(book.data.values(), 7)
+    scan_seconds = time.perf_counter() - started
+
+    print()
+    print(f"{'BUILD':<10}{built * 1000:>10.1f} ms once")
+    print(f"{'SCAN':<10}{scan_seconds * 1000:>10.3f} ms per query")
+    print(f"{'INDEX':<10}{indexed_seconds * 1000 / QUERIES:>10.3f} ms per query")
+    assert indexed == scanned
+    assert indexed_seconds * 10 < scan_seconds * QUERIES
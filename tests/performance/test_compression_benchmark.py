@@ -0,0 +1,56 @@
+import time
+from pathlib import Path
+
+from src.infrastructure.storage.compression import CODECS
+from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.pickle_storage import PickleStorage
+
+CONTACTS = 20_000
+
+
+def make_records(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"c-{i}",
+            "name": f"Contact {chr(ord('A') + i % 26)}",
+            "phones": [f"{1000000000 + i}"],
+            "email": f"contact{i}@example.com",
+            "birthday": None,
+            "address": "12 Main Street",
+        }
+        for i in range(count)
+    ]
+
+
+def measure(storage, records: list[dict]) -> tuple[int, float, float]:
+    started = time.perf_counter()
+    filename = storage.save(records, "benchmark")
+    saved = time.perf_counter() - started
+
+    started = time.perf_counter()
+    assert storage.load("benchmark") == records
+    loaded = time.perf_counter() - started
+
+    return (storage.resolver.data_dir / filename).stat().st_size, saved, loaded
+
+
+def test_compression_size_and_speed(tmp_path: Path):
+    """Compares file size, save time and load time for each codec."""
+    records = make_records(CONTACTS)
+    codecs = {"none": None, **{codec.name: codec for codec in CODECS.values()}}
+
+    print()
+    print(f"{'format':<14}{'size KB':>10}{'save ms':>10}{'load ms':>10}")
+    for storage_class in (JsonStorage, PickleStorage):
+        plain_size = None
+        for name, codec in codecs.items():
+            storage = storage_class(tmp_path / name, compression=codec)
+            size, saved, loaded = measure(storage, records)
+            print(
+                f"{storage.file_extension[1:]:<14}{size / 1024:>10.0f}"
+                f"{saved * 1000:>10.1f}{loaded * 1000:>10.1f}"
+            )
+            if codec is None:
+                plain_size = size
+            else:
+                assert size < plain_size
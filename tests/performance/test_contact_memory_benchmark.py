@@ -0,0 +1,63 @@
+import random
+import tracemalloc
+
+from src.domain.entities.contact import Contact
+from src.domain.entities.note import Note
+from src.domain.value_objects.address import Address
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.domain.value_objects.tag import Tag
+
+CONTACTS = 100_000
+CITIES = ["Kyiv", "Lviv", "Odesa", "Kharkiv", "Dnipro"]
+TAGS = ["work", "home", "family", "ideas", "todo"]
+
+
+def measure(build) -> tuple[list, int]:
+    tracemalloc.start()
+    try:
+        objects = build()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return objects, size
+
+
+def build_contacts() -> list[Contact]:
+    rng = random.Random(11)
+    contacts = []
+    for i in range(CONTACTS):
+        contact = Contact(Name.from_trusted(f"Contact {i}"), f"c-{i}")
+        contact.phones = [
+            Phone.from_trusted(f"{rng.randrange(10**9, 10**10)}") for _ in range(2)
+        ]
+        contact.add_email(Email.from_trusted(f"contact{i}@example.com"))
+        contact.add_address(Address.from_trusted(rng.choice(CITIES)))
+        contacts.append(contact)
+    return contacts
+
+
+def build_notes() -> list[Note]:
+    rng = random.Random(13)
+    notes = []
+    for i in range(CONTACTS):
+        note = Note(f"Note {i}", "Text", f"n-{i}")
+        note.tags = [Tag.from_trusted(tag) for tag in rng.sample(TAGS, 2)]
+        notes.append(note)
+    return notes
+
+
+def test_memory_per_100k():
+    """Reports the memory held by 100k contacts and 100k notes."""
+    contacts, contacts_size = measure(build_contacts)
+    notes, notes_size = measure(build_notes)
+
+    print()
+    print(f"{'CONTACTS':<10}{contacts_size / 2**20:>10.1f} MiB per 100k")
+    print(f"{'NOTES':<10}{notes_size / 2**20:>10.1f} MiB per 100k")
+    assert not hasattr(contacts[0], "__dict__")
+    assert contacts[0].address is contacts[0].address.interned()
+    assert notes[0].tags[0] is Tag.from_trusted(notes[0].tags[0].value)
+    # Slots keep a contact with two phones, an email and a city under 1 KiB
+    assert contacts_size / CONTACTS < 1024
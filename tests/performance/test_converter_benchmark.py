@@ -0,0 +1,45 @@
+import time
+import tracemalloc
+from pathlib import Path
+
+from src.domain.models.dbbase import DBBase
+from src.infrastructure.persistence.converter import StorageConverter
+from src.infrastructure.storage.json_storage import JsonStorage
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+from tests.performance.test_compression_benchmark import make_records
+
+SIZES = (2_000, 8_000)
+
+
+def convert(tmp_path: Path, count: int) -> tuple[float, int]:
+    data_dir = tmp_path / str(count)
+    JsonStorage(data_dir).save(make_records(count), "source")
+    converter = StorageConverter(batch_size=500)
+    sqlite = SQLiteStorage(DBBase, data_dir)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    converter.convert_contacts(JsonStorage(data_dir), "source", sqlite, "book.db")
+    report = converter.convert_contacts(
+        sqlite, "book.db", JsonStorage(data_dir), "target"
+    )
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert report.records == count
+    return 2 * count / elapsed, peak
+
+
+def test_converter_memory_is_bounded(tmp_path: Path):
+    """Shows that peak memory stays flat as the record count grows."""
+    print()
+    print(f"{'records':>10}{'records/s':>12}{'peak KB':>10}")
+    peaks = []
+    for count in SIZES:
+        rate, peak = convert(tmp_path, count)
+        peaks.append(peak)
+        print(f"{count:>10}{rate:>12,.0f}{peak / 1024:>10.0f}")
+
+    # Four times the records must not cost anywhere near four times the memory
+    assert peaks[1] < peaks[0] * 2
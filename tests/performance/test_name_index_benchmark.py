@@ -0,0 +1,31 @@
+import time
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.name import Name
+
+CONTACTS = 100_000
+LOOKUPS = 1_000
+
+
+def test_name_lookup_is_constant_time():
+    """Compares indexed find_all with the previous linear scan."""
+    book = AddressBook()
+    for i in range(CONTACTS):
+        book.add_record(Contact(Name.from_trusted(f"Contact {i}"), f"c-{i}"))
+    names = [f"Contact {i}" for i in range(0, CONTACTS, CONTACTS // LOOKUPS)]
+
+    started = time.perf_counter()
+    for name in names:
+        assert len(book.find_all(name)) == 1
+    indexed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for name in names[:10]:
+        [c for c in book.data.values() if c.name.value == name]
+    scanned = (time.perf_counter() - started) * len(names) / 10
+
+    print()
+    print(f"{'SCAN':<10}{scanned * 1000 / len(names):>10.3f} ms per lookup")
+    print(f"{'INDEX':<10}{indexed * 1000 / len(names):>10.3f} ms per lookup")
+    assert indexed * 100 < scanned
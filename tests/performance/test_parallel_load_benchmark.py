@@ -0,0 +1,34 @@
+import time
+from pathlib import Path
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.storage.json_storage import JsonStorage
+from tests.performance.test_trusted_load_benchmark import make_records
+
+CONTACTS = 100_000
+
+
+def load_seconds(adapter: DomainStorageAdapter) -> float:
+    started = time.perf_counter()
+    book, _ = adapter.load_contacts("benchmark")
+    elapsed = time.perf_counter() - started
+
+    assert len(book) == CONTACTS
+    return elapsed
+
+
+def test_parallel_load_speed(tmp_path: Path, monkeypatch):
+    """Compares sequential and process-pool loads of 100k validated contacts."""
+    JsonStorage(tmp_path).save(make_records(CONTACTS), "benchmark")
+    adapter = DomainStorageAdapter(JsonStorage(tmp_path))
+    # Validation is the cost parallel loading spreads across cores
+    monkeypatch.setattr(StorageConfig, "TRUSTED_LOAD", False)
+
+    sequential = load_seconds(adapter)
+    monkeypatch.setattr(StorageConfig, "PARALLEL_LOAD", True)
+    parallel = load_seconds(adapter)
+
+    print()
+    print(f"{'SEQUENTIAL':<12}{sequential:>10.2f} s")
+    print(f"{'PARALLEL':<12}{parallel:>10.2f} s")
@@ -0,0 +1,43 @@
+import random
+import time
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+
+CONTACTS = 100_000
+QUERIES = 100
+
+
+def test_phone_lookup_speed():
+    """Compares indexed phone matching with a scan of every contact."""
+    rng = random.Random(3)
+    book = AddressBook()
+    for i in range(CONTACTS):
+        contact = Contact(Name.from_trusted("Contact"), f"c-{i}")
+        contact.phones = [Phone.from_trusted(f"{rng.randrange(10**9, 10**10)}")]
+        book.add_record(contact)
+    queries = [f"{rng.randrange(10**6, 10**7)}" for _ in range(QUERIES)]
+
+    started = time.perf_counter()
+    book._phones.matching_ids("0")
+    built = time.perf_counter() - started
+
+    started = time.perf_counter()
+    indexed = [set(book._phones.matching_ids(q)) for q in queries]
+    indexed_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned = [
+        {c.id for c in book.data.values() if c.has_phone_matching(q)}
+        for q in queries[:10]
+    ]
+    scan_seconds = (time.perf_counter() - started) * QUERIES / 10
+
+    print()
+    print(f"{'BUILD':<10}{built * 1000:>10.1f} ms once")
+    print(f"{'SCAN':<10}{scan_seconds * 1000 / QUERIES:>10.3f} ms per query")
+    print(f"{'INDEX':<10}{indexed_seconds * 1000 / QUERIES:>10.3f} ms per query")
+    assert indexed[:10] == scanned
+    assert indexed_seconds * 20 < scan_seconds
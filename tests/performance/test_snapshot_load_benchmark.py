@@ -0,0 +1,49 @@
+import time
+from pathlib import Path
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.email import Email
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.storage.pickle_storage import PickleStorage
+from src.infrastructure.storage.snapshot_storage import SnapshotStorage
+
+CONTACTS = 50_000
+
+
+def make_book(count: int) -> AddressBook:
+    book = AddressBook()
+    for i in range(count):
+        contact = Contact(Name(f"Contact {chr(ord('A') + i % 26)}"), f"c-{i}")
+        contact.add_phone(Phone(f"{1000000000 + i}"))
+        contact.add_email(Email(f"contact{i}@example.com"))
+        book.add_record(contact)
+    return book
+
+
+def cold_start_seconds(storage, filename: str) -> float:
+    started = time.perf_counter()
+    book = storage.load(filename)
+    # A typical CLI command touches a single contact after startup
+    assert book["c-12345"].phones[0].value == "1000012345"
+    return time.perf_counter() - started
+
+
+def test_snapshot_cold_start(tmp_path: Path):
+    """Compares loading one contact from pickle and from an mmap snapshot."""
+    book = make_book(CONTACTS)
+    pickle_storage = PickleStorage(tmp_path)
+    snapshot_storage = SnapshotStorage(tmp_path)
+    pickle_storage.save(book, "benchmark")
+    snapshot_storage.save(book, "benchmark")
+
+    results = {
+        "PICKLE": cold_start_seconds(pickle_storage, "benchmark"),
+        "SNAPSHOT": cold_start_seconds(snapshot_storage, "benchmark"),
+    }
+
+    print()
+    for name, seconds in results.items():
+        print(f"{name:<12}{seconds * 1000:>10.1f} ms")
+    assert results["SNAPSHOT"] < results["PICKLE"]
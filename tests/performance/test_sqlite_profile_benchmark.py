@@ -0,0 +1,43 @@
+import time
+from pathlib import Path
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.models.dbbase import DBBase
+from src.domain.value_objects.name import Name
+from src.domain.value_objects.phone import Phone
+from src.infrastructure.storage.sqlite_profile import SQLiteProfile
+from src.infrastructure.storage.sqlite_storage import SQLiteStorage
+
+SAVES = 200
+
+
+def saves_per_second(profile: SQLiteProfile, data_dir: Path) -> float:
+    storage = SQLiteStorage(DBBase, data_dir, profile=profile)
+    book = AddressBook()
+    storage.save(book, "benchmark.db")
+
+    started = time.perf_counter()
+    for i in range(SAVES):
+        contact = Contact(Name("Benchmark"), f"c-{i}")
+        contact.add_phone(Phone(f"{1000000000 + i}"))
+        book.add_record(contact)
+        storage.save(book, "benchmark.db")
+    elapsed = time.perf_counter() - started
+
+    assert len(storage.load("benchmark.db")) == SAVES
+    return SAVES / elapsed
+
+
+def test_profile_save_throughput(tmp_path: Path):
+    """Compares one-contact incremental saves per second across profiles."""
+    results = {}
+    for profile in SQLiteProfile:
+        data_dir = tmp_path / profile.name.lower()
+        data_dir.mkdir()
+        results[profile.name] = saves_per_second(profile, data_dir)
+
+    print()
+    for name, rate in results.items():
+        print(f"{name:<12}{rate:>10.0f} saves/s")
+    assert all(rate > 0 for rate in results.values())
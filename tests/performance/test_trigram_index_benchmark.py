@@ -0,0 +1,38 @@
+import random
+import string
+import time
+
+from src.domain.address_book import AddressBook
+from src.domain.entities.contact import Contact
+from src.domain.value_objects.name import Name
+
+CONTACTS = 100_000
+QUERIES = 100
+
+
+def test_text_search_speed():
+    """Compares trigram-indexed substring search with a scan of every contact."""
+    rng = random.Random(5)
+    book = AddressBook()
+    for i in range(CONTACTS):
+        name = "".join(rng.choices(string.ascii_lowercase, k=10)).title()
+        book.add_record(Contact(Name.from_trusted(name), f"c-{i}"))
+    names = [contact.name.value for contact in book.data.values()]
+    queries = [rng.choice(names)[2:7] for _ in range(QUERIES)]
+
+    started = time.perf_counter()
+    indexed = [[c.id for c in book.search(q)] for q in queries]
+    indexed_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    scanned = [
+        [c.id for c in book.data.values() if c.matches_text(q, exact=False)]
+        for q in queries[:10]
+    ]
+    scan_seconds = (time.perf_counter() - started) * QUERIES / 10
+
+    print()
+    print(f"{'SCAN':<10}{scan_seconds * 1000 / QUERIES:>10.3f} ms per query")
+    print(f"{'INDEX':<10}{indexed_seconds * 1000 / QUERIES:>10.3f} ms per query")
+    assert indexed[:10] == scanned
+    assert indexed_seconds * 10 < scan_seconds
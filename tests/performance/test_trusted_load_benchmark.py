@@ -0,0 +1,51 @@
+import time
+from pathlib import Path
+
+from src.config.storage_config import StorageConfig
+from src.infrastructure.persistence.domain_storage_adapter import DomainStorageAdapter
+from src.infrastructure.storage.json_storage import JsonStorage
+
+CONTACTS = 100_000
+
+
+def make_records(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"c-{i}",
+            "name": f"Contact {chr(ord('A') + i % 26)}",
+            "phones": [f"{1000000000 + i}", f"{2000000000 + i}"],
+            "birthday": f"{1 + i % 28:02d}.{1 + i % 12:02d}.{1950 + i % 50}",
+            "email": f"contact{i}@example.com",
+            "address": f"{i} Main Street",
+        }
+        for i in range(count)
+    ]
+
+
+def load_seconds(adapter: DomainStorageAdapter) -> float:
+    started = time.perf_counter()
+    book, _ = adapter.load_contacts("benchmark")
+    elapsed = time.perf_counter() - started
+
+    assert len(book) == CONTACTS
+    return elapsed
+
+
+def test_trusted_load_speedup(tmp_path: Path, monkeypatch):
+    """Compares validated and trusted JSON loads of 100k contacts."""
+    storage = JsonStorage(tmp_path)
+    storage.save(
+        make_records(CONTACTS),
+        "benchmark",
+        format_version=StorageConfig.TRUSTED_LOAD_FORMAT_VERSION,
+    )
+    adapter = DomainStorageAdapter(storage)
+
+    trusted = load_seconds(adapter)
+    monkeypatch.setattr(StorageConfig, "TRUSTED_LOAD", False)
+    validated = load_seconds(adapter)
+
+    print()
+    print(f"{'VALIDATED':<12}{validated:>10.2f} s")
+    print(f"{'TRUSTED':<12}{trusted:>10.2f} s")
+    assert trusted < validated